@@ -0,0 +1,169 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Example OTIO C++ code timing a long list of edits, such as the events of
+// an EDL being conformed, applied to a track one at a time and through an
+// EditSession.
+
+#include <chrono>
+#include <iostream>
+#include <string>
+#include <vector>
+
+#include "opentimelineio/algo/editAlgorithm.h"
+#include "opentimelineio/clip.h"
+#include "opentimelineio/gap.h"
+#include "opentimelineio/track.h"
+
+namespace otio = opentimelineio::OPENTIMELINEIO_VERSION_NS;
+
+using chrono_time_point = std::chrono::steady_clock::time_point;
+
+/// utility function for printing std::chrono elapsed time
+double
+print_elapsed_time(
+    const std::string&       message,
+    const chrono_time_point& begin,
+    const chrono_time_point& end)
+{
+    const std::chrono::duration<float> dur = end - begin;
+
+    std::cout << message << ": " << dur.count() << " [s]" << std::endl;
+
+    return dur.count();
+}
+
+// Build a track that alternates clips and gaps of varying lengths.
+otio::Track*
+make_track(int item_count)
+{
+    otio::Track* track = new otio::Track;
+    for (int i = 0; i < item_count; ++i)
+    {
+        const double duration = 1 + (i * 7) % 48;
+        if (i % 3)
+        {
+            track->append_child(new otio::Clip(
+                "clip",
+                nullptr,
+                otio::TimeRange(
+                    otio::RationalTime(i * 10, 24),
+                    otio::RationalTime(duration, 24))));
+        }
+        else
+        {
+            track->append_child(
+                new otio::Gap(otio::RationalTime(duration, 24)));
+        }
+    }
+    return track;
+}
+
+// Overwrite, insert and slice at frames spread through the track, in order.
+std::vector<otio::algo::EditOperation>
+make_edits(otio::Track* track, int edit_count)
+{
+    std::vector<otio::algo::EditOperation> edits;
+    const int step = int(track->duration().value()) / (edit_count + 1);
+    for (int i = 0; i < edit_count; ++i)
+    {
+        const otio::RationalTime time((i + 1) * step, 24);
+        otio::algo::EditOperation edit;
+        edit.kind = i % 3 == 0   ? otio::algo::EditOperationKind::Overwrite
+                    : i % 3 == 1 ? otio::algo::EditOperationKind::Insert
+                                 : otio::algo::EditOperationKind::Slice;
+        edit.item = new otio::Clip(
+            "edit",
+            nullptr,
+            otio::TimeRange(
+                otio::RationalTime(i, 24),
+                otio::RationalTime(12, 24)));
+        edit.range = otio::TimeRange(time, otio::RationalTime(12, 24));
+        edit.time  = time;
+        edits.push_back(edit);
+    }
+    return edits;
+}
+
+void
+apply_one_at_a_time(
+    otio::Track*                                  track,
+    std::vector<otio::algo::EditOperation> const& edits,
+    otio::ErrorStatus*                            error_status)
+{
+    for (const auto& edit: edits)
+    {
+        switch (edit.kind)
+        {
+            case otio::algo::EditOperationKind::Overwrite:
+                otio::algo::overwrite(
+                    edit.item,
+                    track,
+                    edit.range,
+                    true,
+                    nullptr,
+                    error_status);
+                break;
+            case otio::algo::EditOperationKind::Insert:
+                otio::algo::insert(
+                    edit.item,
+                    track,
+                    edit.time,
+                    true,
+                    nullptr,
+                    error_status);
+                break;
+            default:
+                otio::algo::slice(track, edit.time, true, error_status);
+                break;
+        }
+    }
+}
+
+int
+main(int argc, char* argv[])
+{
+    int item_count = 20000;
+    int edit_count = 2000;
+    if (argc > 1)
+    {
+        item_count = std::stoi(argv[1]);
+    }
+    if (argc > 2)
+    {
+        edit_count = std::stoi(argv[2]);
+    }
+
+    otio::SerializableObject::Retainer<otio::Track> track(
+        make_track(item_count));
+    otio::SerializableObject::Retainer<otio::Track> session_track(
+        dynamic_cast<otio::Track*>(track->clone()));
+    std::cout << edit_count << " edits of a track of " << item_count
+              << " items" << std::endl;
+
+    otio::ErrorStatus err;
+
+    chrono_time_point begin = std::chrono::steady_clock::now();
+    apply_one_at_a_time(track, make_edits(track, edit_count), &err);
+    chrono_time_point end = std::chrono::steady_clock::now();
+    print_elapsed_time("  one at a time", begin, end);
+
+    begin = std::chrono::steady_clock::now();
+    otio::algo::EditSession session(session_track);
+    session.apply(make_edits(session_track, edit_count), &err);
+    end = std::chrono::steady_clock::now();
+    print_elapsed_time("  edit session", begin, end);
+
+    if (otio::is_error(err))
+    {
+        std::cout << "  error: " << err.full_description << std::endl;
+        return 1;
+    }
+    std::cout << "  the tracks "
+              << (track->to_json_string() == session_track->to_json_string()
+                      ? "match"
+                      : "do not match")
+              << std::endl;
+
+    return 0;
+}
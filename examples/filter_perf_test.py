@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+__doc__ = """
+Time filtered_composition and filtered_with_sequence_context on a generated
+timeline with many clips and gaps, checking that the time grows linearly
+with the number of items.
+"""
+
+import argparse
+import time
+
+import opentimelineio as otio
+
+
+def parse_args():
+    """ parse arguments out of sys.argv """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        '-i',
+        '--items',
+        type=int,
+        default=50000,
+        help='Number of items in the largest timeline.'
+    )
+    parser.add_argument(
+        '-t',
+        '--tracks',
+        type=int,
+        default=4,
+        help='Number of tracks the items are spread over.'
+    )
+    parser.add_argument(
+        '-r',
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of times each filter is run.'
+    )
+    return parser.parse_args()
+
+
+def make_timeline(items, tracks):
+    """ tracks alternating clips and gaps """
+    timeline = otio.schema.Timeline(name="filter perf test")
+    for t in range(tracks):
+        track = otio.schema.Track(name="track {}".format(t))
+        for i in range(items // tracks):
+            duration = otio.opentime.RationalTime(1 + i % 48, 24)
+            if i % 3:
+                track.append(
+                    otio.schema.Clip(
+                        name="clip {}".format(i),
+                        source_range=otio.opentime.TimeRange(
+                            otio.opentime.RationalTime(i, 24),
+                            duration
+                        )
+                    )
+                )
+            else:
+                track.append(
+                    otio.schema.Gap(
+                        source_range=otio.opentime.TimeRange(
+                            duration=duration
+                        )
+                    )
+                )
+        timeline.tracks.append(track)
+    return timeline
+
+
+def rename_clips(thing):
+    if isinstance(thing, otio.schema.Clip):
+        thing.name = thing.name.upper()
+    return thing
+
+
+def drop_clips_after_gaps(prev_item, thing, _):
+    if isinstance(prev_item, otio.schema.Gap):
+        return None
+    return thing
+
+
+def time_filter(label, filter_fn, timeline, repeat):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        filter_fn(timeline)
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+
+    print("  {}: {} [s]".format(label, best))
+    return best
+
+
+def main():
+    args = parse_args()
+
+    # time a few sizes up to the largest, so the growth can be compared
+    for items in (args.items // 4, args.items // 2, args.items):
+        timeline = make_timeline(items, args.tracks)
+        print("{} items".format(items))
+
+        time_filter(
+            "filtered_composition",
+            lambda tl: otio.algorithms.filtered_composition(
+                tl,
+                rename_clips,
+                types_to_prune=(otio.schema.Gap,)
+            ),
+            timeline,
+            args.repeat
+        )
+        time_filter(
+            "filtered_with_sequence_context",
+            lambda tl: otio.algorithms.filtered_with_sequence_context(
+                tl,
+                drop_clips_after_gaps
+            ),
+            timeline,
+            args.repeat
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Example OTIO C++ code timing flatten_stack() on a generated stack of many
+// tracks with many gaps, such as a multi-layer VFX timeline, and keeping the
+// flattened track up to date with a StackFlattener while the stack is edited.
+
+#include <chrono>
+#include <iostream>
+#include <string>
+
+#include "opentimelineio/algo/editAlgorithm.h"
+#include "opentimelineio/clip.h"
+#include "opentimelineio/gap.h"
+#include "opentimelineio/stack.h"
+#include "opentimelineio/stackAlgorithm.h"
+#include "opentimelineio/track.h"
+
+namespace otio = opentimelineio::OPENTIMELINEIO_VERSION_NS;
+
+using chrono_time_point = std::chrono::steady_clock::time_point;
+
+/// utility function for printing std::chrono elapsed time
+double
+print_elapsed_time(
+    const std::string&       message,
+    const chrono_time_point& begin,
+    const chrono_time_point& end)
+{
+    const std::chrono::duration<float> dur = end - begin;
+
+    std::cout << message << ": " << dur.count() << " [s]" << std::endl;
+
+    return dur.count();
+}
+
+// Build a stack where each track alternates clips and gaps of varying
+// lengths, so that every level of the stack shows through somewhere.
+otio::Stack*
+make_stack(int track_count, int item_count)
+{
+    otio::Stack* stack = new otio::Stack;
+    for (int t = 0; t < track_count; ++t)
+    {
+        otio::Track* track = new otio::Track;
+        for (int i = 0; i < item_count; ++i)
+        {
+            const double duration = 1 + (i * 7 + t * 13) % 48;
+            if ((i + t) % 3 == 0 || t == 0)
+            {
+                track->append_child(new otio::Clip(
+                    "clip",
+                    nullptr,
+                    otio::TimeRange(
+                        otio::RationalTime(i * 10, 24),
+                        otio::RationalTime(duration, 24))));
+            }
+            else
+            {
+                track->append_child(
+                    new otio::Gap(otio::RationalTime(duration, 24)));
+            }
+        }
+        stack->append_child(track);
+    }
+    return stack;
+}
+
+int
+main(int argc, char* argv[])
+{
+    int track_count = 30;
+    int item_count  = 2000;
+    if (argc > 1)
+    {
+        track_count = std::stoi(argv[1]);
+    }
+    if (argc > 2)
+    {
+        item_count = std::stoi(argv[2]);
+    }
+
+    otio::SerializableObject::Retainer<otio::Stack> stack(
+        make_stack(track_count, item_count));
+    std::cout << "flatten " << track_count << " tracks of " << item_count
+              << " items" << std::endl;
+
+    otio::ErrorStatus err;
+
+    chrono_time_point begin = std::chrono::steady_clock::now();
+    otio::SerializableObject::Retainer<otio::Track> flat(
+        otio::flatten_stack(stack, &err));
+    chrono_time_point end = std::chrono::steady_clock::now();
+    print_elapsed_time("  flatten_stack", begin, end);
+
+    if (otio::is_error(err))
+    {
+        std::cout << "  error: " << err.full_description << std::endl;
+        return 1;
+    }
+    std::cout << "  flattened to " << flat->children().size() << " items"
+              << std::endl;
+
+    // Overwrite a short range in the middle of each track in turn, updating
+    // the flattened track after each edit.
+    otio::StackFlattener flattener(stack, &err);
+    const otio::RationalTime middle(
+        stack->duration().value_rescaled_to(24) / 2,
+        24);
+
+    begin = std::chrono::steady_clock::now();
+    for (int t = 0; t < track_count; ++t)
+    {
+        const otio::TimeRange range(
+            middle + otio::RationalTime(t * 10, 24),
+            otio::RationalTime(5, 24));
+        otio::algo::overwrite(
+            new otio::Clip("edit", nullptr, range),
+            dynamic_cast<otio::Track*>(stack->children()[t].value),
+            range,
+            true,
+            nullptr,
+            &err);
+        flattener.update(range, &err);
+    }
+    end = std::chrono::steady_clock::now();
+    print_elapsed_time("  edit and update", begin, end);
+
+    begin = std::chrono::steady_clock::now();
+    flat = otio::flatten_stack(stack, &err);
+    end  = std::chrono::steady_clock::now();
+    print_elapsed_time("  flatten_stack after the edits", begin, end);
+
+    if (otio::is_error(err))
+    {
+        std::cout << "  error: " << err.full_description << std::endl;
+        return 1;
+    }
+    std::cout << "  the updated track "
+              << (flat->to_json_string()
+                          == flattener.flattened_track()->to_json_string()
+                      ? "matches"
+                      : "does not match")
+              << " the flattened stack" << std::endl;
+
+    return 0;
+}
@@ -1,7 +1,9 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright Contributors to the OpenTimelineIO project
 
+#include <algorithm>
 #include <iostream>
+#include <vector>
 
 #include "opentimelineio/clip.h"
 #include "opentimelineio/deserialization.h"
@@ -19,12 +21,14 @@ const struct
 {
     bool FIXED_TMP                   = true;
     bool PRINT_CPP_VERSION_FAMILY    = false;
+    bool FROM_JSON_FILE_NO_LINES     = true;
     bool TO_JSON_STRING              = true;
     bool TO_JSON_STRING_NO_DOWNGRADE = true;
     bool TO_JSON_FILE                = true;
     bool TO_JSON_FILE_NO_DOWNGRADE   = true;
     bool CLONE_TEST                  = true;
     bool SINGLE_CLIP_DOWNGRADE_TEST  = true;
+    int  FROM_JSON_FILE_RUNS         = 10;
 } RUN_STRUCT;
 
 // typedef std::chrono::duration<float> fsec;
@@ -46,6 +50,40 @@ print_elapsed_time(
     return dur.count();
 }
 
+/// utility function for printing the median and the range of a series of
+/// elapsed times
+double
+print_elapsed_times(const std::string& message, std::vector<double> times)
+{
+    std::sort(times.begin(), times.end());
+    const size_t middle = times.size() / 2;
+    const double median =
+        (times.size() % 2 ? times[middle]
+                          : (times[middle - 1] + times[middle]) / 2);
+
+    std::cout << message << ": median " << median << " [s], min "
+              << times.front() << " [s], max " << times.back() << " [s] ("
+              << times.size() << " runs)" << std::endl;
+
+    return median;
+}
+
+/// read a JSON file, returning the elapsed time
+double
+time_json_file_read(
+    const std::string&              path,
+    const otio::DeserializeOptions& options,
+    otio::ErrorStatus*              err)
+{
+    std::any          result;
+    chrono_time_point begin = std::chrono::steady_clock::now();
+    otio::deserialize_json_from_file(path, &result, options, err);
+    chrono_time_point end = std::chrono::steady_clock::now();
+
+    const std::chrono::duration<float> dur = end - begin;
+    return dur.count();
+}
+
 void
 print_version_map()
 {
@@ -144,6 +182,51 @@ main(int argc, char* argv[])
 
     print_elapsed_time("deserialize_json_from_file", begin, end);
 
+    if (RUN_STRUCT.FROM_JSON_FILE_NO_LINES)
+    {
+        // The file was just read, so every run below finds it in the page
+        // cache. The reads with and without line numbers take turns going
+        // first, so that neither is favored by the order of the runs.
+        otio::DeserializeOptions lines;
+        otio::DeserializeOptions no_lines;
+        no_lines.track_line_numbers = false;
+
+        const std::string   path = examples::normalize_path(argv[1]);
+        std::vector<double> lines_times;
+        std::vector<double> no_lines_times;
+        for (int i = 0; i < RUN_STRUCT.FROM_JSON_FILE_RUNS; ++i)
+        {
+            if (i % 2)
+            {
+                no_lines_times.push_back(
+                    time_json_file_read(path, no_lines, &err));
+                lines_times.push_back(time_json_file_read(path, lines, &err));
+            }
+            else
+            {
+                lines_times.push_back(time_json_file_read(path, lines, &err));
+                no_lines_times.push_back(
+                    time_json_file_read(path, no_lines, &err));
+            }
+            assert(!otio::is_error(err));
+
+            if (otio::is_error(err))
+            {
+                examples::print_error(err);
+                return 1;
+            }
+        }
+
+        const double file_read = print_elapsed_times(
+            "deserialize_json_from_file [line numbers]",
+            lines_times);
+        const double file_read_no_lines = print_elapsed_times(
+            "deserialize_json_from_file [no line numbers]",
+            no_lines_times);
+        std::cout << "  JSON from file median lines/no_lines: "
+                  << file_read / file_read_no_lines << std::endl;
+    }
+
     double str_dg, str_nodg;
     if (RUN_STRUCT.TO_JSON_STRING)
     {
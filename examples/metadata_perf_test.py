@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+__doc__ = """
+Time the conversion of large metadata dictionaries to OTIO values, comparing
+the C++ conversion with the pure python implementation it replaces.
+"""
+
+import argparse
+import time
+
+import opentimelineio as otio
+from opentimelineio.core import _core_utils
+
+
+def parse_args():
+    """ parse arguments out of sys.argv """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        '-f',
+        '--frames',
+        type=int,
+        default=10000,
+        help='Number of per-frame CDL entries in the metadata.'
+    )
+    parser.add_argument(
+        '-r',
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of times each conversion is run.'
+    )
+    return parser.parse_args()
+
+
+def make_metadata(frames):
+    """ per-frame CDL values plus a vendor blob, as seen on real clips """
+    return {
+        "cdl": [
+            {
+                "frame": frame,
+                "slope": [1.0, 1.01, 0.99],
+                "offset": [0.0, 0.001, -0.001],
+                "power": [1.0, 1.0, 1.0],
+                "saturation": 1.0,
+            }
+            for frame in range(frames)
+        ],
+        "vendor": {
+            "tool": "example",
+            "version": 3,
+            "settings": {str(i): "value {}".format(i) for i in range(1000)},
+        },
+    }
+
+
+def time_conversion(label, convert, metadata, repeat):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        convert(metadata)
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+
+    print("{}: {} [s]".format(label, best))
+    return best
+
+
+def main():
+    args = parse_args()
+    metadata = make_metadata(args.frames)
+
+    python_time = time_conversion(
+        "python _value_to_any",
+        _core_utils._python_value_to_any,
+        metadata,
+        args.repeat
+    )
+    native_time = time_conversion(
+        "C++ _value_to_any",
+        _core_utils._value_to_any,
+        metadata,
+        args.repeat
+    )
+    print("  python/C++: {}".format(python_time / native_time))
+
+    clip = otio.schema.Clip(name="clip")
+    time_conversion(
+        "Clip.metadata assignment",
+        lambda md: clip.metadata.update(md),
+        metadata,
+        args.repeat
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Example OTIO C++ code comparing track duration computed with RationalTime,
+// as Track::available_range() does, against the same sum computed exactly
+// with TickTime.
+
+#include <chrono>
+#include <iostream>
+#include <string>
+#include <vector>
+
+#include "opentime/tickTime.h"
+#include "opentimelineio/clip.h"
+#include "opentimelineio/track.h"
+
+namespace otio  = opentimelineio::OPENTIMELINEIO_VERSION_NS;
+namespace otime = opentime::OPENTIME_VERSION_NS;
+
+using chrono_time_point = std::chrono::steady_clock::time_point;
+
+const struct
+{
+    bool TRACK_DURATION = true;
+    bool RAW_SUM        = true;
+} RUN_STRUCT;
+
+/// utility function for printing std::chrono elapsed time
+double
+print_elapsed_time(
+    const std::string&       message,
+    const chrono_time_point& begin,
+    const chrono_time_point& end)
+{
+    const std::chrono::duration<float> dur = end - begin;
+
+    std::cout << message << ": " << dur.count() << " [s]" << std::endl;
+
+    return dur.count();
+}
+
+// Durations of a few frames at rates commonly mixed on one track.
+std::vector<otime::RationalTime>
+make_durations(int count)
+{
+    const double rates[] = { 24000 / 1001.0, 24.0, 48000 / 1001.0, 25.0 };
+
+    std::vector<otime::RationalTime> durations;
+    durations.reserve(count);
+    for (int i = 0; i < count; ++i)
+    {
+        durations.emplace_back(1 + i % 47, rates[i % 4]);
+    }
+    return durations;
+}
+
+void
+print_drift(otime::RationalTime sum, otime::TickTime exact)
+{
+    otime::TickTime approximate = otime::TickTime::from_rational_time(sum);
+    std::cout << "  RationalTime sum: " << sum.value() << " @ " << sum.rate()
+              << ", drift: " << (approximate - exact).ticks() << " ticks ("
+              << (approximate - exact).to_seconds() << " [s])" << std::endl;
+}
+
+void
+time_track_duration(int count)
+{
+    otio::SerializableObject::Retainer<otio::Track> track(new otio::Track);
+    for (auto const& duration: make_durations(count))
+    {
+        otime::RationalTime start(0, duration.rate());
+        otime::TimeRange    range(start, duration);
+        track->append_child(new otio::Clip("clip", nullptr, range));
+    }
+
+    otio::ErrorStatus err;
+
+    chrono_time_point begin = std::chrono::steady_clock::now();
+    otime::RationalTime sum = track->available_range(&err).duration();
+    chrono_time_point end   = std::chrono::steady_clock::now();
+    print_elapsed_time("  Track::available_range", begin, end);
+
+    begin                 = std::chrono::steady_clock::now();
+    otime::TickTime exact = otime::TickTime();
+    for (auto const& child: track->children())
+    {
+        auto item = dynamic_cast<otio::Item*>(child.value);
+        exact += otime::TickTime::from_rational_time(item->duration(&err));
+    }
+    end = std::chrono::steady_clock::now();
+    print_elapsed_time("  TickTime sum of item durations", begin, end);
+
+    print_drift(sum, exact);
+}
+
+void
+time_raw_sum(int count)
+{
+    const auto durations = make_durations(count);
+
+    chrono_time_point   begin = std::chrono::steady_clock::now();
+    otime::RationalTime sum;
+    for (auto const& duration: durations)
+    {
+        sum += duration;
+    }
+    chrono_time_point end = std::chrono::steady_clock::now();
+    const double      rational =
+        print_elapsed_time("  RationalTime +=", begin, end);
+
+    std::vector<otime::TickTime> ticks;
+    ticks.reserve(durations.size());
+    for (auto const& duration: durations)
+    {
+        ticks.push_back(otime::TickTime::from_rational_time(duration));
+    }
+
+    begin                 = std::chrono::steady_clock::now();
+    otime::TickTime exact = otime::TickTime();
+    for (auto const& duration: ticks)
+    {
+        exact += duration;
+    }
+    end = std::chrono::steady_clock::now();
+    const double tick = print_elapsed_time("  TickTime +=", begin, end);
+
+    std::cout << "  speedup: " << rational / tick << "x" << std::endl;
+    print_drift(sum, exact);
+}
+
+int
+main(int argc, char* argv[])
+{
+    int count = 100000;
+    if (argc > 1)
+    {
+        count = std::stoi(argv[1]);
+    }
+
+    if (RUN_STRUCT.TRACK_DURATION)
+    {
+        std::cout << "track duration, " << count << " clips" << std::endl;
+        time_track_duration(count);
+    }
+
+    if (RUN_STRUCT.RAW_SUM)
+    {
+        std::cout << "raw sum, " << count << " durations" << std::endl;
+        time_raw_sum(count);
+    }
+
+    return 0;
+}
@@ -0,0 +1,153 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+// Example OTIO C++ code for timing timecode conversion with
+// RationalTime::to_timecode()/from_timecode() against a reused
+// TimecodeFormatter.
+
+#include <chrono>
+#include <iostream>
+#include <string>
+#include <vector>
+
+#include "opentime/rationalTime.h"
+#include "opentime/timecodeFormatter.h"
+
+namespace otime = opentime::OPENTIME_VERSION_NS;
+
+using chrono_time_point = std::chrono::steady_clock::time_point;
+
+const struct
+{
+    bool TO_TIMECODE   = true;
+    bool FROM_TIMECODE = true;
+    bool DROP_FRAME    = true;
+} RUN_STRUCT;
+
+/// utility function for printing std::chrono elapsed time
+double
+print_elapsed_time(
+    const std::string&       message,
+    const chrono_time_point& begin,
+    const chrono_time_point& end)
+{
+    const std::chrono::duration<float> dur = end - begin;
+
+    std::cout << message << ": " << dur.count() << " [s]" << std::endl;
+
+    return dur.count();
+}
+
+void
+time_to_timecode(double rate, int frames, otime::IsDropFrameRate drop_frame)
+{
+    // keep the results alive so the work isn't optimized away
+    size_t total = 0;
+
+    chrono_time_point begin = std::chrono::steady_clock::now();
+    for (int frame = 0; frame < frames; ++frame)
+    {
+        otime::RationalTime t(frame, rate);
+        total += t.to_timecode(rate, drop_frame, nullptr).size();
+    }
+    chrono_time_point end = std::chrono::steady_clock::now();
+    const double      per_call =
+        print_elapsed_time("  RationalTime::to_timecode", begin, end);
+
+    otime::TimecodeFormatter formatter(rate, drop_frame);
+
+    begin = std::chrono::steady_clock::now();
+    for (int frame = 0; frame < frames; ++frame)
+    {
+        otime::RationalTime t(frame, rate);
+        total += formatter.to_timecode(t).size();
+    }
+    end = std::chrono::steady_clock::now();
+    print_elapsed_time("  TimecodeFormatter::to_timecode", begin, end);
+
+    char buffer[otime::TimecodeFormatter::buffer_size];
+    begin = std::chrono::steady_clock::now();
+    for (int frame = 0; frame < frames; ++frame)
+    {
+        otime::RationalTime t(frame, rate);
+        total += formatter.format(t, buffer, sizeof(buffer));
+    }
+    end = std::chrono::steady_clock::now();
+    const double buffered =
+        print_elapsed_time("  TimecodeFormatter::format", begin, end);
+
+    std::cout << "  speedup: " << per_call / buffered << "x (" << total
+              << " characters)" << std::endl;
+}
+
+void
+time_from_timecode(double rate, int frames)
+{
+    otime::TimecodeFormatter formatter(rate);
+    std::vector<std::string> timecodes;
+    timecodes.reserve(frames);
+    for (int frame = 0; frame < frames; ++frame)
+    {
+        otime::RationalTime t(frame, rate);
+        timecodes.push_back(formatter.to_timecode(t));
+    }
+
+    double total = 0;
+
+    chrono_time_point begin = std::chrono::steady_clock::now();
+    for (auto const& timecode: timecodes)
+    {
+        total += otime::RationalTime::from_timecode(timecode, rate).value();
+    }
+    chrono_time_point end = std::chrono::steady_clock::now();
+    const double      per_call =
+        print_elapsed_time("  RationalTime::from_timecode", begin, end);
+
+    begin = std::chrono::steady_clock::now();
+    for (auto const& timecode: timecodes)
+    {
+        total += formatter.from_timecode(timecode).value();
+    }
+    end = std::chrono::steady_clock::now();
+    const double reused =
+        print_elapsed_time("  TimecodeFormatter::from_timecode", begin, end);
+
+    std::cout << "  speedup: " << per_call / reused << "x (checksum " << total
+              << ")" << std::endl;
+}
+
+int
+main(int argc, char* argv[])
+{
+    int frames = 1000000;
+    if (argc > 1)
+    {
+        frames = std::stoi(argv[1]);
+    }
+
+    if (RUN_STRUCT.TO_TIMECODE)
+    {
+        std::cout << "to timecode, 24 fps, " << frames << " frames"
+                  << std::endl;
+        time_to_timecode(24, frames, otime::IsDropFrameRate::InferFromRate);
+    }
+
+    if (RUN_STRUCT.TO_TIMECODE && RUN_STRUCT.DROP_FRAME)
+    {
+        std::cout << "to timecode, 29.97 fps drop frame, " << frames
+                  << " frames" << std::endl;
+        time_to_timecode(
+            30000 / 1001.0,
+            frames,
+            otime::IsDropFrameRate::ForceYes);
+    }
+
+    if (RUN_STRUCT.FROM_TIMECODE)
+    {
+        std::cout << "from timecode, 24 fps, " << frames << " frames"
+                  << std::endl;
+        time_from_timecode(24, frames);
+    }
+
+    return 0;
+}
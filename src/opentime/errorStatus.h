@@ -22,6 +22,7 @@ struct OPENTIME_API_TYPE ErrorStatus
         TIMECODE_RATE_MISMATCH,
         NEGATIVE_VALUE,
         INVALID_RATE_FOR_DROP_FRAME_TIMECODE,
+        INEXACT_TICK_CONVERSION,
     };
 
     /// @brief Construct a new status with no error.
@@ -3,21 +3,16 @@
 
 #include "opentime/rationalTime.h"
 #include "opentime/stringPrintf.h"
+#include "opentime/timecodeFormatter.h"
 #include <algorithm>
 #include <array>
 #include <ciso646>
 #include <cmath>
-#include <vector>
 
 namespace opentime { namespace OPENTIME_VERSION_NS {
 
 RationalTime RationalTime::_invalid_time{ 0, RationalTime::_invalid_rate };
 
-static constexpr std::array<double, 2> dropframe_timecode_rates{ {
-    30000.0 / 1001.0,
-    60000.0 / 1001.0,
-} };
-
 // See the official source of these numbers here:
 // ST 12-1:2014 - SMPTE Standard - Time and Control Code
 // https://ieeexplore.ieee.org/document/7291029
@@ -78,14 +73,6 @@ RationalTime::nearest_smpte_timecode_rate(double rate)
     return nearest_rate;
 }
 
-static bool
-is_dropframe_rate(double rate)
-{
-    auto b = dropframe_timecode_rates.begin(),
-         e = dropframe_timecode_rates.end();
-    return std::find(b, e, rate) != e;
-}
-
 static bool
 parseFloat(
     char const* pCurr,
@@ -192,112 +179,7 @@ RationalTime::from_timecode(
     double             rate,
     ErrorStatus*       error_status)
 {
-    if (!RationalTime::is_smpte_timecode_rate(rate))
-    {
-        if (error_status)
-        {
-            *error_status = ErrorStatus{ ErrorStatus::INVALID_TIMECODE_RATE };
-        }
-        return RationalTime::_invalid_time;
-    }
-
-    bool rate_is_dropframe = is_dropframe_rate(rate);
-
-    if (timecode.find(';') != std::string::npos)
-    {
-        if (!rate_is_dropframe)
-        {
-            if (error_status)
-            {
-                *error_status = ErrorStatus(
-                    ErrorStatus::INVALID_RATE_FOR_DROP_FRAME_TIMECODE,
-                    string_printf(
-                        "Timecode '%s' indicates drop frame rate due "
-                        "to the ';' frame divider. "
-                        "Passed in rate %g is not a valid drop frame rate.",
-                        timecode.c_str(),
-                        rate));
-            }
-            return RationalTime::_invalid_time;
-        }
-    }
-    else
-    {
-        rate_is_dropframe = false;
-    }
-
-    std::vector<std::string> fields{ "", "", "", "" };
-    int                      hours, minutes, seconds, frames;
-
-    try
-    {
-        // split the fields
-        unsigned int last_pos = 0;
-        for (unsigned int i = 0; i < 4; i++)
-        {
-            fields[i] = timecode.substr(last_pos, 2);
-            last_pos  = last_pos + 3;
-        }
-
-        hours   = std::stoi(fields[0]);
-        minutes = std::stoi(fields[1]);
-        seconds = std::stoi(fields[2]);
-        frames  = std::stoi(fields[3]);
-    }
-    catch (std::exception const&)
-    {
-        if (error_status)
-        {
-            *error_status = ErrorStatus(
-                ErrorStatus::INVALID_TIMECODE_STRING,
-                string_printf(
-                    "Input timecode '%s' is an invalid timecode",
-                    timecode.c_str()));
-        }
-        return RationalTime::_invalid_time;
-    }
-
-    const int nominal_fps = static_cast<int>(std::ceil(rate));
-
-    if (frames >= nominal_fps)
-    {
-        if (error_status)
-        {
-            *error_status = ErrorStatus(
-                ErrorStatus::TIMECODE_RATE_MISMATCH,
-                string_printf(
-                    "Frame rate mismatch.  Timecode '%s' has "
-                    "frames beyond %d",
-                    timecode.c_str(),
-                    nominal_fps - 1));
-        }
-        return RationalTime::_invalid_time;
-    }
-
-    int dropframes = 0;
-    if (rate_is_dropframe)
-    {
-        if ((rate == 29.97) or (rate == 30000 / 1001.0))
-        {
-            dropframes = 2;
-        }
-        else if ((rate == 59.94) or (rate == 60000 / 1001.0))
-        {
-            dropframes = 4;
-        }
-    }
-
-    // to use for drop frame compensation
-    int total_minutes = hours * 60 + minutes;
-
-    // convert to frames
-    const int value =
-        (((total_minutes * 60) + seconds) * nominal_fps + frames
-         - (dropframes
-            * (total_minutes
-               - static_cast<int>(std::floor(total_minutes / 10)))));
-
-    return RationalTime{ double(value), rate };
+    return TimecodeFormatter(rate).from_timecode(timecode, error_status);
 }
 
 static void
@@ -436,138 +318,7 @@ RationalTime::to_timecode(
     IsDropFrameRate drop_frame,
     ErrorStatus*    error_status) const
 {
-    if (error_status)
-    {
-        *error_status = ErrorStatus();
-    }
-
-    double frames_in_target_rate = this->value_rescaled_to(rate);
-
-    if (frames_in_target_rate < 0)
-    {
-        if (error_status)
-        {
-            *error_status = ErrorStatus(ErrorStatus::NEGATIVE_VALUE);
-        }
-        return std::string();
-    }
-
-    // It is common practice to use truncated or rounded values
-    // like 29.97 instead of exact SMPTE rates like 30000/1001
-    // so as a convenience we will snap the rate to the nearest
-    // SMPTE rate if it is close enough.
-    double nearest_smpte_rate = nearest_smpte_timecode_rate(rate);
-    if (abs(nearest_smpte_rate - rate) > 0.1)
-    {
-        if (error_status)
-        {
-            *error_status = ErrorStatus(ErrorStatus::INVALID_TIMECODE_RATE);
-        }
-        return std::string();
-    }
-
-    // Let's assume this is the rate instead of the given rate.
-    rate = nearest_smpte_rate;
-
-    bool rate_is_dropframe = is_dropframe_rate(rate);
-    if (drop_frame == IsDropFrameRate::ForceYes and not rate_is_dropframe)
-    {
-        if (error_status)
-        {
-            *error_status =
-                ErrorStatus(ErrorStatus::INVALID_RATE_FOR_DROP_FRAME_TIMECODE);
-        }
-        return std::string();
-    }
-
-    if (drop_frame != IsDropFrameRate::InferFromRate)
-    {
-        if (drop_frame == IsDropFrameRate::ForceYes)
-        {
-            rate_is_dropframe = true;
-        }
-        else
-        {
-            rate_is_dropframe = false;
-        }
-    }
-
-    // extra math for dropframes stuff
-    int  dropframes = 0;
-    char div        = ':';
-    if (!rate_is_dropframe)
-    {
-        if (std::round(rate) == 24)
-        {
-            rate = 24.0;
-        }
-    }
-    else
-    {
-        if (rate == 30000 / 1001.0)
-        {
-            dropframes = 2;
-        }
-        else if (rate == 60000 / 1001.0)
-        {
-            dropframes = 4;
-        }
-        div = ';';
-    }
-
-    // Number of frames in an hour
-    int frames_per_hour = static_cast<int>(std::round(rate * 60 * 60));
-    // Number of frames in a day - timecode rolls over after 24 hours
-    int frames_per_24_hours = frames_per_hour * 24;
-    // Number of frames per ten minutes
-    int frames_per_10_minutes = static_cast<int>(std::round(rate * 60 * 10));
-    // Number of frames per minute is the round of the framerate * 60 minus
-    // the number of dropped frames
-    int frames_per_minute =
-        static_cast<int>((std::round(rate) * 60) - dropframes);
-
-    // If the number of frames is more than 24 hours, roll over clock
-    double value = std::fmod(frames_in_target_rate, frames_per_24_hours);
-
-    if (rate_is_dropframe)
-    {
-        int ten_minute_chunks =
-            static_cast<int>(std::floor(value / frames_per_10_minutes));
-        int frames_over_ten_minutes =
-            static_cast<int>(std::fmod(value, frames_per_10_minutes));
-
-        if (frames_over_ten_minutes > dropframes)
-        {
-            value += (dropframes * 9 * ten_minute_chunks)
-                     + dropframes
-                           * std::floor(
-                               (frames_over_ten_minutes - dropframes)
-                               / frames_per_minute);
-        }
-        else
-        {
-            value += dropframes * 9 * ten_minute_chunks;
-        }
-    }
-
-    int nominal_fps = static_cast<int>(std::ceil(rate));
-
-    // compute the fields
-    int frames        = static_cast<int>(std::fmod(value, nominal_fps));
-    int seconds_total = static_cast<int>(std::floor(value / nominal_fps));
-    int seconds       = static_cast<int>(std::fmod(seconds_total, 60));
-    int minutes =
-        static_cast<int>(std::fmod(std::floor(seconds_total / 60), 60));
-    int hours =
-        static_cast<int>(std::floor(std::floor(seconds_total / 60) / 60));
-
-    return string_printf(
-        "%02d:%02d:%02d%c%02d",
-        hours,
-        minutes,
-        seconds,
-        div,
-        frames);
+    return TimecodeFormatter(rate, drop_frame).to_timecode(*this, error_status);
 }
 
 std::string
@@ -404,6 +404,7 @@ private:
 
     friend class TimeTransform;
     friend class TimeRange;
+    friend class TimecodeFormatter;
 
     double _value, _rate;
 
@@ -0,0 +1,96 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentime/tickTime.h"
+#include <array>
+#include <cmath>
+#include <limits>
+
+namespace opentime { namespace OPENTIME_VERSION_NS {
+
+// Rates are matched against these denominators to find their exact
+// rational value, e.g. 24000/1001 for 23.976.
+static constexpr std::array<int64_t, 2> rate_denominators{ { 1, 1001 } };
+
+// The largest magnitude that converts to int64_t without overflow.
+static constexpr double max_ticks = 9.2e18;
+
+int64_t
+TickTime::ticks_per_unit(double rate) noexcept
+{
+    if (!(rate > 0) || !std::isfinite(rate))
+    {
+        return 0;
+    }
+
+    for (int64_t denominator: rate_denominators)
+    {
+        double const scaled    = rate * double(denominator);
+        double const numerator = std::round(scaled);
+        if (numerator < 1 || numerator > double(ticks_per_second)
+            || std::abs(scaled - numerator) > 1e-6)
+        {
+            continue;
+        }
+
+        int64_t const n = int64_t(numerator);
+        if ((ticks_per_second * denominator) % n == 0)
+        {
+            return ticks_per_second * denominator / n;
+        }
+    }
+    return 0;
+}
+
+TickTime
+TickTime::from_rational_time(
+    RationalTime time,
+    ErrorStatus* error_status) noexcept
+{
+    double const  value    = time.value();
+    int64_t const per_unit = ticks_per_unit(time.rate());
+
+    if (per_unit != 0 && value == std::trunc(value)
+        && std::abs(value) < max_ticks / double(per_unit))
+    {
+        return TickTime{ int64_t(value) * per_unit };
+    }
+
+    double const ticks =
+        per_unit != 0 ? value * double(per_unit)
+                      : value * double(ticks_per_second) / time.rate();
+    double const rounded = std::round(ticks);
+    if (!(std::abs(rounded) < max_ticks))
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(ErrorStatus::INEXACT_TICK_CONVERSION);
+        }
+        return TickTime();
+    }
+
+    if (rounded != ticks && error_status)
+    {
+        *error_status = ErrorStatus(ErrorStatus::INEXACT_TICK_CONVERSION);
+    }
+    return TickTime{ int64_t(rounded) };
+}
+
+RationalTime
+TickTime::to_rational_time(double rate) const noexcept
+{
+    int64_t const per_unit = ticks_per_unit(rate);
+    if (per_unit == 0)
+    {
+        return RationalTime(to_seconds() * rate, rate);
+    }
+
+    // Split off the whole units so that large tick counts stay exact.
+    int64_t const units     = _ticks / per_unit;
+    int64_t const remainder = _ticks % per_unit;
+    return RationalTime(
+        double(units) + double(remainder) / double(per_unit),
+        rate);
+}
+
+}} // namespace opentime::OPENTIME_VERSION_NS
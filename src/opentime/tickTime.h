@@ -0,0 +1,135 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentime/errorStatus.h"
+#include "opentime/rationalTime.h"
+#include "opentime/version.h"
+#include <cstdint>
+
+namespace opentime { namespace OPENTIME_VERSION_NS {
+
+/// @brief This class represents a time as an integer number of ticks of a
+/// timebase shared by all times.
+///
+/// The timebase has 705600000 ticks per second, which is a whole number of
+/// ticks per frame or sample for the common video rates (including the
+/// 1000/1001 NTSC rates) and audio rates, so times at those rates convert
+/// to and from RationalTime without loss. Since every TickTime has the same
+/// timebase, comparisons and arithmetic are plain integer operations and
+/// long sums do not drift. A 64 bit tick count covers more than 400 years.
+class OPENTIME_API_TYPE TickTime
+{
+public:
+    /// @brief The number of ticks in a second.
+    static constexpr int64_t ticks_per_second = 705600000;
+
+    /// @brief Construct a new time with the given number of ticks.
+    explicit constexpr TickTime(int64_t ticks = 0) noexcept
+        : _ticks{ ticks }
+    {}
+
+    /// @brief Returns the number of ticks.
+    constexpr int64_t ticks() const noexcept { return _ticks; }
+
+    /// @brief Returns the number of ticks in one unit of the given rate, or
+    /// zero if that is not a whole number of ticks.
+    static OPENTIME_API int64_t ticks_per_unit(double rate) noexcept;
+
+    /// @brief Convert a RationalTime to ticks.
+    ///
+    /// If the time is not a whole number of ticks, it is rounded to the
+    /// nearest tick and error_status is set to INEXACT_TICK_CONVERSION.
+    ///
+    /// @param time The time to convert.
+    /// @param error_status The return status.
+    static OPENTIME_API TickTime from_rational_time(
+        RationalTime time,
+        ErrorStatus* error_status = nullptr) noexcept;
+
+    /// @brief Convert to a RationalTime at the given rate.
+    ///
+    /// The conversion is exact when the rate has a whole number of ticks per
+    /// unit, which makes a round trip through TickTime lossless.
+    OPENTIME_API RationalTime to_rational_time(double rate) const noexcept;
+
+    /// @brief Returns the time in seconds.
+    constexpr double to_seconds() const noexcept
+    {
+        return double(_ticks) / ticks_per_second;
+    }
+
+    /// @brief Add a time to this time.
+    constexpr TickTime& operator+=(TickTime other) noexcept
+    {
+        _ticks += other._ticks;
+        return *this;
+    }
+
+    /// @brief Subtract a time from this time.
+    constexpr TickTime& operator-=(TickTime other) noexcept
+    {
+        _ticks -= other._ticks;
+        return *this;
+    }
+
+    /// @brief Return the addition of two times.
+    friend constexpr TickTime operator+(TickTime lhs, TickTime rhs) noexcept
+    {
+        return TickTime{ lhs._ticks + rhs._ticks };
+    }
+
+    /// @brief Return the subtraction of two times.
+    friend constexpr TickTime operator-(TickTime lhs, TickTime rhs) noexcept
+    {
+        return TickTime{ lhs._ticks - rhs._ticks };
+    }
+
+    /// @brief Return the negative of this time.
+    friend constexpr TickTime operator-(TickTime lhs) noexcept
+    {
+        return TickTime{ -lhs._ticks };
+    }
+
+    /// @brief Return whether a time is greater than another time.
+    friend constexpr bool operator>(TickTime lhs, TickTime rhs) noexcept
+    {
+        return lhs._ticks > rhs._ticks;
+    }
+
+    /// @brief Return whether a time is greater than or equal to another time.
+    friend constexpr bool operator>=(TickTime lhs, TickTime rhs) noexcept
+    {
+        return lhs._ticks >= rhs._ticks;
+    }
+
+    /// @brief Return whether a time is less than another time.
+    friend constexpr bool operator<(TickTime lhs, TickTime rhs) noexcept
+    {
+        return lhs._ticks < rhs._ticks;
+    }
+
+    /// @brief Return whether a time is less than or equal to another time.
+    friend constexpr bool operator<=(TickTime lhs, TickTime rhs) noexcept
+    {
+        return lhs._ticks <= rhs._ticks;
+    }
+
+    /// @brief Return whether two times are equal.
+    friend constexpr bool operator==(TickTime lhs, TickTime rhs) noexcept
+    {
+        return lhs._ticks == rhs._ticks;
+    }
+
+    /// @brief Return whether two times are not equal.
+    friend constexpr bool operator!=(TickTime lhs, TickTime rhs) noexcept
+    {
+        return lhs._ticks != rhs._ticks;
+    }
+
+private:
+    int64_t _ticks;
+};
+
+}} // namespace opentime::OPENTIME_VERSION_NS
@@ -0,0 +1,324 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentime/timeRangeSet.h"
+#include <algorithm>
+
+namespace opentime { namespace OPENTIME_VERSION_NS {
+
+static inline double
+start_s(TimeRange const& range) noexcept
+{
+    return range.start_time().to_seconds();
+}
+
+static inline double
+end_s(TimeRange const& range) noexcept
+{
+    return range.end_time_exclusive().to_seconds();
+}
+
+static bool
+start_before(TimeRange const& lhs, TimeRange const& rhs) noexcept
+{
+    double const lhs_start = start_s(lhs);
+    double const rhs_start = start_s(rhs);
+    return lhs_start < rhs_start
+           || (lhs_start == rhs_start && end_s(lhs) < end_s(rhs));
+}
+
+// Merge neighbouring ranges of a sorted list that overlap or are less
+// than epsilon_s apart.
+static void
+coalesce(std::vector<TimeRange>& ranges, double epsilon_s)
+{
+    if (ranges.empty())
+    {
+        return;
+    }
+
+    size_t last = 0;
+    for (size_t i = 1; i < ranges.size(); ++i)
+    {
+        if (start_s(ranges[i]) - end_s(ranges[last]) < epsilon_s)
+        {
+            ranges[last] = ranges[last].extended_by(ranges[i]);
+        }
+        else
+        {
+            ranges[++last] = ranges[i];
+        }
+    }
+    ranges.resize(last + 1);
+}
+
+static inline bool
+is_ignored(TimeRange const& range, double epsilon_s) noexcept
+{
+    return range.is_invalid_range()
+           || end_s(range) - start_s(range) < epsilon_s;
+}
+
+TimeRangeSet::TimeRangeSet(
+    std::vector<TimeRange> const& ranges,
+    double                        epsilon_s)
+    : _epsilon_s{ epsilon_s }
+    , _ranges{ ranges }
+{
+    _normalize();
+}
+
+void
+TimeRangeSet::_normalize()
+{
+    _ranges.erase(
+        std::remove_if(
+            _ranges.begin(),
+            _ranges.end(),
+            [this](TimeRange const& range) {
+                return is_ignored(range, _epsilon_s);
+            }),
+        _ranges.end());
+    std::sort(_ranges.begin(), _ranges.end(), start_before);
+    coalesce(_ranges, _epsilon_s);
+}
+
+size_t
+TimeRangeSet::_first_ending_after(double seconds) const noexcept
+{
+    auto it = std::upper_bound(
+        _ranges.begin(),
+        _ranges.end(),
+        seconds,
+        [](double seconds, TimeRange const& range) {
+            return seconds < end_s(range);
+        });
+    return size_t(it - _ranges.begin());
+}
+
+void
+TimeRangeSet::add(TimeRange range)
+{
+    if (is_ignored(range, _epsilon_s))
+    {
+        return;
+    }
+
+    // The ranges that are close enough to the new one to be merged with it
+    // are contiguous, starting with the first one that does not end more
+    // than epsilon_s before it.
+    double const range_start = start_s(range);
+    double const range_end   = end_s(range);
+    size_t const first = _first_ending_after(range_start - _epsilon_s);
+    size_t       last  = first;
+    while (last < _ranges.size()
+           && start_s(_ranges[last]) - range_end < _epsilon_s)
+    {
+        range = _ranges[last].extended_by(range);
+        ++last;
+    }
+
+    _ranges.erase(_ranges.begin() + first, _ranges.begin() + last);
+    _ranges.insert(_ranges.begin() + first, range);
+}
+
+TimeRangeSet
+TimeRangeSet::union_with(TimeRangeSet const& other) const
+{
+    TimeRangeSet result(_epsilon_s);
+    result._ranges.reserve(_ranges.size() + other._ranges.size());
+    std::merge(
+        _ranges.begin(),
+        _ranges.end(),
+        other._ranges.begin(),
+        other._ranges.end(),
+        std::back_inserter(result._ranges),
+        start_before);
+    coalesce(result._ranges, _epsilon_s);
+    return result;
+}
+
+TimeRangeSet
+TimeRangeSet::intersection_with(TimeRangeSet const& other) const
+{
+    TimeRangeSet result(_epsilon_s);
+    size_t       i = 0, j = 0;
+    while (i < _ranges.size() && j < other._ranges.size())
+    {
+        TimeRange const& a = _ranges[i];
+        TimeRange const& b = other._ranges[j];
+
+        RationalTime const start =
+            start_s(a) < start_s(b) ? b.start_time() : a.start_time();
+        RationalTime const end = end_s(a) < end_s(b) ? a.end_time_exclusive()
+                                                     : b.end_time_exclusive();
+        if (end.to_seconds() - start.to_seconds() >= _epsilon_s)
+        {
+            result._ranges.push_back(
+                TimeRange::range_from_start_end_time(start, end));
+        }
+
+        if (end_s(a) < end_s(b))
+        {
+            ++i;
+        }
+        else
+        {
+            ++j;
+        }
+    }
+    coalesce(result._ranges, _epsilon_s);
+    return result;
+}
+
+TimeRangeSet
+TimeRangeSet::difference_with(TimeRangeSet const& other) const
+{
+    TimeRangeSet result(_epsilon_s);
+    size_t       j = 0;
+    for (TimeRange const& a: _ranges)
+    {
+        double const a_start = start_s(a);
+        double const a_end   = end_s(a);
+
+        while (j < other._ranges.size() && end_s(other._ranges[j]) <= a_start)
+        {
+            ++j;
+        }
+
+        RationalTime cursor = a.start_time();
+        for (; j < other._ranges.size(); ++j)
+        {
+            TimeRange const& b = other._ranges[j];
+            if (start_s(b) >= a_end)
+            {
+                break;
+            }
+
+            if (start_s(b) - cursor.to_seconds() >= _epsilon_s)
+            {
+                result._ranges.push_back(TimeRange::range_from_start_end_time(
+                    cursor,
+                    b.start_time()));
+            }
+            if (end_s(b) > cursor.to_seconds())
+            {
+                cursor = b.end_time_exclusive();
+            }
+            if (end_s(b) > a_end)
+            {
+                // b may also cover the start of the next range.
+                break;
+            }
+        }
+
+        if (a_end - cursor.to_seconds() >= _epsilon_s)
+        {
+            result._ranges.push_back(TimeRange::range_from_start_end_time(
+                cursor,
+                a.end_time_exclusive()));
+        }
+    }
+    return result;
+}
+
+TimeRangeSet
+TimeRangeSet::clamped(TimeRange range) const
+{
+    return intersection_with(TimeRangeSet({ range }, _epsilon_s));
+}
+
+TimeRangeSet
+TimeRangeSet::gaps() const
+{
+    TimeRangeSet result(_epsilon_s);
+    for (size_t i = 1; i < _ranges.size(); ++i)
+    {
+        result._ranges.push_back(TimeRange::range_from_start_end_time(
+            _ranges[i - 1].end_time_exclusive(),
+            _ranges[i].start_time()));
+    }
+    return result;
+}
+
+TimeRangeSet
+TimeRangeSet::gaps(TimeRange bounds) const
+{
+    return TimeRangeSet({ bounds }, _epsilon_s).difference_with(*this);
+}
+
+TimeRange
+TimeRangeSet::bounds() const noexcept
+{
+    if (_ranges.empty())
+    {
+        return TimeRange();
+    }
+    return TimeRange::range_from_start_end_time(
+        _ranges.front().start_time(),
+        _ranges.back().end_time_exclusive());
+}
+
+RationalTime
+TimeRangeSet::duration(double rate) const noexcept
+{
+    double value = 0;
+    for (TimeRange const& range: _ranges)
+    {
+        value += range.duration().value_rescaled_to(rate);
+    }
+    return RationalTime(value, rate);
+}
+
+bool
+TimeRangeSet::contains(RationalTime time) const noexcept
+{
+    double const seconds = time.to_seconds();
+    size_t const i       = _first_ending_after(seconds);
+    return i < _ranges.size() && start_s(_ranges[i]) <= seconds;
+}
+
+bool
+TimeRangeSet::covers(TimeRange range) const noexcept
+{
+    if (range.is_invalid_range())
+    {
+        return false;
+    }
+
+    double const range_start = start_s(range);
+    double const range_end   = end_s(range);
+    size_t const i           = _first_ending_after(range_start);
+    if (i == _ranges.size())
+    {
+        return false;
+    }
+    return start_s(_ranges[i]) - range_start < _epsilon_s
+           && range_end - end_s(_ranges[i]) < _epsilon_s;
+}
+
+bool
+TimeRangeSet::overlaps(TimeRange range) const noexcept
+{
+    if (range.is_invalid_range())
+    {
+        return false;
+    }
+
+    double const range_start = start_s(range);
+    double const range_end   = end_s(range);
+    for (size_t i = _first_ending_after(range_start);
+         i < _ranges.size() && start_s(_ranges[i]) < range_end;
+         ++i)
+    {
+        double const start = std::max(range_start, start_s(_ranges[i]));
+        double const end   = std::min(range_end, end_s(_ranges[i]));
+        if (end - start >= _epsilon_s)
+        {
+            return true;
+        }
+    }
+    return false;
+}
+
+}} // namespace opentime::OPENTIME_VERSION_NS
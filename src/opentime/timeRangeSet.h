@@ -0,0 +1,111 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentime/rationalTime.h"
+#include "opentime/timeRange.h"
+#include "opentime/version.h"
+#include <vector>
+
+namespace opentime { namespace OPENTIME_VERSION_NS {
+
+/// @brief This class represents a set of times as a sorted list of disjoint
+/// time ranges.
+///
+/// Ranges are merged when they overlap or when the gap between them is less
+/// than epsilon_s, and ranges shorter than epsilon_s are dropped, so that
+/// the set agrees with the epsilon comparisons of the TimeRange relations.
+/// Invalid ranges are ignored. Comparisons are done in seconds, so ranges
+/// with different rates can be mixed; the ranges of a result keep the rates
+/// of the times they start and end at.
+class OPENTIME_API_TYPE TimeRangeSet
+{
+public:
+    /// @brief Create an empty set.
+    explicit TimeRangeSet(double epsilon_s = DEFAULT_EPSILON_s) noexcept
+        : _epsilon_s{ epsilon_s }
+    {}
+
+    /// @brief Create a set from the given ranges, in O(n log n).
+    OPENTIME_API explicit TimeRangeSet(
+        std::vector<TimeRange> const& ranges,
+        double                        epsilon_s = DEFAULT_EPSILON_s);
+
+    /// @brief Returns the tolerance used to compare times, in seconds.
+    double epsilon_s() const noexcept { return _epsilon_s; }
+
+    /// @brief Returns the sorted, disjoint ranges of the set.
+    std::vector<TimeRange> const& ranges() const noexcept { return _ranges; }
+
+    /// @brief Returns whether the set is empty.
+    bool empty() const noexcept { return _ranges.empty(); }
+
+    /// @brief Returns the number of disjoint ranges in the set.
+    size_t size() const noexcept { return _ranges.size(); }
+
+    /// @brief Add a range to the set.
+    OPENTIME_API void add(TimeRange range);
+
+    /// @brief Returns the union of this set and the given set.
+    OPENTIME_API TimeRangeSet union_with(TimeRangeSet const& other) const;
+
+    /// @brief Returns the intersection of this set and the given set.
+    OPENTIME_API TimeRangeSet
+    intersection_with(TimeRangeSet const& other) const;
+
+    /// @brief Returns the times of this set that are not in the given set.
+    OPENTIME_API TimeRangeSet difference_with(TimeRangeSet const& other) const;
+
+    /// @brief Returns the part of this set within the given range.
+    OPENTIME_API TimeRangeSet clamped(TimeRange range) const;
+
+    /// @brief Returns the gaps between the ranges of this set.
+    OPENTIME_API TimeRangeSet gaps() const;
+
+    /// @brief Returns the times within the given bounds that are not in
+    /// this set.
+    OPENTIME_API TimeRangeSet gaps(TimeRange bounds) const;
+
+    /// @brief Returns the range from the start of the first range to the end
+    /// of the last range, or an empty range if the set is empty.
+    OPENTIME_API TimeRange bounds() const noexcept;
+
+    /// @brief Returns the total duration of the set at the given rate.
+    OPENTIME_API RationalTime duration(double rate) const noexcept;
+
+    /// @brief Returns whether the set contains the given time, in
+    /// O(log n).
+    OPENTIME_API bool contains(RationalTime time) const noexcept;
+
+    /// @brief Returns whether the given range is entirely within the set, in
+    /// O(log n).
+    OPENTIME_API bool covers(TimeRange range) const noexcept;
+
+    /// @brief Returns whether the given range shares any time with the set,
+    /// in O(log n).
+    OPENTIME_API bool overlaps(TimeRange range) const noexcept;
+
+    /// @brief Returns whether two sets hold the same ranges.
+    friend bool operator==(TimeRangeSet const& lhs, TimeRangeSet const& rhs)
+    {
+        return lhs._ranges == rhs._ranges;
+    }
+
+    /// @brief Returns whether two sets do not hold the same ranges.
+    friend bool operator!=(TimeRangeSet const& lhs, TimeRangeSet const& rhs)
+    {
+        return !(lhs == rhs);
+    }
+
+private:
+    // Index of the first range that ends after the given time, in seconds.
+    size_t _first_ending_after(double seconds) const noexcept;
+
+    void _normalize();
+
+    double                 _epsilon_s;
+    std::vector<TimeRange> _ranges;
+};
+
+}} // namespace opentime::OPENTIME_VERSION_NS
@@ -0,0 +1,335 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentime/timecodeFormatter.h"
+#include "opentime/stringPrintf.h"
+#include <algorithm>
+#include <array>
+#include <ciso646>
+#include <cmath>
+#include <cstdlib>
+
+namespace opentime { namespace OPENTIME_VERSION_NS {
+
+static constexpr std::array<double, 2> dropframe_timecode_rates{ {
+    30000.0 / 1001.0,
+    60000.0 / 1001.0,
+} };
+
+static bool
+is_dropframe_rate(double rate)
+{
+    auto b = dropframe_timecode_rates.begin(),
+         e = dropframe_timecode_rates.end();
+    return std::find(b, e, rate) != e;
+}
+
+// Parse one two character timecode field the way std::stoi() would parse
+// the same substring, without allocating.
+static bool
+parse_field(std::string const& timecode, size_t pos, int* result)
+{
+    if (pos > timecode.size())
+    {
+        return false;
+    }
+
+    char   field[3] = { '\0', '\0', '\0' };
+    size_t length   = std::min<size_t>(2, timecode.size() - pos);
+    std::copy_n(timecode.data() + pos, length, field);
+
+    char* end = nullptr;
+    *result   = static_cast<int>(std::strtol(field, &end, 10));
+    return end != field;
+}
+
+static inline char*
+write_two_digits(char* p, int value)
+{
+    p[0] = static_cast<char>('0' + value / 10);
+    p[1] = static_cast<char>('0' + value % 10);
+    return p + 2;
+}
+
+TimecodeFormatter::TimecodeFormatter(
+    double          rate,
+    IsDropFrameRate drop_frame) noexcept
+    : _rate{ rate }
+    , _drop_frame{ drop_frame }
+    , _format_outcome{ ErrorStatus::OK }
+    , _format_is_dropframe{ false }
+    , _div{ ':' }
+    , _dropframes{ 0 }
+    , _frames_per_24_hours{ 0 }
+    , _frames_per_10_minutes{ 0 }
+    , _frames_per_minute{ 0 }
+    , _nominal_fps{ 0 }
+    , _parse_rate_is_valid{ RationalTime::is_smpte_timecode_rate(rate) }
+    , _parse_rate_is_dropframe{ is_dropframe_rate(rate) }
+    , _parse_dropframes{ 0 }
+    , _parse_nominal_fps{ static_cast<int>(std::ceil(rate)) }
+{
+    if (_parse_rate_is_dropframe)
+    {
+        if ((rate == 29.97) or (rate == 30000 / 1001.0))
+        {
+            _parse_dropframes = 2;
+        }
+        else if ((rate == 59.94) or (rate == 60000 / 1001.0))
+        {
+            _parse_dropframes = 4;
+        }
+    }
+
+    // It is common practice to use truncated or rounded values
+    // like 29.97 instead of exact SMPTE rates like 30000/1001
+    // so as a convenience we will snap the rate to the nearest
+    // SMPTE rate if it is close enough.
+    double nearest_smpte_rate = RationalTime::nearest_smpte_timecode_rate(rate);
+    if (abs(nearest_smpte_rate - rate) > 0.1)
+    {
+        _format_outcome = ErrorStatus::INVALID_TIMECODE_RATE;
+        return;
+    }
+
+    // Let's assume this is the rate instead of the given rate.
+    rate = nearest_smpte_rate;
+
+    bool rate_is_dropframe = is_dropframe_rate(rate);
+    if (drop_frame == IsDropFrameRate::ForceYes and not rate_is_dropframe)
+    {
+        _format_outcome = ErrorStatus::INVALID_RATE_FOR_DROP_FRAME_TIMECODE;
+        return;
+    }
+
+    if (drop_frame != IsDropFrameRate::InferFromRate)
+    {
+        rate_is_dropframe = drop_frame == IsDropFrameRate::ForceYes;
+    }
+
+    // extra math for dropframes stuff
+    if (!rate_is_dropframe)
+    {
+        if (std::round(rate) == 24)
+        {
+            rate = 24.0;
+        }
+    }
+    else
+    {
+        if (rate == 30000 / 1001.0)
+        {
+            _dropframes = 2;
+        }
+        else if (rate == 60000 / 1001.0)
+        {
+            _dropframes = 4;
+        }
+        _div = ';';
+    }
+    _format_is_dropframe = rate_is_dropframe;
+
+    // Number of frames in an hour
+    int frames_per_hour = static_cast<int>(std::round(rate * 60 * 60));
+    // Number of frames in a day - timecode rolls over after 24 hours
+    _frames_per_24_hours = frames_per_hour * 24;
+    // Number of frames per ten minutes
+    _frames_per_10_minutes = static_cast<int>(std::round(rate * 60 * 10));
+    // Number of frames per minute is the round of the framerate * 60 minus
+    // the number of dropped frames
+    _frames_per_minute =
+        static_cast<int>((std::round(rate) * 60) - _dropframes);
+
+    _nominal_fps = static_cast<int>(std::ceil(rate));
+}
+
+size_t
+TimecodeFormatter::format(
+    RationalTime time,
+    char*        buffer,
+    size_t       size,
+    ErrorStatus* error_status) const noexcept
+{
+    if (error_status)
+    {
+        *error_status = ErrorStatus();
+    }
+
+    double frames_in_target_rate = time.value_rescaled_to(_rate);
+
+    if (frames_in_target_rate < 0)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(ErrorStatus::NEGATIVE_VALUE);
+        }
+        return 0;
+    }
+
+    if (_format_outcome != ErrorStatus::OK)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(_format_outcome);
+        }
+        return 0;
+    }
+
+    // If the number of frames is more than 24 hours, roll over clock
+    double value = std::fmod(frames_in_target_rate, _frames_per_24_hours);
+
+    if (_format_is_dropframe)
+    {
+        int ten_minute_chunks =
+            static_cast<int>(std::floor(value / _frames_per_10_minutes));
+        int frames_over_ten_minutes =
+            static_cast<int>(std::fmod(value, _frames_per_10_minutes));
+
+        if (frames_over_ten_minutes > _dropframes)
+        {
+            value += (_dropframes * 9 * ten_minute_chunks)
+                     + _dropframes
+                           * std::floor(
+                               (frames_over_ten_minutes - _dropframes)
+                               / _frames_per_minute);
+        }
+        else
+        {
+            value += _dropframes * 9 * ten_minute_chunks;
+        }
+    }
+
+    // compute the fields
+    int frames        = static_cast<int>(std::fmod(value, _nominal_fps));
+    int seconds_total = static_cast<int>(std::floor(value / _nominal_fps));
+    int seconds       = static_cast<int>(std::fmod(seconds_total, 60));
+    int minutes =
+        static_cast<int>(std::fmod(std::floor(seconds_total / 60), 60));
+    int hours =
+        static_cast<int>(std::floor(std::floor(seconds_total / 60) / 60));
+
+    // The fields are almost always two digits, which are written directly;
+    // anything else goes through snprintf.
+    constexpr size_t length = 11;
+    if (size > length && hours >= 0 && hours < 100 && minutes >= 0
+        && minutes < 100 && seconds >= 0 && seconds < 100 && frames >= 0
+        && frames < 100)
+    {
+        char* p = write_two_digits(buffer, hours);
+        *p++    = ':';
+        p       = write_two_digits(p, minutes);
+        *p++    = ':';
+        p       = write_two_digits(p, seconds);
+        *p++    = _div;
+        p       = write_two_digits(p, frames);
+        *p      = '\0';
+        return length;
+    }
+
+    int written = snprintf(
+        buffer,
+        size,
+        "%02d:%02d:%02d%c%02d",
+        hours,
+        minutes,
+        seconds,
+        _div,
+        frames);
+    return written > 0 ? static_cast<size_t>(written) : 0;
+}
+
+std::string
+TimecodeFormatter::to_timecode(RationalTime time, ErrorStatus* error_status)
+    const
+{
+    char   buffer[buffer_size];
+    size_t length = format(time, buffer, sizeof(buffer), error_status);
+    return std::string(buffer, std::min(length, sizeof(buffer) - 1));
+}
+
+RationalTime
+TimecodeFormatter::from_timecode(
+    std::string const& timecode,
+    ErrorStatus*       error_status) const
+{
+    if (!_parse_rate_is_valid)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus{ ErrorStatus::INVALID_TIMECODE_RATE };
+        }
+        return RationalTime::_invalid_time;
+    }
+
+    bool rate_is_dropframe = _parse_rate_is_dropframe;
+
+    if (timecode.find(';') != std::string::npos)
+    {
+        if (!rate_is_dropframe)
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::INVALID_RATE_FOR_DROP_FRAME_TIMECODE,
+                    string_printf(
+                        "Timecode '%s' indicates drop frame rate due "
+                        "to the ';' frame divider. "
+                        "Passed in rate %g is not a valid drop frame rate.",
+                        timecode.c_str(),
+                        _rate));
+            }
+            return RationalTime::_invalid_time;
+        }
+    }
+    else
+    {
+        rate_is_dropframe = false;
+    }
+
+    int hours, minutes, seconds, frames;
+    if (!parse_field(timecode, 0, &hours) || !parse_field(timecode, 3, &minutes)
+        || !parse_field(timecode, 6, &seconds)
+        || !parse_field(timecode, 9, &frames))
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::INVALID_TIMECODE_STRING,
+                string_printf(
+                    "Input timecode '%s' is an invalid timecode",
+                    timecode.c_str()));
+        }
+        return RationalTime::_invalid_time;
+    }
+
+    if (frames >= _parse_nominal_fps)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::TIMECODE_RATE_MISMATCH,
+                string_printf(
+                    "Frame rate mismatch.  Timecode '%s' has "
+                    "frames beyond %d",
+                    timecode.c_str(),
+                    _parse_nominal_fps - 1));
+        }
+        return RationalTime::_invalid_time;
+    }
+
+    int dropframes = rate_is_dropframe ? _parse_dropframes : 0;
+
+    // to use for drop frame compensation
+    int total_minutes = hours * 60 + minutes;
+
+    // convert to frames
+    const int value =
+        (((total_minutes * 60) + seconds) * _parse_nominal_fps + frames
+         - (dropframes
+            * (total_minutes
+               - static_cast<int>(std::floor(total_minutes / 10)))));
+
+    return RationalTime{ double(value), _rate };
+}
+
+}} // namespace opentime::OPENTIME_VERSION_NS
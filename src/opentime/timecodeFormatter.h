@@ -0,0 +1,99 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentime/errorStatus.h"
+#include "opentime/rationalTime.h"
+#include "opentime/version.h"
+#include <cstddef>
+#include <string>
+
+namespace opentime { namespace OPENTIME_VERSION_NS {
+
+/// @brief This class converts between times and timecode strings for a
+/// single rate and drop frame mode.
+///
+/// The rate validation and drop frame constants are computed once, when the
+/// formatter is constructed, so converting many times with the same
+/// formatter is cheaper than calling RationalTime::to_timecode() and
+/// RationalTime::from_timecode() for each of them. The results are the same
+/// as those functions.
+class OPENTIME_API_TYPE TimecodeFormatter
+{
+public:
+    /// @brief The size of a buffer that can hold any timecode written by
+    /// format(), including the terminating null character.
+    static constexpr size_t buffer_size = 64;
+
+    /// @brief Create a new formatter.
+    ///
+    /// @param rate The timecode rate.
+    /// @param drop_frame Whether to use drop frame timecode.
+    OPENTIME_API explicit TimecodeFormatter(
+        double          rate,
+        IsDropFrameRate drop_frame = IsDropFrameRate::InferFromRate) noexcept;
+
+    /// @brief Returns the timecode rate.
+    double rate() const noexcept { return _rate; }
+
+    /// @brief Returns the drop frame mode.
+    IsDropFrameRate drop_frame() const noexcept { return _drop_frame; }
+
+    /// @brief Write the timecode for a time into a buffer.
+    ///
+    /// As with snprintf(), at most size - 1 characters are written followed
+    /// by a null character, and the length of the complete timecode is
+    /// returned; a buffer of buffer_size characters is always large enough.
+    /// On error nothing is written and zero is returned.
+    ///
+    /// @param time The time to convert.
+    /// @param buffer The output buffer.
+    /// @param size The size of the output buffer.
+    /// @param error_status The return status.
+    OPENTIME_API size_t format(
+        RationalTime time,
+        char*        buffer,
+        size_t       size,
+        ErrorStatus* error_status = nullptr) const noexcept;
+
+    /// @brief Convert a time to timecode (e.g., "HH:MM:SS;FRAME").
+    ///
+    /// @param time The time to convert.
+    /// @param error_status The return status.
+    OPENTIME_API std::string
+    to_timecode(RationalTime time, ErrorStatus* error_status = nullptr) const;
+
+    /// @brief Convert a timecode string ("HH:MM:SS;FRAME") into a time.
+    ///
+    /// The drop frame mode is taken from the timecode string, as with
+    /// RationalTime::from_timecode().
+    ///
+    /// @param timecode The timecode string.
+    /// @param error_status The return status.
+    OPENTIME_API RationalTime from_timecode(
+        std::string const& timecode,
+        ErrorStatus*       error_status = nullptr) const;
+
+private:
+    double          _rate;
+    IsDropFrameRate _drop_frame;
+
+    // Formatting
+    ErrorStatus::Outcome _format_outcome;
+    bool                 _format_is_dropframe;
+    char                 _div;
+    int                  _dropframes;
+    int                  _frames_per_24_hours;
+    int                  _frames_per_10_minutes;
+    int                  _frames_per_minute;
+    int                  _nominal_fps;
+
+    // Parsing
+    bool _parse_rate_is_valid;
+    bool _parse_rate_is_dropframe;
+    int  _parse_dropframes;
+    int  _parse_nominal_fps;
+};
+
+}} // namespace opentime::OPENTIME_VERSION_NS
@@ -234,6 +234,7 @@ const label_to_schema_version_map CORE_VERSION_MAP{
           { "Test", 1 },
           { "TimeEffect", 1 },
           { "Timeline", 1 },
+          { "TimelineDelta", 1 },
           { "Track", 1 },
           { "Transition", 1 },
           { "UnknownSchema", 1 },
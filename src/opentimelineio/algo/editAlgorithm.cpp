@@ -5,12 +5,15 @@
 
 #include "opentimelineio/algo/editAlgorithm.h"
 
+#include "opentimelineio/editJournal.h"
 #include "opentimelineio/effect.h"
 #include "opentimelineio/gap.h"
 #include "opentimelineio/linearTimeWarp.h"
 #include "opentimelineio/track.h"
 #include "opentimelineio/transition.h"
 
+#include <algorithm>
+
 namespace otime = opentime::OPENTIME_VERSION_NS;
 
 using otime::RationalTime;
@@ -66,6 +69,8 @@ overwrite(
     Item*            fill_template,
     ErrorStatus*     error_status)
 {
+    EditJournal::Group group(composition);
+
     const TimeRange    composition_range = composition->trimmed_range();
     const RationalTime start_time        = range.start_time();
     if (start_time >= composition_range.end_time_exclusive())
@@ -289,6 +294,8 @@ insert(
     Item*               fill_template,
     ErrorStatus*        error_status)
 {
+    EditJournal::Group group(composition);
+
     // Check for transitions to remove first.
     if (remove_transitions)
     {
@@ -402,6 +409,8 @@ trim(
     Item*               fill_template,
     ErrorStatus*        error_status)
 {
+    EditJournal::Group group(item);
+
     Composition* composition = item->parent();
     if (!composition)
     {
@@ -486,6 +495,8 @@ slice(
     bool const          remove_transitions,
     ErrorStatus*        error_status)
 {
+    EditJournal::Group group(composition);
+
     auto item = dynamic_retainer_cast<Item>(
         composition->child_at_time(time, error_status));
     if (!item)
@@ -581,6 +592,8 @@ slice(
 void
 slip(Item* item, RationalTime const& delta)
 {
+    EditJournal::Group group(item);
+
     const TimeRange range      = item->trimmed_range();
     RationalTime    start_time = range.start_time();
     start_time += delta;
@@ -613,6 +626,8 @@ slip(Item* item, RationalTime const& delta)
 void
 slide(Item* item, RationalTime const& delta)
 {
+    EditJournal::Group group(item);
+
     Composition* composition = item->parent();
     if (!composition)
     {
@@ -665,6 +680,8 @@ ripple(
     RationalTime const& delta_out,
     ErrorStatus*        error_status)
 {
+    EditJournal::Group group(item);
+
     if (error_status)
         *error_status = ErrorStatus::OK;
 
@@ -714,6 +731,8 @@ roll(
     RationalTime const& delta_out,
     ErrorStatus*        error_status)
 {
+    EditJournal::Group group(item);
+
     Composition* composition = item->parent();
     if (!composition)
     {
@@ -810,6 +829,8 @@ fill(
     ReferencePoint const reference_point,
     ErrorStatus*         error_status)
 {
+    EditJournal::Group group(track);
+
     // Find the gap to replace.
     auto gap = dynamic_retainer_cast<Gap>(
         track->child_at_time(track_time, error_status, true));
@@ -912,6 +933,8 @@ remove(
     Item*               fill_template,
     ErrorStatus*        error_status)
 {
+    EditJournal::Group group(composition);
+
     auto item = dynamic_retainer_cast<Item>(
         composition->child_at_time(time, error_status));
     if (!item)
@@ -932,4 +955,492 @@ remove(
     }
 }
 
+namespace {
+
+void
+apply_operation(
+    EditOperation const& operation,
+    Composition*         composition,
+    ErrorStatus*         error_status)
+{
+    switch (operation.kind)
+    {
+        case EditOperationKind::Overwrite:
+            overwrite(
+                operation.item,
+                composition,
+                operation.range,
+                operation.remove_transitions,
+                operation.fill_template,
+                error_status);
+            break;
+        case EditOperationKind::Insert:
+            insert(
+                operation.item,
+                composition,
+                operation.time,
+                operation.remove_transitions,
+                operation.fill_template,
+                error_status);
+            break;
+        case EditOperationKind::Trim:
+            trim(
+                operation.item,
+                operation.delta_in,
+                operation.delta_out,
+                operation.fill_template,
+                error_status);
+            break;
+        case EditOperationKind::Slice:
+            slice(
+                composition,
+                operation.time,
+                operation.remove_transitions,
+                error_status);
+            break;
+        case EditOperationKind::Slip:
+            slip(operation.item, operation.delta);
+            break;
+        case EditOperationKind::Slide:
+            slide(operation.item, operation.delta);
+            break;
+        case EditOperationKind::Ripple:
+            ripple(
+                operation.item,
+                operation.delta_in,
+                operation.delta_out,
+                error_status);
+            break;
+        case EditOperationKind::Roll:
+            roll(
+                operation.item,
+                operation.delta_in,
+                operation.delta_out,
+                error_status);
+            break;
+        case EditOperationKind::Fill:
+            fill(
+                operation.item,
+                composition,
+                operation.time,
+                operation.reference_point,
+                error_status);
+            break;
+        case EditOperationKind::Remove:
+            remove(
+                composition,
+                operation.time,
+                operation.fill,
+                operation.fill_template,
+                error_status);
+            break;
+    }
+}
+
+inline bool
+is_item_edit(EditOperationKind kind)
+{
+    return kind == EditOperationKind::Trim || kind == EditOperationKind::Slip
+           || kind == EditOperationKind::Slide
+           || kind == EditOperationKind::Ripple
+           || kind == EditOperationKind::Roll;
+}
+
+inline bool
+is_transition(Composable* child)
+{
+    return dynamic_cast<Transition*>(child) != nullptr;
+}
+
+// Count the children that a search of part of a track may not find in the
+// same way as a search of the whole track: nested compositions, which the
+// search recurses into, and items of negative duration and transitions
+// longer than their neighbors, which put the ranges of the children out of
+// order for the binary searches.
+int
+count_irregular(
+    std::vector<SerializableObject::Retainer<Composable>> const& children,
+    int                                                          first,
+    int                                                          last)
+{
+    int count = 0;
+    for (int i = first; i < last; ++i)
+    {
+        Composable* child = children[i];
+        if (auto transition = dynamic_cast<Transition*>(child))
+        {
+            Item* previous =
+                i > 0 ? dynamic_cast<Item*>(children[i - 1].value) : nullptr;
+            Item* next = i + 1 < int(children.size())
+                             ? dynamic_cast<Item*>(children[i + 1].value)
+                             : nullptr;
+            if (!previous || !next
+                || transition->in_offset()
+                       > previous->trimmed_range().duration()
+                || transition->out_offset() > next->trimmed_range().duration())
+            {
+                ++count;
+            }
+        }
+        else if (dynamic_cast<Composition*>(child))
+        {
+            ++count;
+        }
+        else if (auto item = dynamic_cast<Item*>(child))
+        {
+            if (item->trimmed_range().duration().value() < 0)
+            {
+                ++count;
+            }
+        }
+    }
+    return count;
+}
+
+} // namespace
+
+EditSession::EditSession(Track* track)
+    : _track(track)
+    , _window(new Track)
+    , _spacer(new Gap)
+{}
+
+EditSession::~EditSession()
+{}
+
+void
+EditSession::apply(EditOperation const& operation, ErrorStatus* error_status)
+{
+    // Make the operation, with the moves of the children in and out of the
+    // window, one step of the journal of the track.
+    EditJournal::Group group(_track.value);
+
+    if (_track->source_range())
+    {
+        _apply_to_track(operation, error_status);
+        return;
+    }
+
+    if (is_item_edit(operation.kind))
+    {
+        // Item edits only change the item and its neighbors.
+        if (!operation.item || operation.item->parent() != _track.value)
+        {
+            _apply_to_track(operation, error_status);
+            return;
+        }
+        const int index = _track->index_of_child(operation.item);
+        const int first = std::max(index - 2, 0);
+        if (!_extend_starts(first + 1))
+        {
+            _apply_to_track(operation, error_status);
+            return;
+        }
+        _apply_to_window(
+            operation,
+            first,
+            std::min(index + 3, int(_track->children().size())),
+            error_status);
+        return;
+    }
+
+    if (_irregular_count() > 0)
+    {
+        _apply_to_track(operation, error_status);
+        return;
+    }
+
+    switch (operation.kind)
+    {
+        case EditOperationKind::Overwrite:
+            _apply_to_range(
+                operation,
+                operation.range.start_time(),
+                std::max(
+                    operation.range.start_time(),
+                    operation.range.end_time_exclusive()),
+                error_status);
+            break;
+        case EditOperationKind::Insert:
+            _apply_to_range(
+                operation,
+                operation.time,
+                operation.time + RationalTime(1.0, operation.time.rate()),
+                error_status);
+            break;
+        case EditOperationKind::Fill: {
+            const RationalTime duration =
+                operation.item->trimmed_range().duration();
+            _apply_to_range(
+                operation,
+                operation.time,
+                std::max(operation.time, operation.time + duration),
+                error_status);
+            break;
+        }
+        default:
+            _apply_to_range(
+                operation,
+                operation.time,
+                operation.time,
+                error_status);
+            break;
+    }
+}
+
+void
+EditSession::apply(
+    std::vector<EditOperation> const& operations,
+    ErrorStatus*                      error_status)
+{
+    for (const auto& operation: operations)
+    {
+        apply(operation, error_status);
+        if (is_error(error_status))
+        {
+            return;
+        }
+    }
+}
+
+void
+EditSession::reset()
+{
+    _starts.clear();
+    _irregular = -1;
+}
+
+bool
+EditSession::_extend_starts(size_t count)
+{
+    // The start times are added up in the same way as
+    // Track::range_of_all_children(), so that they are exactly the same.
+    auto const& children = _track->children();
+    if (_starts.empty())
+    {
+        double rate = 1;
+        if (!children.empty())
+        {
+            if (auto transition = dynamic_retainer_cast<Transition>(
+                    children.front()))
+            {
+                rate = transition->in_offset().rate();
+            }
+            else if (auto item = dynamic_retainer_cast<Item>(children.front()))
+            {
+                ErrorStatus error_status;
+                rate = item->trimmed_range(&error_status).duration().rate();
+                if (is_error(error_status))
+                {
+                    return false;
+                }
+            }
+        }
+        _starts.push_back(RationalTime(0, rate));
+    }
+
+    while (_starts.size() < count && _starts.size() <= children.size())
+    {
+        const size_t       index = _starts.size() - 1;
+        const RationalTime start = _starts.back();
+        if (auto item = dynamic_retainer_cast<Item>(children[index]))
+        {
+            ErrorStatus        error_status;
+            const RationalTime end =
+                TimeRange(start, item->trimmed_range(&error_status).duration())
+                    .end_time_exclusive();
+            if (is_error(error_status))
+            {
+                return false;
+            }
+            _starts.push_back(end);
+        }
+        else
+        {
+            _starts.push_back(start);
+        }
+    }
+    return true;
+}
+
+bool
+EditSession::_extend_starts_past(RationalTime const& time)
+{
+    const size_t size = _track->children().size() + 1;
+    if (!_extend_starts(1))
+    {
+        return false;
+    }
+    while (_starts.size() < size && !(time < _starts.back()))
+    {
+        if (!_extend_starts(_starts.size() + 1))
+        {
+            return false;
+        }
+    }
+
+    // Also find the neighbors after the time.
+    return _extend_starts(_starts.size() + 3);
+}
+
+void
+EditSession::_truncate_starts(size_t count)
+{
+    if (_starts.size() > count)
+    {
+        _starts.resize(count);
+    }
+}
+
+int
+EditSession::_irregular_count()
+{
+    if (_irregular < 0)
+    {
+        _irregular = count_irregular(
+            _track->children(),
+            0,
+            int(_track->children().size()));
+    }
+    return _irregular;
+}
+
+void
+EditSession::_apply_to_track(
+    EditOperation const& operation,
+    ErrorStatus*         error_status)
+{
+    apply_operation(operation, _track, error_status);
+    reset();
+}
+
+void
+EditSession::_apply_to_range(
+    EditOperation const& operation,
+    RationalTime const&  start_time,
+    RationalTime const&  end_time,
+    ErrorStatus*         error_status)
+{
+    if (!_extend_starts_past(end_time))
+    {
+        _apply_to_track(operation, error_status);
+        return;
+    }
+
+    const int size = int(_track->children().size());
+
+    // The first child that ends at or after the start time, and the first
+    // child that starts after the end time.
+    const int first = int(
+        std::lower_bound(_starts.begin() + 1, _starts.end(), start_time)
+        - (_starts.begin() + 1));
+    const int last = int(
+        std::upper_bound(
+            _starts.begin(),
+            _starts.begin() + std::min(int(_starts.size()), size),
+            end_time)
+        - _starts.begin());
+
+    // Keep a couple of neighbors on either side, for the edits that look
+    // at the neighbors of the items they change.
+    _apply_to_window(
+        operation,
+        std::max(first - 2, 0),
+        std::min(last + 2, size),
+        error_status);
+}
+
+void
+EditSession::_apply_to_window(
+    EditOperation const& operation,
+    int                  first,
+    int                  last,
+    ErrorStatus*         error_status)
+{
+    auto const& children = _track->children();
+    const int   size     = int(children.size());
+
+    // Transitions overlap their neighbors, so don't split the track next to
+    // one. A transition at the start of the track also changes its range.
+    if (size > 0 && is_transition(children.front()))
+    {
+        first = 0;
+    }
+    while (first > 0
+           && (is_transition(children[first])
+               || is_transition(children[first - 1])))
+    {
+        --first;
+    }
+    while (last < size && last > 0
+           && (is_transition(children[last - 1])
+               || is_transition(children[last])))
+    {
+        ++last;
+    }
+
+    // Move the children to a track of their own, after a gap that takes the
+    // place of the children before them, so that they keep their times.
+    // Placeholders keep their places in the track meanwhile.
+    const int count = last - first;
+    while (int(_placeholders.size()) < count)
+    {
+        _placeholders.push_back(new Gap);
+    }
+    if (_irregular >= 0)
+    {
+        _irregular -= count_irregular(children, first, last);
+    }
+    // The moves are recorded too, so that undoing them finds each child
+    // where it was moved to.
+    EditJournal::_attach(_window, EditJournal::journal_of(_track));
+    if (first > 0)
+    {
+        const RationalTime start = _starts[first];
+        _spacer->set_source_range(
+            TimeRange(RationalTime(0, start.rate()), start));
+        _window->append_child(_spacer);
+    }
+    for (int i = 0; i < count; ++i)
+    {
+        SerializableObject::Retainer<Composable> child = children[first + i];
+        _track->set_child(first + i, _placeholders[i]);
+        _window->append_child(child);
+    }
+
+    apply_operation(operation, _window, error_status);
+    if (error_status && error_status->object_details == _window.value)
+    {
+        error_status->object_details = _track;
+    }
+
+    // Move the children back.
+    std::vector<SerializableObject::Retainer<Composable>> edited(
+        _window->children().begin() + (first > 0 ? 1 : 0),
+        _window->children().end());
+    _window->clear_children();
+    EditJournal::_attach(_window, nullptr);
+    const int edited_count = int(edited.size());
+    for (int i = 0; i < std::min(count, edited_count); ++i)
+    {
+        _track->set_child(first + i, edited[i]);
+    }
+    for (int i = count; i < edited_count; ++i)
+    {
+        _track->insert_child(first + i, edited[i]);
+    }
+    for (int i = edited_count; i < count; ++i)
+    {
+        _track->remove_child(first + edited_count);
+    }
+    if (_irregular >= 0)
+    {
+        _irregular +=
+            count_irregular(children, first, first + edited_count);
+    }
+
+    // The children before the window kept their start times.
+    _truncate_starts(first > 0 ? first + 1 : 0);
+}
+
 }}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS::algo
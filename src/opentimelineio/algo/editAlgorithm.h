@@ -4,6 +4,9 @@
 #pragma once
 
 #include "opentimelineio/composition.h"
+#include "opentimelineio/track.h"
+
+#include <vector>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 namespace algo {
@@ -215,4 +218,131 @@ OTIO_API void remove(
     Item*               fill_template = nullptr,
     ErrorStatus*        error_status  = nullptr);
 
+//! Enum used by EditOperation to select the edit to apply.
+enum class EditOperationKind
+{
+    Overwrite,
+    Insert,
+    Trim,
+    Slice,
+    Slip,
+    Slide,
+    Ripple,
+    Roll,
+    Fill,
+    Remove
+};
+
+// An edit to apply to the track of an EditSession.
+//
+// Each kind of edit takes the arguments of the function of the same name,
+// with the track of the session as the composition or track:
+//
+//   Overwrite = item, range, remove_transitions, fill_template
+//      Insert = item, time, remove_transitions, fill_template
+//        Trim = item, delta_in, delta_out, fill_template
+//       Slice = time, remove_transitions
+//        Slip = item, delta
+//       Slide = item, delta
+//      Ripple = item, delta_in, delta_out
+//        Roll = item, delta_in, delta_out
+//        Fill = item, time, reference_point
+//      Remove = time, fill, fill_template
+//
+// The other fields are ignored.
+struct EditOperation
+{
+    EditOperationKind                  kind = EditOperationKind::Overwrite;
+    SerializableObject::Retainer<Item> item;
+    TimeRange                          range;
+    RationalTime                       time;
+    RationalTime                       delta;
+    RationalTime                       delta_in;
+    RationalTime                       delta_out;
+    bool                               remove_transitions = true;
+    bool                               fill               = true;
+    SerializableObject::Retainer<Item> fill_template;
+    ReferencePoint reference_point = ReferencePoint::Source;
+};
+
+// Apply many edits to a track.
+//
+// Each of the edit functions above searches the whole track for the items
+// it changes, so applying a long list of edits one at a time, such as the
+// events of an EDL, costs O(edits * items). A session keeps the start times
+// of the children of its track between edits, finds the children that an
+// edit touches with a binary search, and applies the edit to just those
+// children. The start times after an edit are only worked out again as far
+// as the next edit needs them, so edits made in time order (or in reverse)
+// cost O(log items) each, apart from moving the children of the track
+// along when an edit adds or removes some.
+//
+// The result is the same as calling the edit functions one at a time.
+// Edits that cannot be narrowed down to part of the track are applied to
+// the whole track: edits of a track with a source range, edits of items in
+// nested compositions, and edits at a time of a track that contains nested
+// compositions, items of negative duration, or transitions longer than the
+// items next to them.
+//
+// The track must only be edited through the session while it is in use;
+// call reset() after editing it in any other way, including undoing or
+// redoing edits with an EditJournal. Each edit is one step of the journal.
+class OTIO_API_TYPE EditSession
+{
+public:
+    OTIO_API explicit EditSession(Track* track);
+
+    OTIO_API ~EditSession();
+
+    EditSession(EditSession const&)            = delete;
+    EditSession& operator=(EditSession const&) = delete;
+
+    // Return the track.
+    Track* track() const noexcept { return _track; }
+
+    // Apply an edit.
+    OTIO_API void
+    apply(EditOperation const& operation, ErrorStatus* error_status = nullptr);
+
+    // Apply edits in order, stopping at the first one that fails.
+    OTIO_API void apply(
+        std::vector<EditOperation> const& operations,
+        ErrorStatus*                      error_status = nullptr);
+
+    // Forget the start times of the children of the track, after the track
+    // was edited outside of the session.
+    OTIO_API void reset();
+
+private:
+    bool _extend_starts(size_t count);
+    bool _extend_starts_past(RationalTime const& time);
+    void _truncate_starts(size_t count);
+    int  _irregular_count();
+
+    void _apply_to_track(EditOperation const& operation, ErrorStatus*);
+    void _apply_to_range(
+        EditOperation const& operation,
+        RationalTime const&  start_time,
+        RationalTime const&  end_time,
+        ErrorStatus*         error_status);
+    void _apply_to_window(
+        EditOperation const& operation,
+        int                  first,
+        int                  last,
+        ErrorStatus*         error_status);
+
+    SerializableObject::Retainer<Track>             _track;
+    SerializableObject::Retainer<Track>             _window;
+    SerializableObject::Retainer<Item>              _spacer;
+    std::vector<SerializableObject::Retainer<Item>> _placeholders;
+
+    // The start time of each child of the track, and the end time of the
+    // last one, as far as they have been worked out.
+    std::vector<RationalTime> _starts;
+
+    // The number of nested compositions and items of negative duration in
+    // the track, or -1 if they have not been counted.
+    int _irregular = -1;
+};
+
 }}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS::algo
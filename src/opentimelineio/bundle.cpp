@@ -15,8 +15,22 @@
 #include <mz_zip_rw.h>
 
 #include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <deque>
 #include <filesystem>
 #include <fstream>
+#include <mutex>
+#include <thread>
+
+#if defined(__linux__)
+#include <fcntl.h>
+#include <linux/fs.h>
+#include <sys/ioctl.h>
+#include <unistd.h>
+#elif defined(__APPLE__)
+#include <sys/clonefile.h>
+#endif
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 namespace bundle {
@@ -25,6 +39,7 @@ namespace bundle {
     // - URL parsing utilities (percent_decode, starts_with, to_lower, file_from_url)
     // - BundleFile and bundle file processing
     // - ZipWriter and ZipReader
+    // - Concurrent media writing (parallel_for, WriteProgress, MediaReader)
     // - Public API (dry_run, write_otioz, read_otioz, write_otiod, read_otiod)
 
     namespace {
@@ -422,6 +437,47 @@ namespace bundle {
                         "cannot add '" + path + "' to zip '" + _path + "'");
             }
 
+            // Add a file uncompressed, with the data given in chunks by
+            // read(chunk), which returns false at the end of the file.
+            template<typename Read>
+            void add_chunks_uncompressed(
+                std::string const& name,
+                std::string const& path,
+                uint64_t           size,
+                Read&&             read)
+            {
+                mz_zip_file file_info = {};
+                file_info.filename = name.c_str();
+                file_info.version_madeby = MZ_VERSION_MADEBY;
+                file_info.compression_method = MZ_COMPRESS_METHOD_STORE;
+                file_info.flag = MZ_ZIP_FLAG_UTF8;
+                file_info.uncompressed_size = static_cast<int64_t>(size);
+                mz_os_get_file_date(
+                    path.c_str(),
+                    &file_info.modified_date,
+                    &file_info.accessed_date,
+                    &file_info.creation_date);
+
+                if (mz_zip_writer_entry_open(_writer, &file_info) != MZ_OK)
+                    throw std::runtime_error(
+                        "cannot add '" + path + "' to zip '" + _path + "'");
+                std::vector<char> chunk;
+                while (read(chunk))
+                {
+                    if (mz_zip_writer_entry_write(
+                            _writer,
+                            chunk.data(),
+                            static_cast<int32_t>(chunk.size())) !=
+                        static_cast<int32_t>(chunk.size()))
+                        throw std::runtime_error(
+                            "cannot write '" + path + "' to zip '" + _path +
+                            "'");
+                }
+                if (mz_zip_writer_entry_close(_writer) != MZ_OK)
+                    throw std::runtime_error(
+                        "cannot add '" + path + "' to zip '" + _path + "'");
+            }
+
             void finalize()
             {
                 if (_finalized) return;
@@ -530,6 +586,17 @@ namespace bundle {
                 }
             }
 
+            // Get the information for the entry the cursor is currently on. Call
+            // only from within a for_each_entry callback.
+            mz_zip_file const& current_info()
+            {
+                mz_zip_file* info = nullptr;
+                if (mz_zip_reader_entry_get_info(_reader, &info) != MZ_OK || !info)
+                    throw std::runtime_error(
+                        "cannot stat zip entry in '" + _path + "'");
+                return *info;
+            }
+
             // Save the entry the cursor is currently on to a file. Call only from
             // within a for_each_entry callback.
             void extract_current_to_file(std::string const& path)
@@ -544,6 +611,336 @@ namespace bundle {
             void* _reader = nullptr;
         };
     
+        // Run task(0) ... task(count - 1) on up to num_threads threads,
+        // including the calling thread. Once a task throws no more tasks
+        // are started, and the first exception is rethrown on the calling
+        // thread.
+        void parallel_for(
+            size_t                             count,
+            int                                num_threads,
+            std::function<void(size_t)> const& task)
+        {
+            std::atomic<size_t> next{ 0 };
+            std::mutex          mutex;
+            std::exception_ptr  error;
+            auto worker = [&]()
+            {
+                for (size_t i = next++; i < count; i = next++)
+                {
+                    try
+                    {
+                        task(i);
+                    }
+                    catch (...)
+                    {
+                        std::lock_guard<std::mutex> lock(mutex);
+                        if (!error)
+                            error = std::current_exception();
+                        next = count;
+                    }
+                }
+            };
+
+            std::vector<std::thread> threads;
+            size_t const extra_threads =
+                std::min(count, static_cast<size_t>(std::max(num_threads, 1))) - 1;
+            for (size_t i = 0; i < extra_threads; ++i)
+            {
+                threads.emplace_back(worker);
+            }
+            worker();
+            for (auto& t : threads)
+            {
+                t.join();
+            }
+            if (error)
+                std::rethrow_exception(error);
+        }
+
+        // This class counts the media files written to a bundle and reports
+        // them to the progress callback, one call at a time.
+        class WriteProgress
+        {
+        public:
+            WriteProgress(
+                WriteOptions const&         options,
+                std::vector<uint64_t> const& sizes) :
+                _callback(options.progress_callback),
+                _files_total(sizes.size())
+            {
+                for (auto size : sizes)
+                    _bytes_total += size;
+            }
+
+            void file_written(uint64_t size)
+            {
+                std::lock_guard<std::mutex> lock(_mutex);
+                ++_files_written;
+                _bytes_written += size;
+                if (_callback)
+                    _callback(
+                        _files_written,
+                        _files_total,
+                        _bytes_written,
+                        _bytes_total);
+            }
+
+        private:
+            WriteProgressCallback const& _callback;
+            std::mutex                   _mutex;
+            size_t                       _files_written = 0;
+            size_t const                 _files_total;
+            uint64_t                     _bytes_written = 0;
+            uint64_t                     _bytes_total   = 0;
+        };
+
+        // Get the sizes of the media files. Files that cannot be read are
+        // given a size of zero, and are reported when they are written.
+        std::vector<uint64_t> media_file_sizes(std::vector<BundleFile> const& files)
+        {
+            std::vector<uint64_t> out;
+            out.reserve(files.size());
+            for (auto const& f : files)
+            {
+                std::error_code ec;
+                auto const size = std::filesystem::file_size(
+                    std::filesystem::u8path(f.source_path),
+                    ec);
+                out.push_back(ec ? 0 : static_cast<uint64_t>(size));
+            }
+            return out;
+        }
+
+        // Try to make a copy-on-write clone of a file. Returns false if the
+        // platform or the filesystem does not support it.
+        bool reflink_file(
+            std::filesystem::path const& source,
+            std::filesystem::path const& target)
+        {
+#if defined(__linux__) && defined(FICLONE)
+            int const in = ::open(source.c_str(), O_RDONLY | O_CLOEXEC);
+            if (in < 0)
+                return false;
+            int const out = ::open(
+                target.c_str(),
+                O_WRONLY | O_CREAT | O_EXCL | O_CLOEXEC,
+                0666);
+            if (out < 0)
+            {
+                ::close(in);
+                return false;
+            }
+            bool const ok = ::ioctl(out, FICLONE, in) == 0;
+            ::close(out);
+            ::close(in);
+            std::error_code ec;
+            if (ok)
+                std::filesystem::permissions(
+                    target,
+                    std::filesystem::status(source).permissions(),
+                    ec);
+            else
+                std::filesystem::remove(target, ec);
+            return ok;
+#elif defined(__APPLE__)
+            return ::clonefile(source.c_str(), target.c_str(), 0) == 0;
+#else
+            return false;
+#endif
+        }
+
+        // Place a media file in an otiod bundle according to the policy,
+        // falling back to a copy.
+        void place_media_file(
+            std::filesystem::path const& source,
+            std::filesystem::path const& target,
+            MediaCopyPolicy              policy)
+        {
+            switch (policy)
+            {
+            case MediaCopyPolicy::hardlink_if_possible:
+            {
+                std::error_code ec;
+                std::filesystem::create_hard_link(source, target, ec);
+                if (!ec)
+                    return;
+                break;
+            }
+            case MediaCopyPolicy::reflink_if_possible:
+                if (reflink_file(source, target))
+                    return;
+                break;
+            default: break;
+            }
+            std::filesystem::copy_file(source, target);
+        }
+
+        // This class reads media files ahead of the zip writer. The files
+        // are read in order by a pool of threads, each reading one file at a
+        // time in chunks. The chunks that have been read but not yet written
+        // are limited, except for those of the file being written, which is
+        // always allowed a couple of chunks so that the writer can progress.
+        class MediaReader
+        {
+        public:
+            static size_t constexpr chunk_size = 4 * 1024 * 1024;
+
+            MediaReader(std::vector<BundleFile> const& files, int num_threads) :
+                _files(files),
+                _slots(files.size()),
+                _max_buffered(
+                    static_cast<size_t>(std::max(num_threads, 1)) * 4 * chunk_size)
+            {
+                for (int i = 0; i < num_threads; ++i)
+                {
+                    _threads.emplace_back([this] { _run(); });
+                }
+            }
+
+            ~MediaReader()
+            {
+                {
+                    std::lock_guard<std::mutex> lock(_mutex);
+                    _stop = true;
+                }
+                _cv.notify_all();
+                for (auto& t : _threads)
+                {
+                    t.join();
+                }
+            }
+
+            MediaReader(MediaReader const&) = delete;
+            MediaReader& operator=(MediaReader const&) = delete;
+
+            // Get the next chunk of the file, which must be the file after
+            // the last one finished. Returns false at the end of the file,
+            // and throws if the file could not be read.
+            bool next_chunk(size_t index, std::vector<char>& chunk)
+            {
+                std::unique_lock<std::mutex> lock(_mutex);
+                _writing = index;
+                _cv.notify_all();
+                auto& slot = _slots[index];
+                _cv.wait(lock, [&] { return !slot.chunks.empty() || slot.done; });
+                if (!slot.chunks.empty())
+                {
+                    chunk = std::move(slot.chunks.front());
+                    slot.chunks.pop_front();
+                    _buffered -= chunk.size();
+                    _cv.notify_all();
+                    return true;
+                }
+                if (slot.error)
+                    std::rethrow_exception(slot.error);
+                return false;
+            }
+
+        private:
+            struct Slot
+            {
+                std::deque<std::vector<char>> chunks;
+                bool                          done = false;
+                std::exception_ptr            error;
+            };
+
+            void _run()
+            {
+                while (true)
+                {
+                    size_t index = 0;
+                    {
+                        std::lock_guard<std::mutex> lock(_mutex);
+                        if (_stop || _next >= _files.size())
+                            return;
+                        index = _next++;
+                    }
+                    auto&              slot  = _slots[index];
+                    std::exception_ptr error;
+                    try
+                    {
+                        _read(index, slot);
+                    }
+                    catch (...)
+                    {
+                        error = std::current_exception();
+                    }
+                    {
+                        std::lock_guard<std::mutex> lock(_mutex);
+                        slot.done  = true;
+                        slot.error = error;
+                    }
+                    _cv.notify_all();
+                }
+            }
+
+            void _read(size_t index, Slot& slot)
+            {
+                auto const& path = _files[index].source_path;
+                std::ifstream in(std::filesystem::u8path(path), std::ios::binary);
+                if (!in)
+                    throw std::runtime_error("cannot read '" + path + "'");
+                while (true)
+                {
+                    std::vector<char> chunk(chunk_size);
+                    in.read(chunk.data(), chunk.size());
+                    chunk.resize(static_cast<size_t>(in.gcount()));
+                    if (in.bad())
+                        throw std::runtime_error("cannot read '" + path + "'");
+                    if (chunk.empty())
+                        return;
+
+                    std::unique_lock<std::mutex> lock(_mutex);
+                    _cv.wait(lock, [&] {
+                        return _stop ||
+                               (index == _writing ? slot.chunks.size() < 2
+                                                  : _buffered < _max_buffered);
+                    });
+                    if (_stop)
+                        return;
+                    _buffered += chunk.size();
+                    slot.chunks.push_back(std::move(chunk));
+                    lock.unlock();
+                    _cv.notify_all();
+                    if (in.eof())
+                        return;
+                }
+            }
+
+            std::vector<BundleFile> const& _files;
+            std::vector<Slot>              _slots;
+            size_t const                   _max_buffered;
+            std::mutex                     _mutex;
+            std::condition_variable        _cv;
+            size_t                         _next     = 0;
+            size_t                         _writing  = 0;
+            size_t                         _buffered = 0;
+            bool                           _stop     = false;
+            std::vector<std::thread>       _threads;
+        };
+
+        // Get the offset of an entry's data from its local header, which
+        // starts at header_offset. The local header has its own file name
+        // and extra field, which may differ from those in the zip directory.
+        uint64_t entry_data_offset(
+            std::ifstream&     in,
+            int64_t            header_offset,
+            std::string const& name)
+        {
+            unsigned char header[30];
+            in.seekg(header_offset);
+            in.read(reinterpret_cast<char*>(header), sizeof(header));
+            if (!in ||
+                header[0] != 'P' || header[1] != 'K' ||
+                header[2] != 3 || header[3] != 4)
+                throw std::runtime_error(
+                    "cannot read the local header of zip entry '" + name + "'");
+            uint64_t const name_size  = header[26] | (header[27] << 8);
+            uint64_t const extra_size = header[28] | (header[29] << 8);
+            return static_cast<uint64_t>(header_offset) + sizeof(header) +
+                   name_size + extra_size;
+        }
+
         // Validate that an extraction path is contained within the destination
         // directory. Protects against zip slip vulnerabilities where archive
         // entries contain ".." or absolute paths.
@@ -692,12 +1089,39 @@ namespace bundle {
         // Write the bundle
         try
         {
+            std::vector<BundleFile> const media(files.begin(), files.end());
+            auto const    sizes = media_file_sizes(media);
+            WriteProgress progress(options, sizes);
+
             ZipWriter zw(path);
             zw.add_text(version_file, version);
             zw.add_text(timeline_file, json);
-            for (const auto& i : files)
+            if (options.num_threads > 1 && media.size() > 1)
+            {
+                // Read the media ahead while it is written to the zip
+                MediaReader reader(media, options.num_threads - 1);
+                for (size_t i = 0; i < media.size(); ++i)
+                {
+                    zw.add_chunks_uncompressed(
+                        media[i].archive_name,
+                        media[i].source_path,
+                        sizes[i],
+                        [&](std::vector<char>& chunk)
+                        {
+                            return reader.next_chunk(i, chunk);
+                        });
+                    progress.file_written(sizes[i]);
+                }
+            }
+            else
             {
-                zw.add_file_uncompressed(i.archive_name, i.source_path);
+                for (size_t i = 0; i < media.size(); ++i)
+                {
+                    zw.add_file_uncompressed(
+                        media[i].archive_name,
+                        media[i].source_path);
+                    progress.file_written(sizes[i]);
+                }
             }
             zw.finalize();
         }
@@ -821,6 +1245,57 @@ namespace bundle {
         return result;
     }
 
+    std::vector<MediaEntry> otioz_media_entries(
+        std::string const& path,
+        ErrorStatus*       error_status)
+    {
+        // Validate the path
+        auto const input_path = std::filesystem::u8path(path);
+        if (!std::filesystem::is_regular_file(input_path))
+        {
+            if (error_status)
+                *error_status = ErrorStatus(
+                    ErrorStatus::FILE_OPEN_FAILED,
+                    "input '" + path  + "' is not a file");
+            return {};
+        }
+
+        // Find the media entries
+        std::vector<MediaEntry> out;
+        try
+        {
+            ZipReader zr(path);
+            std::ifstream in(input_path, std::ios::binary);
+            if (!in)
+                throw std::runtime_error("cannot open '" + path + "'");
+            std::string const media_prefix = std::string(media_dir) + "/";
+            zr.for_each_entry([&](std::string const& filename, bool is_dir)
+            {
+                if (is_dir || filename.compare(0, media_prefix.size(), media_prefix) != 0)
+                    return;
+
+                auto const& info = zr.current_info();
+                if (info.compression_method != MZ_COMPRESS_METHOD_STORE ||
+                    (info.flag & MZ_ZIP_FLAG_ENCRYPTED))
+                    throw std::runtime_error(
+                        "media file '" + filename + "' is not stored uncompressed");
+                out.push_back({
+                    filename,
+                    entry_data_offset(in, info.disk_offset, filename),
+                    static_cast<uint64_t>(info.uncompressed_size) });
+            });
+        }
+        catch (const std::exception& e)
+        {
+            if (error_status)
+                *error_status = ErrorStatus(
+                    ErrorStatus::FILE_OPEN_FAILED,
+                    "error reading '" + path + "': " + e.what());
+            return {};
+        }
+        return out;
+    }
+
     bool write_otiod(
         Timeline const*     timeline,
         std::string const&  path,
@@ -873,12 +1348,17 @@ namespace bundle {
             }
             
             // Copy the media files
-            for (const auto& i : files)
+            std::vector<BundleFile> const media(files.begin(), files.end());
+            auto const    sizes = media_file_sizes(media);
+            WriteProgress progress(options, sizes);
+            parallel_for(media.size(), options.num_threads, [&](size_t i)
             {
-                std::filesystem::copy_file(
-                    i.source_path,
-                    output_path / std::filesystem::u8path(i.archive_name));
-            }
+                place_media_file(
+                    std::filesystem::u8path(media[i].source_path),
+                    output_path / std::filesystem::u8path(media[i].archive_name),
+                    options.copy_policy);
+                progress.file_written(sizes[i]);
+            });
         }
         catch (const std::exception& e)
         {
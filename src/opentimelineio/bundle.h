@@ -5,6 +5,8 @@
 
 #include "opentimelineio/timeline.h"
 
+#include <functional>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
 /// @brief Utilities for working with OTIO bundles (otioz and otiod)
@@ -36,6 +38,32 @@ namespace bundle {
         all_missing
     };
 
+    /// @brief This enumeration provides how media files are placed in otiod
+    /// bundles.
+    ///
+    /// Links are only made when the filesystem supports them, which for both
+    /// kinds of link requires that the media and the bundle are on the same
+    /// filesystem. Otherwise the media is copied. Note that a hard link shares
+    /// the file with the original media, so changes to one are seen in the
+    /// other; a reflink is a copy-on-write clone of the media.
+    enum MediaCopyPolicy
+    {
+        copy_files,
+        hardlink_if_possible,
+        reflink_if_possible
+    };
+
+    /// @brief Callback for the progress of writing a bundle.
+    ///
+    /// The arguments are the number of media files written, the total number
+    /// of media files, the number of media bytes written, and the total number
+    /// of media bytes.
+    using WriteProgressCallback = std::function<void(
+        size_t   files_written,
+        size_t   files_total,
+        uint64_t bytes_written,
+        uint64_t bytes_total)>;
+
     /// @brief Get a file from a URL.
     std::optional<std::string> file_from_url(std::string const& url);
 
@@ -52,6 +80,23 @@ namespace bundle {
         
         /// @brief Number of spaces for JSON indentation.
         int indent = 4;
+
+        /// @brief Maximum number of threads used to write the media files.
+        ///
+        /// For otiod bundles the media files are copied concurrently. For
+        /// otioz bundles the media files are read ahead concurrently, while
+        /// the calling thread writes them to the zip file.
+        int num_threads = 1;
+
+        /// @brief How media files are placed in otiod bundles.
+        MediaCopyPolicy copy_policy = MediaCopyPolicy::copy_files;
+
+        /// @brief Called after each media file is written to the bundle.
+        ///
+        /// Calls are never concurrent, but they may be made from the threads
+        /// that write the media. If the callback throws an exception, writing
+        /// stops and the error is reported.
+        WriteProgressCallback progress_callback;
     };
 
     /// @brief Options for reading bundles.
@@ -93,6 +138,32 @@ namespace bundle {
         ReadOptions const& options      = ReadOptions(),
         ErrorStatus*       error_status = nullptr);
 
+    /// @brief The location of a media file in an otioz bundle.
+    ///
+    /// Media files are stored uncompressed, so the contents of a media file
+    /// are the size bytes at the offset in the otioz file.
+    struct OTIO_API_TYPE MediaEntry
+    {
+        /// @brief The name of the media file in the bundle, as used by the
+        /// media references (for example "media/video.mov").
+        std::string name;
+
+        /// @brief Byte offset of the media file contents in the otioz file.
+        uint64_t offset = 0;
+
+        /// @brief Size of the media file in bytes.
+        uint64_t size = 0;
+    };
+
+    /// @brief Get the locations of the media files in an otioz bundle.
+    ///
+    /// Only the zip directory is read, so that the media files can then be
+    /// read or memory mapped directly from the otioz file, without extracting
+    /// them. It is an error for a media file to be compressed or encrypted.
+    OTIO_API std::vector<MediaEntry> otioz_media_entries(
+        std::string const& path,
+        ErrorStatus*       error_status = nullptr);
+
     /// @brief Write a timeline and it's referenced media to an otiod bundle.
     OTIO_API bool write_otiod(
         Timeline const*     timeline,
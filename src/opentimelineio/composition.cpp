@@ -3,6 +3,7 @@
 
 #include "opentimelineio/composition.h"
 #include "opentimelineio/clip.h"
+#include "opentimelineio/editJournal.h"
 #include "opentimelineio/vectorIndexing.h"
 
 #include <assert.h>
@@ -42,6 +43,11 @@ Composition::composition_kind() const
 void
 Composition::clear_children()
 {
+    if (!_children.empty())
+    {
+        EditJournal::_children_setting(this, {});
+    }
+
     for (Composable* child: _children)
     {
         child->_set_parent(nullptr);
@@ -68,6 +74,8 @@ Composition::set_children(
         }
     }
 
+    EditJournal::_children_setting(this, children);
+
     for (auto child: children)
     {
         child->_set_parent(this);
@@ -98,14 +106,17 @@ Composition::insert_child(
     index = adjusted_vector_index(index, _children);
     if (index >= int(_children.size()))
     {
+        index = int(_children.size());
         _children.emplace_back(child);
     }
     else
     {
-        _children.insert(_children.begin() + std::max(index, 0), child);
+        index = std::max(index, 0);
+        _children.insert(_children.begin() + index, child);
     }
 
     _child_set.insert(child);
+    EditJournal::_child_inserted(this, index);
     return true;
 }
 
@@ -133,6 +144,7 @@ Composition::set_child(int index, Composable* child, ErrorStatus* error_status)
             return false;
         }
 
+        EditJournal::_child_setting(this, index, child);
         _children[index]->_set_parent(nullptr);
         _child_set.erase(_children[index]);
         child->_set_parent(this);
@@ -155,20 +167,12 @@ Composition::remove_child(int index, ErrorStatus* error_status)
     }
 
     index = adjusted_vector_index(index, _children);
+    index = std::min(std::max(index, 0), int(_children.size()) - 1);
 
+    EditJournal::_child_removing(this, index);
     _child_set.erase(_children[index]);
-
-    if (size_t(index) >= _children.size())
-    {
-        _children.back()->_set_parent(nullptr);
-        _children.pop_back();
-    }
-    else
-    {
-        index = std::max(index, 0);
-        _children[index]->_set_parent(nullptr);
-        _children.erase(_children.begin() + index);
-    }
+    _children[index]->_set_parent(nullptr);
+    _children.erase(_children.begin() + index);
 
     return true;
 }
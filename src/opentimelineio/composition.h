@@ -10,6 +10,7 @@
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
 class Clip;
+class EditJournal;
 
 /// @brief Base class for an Item that contains Composables.
 ///
@@ -184,6 +185,8 @@ protected:
         ErrorStatus*      error_status = nullptr) const;
 
 private:
+    friend class EditJournal;
+
     // XXX: python implementation is O(n^2) in number of children
     std::vector<Composable*>
     _children_at_time(RationalTime, ErrorStatus* error_status = nullptr) const;
@@ -225,6 +228,10 @@ private:
     // This is for fast lookup only, and varies automatically
     // as _children is mutated.
     std::set<Composable*> _child_set;
+
+    // The journal that records the changes of this composition and of its
+    // descendants, if any.
+    EditJournal* _edit_journal = nullptr;
 };
 
 template <typename T>
@@ -5,10 +5,16 @@
 #include "opentime/timeRange.h"
 #include "opentime/timeTransform.h"
 #include "opentimelineio/color.h"
+#include "opentimelineio/deserialization.h"
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/serializableObjectWithMetadata.h"
 #include "stringUtils.h"
 
+#include <algorithm>
+#include <atomic>
+#include <memory>
+#include <thread>
+
 #define RAPIDJSON_NAMESPACE OTIO_rapidjson
 #include <rapidjson/cursorstreamwrapper.h>
 #include <rapidjson/error/en.h>
@@ -225,6 +231,40 @@ public:
         return nullptr;
     }
 
+    // Merge the reference ids of a decoder that read one element of a split
+    // document, and register its root object under placeholder_id.  Returns
+    // false if an id would be duplicated or the root is not an object.
+    bool
+    adopt_references(JSONDecoder& piece, std::string const& placeholder_id)
+    {
+        if (piece._root.type() != typeid(SerializableObject::Retainer<>))
+        {
+            return false;
+        }
+
+        auto& object_for_id = _resolver.object_for_id;
+        for (auto const& e: piece._resolver.object_for_id)
+        {
+            if (!object_for_id.emplace(e.first, e.second).second)
+            {
+                return false;
+            }
+        }
+
+        return object_for_id
+            .emplace(
+                placeholder_id,
+                std::any_cast<SerializableObject::Retainer<>&>(piece._root)
+                    .value)
+            .second;
+    }
+
+    // Make every reference id known to root resolvable by this decoder.
+    void share_references(JSONDecoder const& root)
+    {
+        _resolver.object_for_id = root._resolver.object_for_id;
+    }
+
     std::any _root;
 
     void _internal_error(std::string const& err_msg)
@@ -681,7 +721,10 @@ SerializableObject::Reader::_decode(_Resolver& resolver)
                 resolver.object_for_id[ref_id] = so;
             }
             resolver.data_for_object.emplace(so, std::move(_dict));
-            resolver.line_number_for_object[so] = _line_number;
+            if (_line_number > 0)
+            {
+                resolver.line_number_for_object[so] = _line_number;
+            }
             return std::any(SerializableObject::Retainer<>(so));
         }
 
@@ -873,12 +916,372 @@ SerializableObject::Reader::read(std::string const& key, std::any* value)
     }
 }
 
+namespace {
+
+// A byte range of the input holding one JSON object, and the line it
+// starts on.
+struct _Span
+{
+    size_t begin;
+    size_t end;
+    int    line;
+};
+
+// Arrays stored under this key, nested no deeper than this, are candidates
+// for splitting a document: that reaches the tracks of a timeline, also when
+// the timeline is inside a SerializableCollection.
+static char constexpr _split_key[]       = "children";
+static size_t constexpr _max_split_depth = 4;
+
+// Prefix of the reference ids that stand in for split-out elements.
+static char constexpr _placeholder_prefix[] = "__OTIO_DESERIALIZE_ELEMENT_";
+
+// Find the object elements of the largest candidate array of the document.
+// This is a lexical scan only; if the document does not look well formed
+// false is returned and the serial decoder is left to report the problem.
+bool
+_find_split_spans(std::string const& input, std::vector<_Span>& spans)
+{
+    struct Level
+    {
+        bool               is_dict;
+        bool               is_split_candidate;
+        bool               expect_key;
+        std::string        key;
+        size_t             begin;
+        int                line;
+        std::vector<_Span> elements;
+    };
+
+    std::vector<Level> stack;
+    char const*        data = input.data();
+    size_t const       size = input.size();
+    int                line = 1;
+
+    for (size_t i = 0; i < size; ++i)
+    {
+        char const c = data[i];
+        if (c == '\n')
+        {
+            ++line;
+        }
+        else if (c == '"')
+        {
+            size_t const begin = i + 1;
+            for (++i; i < size && data[i] != '"'; ++i)
+            {
+                if (data[i] == '\\')
+                {
+                    ++i;
+                }
+                else if (data[i] == '\n')
+                {
+                    ++line;
+                }
+            }
+            if (i >= size)
+            {
+                return false;
+            }
+            if (!stack.empty() && stack.back().expect_key)
+            {
+                stack.back().key.assign(data + begin, i - begin);
+                stack.back().expect_key = false;
+            }
+        }
+        else if (c == '{' || c == '[')
+        {
+            bool const candidate = c == '[' && !stack.empty()
+                                   && stack.back().is_dict
+                                   && stack.size() <= _max_split_depth
+                                   && stack.back().key == _split_key;
+            stack.push_back(
+                Level{ c == '{', candidate, c == '{', {}, i, line, {} });
+        }
+        else if (c == '}' || c == ']')
+        {
+            if (stack.empty() || stack.back().is_dict != (c == '}'))
+            {
+                return false;
+            }
+
+            Level level = std::move(stack.back());
+            stack.pop_back();
+            if (stack.empty())
+            {
+                continue;
+            }
+
+            Level& parent = stack.back();
+            if (parent.is_split_candidate && level.is_dict)
+            {
+                parent.elements.push_back({ level.begin, i + 1, level.line });
+            }
+            else if (
+                level.is_split_candidate
+                && level.elements.size() > spans.size())
+            {
+                spans.swap(level.elements);
+            }
+        }
+        else if (c == ',' && !stack.empty() && stack.back().is_dict)
+        {
+            stack.back().expect_key = true;
+        }
+    }
+
+    return stack.empty();
+}
+
+// Run task(0) ... task(count - 1) on up to num_threads threads, including
+// the calling thread.
+void
+_parallel_for(
+    size_t                             count,
+    int                                num_threads,
+    std::function<void(size_t)> const& task)
+{
+    std::atomic<size_t> next{ 0 };
+    auto                worker = [&]() {
+        for (size_t i = next++; i < count; i = next++)
+        {
+            task(i);
+        }
+    };
+
+    std::vector<std::thread> threads;
+    size_t const             extra_threads =
+        std::min(count, static_cast<size_t>(std::max(num_threads, 1))) - 1;
+    for (size_t i = 0; i < extra_threads; ++i)
+    {
+        threads.emplace_back(worker);
+    }
+    worker();
+    for (auto& t: threads)
+    {
+        t.join();
+    }
+}
+
+// Parse the given input into the decoder, without finalizing it.  Line
+// numbers are reported relative to first_line, if they are tracked at all.
+bool
+_parse(
+    char const*             input,
+    int                     first_line,
+    bool                    track_line_numbers,
+    JSONDecoder&            handler,
+    OTIO_rapidjson::Reader& reader)
+{
+    OTIO_rapidjson::StringStream ss(input);
+    if (!track_line_numbers)
+    {
+        return reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(ss, handler);
+    }
+
+    OTIO_rapidjson::CursorStreamWrapper<decltype(ss)> csw(ss);
+    handler._line_number_function = [&csw, first_line]() {
+        return csw.GetLine() + first_line - 1;
+    };
+
+    bool status =
+        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(csw, handler);
+    handler._line_number_function = [] { return size_t(0); };
+    return status;
+}
+
+// Decode the document by splitting it at the elements found by
+// _find_split_spans(), decoding and resolving each element on its own
+// thread, and then decoding the remaining skeleton of the document, in which
+// every element is replaced by a reference to the decoded object.
+//
+// Returns false if the document could not be decoded this way for any
+// reason; the caller then decodes it serially, so that errors are reported
+// exactly as they would be otherwise.
+bool
+_deserialize_json_in_parallel(
+    std::string const&        input,
+    DeserializeOptions const& options,
+    std::any*                 destination)
+{
+    int const  num_threads        = options.num_threads;
+    bool const track_line_numbers = options.track_line_numbers;
+
+    std::vector<_Span> spans;
+    if (!_find_split_spans(input, spans) || spans.size() < 2)
+    {
+        return false;
+    }
+
+    // The skeleton keeps the newlines of each element so that line numbers
+    // remain the same as in the input.
+    std::vector<std::string> placeholder_ids;
+    std::string              skeleton;
+    skeleton.reserve(input.size() / spans.size() + spans.size() * 80);
+    size_t pos = 0;
+    for (auto const& span: spans)
+    {
+        placeholder_ids.push_back(
+            _placeholder_prefix + std::to_string(placeholder_ids.size()));
+        skeleton.append(input, pos, span.begin - pos);
+        skeleton += "{\"OTIO_SCHEMA\": \"SerializableObjectRef.1\", \"id\": \"";
+        skeleton += placeholder_ids.back();
+        skeleton += "\"}";
+        skeleton.append(
+            std::count(
+                input.begin() + span.begin,
+                input.begin() + span.end,
+                '\n'),
+            '\n');
+        pos = span.end;
+    }
+    skeleton.append(input, pos, std::string::npos);
+
+    std::vector<std::unique_ptr<JSONDecoder>> pieces(spans.size());
+    std::vector<char>                         parsed(spans.size(), false);
+    _parallel_for(spans.size(), num_threads, [&](size_t i) {
+        std::string const piece(
+            input,
+            spans[i].begin,
+            spans[i].end - spans[i].begin);
+        OTIO_rapidjson::Reader reader;
+        pieces[i] = std::make_unique<JSONDecoder>([] { return size_t(0); });
+        parsed[i] =
+            _parse(
+                piece.c_str(),
+                spans[i].line,
+                track_line_numbers,
+                *pieces[i],
+                reader)
+            && !pieces[i]->has_errored();
+    });
+
+    if (std::count(parsed.begin(), parsed.end(), false))
+    {
+        return false;
+    }
+
+    OTIO_rapidjson::Reader reader;
+    JSONDecoder            handler([] { return size_t(0); });
+    if (!_parse(skeleton.c_str(), 1, track_line_numbers, handler, reader)
+        || handler.has_errored())
+    {
+        return false;
+    }
+
+    // Merge the reference ids in document order, then resolve every element
+    // against the merged ids before resolving the skeleton, which parents
+    // the elements.
+    for (size_t i = 0; i < pieces.size(); ++i)
+    {
+        if (!handler.adopt_references(*pieces[i], placeholder_ids[i]))
+        {
+            return false;
+        }
+    }
+
+    _parallel_for(pieces.size(), num_threads, [&](size_t i) {
+        pieces[i]->share_references(handler);
+        pieces[i]->finalize();
+    });
+
+    for (auto const& piece: pieces)
+    {
+        if (piece->has_errored())
+        {
+            return false;
+        }
+    }
+
+    handler.finalize();
+    if (handler.has_errored())
+    {
+        return false;
+    }
+
+    destination->swap(handler._root);
+    return true;
+}
+
+FILE*
+_open_file(std::string const& file_name)
+{
+    FILE* fp = nullptr;
+#if defined(_WINDOWS)
+    const int wlen =
+        MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
+    std::vector<wchar_t> wchars(wlen);
+    MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
+    if (_wfopen_s(&fp, wchars.data(), L"r") != 0)
+    {
+        fp = nullptr;
+    }
+#else  // _WINDOWS
+    fp = fopen(file_name.c_str(), "r");
+#endif // _WINDOWS
+    return fp;
+}
+
+// Decode the stream without tracking line numbers.  Returns false if it
+// could not be decoded; the caller then decodes the input again with line
+// numbers tracked, to report the error.
+template <typename Stream>
+bool
+_deserialize_json_without_line_numbers(Stream& stream, std::any* destination)
+{
+    OTIO_rapidjson::Reader reader;
+    JSONDecoder            handler([] { return size_t(0); });
+
+    bool status =
+        reader.Parse<OTIO_rapidjson::kParseNanAndInfFlag>(stream, handler);
+    handler.finalize();
+
+    if (!status || handler.has_errored())
+    {
+        return false;
+    }
+
+    destination->swap(handler._root);
+    return true;
+}
+
+} // namespace
+
 bool
 deserialize_json_from_string(
     std::string const& input,
     std::any*          destination,
     ErrorStatus*       error_status)
 {
+    return deserialize_json_from_string(
+        input,
+        destination,
+        DeserializeOptions(),
+        error_status);
+}
+
+bool
+deserialize_json_from_string(
+    std::string const&        input,
+    std::any*                 destination,
+    DeserializeOptions const& options,
+    ErrorStatus*              error_status)
+{
+    if (options.num_threads > 1
+        && _deserialize_json_in_parallel(input, options, destination))
+    {
+        return true;
+    }
+
+    if (!options.track_line_numbers)
+    {
+        OTIO_rapidjson::StringStream ss(input.c_str());
+        if (_deserialize_json_without_line_numbers(ss, destination))
+        {
+            return true;
+        }
+    }
+
     OTIO_rapidjson::Reader                            reader;
     OTIO_rapidjson::StringStream                      ss(input.c_str());
     OTIO_rapidjson::CursorStreamWrapper<decltype(ss)> csw(ss);
@@ -920,20 +1323,21 @@ deserialize_json_from_file(
     std::any*          destination,
     ErrorStatus*       error_status)
 {
+    return deserialize_json_from_file(
+        file_name,
+        destination,
+        DeserializeOptions(),
+        error_status);
+}
 
-    FILE* fp = nullptr;
-#if defined(_WINDOWS)
-    const int wlen =
-        MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, NULL, 0);
-    std::vector<wchar_t> wchars(wlen);
-    MultiByteToWideChar(CP_UTF8, 0, file_name.c_str(), -1, wchars.data(), wlen);
-    if (_wfopen_s(&fp, wchars.data(), L"r") != 0)
-    {
-        fp = nullptr;
-    }
-#else  // _WINDOWS
-    fp = fopen(file_name.c_str(), "r");
-#endif // _WINDOWS
+bool
+deserialize_json_from_file(
+    std::string const&        file_name,
+    std::any*                 destination,
+    DeserializeOptions const& options,
+    ErrorStatus*              error_status)
+{
+    FILE* fp = _open_file(file_name);
     if (!fp)
     {
         if (error_status)
@@ -944,6 +1348,36 @@ deserialize_json_from_file(
         return false;
     }
 
+    if (options.num_threads > 1)
+    {
+        // The parallel decoder needs the whole document in memory to split
+        // it; its errors are reported the same way for files and strings.
+        std::string input;
+        char        buffer[65536];
+        for (size_t n; (n = fread(buffer, 1, sizeof(buffer), fp)) > 0;)
+        {
+            input.append(buffer, n);
+        }
+        fclose(fp);
+        return deserialize_json_from_string(
+            input,
+            destination,
+            options,
+            error_status);
+    }
+
+    if (!options.track_line_numbers)
+    {
+        char                           readBuffer[65536];
+        OTIO_rapidjson::FileReadStream fs(fp, readBuffer, sizeof(readBuffer));
+        if (_deserialize_json_without_line_numbers(fs, destination))
+        {
+            fclose(fp);
+            return true;
+        }
+        rewind(fp);
+    }
+
     OTIO_rapidjson::Reader reader;
 
     char                           readBuffer[65536];
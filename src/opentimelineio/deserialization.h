@@ -11,6 +11,26 @@
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
+/// @brief Options for deserializing JSON data.
+struct OTIO_API_TYPE DeserializeOptions
+{
+    /// @brief Maximum number of threads used to decode the data.
+    ///
+    /// When greater than one, the elements of the largest "children" array
+    /// near the top of the document (for a timeline, its tracks) are decoded
+    /// concurrently. The resulting objects, schema upgrades and errors are
+    /// the same as with the serial decoder.
+    int num_threads = 1;
+
+    /// @brief Whether to track line numbers while decoding.
+    ///
+    /// Line numbers are only used in error messages. When false, the decoder
+    /// skips the per-character cursor and per-object line bookkeeping, and
+    /// if decoding fails the input is decoded again with tracking enabled,
+    /// so the reported errors are the same either way.
+    bool track_line_numbers = true;
+};
+
 /// @brief Deserialize JSON data from a string.
 OTIO_API bool deserialize_json_from_string(
     std::string const& input,
@@ -23,4 +43,18 @@ OTIO_API bool deserialize_json_from_file(
     std::any*          destination,
     ErrorStatus*       error_status = nullptr);
 
+/// @brief Deserialize JSON data from a string with the given options.
+OTIO_API bool deserialize_json_from_string(
+    std::string const&        input,
+    std::any*                 destination,
+    DeserializeOptions const& options,
+    ErrorStatus*              error_status = nullptr);
+
+/// @brief Deserialize JSON data from a file with the given options.
+OTIO_API bool deserialize_json_from_file(
+    std::string const&        file_name,
+    std::any*                 destination,
+    DeserializeOptions const& options,
+    ErrorStatus*              error_status = nullptr);
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
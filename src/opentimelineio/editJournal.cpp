@@ -0,0 +1,326 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/editJournal.h"
+#include "opentimelineio/composition.h"
+#include "opentimelineio/stack.h"
+#include "opentimelineio/timeline.h"
+
+#include <atomic>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
+
+namespace {
+
+// The number of attached journals, so that changes need not look for a
+// journal when there is none.
+std::atomic<int> journal_count(0);
+
+} // namespace
+
+struct EditJournal::Change
+{
+    enum class Kind
+    {
+        InsertChild,
+        RemoveChild,
+        SetChild,
+        SetChildren,
+        SetSourceRange
+    };
+
+    Kind                                           kind;
+    SerializableObject::Retainer<Composition>      composition;
+    SerializableObject::Retainer<Item>             item;
+    int                                            index = 0;
+    SerializableObject::Retainer<Composable>       child;
+    SerializableObject::Retainer<Composable>       old_child;
+    std::vector<SerializableObject::Retainer<Composable>> children;
+    std::vector<SerializableObject::Retainer<Composable>> old_children;
+    std::optional<TimeRange>                       source_range;
+    std::optional<TimeRange>                       old_source_range;
+};
+
+EditJournal::Group::Group(Composable const* object)
+    : Group(journal_of(object))
+{}
+
+EditJournal::Group::Group(EditJournal* journal)
+    : _journal(journal)
+{
+    if (_journal)
+    {
+        _journal->begin_group();
+    }
+}
+
+EditJournal::Group::~Group()
+{
+    if (_journal)
+    {
+        _journal->end_group();
+    }
+}
+
+EditJournal::EditJournal(Timeline* timeline)
+    : _timeline(timeline)
+    , _stack(timeline->tracks())
+{
+    if (_stack)
+    {
+        _stack->_edit_journal = this;
+        ++journal_count;
+    }
+}
+
+EditJournal::~EditJournal()
+{
+    if (_stack)
+    {
+        if (_stack->_edit_journal == this)
+        {
+            _stack->_edit_journal = nullptr;
+        }
+        --journal_count;
+    }
+}
+
+EditJournal*
+EditJournal::journal_of(Composable const* object)
+{
+    if (!journal_count.load(std::memory_order_relaxed) || !object)
+    {
+        return nullptr;
+    }
+
+    Composition const* composition = dynamic_cast<Composition const*>(object);
+    if (!composition)
+    {
+        composition = object->parent();
+    }
+    for (; composition; composition = composition->parent())
+    {
+        if (composition->_edit_journal)
+        {
+            return composition->_edit_journal;
+        }
+    }
+    return nullptr;
+}
+
+void
+EditJournal::begin_group()
+{
+    if (_group_depth++ == 0)
+    {
+        _group_empty = true;
+    }
+}
+
+void
+EditJournal::end_group()
+{
+    if (_group_depth > 0)
+    {
+        --_group_depth;
+    }
+}
+
+bool
+EditJournal::undo(ErrorStatus* error_status)
+{
+    if (_undo_steps.empty())
+    {
+        return false;
+    }
+
+    Step step = std::move(_undo_steps.back());
+    _undo_steps.pop_back();
+    const bool ok = _replay(step, true, error_status);
+    _redo_steps.push_back(std::move(step));
+    return ok;
+}
+
+bool
+EditJournal::redo(ErrorStatus* error_status)
+{
+    if (_redo_steps.empty())
+    {
+        return false;
+    }
+
+    Step step = std::move(_redo_steps.back());
+    _redo_steps.pop_back();
+    const bool ok = _replay(step, false, error_status);
+    _undo_steps.push_back(std::move(step));
+    return ok;
+}
+
+void
+EditJournal::clear()
+{
+    _undo_steps.clear();
+    _redo_steps.clear();
+    _group_empty = true;
+}
+
+void
+EditJournal::_child_inserted(Composition* composition, int index)
+{
+    if (auto journal = _recording(composition))
+    {
+        Change change;
+        change.kind        = Change::Kind::InsertChild;
+        change.composition = composition;
+        change.index       = index;
+        change.child       = composition->children()[index];
+        journal->_record(std::move(change));
+    }
+}
+
+void
+EditJournal::_child_removing(Composition* composition, int index)
+{
+    if (auto journal = _recording(composition))
+    {
+        Change change;
+        change.kind        = Change::Kind::RemoveChild;
+        change.composition = composition;
+        change.index       = index;
+        change.old_child   = composition->children()[index];
+        journal->_record(std::move(change));
+    }
+}
+
+void
+EditJournal::_child_setting(
+    Composition* composition,
+    int          index,
+    Composable*  child)
+{
+    if (auto journal = _recording(composition))
+    {
+        Change change;
+        change.kind        = Change::Kind::SetChild;
+        change.composition = composition;
+        change.index       = index;
+        change.child       = child;
+        change.old_child   = composition->children()[index];
+        journal->_record(std::move(change));
+    }
+}
+
+void
+EditJournal::_children_setting(
+    Composition*                    composition,
+    std::vector<Composable*> const& children)
+{
+    if (auto journal = _recording(composition))
+    {
+        Change change;
+        change.kind        = Change::Kind::SetChildren;
+        change.composition = composition;
+        change.children.assign(children.begin(), children.end());
+        change.old_children = composition->children();
+        journal->_record(std::move(change));
+    }
+}
+
+void
+EditJournal::_source_range_setting(
+    Item*                           item,
+    std::optional<TimeRange> const& source_range)
+{
+    if (auto journal = _recording(item))
+    {
+        Change change;
+        change.kind             = Change::Kind::SetSourceRange;
+        change.item             = item;
+        change.source_range     = source_range;
+        change.old_source_range = item->source_range();
+        journal->_record(std::move(change));
+    }
+}
+
+void
+EditJournal::_attach(Composition* composition, EditJournal* journal)
+{
+    composition->_edit_journal = journal;
+}
+
+EditJournal*
+EditJournal::_recording(Composable const* object)
+{
+    EditJournal* journal = journal_of(object);
+    return journal && !journal->_replaying ? journal : nullptr;
+}
+
+void
+EditJournal::_record(Change&& change)
+{
+    _redo_steps.clear();
+    if (_group_depth == 0 || _group_empty)
+    {
+        _undo_steps.emplace_back();
+        _group_empty = _group_depth == 0;
+    }
+    _undo_steps.back().push_back(std::move(change));
+}
+
+bool
+EditJournal::_replay(Step& step, bool undo, ErrorStatus* error_status)
+{
+    // Undo the changes from the last to the first, and redo them from the
+    // first to the last, so that each one finds the timeline as it left it.
+    _replaying    = true;
+    bool      ok  = true;
+    const int end = int(step.size());
+    for (int i = 0; ok && i < end; ++i)
+    {
+        Change& change = step[undo ? end - 1 - i : i];
+        switch (change.kind)
+        {
+            case Change::Kind::InsertChild:
+                ok = undo ? change.composition->remove_child(
+                                change.index,
+                                error_status)
+                          : change.composition->insert_child(
+                                change.index,
+                                change.child,
+                                error_status);
+                break;
+            case Change::Kind::RemoveChild:
+                ok = undo ? change.composition->insert_child(
+                                change.index,
+                                change.old_child,
+                                error_status)
+                          : change.composition->remove_child(
+                                change.index,
+                                error_status);
+                break;
+            case Change::Kind::SetChild:
+                ok = change.composition->set_child(
+                    change.index,
+                    undo ? change.old_child : change.child,
+                    error_status);
+                break;
+            case Change::Kind::SetChildren: {
+                auto const& children =
+                    undo ? change.old_children : change.children;
+                change.composition->clear_children();
+                ok = change.composition->set_children(
+                    std::vector<Composable*>(children.begin(), children.end()),
+                    error_status);
+                break;
+            }
+            case Change::Kind::SetSourceRange:
+                change.item->set_source_range(
+                    undo ? change.old_source_range : change.source_range);
+                break;
+        }
+    }
+    _replaying = false;
+    return ok;
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
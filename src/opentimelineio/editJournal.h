@@ -0,0 +1,158 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/errorStatus.h"
+#include "opentimelineio/serializableObject.h"
+#include "opentimelineio/version.h"
+
+#include <optional>
+#include <vector>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
+
+class Composable;
+class Composition;
+class Item;
+class Stack;
+class Timeline;
+
+namespace algo {
+class EditSession;
+}
+
+/// @brief This class records the edits of a timeline so that they can be
+/// undone and redone.
+///
+/// While a journal is attached to a timeline, each change of the children
+/// of a composition in the timeline and each change of the source range of
+/// an item in the timeline is recorded, together with what it replaced.
+/// Undoing an edit puts back what it replaced, so undo and redo cost in
+/// proportion to the size of the edit rather than the size of the timeline,
+/// unlike keeping a clone of the timeline for each edit.
+///
+/// Each change is an undo step of its own, unless it is made between
+/// begin_group() and end_group(), in which case all the changes of the group
+/// are one step. The functions in algo/editAlgorithm.h group their changes,
+/// so each of them is one step.
+///
+/// Only the edits of the stack of tracks that the timeline has when the
+/// journal is created are recorded. Changes of other properties, such as
+/// names and metadata, are not recorded. The timeline should only be changed
+/// through undo() and redo() in the ways that were recorded; an edit that
+/// is not recorded may stop the steps around it from being undone.
+class OTIO_API_TYPE EditJournal
+{
+public:
+    /// @brief This class groups the changes made during its lifetime into
+    /// one undo step of the journal that records changes of an object, if
+    /// there is one.
+    class OTIO_API_TYPE Group
+    {
+    public:
+        /// @brief Begin a group for the journal of the object.
+        OTIO_API explicit Group(Composable const* object);
+
+        /// @brief Begin a group for the journal.
+        OTIO_API explicit Group(EditJournal* journal);
+
+        /// @brief End the group.
+        OTIO_API ~Group();
+
+        Group(Group const&)            = delete;
+        Group& operator=(Group const&) = delete;
+
+    private:
+        EditJournal* _journal;
+    };
+
+    /// @brief Create a new journal and attach it to a timeline.
+    ///
+    /// @param timeline The timeline.
+    OTIO_API explicit EditJournal(Timeline* timeline);
+
+    /// @brief Detach the journal from the timeline.
+    OTIO_API ~EditJournal();
+
+    EditJournal(EditJournal const&)            = delete;
+    EditJournal& operator=(EditJournal const&) = delete;
+
+    /// @brief Return the timeline.
+    Timeline* timeline() const noexcept { return _timeline; }
+
+    /// @brief Return the journal that records the changes of an object, or
+    /// null if there is none.
+    OTIO_API static EditJournal* journal_of(Composable const* object);
+
+    /// @brief Begin a group of changes. Groups may be nested; the changes
+    /// are one step until the outermost group ends.
+    OTIO_API void begin_group();
+
+    /// @brief End a group of changes.
+    OTIO_API void end_group();
+
+    /// @brief Return whether there is a step to undo.
+    bool can_undo() const noexcept { return !_undo_steps.empty(); }
+
+    /// @brief Return whether there is a step to redo.
+    bool can_redo() const noexcept { return !_redo_steps.empty(); }
+
+    /// @brief Undo the last step.
+    ///
+    /// Return false if there is nothing to undo, or if the step could not
+    /// be undone, in which case the error status is set.
+    ///
+    /// @param error_status The return status.
+    OTIO_API bool undo(ErrorStatus* error_status = nullptr);
+
+    /// @brief Redo the last step that was undone. Steps can only be redone
+    /// until a new change is recorded.
+    ///
+    /// Return false if there is nothing to redo, or if the step could not
+    /// be redone, in which case the error status is set.
+    ///
+    /// @param error_status The return status.
+    OTIO_API bool redo(ErrorStatus* error_status = nullptr);
+
+    /// @brief Forget all of the steps.
+    OTIO_API void clear();
+
+private:
+    friend class Composition;
+    friend class Item;
+    friend class algo::EditSession;
+
+    struct Change;
+    using Step = std::vector<Change>;
+
+    // Called by Composition and Item before or after they change.
+    static void _child_inserted(Composition*, int index);
+    static void _child_removing(Composition*, int index);
+    static void _child_setting(Composition*, int index, Composable* child);
+    static void _children_setting(
+        Composition*                    composition,
+        std::vector<Composable*> const& children);
+    static void _source_range_setting(
+        Item*                           item,
+        std::optional<TimeRange> const& source_range);
+
+    // Record the changes of a composition that is not in the timeline, such
+    // as the window of an algo::EditSession, in a journal.
+    static void _attach(Composition* composition, EditJournal* journal);
+
+    static EditJournal* _recording(Composable const* object);
+    void                _record(Change&& change);
+    bool _replay(Step& step, bool undo, ErrorStatus* error_status);
+
+    SerializableObject::Retainer<Timeline> _timeline;
+    SerializableObject::Retainer<Stack>    _stack;
+
+    std::vector<Step> _undo_steps;
+    std::vector<Step> _redo_steps;
+    int               _group_depth = 0;
+    bool              _group_empty = true;
+    bool              _replaying   = false;
+};
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
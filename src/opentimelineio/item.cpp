@@ -3,6 +3,7 @@
 
 #include "opentimelineio/item.h"
 #include "opentimelineio/composition.h"
+#include "opentimelineio/editJournal.h"
 #include "opentimelineio/effect.h"
 #include "opentimelineio/marker.h"
 
@@ -29,6 +30,13 @@ Item::Item(
 Item::~Item()
 {}
 
+void
+Item::set_source_range(std::optional<TimeRange> const& source_range)
+{
+    EditJournal::_source_range_setting(this, source_range);
+    _source_range = source_range;
+}
+
 bool
 Item::visible() const
 {
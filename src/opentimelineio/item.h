@@ -62,10 +62,8 @@ public:
     }
 
     /// @brief Set the source range of the item.
-    void set_source_range(std::optional<TimeRange> const& source_range)
-    {
-        _source_range = source_range;
-    }
+    OTIO_API void
+    set_source_range(std::optional<TimeRange> const& source_range);
 
     /// @brief Modify the list of effects.
     std::vector<Retainer<Effect>>& effects() noexcept { return _effects; }
@@ -0,0 +1,80 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/itemAlgorithm.h"
+#include "opentimelineio/linearTimeWarp.h"
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
+
+double
+item_time_scalar(Item const* item, ErrorStatus* error_status)
+{
+    double scalar = 1;
+    for (auto const& effect: item->effects())
+    {
+        if (auto warp = dynamic_cast<LinearTimeWarp const*>(effect.value))
+        {
+            scalar *= warp->time_scalar();
+        }
+        else if (dynamic_cast<TimeEffect const*>(effect.value))
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::NOT_IMPLEMENTED,
+                    "cannot evaluate time effect of type "
+                        + effect.value->schema_name(),
+                    effect.value);
+            }
+            return scalar;
+        }
+    }
+    return scalar;
+}
+
+RationalTime
+item_source_time(Item const* item, RationalTime time, ErrorStatus* error_status)
+{
+    double const value = time.value();
+    double const rate  = time.rate();
+    double       source_value;
+    item_source_times(item, &value, &rate, 1, &source_value, error_status);
+    return RationalTime(source_value, rate);
+}
+
+void
+item_source_times(
+    Item const*   item,
+    double const* values,
+    double const* rates,
+    size_t        count,
+    double*       source_values,
+    ErrorStatus*  error_status)
+{
+    double const scalar = item_time_scalar(item, error_status);
+    if (is_error(error_status))
+    {
+        return;
+    }
+    RationalTime const anchor = item->trimmed_range(error_status).start_time();
+    if (is_error(error_status))
+    {
+        return;
+    }
+
+    // Rescale the anchor only when the rate changes, since arrays usually
+    // hold times at a single rate.
+    double anchor_rate  = anchor.rate();
+    double anchor_value = anchor.value();
+    for (size_t i = 0; i < count; ++i)
+    {
+        if (rates[i] != anchor_rate)
+        {
+            anchor_rate  = rates[i];
+            anchor_value = anchor.value_rescaled_to(anchor_rate);
+        }
+        source_values[i] = anchor_value + (values[i] - anchor_value) * scalar;
+    }
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
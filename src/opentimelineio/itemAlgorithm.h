@@ -0,0 +1,55 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/item.h"
+#include "opentimelineio/version.h"
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
+
+/// @brief Return the combined time scalar of the time effects of an item.
+///
+/// The time scalars of the LinearTimeWarp and FreezeFrame effects of the
+/// item are multiplied together. Other time effects cannot be evaluated:
+/// at the first one, error_status is set to NOT_IMPLEMENTED and the scalar
+/// of the effects before it is returned.
+OTIO_API double
+item_time_scalar(Item const* item, ErrorStatus* error_status = nullptr);
+
+/// @brief Return the time of the source media that an item shows at the
+/// given time, applying the time effects of the item.
+///
+/// Times are in the time of the item's trimmed range. The time effects are
+/// anchored at the start of the trimmed range: a time warp scales the
+/// distance from the start, and a freeze frame holds the first frame.
+///
+/// @param item The item.
+/// @param time The presentation time.
+/// @param error_status The return status.
+OTIO_API RationalTime item_source_time(
+    Item const*  item,
+    RationalTime time,
+    ErrorStatus* error_status = nullptr);
+
+/// @brief Map an array of presentation times of an item to the times of its
+/// source media, as item_source_time() does for a single time.
+///
+/// Each time is given by a value and a rate; the source time of each value
+/// is written to source_values, at the same rate.
+///
+/// @param item The item.
+/// @param values The presentation time values.
+/// @param rates The presentation time rates.
+/// @param count The number of times.
+/// @param source_values The source time values, for count times.
+/// @param error_status The return status.
+OTIO_API void item_source_times(
+    Item const*   item,
+    double const* values,
+    double const* rates,
+    size_t        count,
+    double*       source_values,
+    ErrorStatus*  error_status = nullptr);
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
@@ -223,7 +223,10 @@ public:
             {
                 for (auto e: data_for_object)
                 {
-                    int line_number = line_number_for_object[e.first];
+                    auto line = line_number_for_object.find(e.first);
+                    int  line_number = line != line_number_for_object.end()
+                                           ? line->second
+                                           : 0;
                     Reader::_fix_reference_ids(
                         e.second,
                         error_function,
@@ -642,6 +645,12 @@ public:
                 value->_managed_retain();
         }
 
+        Retainer(Retainer&& rhs) noexcept
+            : value(rhs.value)
+        {
+            rhs.value = nullptr;
+        }
+
         Retainer& operator=(Retainer const& rhs)
         {
             if (rhs.value)
@@ -652,6 +661,21 @@ public:
             return *this;
         }
 
+        // Moving a retainer hands over its reference without locking the
+        // object, so that a vector of retainers, such as the children of a
+        // composition, can shift its elements cheaply.
+        Retainer& operator=(Retainer&& rhs) noexcept
+        {
+            if (this != &rhs)
+            {
+                if (value)
+                    value->_managed_release();
+                value     = rhs.value;
+                rhs.value = nullptr;
+            }
+            return *this;
+        }
+
         ~Retainer()
         {
             if (value)
@@ -2,183 +2,443 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include "opentimelineio/stackAlgorithm.h"
+#include "opentimelineio/clip.h"
 #include "opentimelineio/gap.h"
+#include "opentimelineio/itemAlgorithm.h"
 #include "opentimelineio/track.h"
-#include "opentimelineio/trackAlgorithm.h"
 #include "opentimelineio/transition.h"
 
+#include <algorithm>
+#include <cmath>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
-typedef std::map<Track*, std::map<Composable*, TimeRange>> RangeTrackMap;
-typedef std::vector<SerializableObject::Retainer<Track>>   TrackRetainerVector;
+// The children of a track and their ranges, computed once per track so that
+// the children overlapping a range can be found by binary search.
+struct FlattenTrack
+{
+    std::vector<Composable*> children;
+    std::vector<TimeRange>   ranges;
+    std::vector<double>      start_seconds;
+    std::vector<double>      end_seconds;
+
+    // Indices of the children that are not transitions; their ranges are
+    // contiguous, so their end times are sorted.
+    std::vector<size_t> item_indices;
+
+    // The largest transition offsets, in seconds, which bound how far a
+    // transition's range reaches past the items next to it.
+    double max_in_offset_seconds  = 0;
+    double max_out_offset_seconds = 0;
+
+    // The source range and duration of the track.
+    std::optional<TimeRange> source_range;
+    RationalTime             duration;
+
+    // The gap that pads the track if it is shorter than the longest track;
+    // it is the last child.
+    SerializableObject::Retainer<Gap> padding;
+};
+
+typedef std::vector<SerializableObject::Retainer<Composable>>
+    ComposableRetainerVector;
+
+static void
+_add_flatten_child(
+    FlattenTrack& flatten_track,
+    Composable*   child,
+    TimeRange     range)
+{
+    if (auto transition = dynamic_cast<Transition*>(child))
+    {
+        flatten_track.max_in_offset_seconds = std::max(
+            flatten_track.max_in_offset_seconds,
+            transition->in_offset().to_seconds());
+        flatten_track.max_out_offset_seconds = std::max(
+            flatten_track.max_out_offset_seconds,
+            transition->out_offset().to_seconds());
+    }
+    else
+    {
+        flatten_track.item_indices.push_back(flatten_track.children.size());
+    }
+    flatten_track.children.push_back(child);
+    flatten_track.ranges.push_back(range);
+    flatten_track.start_seconds.push_back(range.start_time().to_seconds());
+    flatten_track.end_seconds.push_back(
+        range.end_time_exclusive().to_seconds());
+}
+
+// Collect the children of a track and their ranges.
+static void
+_init_flatten_track(
+    Track*        track,
+    FlattenTrack& flatten_track,
+    ErrorStatus*  error_status)
+{
+    flatten_track = FlattenTrack();
+
+    flatten_track.source_range = track->source_range();
+    flatten_track.duration     = track->duration(error_status);
+    if (is_error(error_status))
+    {
+        return;
+    }
+    auto ranges = track->range_of_all_children(error_status);
+    if (is_error(error_status))
+    {
+        return;
+    }
 
+    flatten_track.children.reserve(track->children().size() + 1);
+    flatten_track.ranges.reserve(track->children().size() + 1);
+    for (auto const& child: track->children())
+    {
+        _add_flatten_child(flatten_track, child, ranges[child]);
+    }
+}
+
+// Return the range of the gap that pads a track.
+static std::optional<TimeRange>
+_padding_range(FlattenTrack const& flatten_track)
+{
+    if (!flatten_track.padding)
+    {
+        return std::nullopt;
+    }
+    return flatten_track.ranges.back();
+}
+
+// Pad a track shorter than the longest track with a gap, as if one had been
+// appended, replacing the gap that padded it before.
 static void
-_flatten_next_item(
-    RangeTrackMap&             range_track_map,
-    Track*                     flat_track,
+_pad_flatten_track(FlattenTrack& flatten_track, RationalTime duration)
+{
+    if (flatten_track.padding)
+    {
+        flatten_track.children.pop_back();
+        flatten_track.ranges.pop_back();
+        flatten_track.start_seconds.pop_back();
+        flatten_track.end_seconds.pop_back();
+        flatten_track.item_indices.pop_back();
+        flatten_track.padding = nullptr;
+    }
+
+    if (flatten_track.duration < duration)
+    {
+        // The gap starts at the end of the last item, like a child
+        // appended to the track would.
+        RationalTime end_time;
+        if (!flatten_track.item_indices.empty())
+        {
+            size_t const last = flatten_track.item_indices.back();
+            end_time = flatten_track.ranges[last].end_time_exclusive();
+        }
+        flatten_track.padding = new Gap(duration - flatten_track.duration);
+        _add_flatten_child(
+            flatten_track,
+            flatten_track.padding,
+            TimeRange(end_time, duration - flatten_track.duration));
+    }
+}
+
+// Collect the children of the tracks and their ranges, and pad the tracks
+// to the duration of the longest track.
+static std::vector<FlattenTrack>
+_flatten_tracks(
     std::vector<Track*> const& tracks,
-    int                        track_index,
-    std::optional<TimeRange>   trim_range,
+    RationalTime&              duration,
     ErrorStatus*               error_status)
 {
-    if (track_index < 0)
+    std::vector<FlattenTrack> flatten_tracks(tracks.size());
+
+    duration = RationalTime();
+    for (size_t i = 0; i < tracks.size(); i++)
     {
-        track_index = int(tracks.size()) - 1;
+        _init_flatten_track(tracks[i], flatten_tracks[i], error_status);
+        if (is_error(error_status))
+        {
+            return {};
+        }
+        duration = std::max(duration, flatten_tracks[i].duration);
     }
 
-    if (track_index < 0)
+    for (auto& flatten_track: flatten_tracks)
     {
-        return;
+        _pad_flatten_track(flatten_track, duration);
     }
+    return flatten_tracks;
+}
 
-    Track* track = tracks[track_index];
+// Return whether a track may have changed within the given range, in
+// seconds, since its children and their ranges were collected.
+static bool
+_flatten_track_changed(
+    Track const*        track,
+    FlattenTrack const& flatten_track,
+    double              start,
+    double              end)
+{
+    auto const&  children = track->children();
+    size_t const count =
+        flatten_track.children.size() - (flatten_track.padding ? 1 : 0);
+    if (children.size() != count
+        || track->source_range() != flatten_track.source_range)
+    {
+        return true;
+    }
+    for (size_t i = 0; i < count; i++)
+    {
+        if (children[i].value != flatten_track.children[i])
+        {
+            return true;
+        }
+    }
 
-    SerializableObject::Retainer<Track> track_retainer;
-    if (trim_range)
+    // The children outside of the range are unchanged, so only the
+    // durations of the children touching the range need to be checked.
+    size_t first = 0;
+    auto   it    = std::partition_point(
+        flatten_track.item_indices.begin(),
+        flatten_track.item_indices.end(),
+        [&](size_t i) {
+            return start - flatten_track.end_seconds[i] > DEFAULT_EPSILON_s;
+        });
+    if (it != flatten_track.item_indices.begin())
     {
-        track = track_trimmed_to_range(track, *trim_range, error_status);
-        if (track == nullptr || is_error(error_status))
+        first = *(it - 1) + 1;
+    }
+    for (size_t i = first; i < count; i++)
+    {
+        if (flatten_track.start_seconds[i] - end > DEFAULT_EPSILON_s)
         {
-            return;
+            break;
+        }
+        auto item = dynamic_cast<Item const*>(flatten_track.children[i]);
+        if (!item
+            || item->trimmed_range().duration()
+                   != flatten_track.ranges[i].duration())
+        {
+            return true;
         }
-        track_retainer = SerializableObject::Retainer<Track>(track);
     }
+    return false;
+}
 
-    std::map<Composable*, TimeRange>* track_map;
-    auto                              it = range_track_map.find(track);
-    if (it != range_track_map.end())
+// Return the source range of an item trimmed to the part of its range in
+// the track that is within trim_range.
+static TimeRange
+_trimmed_source_range(
+    TimeRange source_range,
+    TimeRange child_range,
+    TimeRange trim_range)
+{
+    if (trim_range.start_time() > child_range.start_time())
     {
-        track_map = &it->second;
+        auto trim_amount = trim_range.start_time() - child_range.start_time();
+        source_range     = TimeRange(
+            source_range.start_time() + trim_amount,
+            source_range.duration() - trim_amount);
     }
-    else
+
+    auto trim_end  = trim_range.end_time_exclusive();
+    auto child_end = child_range.end_time_exclusive();
+    if (trim_end < child_end)
     {
-        auto result = range_track_map.emplace(
-            track,
-            track->range_of_all_children(error_status));
-        if (is_error(error_status))
+        auto trim_amount = child_end - trim_end;
+        source_range     = TimeRange(
+            source_range.start_time(),
+            source_range.duration() - trim_amount);
+    }
+    return source_range;
+}
+
+// Append the children of the track at track_index that intersect
+// trim_range to flat_children, trimmed to trim_range. The parts covered by
+// gaps are filled in from the tracks below.
+static void
+_flatten_range(
+    std::vector<FlattenTrack> const& tracks,
+    ComposableRetainerVector&        flat_children,
+    int                              track_index,
+    std::optional<TimeRange>         trim_range,
+    ErrorStatus*                     error_status)
+{
+    FlattenTrack const& track = tracks[track_index];
+
+    size_t first      = 0;
+    double last_start = 0;
+    if (trim_range)
+    {
+        // Skip the items that end before the range, and the transitions
+        // between them, which cannot reach into the range either.
+        double const trim_start = trim_range->start_time().to_seconds();
+        auto const   it         = std::partition_point(
+            track.item_indices.begin(),
+            track.item_indices.end(),
+            [&](size_t i) {
+                return track.end_seconds[i] + track.max_out_offset_seconds
+                           - trim_start
+                       < DEFAULT_EPSILON_s;
+            });
+        if (it != track.item_indices.begin())
         {
-            return;
+            first = *(it - 1) + 1;
         }
-        track_map = &result.first->second;
+
+        // Items that start after this cannot intersect the range, and
+        // neither can the transitions after them.
+        last_start = trim_range->end_time_exclusive().to_seconds()
+                     + track.max_in_offset_seconds;
     }
-    for (auto child: track->children())
+
+    for (size_t i = first; i < track.children.size(); i++)
     {
-        auto item = dynamic_retainer_cast<Item>(child);
-        if (!item)
+        Composable* child       = track.children[i];
+        TimeRange   child_range = track.ranges[i];
+        auto        item        = dynamic_cast<Item*>(child);
+        if (trim_range && !trim_range->intersects(child_range))
+        {
+            if (item && last_start - track.start_seconds[i] < DEFAULT_EPSILON_s)
+            {
+                break;
+            }
+            continue;
+        }
+
+        if (!item && !dynamic_cast<Transition*>(child))
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::TYPE_MISMATCH,
+                    "expected item of type Item* || Transition*",
+                    child);
+            }
+            return;
+        }
+
+        if (!item || item->visible() || track_index == 0)
         {
-            if (!dynamic_retainer_cast<Transition>(child))
+            bool const trimmed =
+                trim_range && !trim_range->contains(child_range);
+            if (trimmed && !item)
             {
                 if (error_status)
                 {
                     *error_status = ErrorStatus(
-                        ErrorStatus::TYPE_MISMATCH,
-                        "expected item of type Item* || Transition*",
-                        child);
+                        ErrorStatus::CANNOT_TRIM_TRANSITION,
+                        "Cannot trim in the middle of a transition");
                 }
                 return;
             }
-        }
 
-        if (!item || item->visible() || track_index == 0)
-        {
-            flat_track->insert_child(
-                static_cast<int>(flat_track->children().size()),
-                static_cast<Composable*>(child->clone(error_status)),
-                error_status);
+            auto copy = static_cast<Composable*>(child->clone(error_status));
             if (is_error(error_status))
             {
                 return;
             }
+            if (trimmed)
+            {
+                auto copy_item    = static_cast<Item*>(copy);
+                auto source_range = item->trimmed_range(error_status);
+                if (is_error(error_status))
+                {
+                    return;
+                }
+                copy_item->set_source_range(_trimmed_source_range(
+                    source_range,
+                    child_range,
+                    *trim_range));
+            }
+            flat_children.push_back(
+                SerializableObject::Retainer<Composable>(copy));
         }
         else
         {
-            TimeRange trim = (*track_map)[item];
+            TimeRange gap_range = child_range;
             if (trim_range)
             {
-                trim = TimeRange(
-                    trim.start_time() + trim_range->start_time(),
-                    trim.duration());
-                (*track_map)[item] = trim;
+                gap_range = TimeRange::range_from_start_end_time(
+                    std::max(
+                        trim_range->start_time(),
+                        child_range.start_time()),
+                    std::min(
+                        trim_range->end_time_exclusive(),
+                        child_range.end_time_exclusive()));
             }
 
-            _flatten_next_item(
-                range_track_map,
-                flat_track,
+            _flatten_range(
                 tracks,
+                flat_children,
                 track_index - 1,
-                trim,
+                gap_range,
                 error_status);
-            if (track == nullptr || is_error(error_status))
+            if (is_error(error_status))
             {
                 return;
             }
         }
     }
+}
 
-    // range_track_map persists over the entire duration of flatten_stack
-    // track_retainer.value is about to be deleted; it's entirely possible
-    // that a new item will be created at the same pointer location, so we
-    // have to clean this value out of the map now.
-    if (track_retainer)
+static ComposableRetainerVector
+_flatten_all_tracks(
+    std::vector<Track*> const& tracks,
+    ErrorStatus*               error_status)
+{
+    RationalTime duration;
+    auto flatten_tracks = _flatten_tracks(tracks, duration, error_status);
+    if (is_error(error_status))
     {
-        range_track_map.erase(track_retainer);
+        return {};
     }
+
+    ComposableRetainerVector flat_children;
+    if (!flatten_tracks.empty())
+    {
+        _flatten_range(
+            flatten_tracks,
+            flat_children,
+            int(flatten_tracks.size()) - 1,
+            std::nullopt,
+            error_status);
+    }
+    return flat_children;
 }
 
-// add a gap to end of a track if it is shorter then the longest track.
-// shorter tracks are clones and get added to the tracks_retainer.
-// a new track will replace the original pointer in the track vector.
 static void
-_normalize_tracks_lengths(
-    std::vector<Track*>& tracks,
-    TrackRetainerVector& tracks_retainer,
-    ErrorStatus*         error_status)
+_set_flat_children(
+    Track*                          flat_track,
+    ComposableRetainerVector const& flat_children,
+    ErrorStatus*                    error_status)
 {
-    RationalTime duration;
-    for (auto track: tracks)
+    std::vector<Composable*> children;
+    children.reserve(flat_children.size());
+    for (auto const& child: flat_children)
     {
-        duration = std::max(duration, track->duration(error_status));
-        if (is_error(error_status))
-        {
-            return;
-        }
+        children.push_back(child);
     }
+    flat_track->set_children(children, error_status);
+}
 
-    for (size_t i = 0; i < tracks.size(); i++)
-    {
-        Track*       old_track      = tracks[i];
-        RationalTime track_duration = old_track->duration(error_status);
-        if (track_duration < duration)
-        {
-            Track* new_track =
-                static_cast<Track*>(old_track->clone(error_status));
-            if (is_error(error_status))
-            {
-                return;
-            }
-            // add track to retainer so it can be freed later
-            tracks_retainer.push_back(
-                SerializableObject::Retainer<Track>(new_track));
-            new_track->append_child(
-                new Gap(duration - track_duration),
-                error_status);
-            if (is_error(error_status))
-            {
-                return;
-            }
-            tracks[i] = new_track;
-        }
-    }
+static Track*
+_flatten_tracks_to_track(
+    std::vector<Track*> const& tracks,
+    ErrorStatus*               error_status)
+{
+    auto flat_children = _flatten_all_tracks(tracks, error_status);
+
+    Track* flat_track = new Track;
+    flat_track->set_name("Flattened");
+    _set_flat_children(flat_track, flat_children, error_status);
+    return flat_track;
 }
 
-Track*
-flatten_stack(Stack* in_stack, ErrorStatus* error_status)
+static std::vector<Track*>
+_enabled_tracks(Stack* in_stack, ErrorStatus* error_status)
 {
     std::vector<Track*> tracks;
-    // tracks are cloned if they need to be normalized
-    // they get added to this retainer so they can be
-    // freed when the algorithm is complete
-    TrackRetainerVector tracks_retainer;
     tracks.reserve(in_stack->children().size());
 
     for (auto c: in_stack->children())
@@ -199,61 +459,468 @@ flatten_stack(Stack* in_stack, ErrorStatus* error_status)
                     "expected item of type Track*",
                     c);
             }
-            return nullptr;
+            return {};
+        }
+    }
+    return tracks;
+}
+
+// Return the start times of the children of a flattened track that starts
+// at start_time, followed by the end time of the last child.
+static std::vector<RationalTime>
+_flat_start_times(
+    ComposableRetainerVector const& flat_children,
+    RationalTime                    start_time)
+{
+    std::vector<RationalTime> start_times;
+    start_times.reserve(flat_children.size() + 1);
+    for (auto const& child: flat_children)
+    {
+        start_times.push_back(start_time);
+        if (auto item = dynamic_retainer_cast<Item>(child))
+        {
+            start_time += item->trimmed_range().duration();
         }
     }
+    start_times.push_back(start_time);
+    return start_times;
+}
 
-    _normalize_tracks_lengths(tracks, tracks_retainer, error_status);
+Track*
+flatten_stack(Stack* in_stack, ErrorStatus* error_status)
+{
+    auto tracks = _enabled_tracks(in_stack, error_status);
     if (is_error(error_status))
     {
         return nullptr;
     }
-
-    Track* flat_track = new Track;
-    flat_track->set_name("Flattened");
-
-    RangeTrackMap range_track_map;
-    _flatten_next_item(
-        range_track_map,
-        flat_track,
-        tracks,
-        -1,
-        std::nullopt,
-        error_status);
-    return flat_track;
+    return _flatten_tracks_to_track(tracks, error_status);
 }
 
 Track*
 flatten_stack(std::vector<Track*> const& tracks, ErrorStatus* error_status)
 {
-    std::vector<Track*> flat_tracks;
-    // tracks are cloned if they need to be normalized
-    // they get added to this retainer so they can be
-    // freed when the algorithm is complete
-    TrackRetainerVector tracks_retainer;
-    flat_tracks.reserve(tracks.size());
-    for (auto track: tracks)
+    return _flatten_tracks_to_track(tracks, error_status);
+}
+
+// The visible clips of a composition in a stack and their ranges, with a
+// cursor into them for scanning times in order.
+struct TopClipComposition
+{
+    std::vector<Clip*>     clips;
+    std::vector<TimeRange> ranges;
+    std::vector<double>    start_seconds;
+    std::vector<double>    end_seconds;
+
+    // Whether the composition is a track, whose clips follow each other so
+    // that their end times are sorted.
+    bool sorted = false;
+
+    // The first clip that does not end before the last time searched.
+    size_t cursor       = 0;
+    double last_seconds = 0;
+};
+
+// Return the index of the first clip of a composition that touches the
+// given time, or the number of clips if there is none.
+static size_t
+_top_clip_index(TopClipComposition& composition, double seconds)
+{
+    size_t const size = composition.clips.size();
+    if (!composition.sorted)
     {
-        flat_tracks.push_back(track);
+        for (size_t i = 0; i < size; i++)
+        {
+            if (composition.start_seconds[i] <= seconds
+                && seconds <= composition.end_seconds[i])
+            {
+                return i;
+            }
+        }
+        return size;
     }
 
-    _normalize_tracks_lengths(flat_tracks, tracks_retainer, error_status);
-    if (is_error(error_status))
+    // Search again when the time goes backwards, otherwise move the cursor
+    // forward past the clips that end before the time.
+    if (seconds < composition.last_seconds)
     {
-        return nullptr;
+        composition.cursor = size_t(
+            std::lower_bound(
+                composition.end_seconds.begin(),
+                composition.end_seconds.end(),
+                seconds)
+            - composition.end_seconds.begin());
+    }
+    composition.last_seconds = seconds;
+    while (composition.cursor < size
+           && composition.end_seconds[composition.cursor] < seconds)
+    {
+        composition.cursor++;
+    }
+    if (composition.cursor < size
+        && composition.start_seconds[composition.cursor] <= seconds)
+    {
+        return composition.cursor;
     }
+    return size;
+}
 
-    Track* flat_track = new Track;
-    flat_track->set_name("Flattened");
+std::vector<TopClip>
+top_clips_at_times(
+    Stack*                           in_stack,
+    std::vector<RationalTime> const& times,
+    ErrorStatus*                     error_status)
+{
+    // Collect the visible clips of the compositions in the stack, from the
+    // top down.
+    std::vector<TopClipComposition> compositions;
+    auto const&                     children = in_stack->children();
+    for (auto child = children.rbegin(); child != children.rend(); ++child)
+    {
+        auto composition = dynamic_cast<Composition*>(child->value);
+        if (!composition)
+        {
+            continue;
+        }
+        auto ranges = composition->range_of_all_children(error_status);
+        if (is_error(error_status))
+        {
+            return {};
+        }
 
-    RangeTrackMap range_track_map;
-    _flatten_next_item(
-        range_track_map,
-        flat_track,
-        flat_tracks,
-        -1,
-        std::nullopt,
-        error_status);
-    return flat_track;
+        compositions.emplace_back();
+        TopClipComposition& top_clip_composition = compositions.back();
+        top_clip_composition.sorted = dynamic_cast<Track*>(composition);
+        for (auto const& grandchild: composition->children())
+        {
+            auto clip = dynamic_cast<Clip*>(grandchild.value);
+            if (!clip || !clip->visible())
+            {
+                continue;
+            }
+            TimeRange const range = ranges[clip];
+            top_clip_composition.clips.push_back(clip);
+            top_clip_composition.ranges.push_back(range);
+            top_clip_composition.start_seconds.push_back(
+                range.start_time().to_seconds());
+            top_clip_composition.end_seconds.push_back(
+                range.end_time_inclusive().to_seconds());
+        }
+    }
+
+    std::vector<TopClip> result(times.size());
+    for (size_t i = 0; i < times.size(); i++)
+    {
+        double const seconds = times[i].to_seconds();
+        for (auto& composition: compositions)
+        {
+            size_t const index = _top_clip_index(composition, seconds);
+            if (index == composition.clips.size())
+            {
+                continue;
+            }
+
+            // Map the time of the stack to the trimmed range of the clip,
+            // then through its time effects.
+            Clip* const clip      = composition.clips[index];
+            result[i].clip        = clip;
+            result[i].source_time = item_source_time(
+                clip,
+                clip->trimmed_range().start_time()
+                    + (times[i] - composition.ranges[index].start_time()),
+                error_status);
+            if (is_error(error_status))
+            {
+                return {};
+            }
+            break;
+        }
+    }
+    return result;
+}
+
+std::vector<TopClip>
+top_clips_at_times(
+    Stack*           in_stack,
+    TimeRange const& range,
+    RationalTime     step,
+    ErrorStatus*     error_status)
+{
+    if (step.value() <= 0)
+    {
+        if (error_status)
+        {
+            *error_status = ErrorStatus(
+                ErrorStatus::INVALID_TIME_RANGE,
+                "the step must be positive");
+        }
+        return {};
+    }
+
+    // Compute each time from the start, at the rate of the range, so that
+    // rounding errors do not accumulate.
+    double const start_value = range.start_time().value();
+    double const rate        = range.start_time().rate();
+    double const step_value  = step.value_rescaled_to(rate);
+    double const end_value =
+        range.end_time_exclusive().value_rescaled_to(rate);
+
+    std::vector<RationalTime> times;
+    for (size_t i = 0; start_value + double(i) * step_value < end_value; i++)
+    {
+        times.push_back(
+            RationalTime(start_value + double(i) * step_value, rate));
+    }
+    return top_clips_at_times(in_stack, times, error_status);
 }
+
+// The state kept by a StackFlattener between updates.
+struct StackFlattener::Cache
+{
+    // The enabled tracks of the stack, and their children and ranges.
+    std::vector<Track*>       tracks;
+    std::vector<FlattenTrack> flatten_tracks;
+
+    // The duration of the stack.
+    RationalTime duration;
+
+    // The start time of each child of the flattened track, followed by the
+    // end time of the last child.
+    std::vector<RationalTime> start_times;
+};
+
+StackFlattener::StackFlattener(Stack* stack, ErrorStatus* error_status)
+    : _stack(stack)
+    , _flattened_track(new Track("Flattened"))
+    , _cache(new Cache)
+{
+    reset(error_status);
+}
+
+StackFlattener::~StackFlattener()
+{}
+
+void
+StackFlattener::update(TimeRange const& range, ErrorStatus* error_status)
+{
+    ErrorStatus status;
+    auto        tracks = _enabled_tracks(_stack, &status);
+    if (is_error(status))
+    {
+        if (error_status)
+        {
+            *error_status = status;
+        }
+        return;
+    }
+    if (tracks != _cache->tracks)
+    {
+        reset(error_status);
+        return;
+    }
+
+    // Collect the children of the tracks that changed again.
+    double const start         = range.start_time().to_seconds();
+    double const end           = range.end_time_exclusive().to_seconds();
+    auto&        flatten_tracks = _cache->flatten_tracks;
+    std::vector<std::optional<TimeRange>> paddings;
+    RationalTime                          duration;
+    for (size_t i = 0; i < tracks.size(); i++)
+    {
+        paddings.push_back(_padding_range(flatten_tracks[i]));
+        if (_flatten_track_changed(tracks[i], flatten_tracks[i], start, end))
+        {
+            _init_flatten_track(tracks[i], flatten_tracks[i], &status);
+            if (is_error(status))
+            {
+                // Flatten the whole stack on the next update.
+                _cache->tracks.clear();
+                if (error_status)
+                {
+                    *error_status = status;
+                }
+                return;
+            }
+        }
+        duration = std::max(duration, flatten_tracks[i].duration);
+    }
+
+    // If the duration of the stack changed, the items after the range were
+    // moved. When the gap that pads a track changes, everything after the
+    // end of the track changes too.
+    double window_start_seconds = start;
+    bool   to_end =
+        std::abs(duration.to_seconds() - _cache->duration.to_seconds())
+        >= DEFAULT_EPSILON_s;
+    for (size_t i = 0; i < tracks.size(); i++)
+    {
+        _pad_flatten_track(flatten_tracks[i], duration);
+        auto const padding = _padding_range(flatten_tracks[i]);
+        if (padding != paddings[i])
+        {
+            for (auto const& p: { padding, paddings[i] })
+            {
+                if (p)
+                {
+                    window_start_seconds = std::min(
+                        window_start_seconds,
+                        p->start_time().to_seconds());
+                }
+            }
+            to_end = true;
+        }
+    }
+
+    // Find the children of the flattened track that touch the range. The
+    // children next to them are unchanged, so the boundaries between them
+    // are also boundaries of the stack flattened again.
+    auto const&  children    = _flattened_track->children();
+    auto&        start_times = _cache->start_times;
+    size_t const count       = children.size();
+    size_t       first       = std::partition_point(
+                       start_times.begin() + 1,
+                       start_times.end(),
+                       [&](RationalTime const& t) {
+                           return window_start_seconds - t.to_seconds()
+                                  > DEFAULT_EPSILON_s;
+                       })
+                   - (start_times.begin() + 1);
+    size_t last = std::partition_point(
+                      start_times.begin(),
+                      start_times.end() - 1,
+                      [&](RationalTime const& t) {
+                          return t.to_seconds() - end < DEFAULT_EPSILON_s;
+                      })
+                  - start_times.begin();
+    last = to_end ? count : std::max(first, last);
+
+    // Transitions cannot be trimmed and children with no duration are
+    // dropped at the ends of a trimmed range, so include them with the
+    // children on both sides of them.
+    auto is_empty = [&](size_t i) {
+        return start_times[i + 1] == start_times[i];
+    };
+    while (first > 0
+           && (is_empty(first - 1) || (first < count && is_empty(first))))
+    {
+        --first;
+    }
+    while (last < count && (is_empty(last) || (last > 0 && is_empty(last - 1))))
+    {
+        ++last;
+    }
+
+    RationalTime window_start = start_times[first];
+    RationalTime window_end   = last < count ? start_times[last] : duration;
+    if (first == last && window_end <= window_start)
+    {
+        _cache->duration = duration;
+        return;
+    }
+
+    // Extend the range by a frame past the start and end of the stack so
+    // that the children with no duration there are kept.
+    RationalTime const frame(1, window_end.rate());
+    if (first == 0)
+    {
+        window_start -= frame;
+    }
+    if (last == count)
+    {
+        window_end += frame;
+    }
+
+    ComposableRetainerVector pieces;
+    if (!flatten_tracks.empty())
+    {
+        _flatten_range(
+            flatten_tracks,
+            pieces,
+            int(flatten_tracks.size()) - 1,
+            TimeRange::range_from_start_end_time(window_start, window_end),
+            &status);
+    }
+    if (status.outcome == ErrorStatus::CANNOT_TRIM_TRANSITION)
+    {
+        reset(error_status);
+        return;
+    }
+    if (is_error(status))
+    {
+        _cache->tracks.clear();
+        if (error_status)
+        {
+            *error_status = status;
+        }
+        return;
+    }
+
+    // Splice the pieces into the flattened track; the retainers keep the
+    // unchanged children alive while the children are replaced.
+    ComposableRetainerVector flat_children;
+    flat_children.reserve(count - (last - first) + pieces.size());
+    flat_children.insert(
+        flat_children.end(),
+        children.begin(),
+        children.begin() + first);
+    flat_children.insert(flat_children.end(), pieces.begin(), pieces.end());
+    flat_children.insert(
+        flat_children.end(),
+        children.begin() + last,
+        children.end());
+    _flattened_track->clear_children();
+    _set_flat_children(_flattened_track, flat_children, error_status);
+
+    auto const piece_start_times =
+        _flat_start_times(pieces, start_times[first]);
+    start_times.erase(
+        start_times.begin() + first,
+        start_times.begin() + last + 1);
+    start_times.insert(
+        start_times.begin() + first,
+        piece_start_times.begin(),
+        piece_start_times.end());
+    _cache->duration = duration;
+}
+
+void
+StackFlattener::reset(ErrorStatus* error_status)
+{
+    ErrorStatus               status;
+    RationalTime              duration;
+    std::vector<FlattenTrack> flatten_tracks;
+    auto                      tracks = _enabled_tracks(_stack, &status);
+    if (!is_error(status))
+    {
+        flatten_tracks = _flatten_tracks(tracks, duration, &status);
+    }
+
+    ComposableRetainerVector flat_children;
+    if (!is_error(status) && !flatten_tracks.empty())
+    {
+        _flatten_range(
+            flatten_tracks,
+            flat_children,
+            int(flatten_tracks.size()) - 1,
+            std::nullopt,
+            &status);
+    }
+    if (is_error(status))
+    {
+        _cache->tracks.clear();
+        if (error_status)
+        {
+            *error_status = status;
+        }
+        return;
+    }
+
+    _flattened_track->clear_children();
+    _set_flat_children(_flattened_track, flat_children, error_status);
+    _cache->tracks         = tracks;
+    _cache->flatten_tracks = std::move(flatten_tracks);
+    _cache->duration       = duration;
+    _cache->start_times    = _flat_start_times(flat_children, RationalTime());
+}
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
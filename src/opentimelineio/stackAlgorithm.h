@@ -7,8 +7,13 @@
 #include "opentimelineio/track.h"
 #include "opentimelineio/version.h"
 
+#include <memory>
+#include <vector>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
+class Clip;
+
 /// @brief Flatten a stack down to a single track.
 OTIO_API Track*
 flatten_stack(Stack* in_stack, ErrorStatus* error_status = nullptr);
@@ -18,4 +23,112 @@ OTIO_API Track* flatten_stack(
     std::vector<Track*> const& tracks,
     ErrorStatus*               error_status = nullptr);
 
+/// @brief The top clip of a stack at a time, and the time of its source
+/// media at that time.
+struct TopClip
+{
+    /// @brief The clip, or null if no clip is visible at the time.
+    SerializableObject::Retainer<Clip> clip;
+
+    /// @brief The time of the clip's source media, with the time effects of
+    /// the clip applied.
+    RationalTime source_time;
+};
+
+/// @brief Return the topmost visible clip of a stack at each of the given
+/// times.
+///
+/// The clips are the ones that top_clip_at_time() returns in Python: the
+/// children of the stack are searched from the top down, and the first
+/// visible clip that is a direct child of a track or other composition in
+/// the stack and touches the time is returned.
+///
+/// The times should be sorted: each track keeps a cursor that only moves
+/// forward while the times increase, so a scan of every frame of a stack
+/// costs O(frames + clips) per track rather than a search of each track
+/// per frame. Times that go backwards are still handled, with a binary
+/// search.
+///
+/// @param in_stack The stack.
+/// @param times The times, in the time of the stack.
+/// @param error_status The return status.
+OTIO_API std::vector<TopClip> top_clips_at_times(
+    Stack*                           in_stack,
+    std::vector<RationalTime> const& times,
+    ErrorStatus*                     error_status = nullptr);
+
+/// @brief Return the topmost visible clip of a stack at each step of a
+/// range, as top_clips_at_times() does for a list of times.
+///
+/// @param in_stack The stack.
+/// @param range The range; the times start at its start time and stop
+/// before its end.
+/// @param step The time between the times, which must be positive.
+/// @param error_status The return status.
+OTIO_API std::vector<TopClip> top_clips_at_times(
+    Stack*           in_stack,
+    TimeRange const& range,
+    RationalTime     step,
+    ErrorStatus*     error_status = nullptr);
+
+/// @brief This class keeps a flattened copy of a stack up to date as the
+/// stack is edited.
+///
+/// The stack is flattened when the flattener is created, as with
+/// flatten_stack(). After an edit of the stack, update() flattens only the
+/// part of the stack that the edit changed and replaces that part of the
+/// flattened track, which is much cheaper than flattening the whole stack
+/// again for small edits.
+class OTIO_API_TYPE StackFlattener
+{
+public:
+    /// @brief Create a new flattener and flatten the stack.
+    ///
+    /// @param stack The stack.
+    /// @param error_status The return status.
+    OTIO_API explicit StackFlattener(
+        Stack*       stack,
+        ErrorStatus* error_status = nullptr);
+
+    OTIO_API ~StackFlattener();
+
+    StackFlattener(StackFlattener const&)            = delete;
+    StackFlattener& operator=(StackFlattener const&) = delete;
+
+    /// @brief Return the stack.
+    Stack* stack() const noexcept { return _stack; }
+
+    /// @brief Return the flattened track.
+    Track* flattened_track() const noexcept { return _flattened_track; }
+
+    /// @brief Update the flattened track after an edit of the stack.
+    ///
+    /// The range is the range of the stack, after the edit, that the edit
+    /// changed, including the items that it moved; the rest of the stack
+    /// must be unchanged. Only the tracks that changed are searched again,
+    /// and only the children of the flattened track that touch the range
+    /// are flattened again. If the duration of the stack changed,
+    /// everything after the range is flattened again too.
+    ///
+    /// If the range cannot be flattened on its own, for example because it
+    /// starts within a transition, the whole stack is flattened again.
+    ///
+    /// @param range The range of the stack that was changed.
+    /// @param error_status The return status.
+    OTIO_API void
+    update(TimeRange const& range, ErrorStatus* error_status = nullptr);
+
+    /// @brief Flatten the whole stack again.
+    ///
+    /// @param error_status The return status.
+    OTIO_API void reset(ErrorStatus* error_status = nullptr);
+
+private:
+    struct Cache;
+
+    SerializableObject::Retainer<Stack> _stack;
+    SerializableObject::Retainer<Track> _flattened_track;
+    std::unique_ptr<Cache>              _cache;
+};
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
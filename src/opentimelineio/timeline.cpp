@@ -3,6 +3,10 @@
 
 #include "opentimelineio/timeline.h"
 #include "opentimelineio/clip.h"
+#include "opentimelineio/transition.h"
+
+#include <cmath>
+#include <map>
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
@@ -86,4 +90,189 @@ Timeline::find_clips(
         shallow_search);
 }
 
+namespace {
+
+// Return the index of key in table, adding it if it is not there yet.
+template <typename Key, typename Value>
+int64_t
+_table_index(
+    std::map<Key, int64_t>& indices,
+    std::vector<Value>&     table,
+    Key const&              key,
+    Value const&            value)
+{
+    auto e = indices.find(key);
+    if (e != indices.end())
+    {
+        return e->second;
+    }
+
+    int64_t index = static_cast<int64_t>(table.size());
+    indices.emplace(key, index);
+    table.push_back(value);
+    return index;
+}
+
+class _ColumnBuilder
+{
+public:
+    _ColumnBuilder(TimelineColumns& columns)
+        : _columns(columns)
+    {}
+
+    void add_row(
+        int64_t                  track_index,
+        Composable*              child,
+        TimeRange const&         range,
+        std::optional<TimeRange> trimmed_range)
+    {
+        double const      rate        = range.duration().rate();
+        std::string const schema_name = child->schema_name();
+        _columns.track_index.push_back(track_index);
+        _columns.schema_index.push_back(_table_index(
+            _schema_indices,
+            _columns.schema_names,
+            schema_name,
+            schema_name));
+        _columns.start.push_back(range.start_time().value_rescaled_to(rate));
+        _columns.duration.push_back(range.duration().value());
+        _columns.source_start.push_back(
+            trimmed_range ? trimmed_range->start_time().value_rescaled_to(rate)
+                          : std::nan(""));
+        _columns.rate.push_back(rate);
+        std::string const name = child->name();
+        _columns.name_index.push_back(
+            _table_index(_name_indices, _columns.names, name, name));
+
+        int64_t media_reference_index = -1;
+        if (auto clip = dynamic_cast<Clip*>(child))
+        {
+            if (auto media_reference = clip->media_reference())
+            {
+                media_reference_index = _table_index(
+                    _media_reference_indices,
+                    _columns.media_references,
+                    media_reference,
+                    SerializableObject::Retainer<MediaReference>(
+                        media_reference));
+            }
+        }
+        _columns.media_reference_index.push_back(media_reference_index);
+    }
+
+private:
+    TimelineColumns&                   _columns;
+    std::map<std::string, int64_t>     _schema_indices;
+    std::map<std::string, int64_t>     _name_indices;
+    std::map<MediaReference*, int64_t> _media_reference_indices;
+};
+
+} // namespace
+
+TimelineColumns
+Timeline::to_columns(ErrorStatus* error_status) const
+{
+    TimelineColumns columns;
+    _ColumnBuilder  builder(columns);
+
+    auto const& tracks = _tracks->children();
+    for (size_t i = 0; i < tracks.size(); ++i)
+    {
+        int64_t const track_index = static_cast<int64_t>(i);
+        if (auto track = dynamic_retainer_cast<Track>(tracks[i]))
+        {
+            // The same arithmetic as Track::range_of_all_children(), without
+            // computing each trimmed range twice or building a map.
+            auto const& children = track->children();
+            if (children.empty())
+            {
+                continue;
+            }
+
+            double rate = 1;
+            if (auto transition =
+                    dynamic_retainer_cast<Transition>(children.front()))
+            {
+                rate = transition->in_offset().rate();
+            }
+            else if (
+                auto item = dynamic_retainer_cast<Item>(children.front()))
+            {
+                rate = item->trimmed_range(error_status).duration().rate();
+                if (is_error(error_status))
+                {
+                    return columns;
+                }
+            }
+
+            RationalTime last_end_time(0, rate);
+            for (auto const& child: children)
+            {
+                if (auto transition = dynamic_retainer_cast<Transition>(child))
+                {
+                    builder.add_row(
+                        track_index,
+                        child,
+                        TimeRange(
+                            last_end_time - transition->in_offset(),
+                            transition->out_offset()
+                                + transition->in_offset()),
+                        std::nullopt);
+                }
+                else if (auto item = dynamic_retainer_cast<Item>(child))
+                {
+                    TimeRange const trimmed_range =
+                        item->trimmed_range(error_status);
+                    if (is_error(error_status))
+                    {
+                        return columns;
+                    }
+
+                    TimeRange const range(
+                        last_end_time,
+                        trimmed_range.duration());
+                    builder.add_row(track_index, child, range, trimmed_range);
+                    last_end_time = range.end_time_exclusive();
+                }
+            }
+        }
+        else if (
+            auto composition = dynamic_retainer_cast<Composition>(tracks[i]))
+        {
+            auto const ranges =
+                composition->range_of_all_children(error_status);
+            if (is_error(error_status))
+            {
+                return columns;
+            }
+
+            for (auto const& child: composition->children())
+            {
+                auto range = ranges.find(child);
+                if (range == ranges.end())
+                {
+                    continue;
+                }
+
+                std::optional<TimeRange> trimmed_range;
+                if (auto item = dynamic_retainer_cast<Item>(child))
+                {
+                    trimmed_range = item->trimmed_range(error_status);
+                    if (is_error(error_status))
+                    {
+                        return columns;
+                    }
+                }
+                builder.add_row(
+                    track_index,
+                    child,
+                    range->second,
+                    trimmed_range);
+            }
+        }
+    }
+
+    return columns;
+}
+
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
@@ -0,0 +1,323 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "opentimelineio/timelineAlgorithm.h"
+#include "opentimelineio/effect.h"
+#include "opentimelineio/externalReference.h"
+#include "opentimelineio/imageSequenceReference.h"
+#include "opentimelineio/itemAlgorithm.h"
+#include "opentimelineio/marker.h"
+#include "opentimelineio/track.h"
+#include "opentimelineio/trackAlgorithm.h"
+#include "opentimelineio/transition.h"
+
+#include <map>
+#include <typeinfo>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
+
+namespace {
+
+RationalTime
+scaled(RationalTime time, double scalar)
+{
+    return RationalTime(time.value() * scalar, time.rate());
+}
+
+// Map a range of an item's time through the time effects of the item, as
+// item_source_times() maps single times. Time effects that cannot be
+// evaluated are ignored.
+TimeRange
+apply_time_effects(Item const* item, TimeRange range, RationalTime anchor)
+{
+    double const scalar = item_time_scalar(item);
+    if (scalar == 1)
+    {
+        return range;
+    }
+
+    // A frozen item shows the frame at the anchor; a reversed item shows
+    // frames counting down from the start of the range.
+    RationalTime frame(1, range.duration().rate());
+    if (scalar == 0)
+    {
+        return TimeRange(anchor, frame);
+    }
+    if (scalar > 0)
+    {
+        return TimeRange(
+            anchor + scaled(range.start_time() - anchor, scalar),
+            scaled(range.duration(), scalar));
+    }
+    RationalTime last = range.end_time_exclusive() - frame;
+    return TimeRange(
+        anchor + scaled(last - anchor, scalar),
+        scaled(range.duration() - frame, -scalar) + frame);
+}
+
+std::string
+media_key(MediaReference const* media_reference)
+{
+    if (auto external = dynamic_cast<ExternalReference const*>(media_reference))
+    {
+        return external->target_url();
+    }
+    if (auto sequence =
+            dynamic_cast<ImageSequenceReference const*>(media_reference))
+    {
+        return sequence->target_url_base() + sequence->name_prefix()
+               + sequence->name_suffix();
+    }
+    return std::string();
+}
+
+class MediaUsageBuilder
+{
+public:
+    MediaUsageBuilder(RationalTime handles, ErrorStatus* error_status)
+        : _handles{ handles }
+        , _error_status{ error_status }
+    {}
+
+    // Visit an item, given the range of its trimmed range that is visible.
+    void visit(Item* item, TimeRange range)
+    {
+        TimeRange trimmed = item->trimmed_range(_error_status);
+        if (is_error(_error_status))
+        {
+            return;
+        }
+        range = apply_time_effects(item, range, trimmed.start_time());
+
+        if (auto clip = dynamic_cast<Clip*>(item))
+        {
+            add_clip(clip, range);
+        }
+        else if (auto composition = dynamic_cast<Composition*>(item))
+        {
+            visit_children(composition, range);
+        }
+    }
+
+    std::vector<MediaUsage> usages;
+
+private:
+    void visit_children(Composition* composition, TimeRange range)
+    {
+        auto child_ranges = composition->range_of_all_children(_error_status);
+        if (is_error(_error_status))
+        {
+            return;
+        }
+
+        // Transition handles match Track::handles_of_child(), but looking at
+        // the neighbors by index avoids searching the track for each child.
+        auto const& children = composition->children();
+        bool const  is_track = dynamic_cast<Track*>(composition) != nullptr;
+        for (size_t i = 0; i < children.size(); ++i)
+        {
+            auto item = dynamic_retainer_cast<Item>(children[i]);
+            if (!item || !item->enabled())
+            {
+                continue;
+            }
+
+            TimeRange const child_range = child_ranges[item.value];
+            RationalTime    start       = range.start_time();
+            RationalTime    end         = range.end_time_exclusive();
+            bool const at_head = start <= child_range.start_time();
+            bool const at_tail = end >= child_range.end_time_exclusive();
+            start = at_head ? child_range.start_time() : start;
+            end   = at_tail ? child_range.end_time_exclusive() : end;
+            if (end <= start)
+            {
+                continue;
+            }
+
+            TimeRange trimmed = item->trimmed_range(_error_status);
+            if (is_error(_error_status))
+            {
+                return;
+            }
+            start = start - child_range.start_time() + trimmed.start_time();
+            end   = end - child_range.start_time() + trimmed.start_time();
+
+            if (is_track && at_head && i > 0)
+            {
+                if (auto transition =
+                        dynamic_retainer_cast<Transition>(children[i - 1]))
+                {
+                    start -= transition->in_offset();
+                }
+            }
+            if (is_track && at_tail && i + 1 < children.size())
+            {
+                if (auto transition =
+                        dynamic_retainer_cast<Transition>(children[i + 1]))
+                {
+                    end += transition->out_offset();
+                }
+            }
+
+            visit(item, TimeRange::range_from_start_end_time(start, end));
+            if (is_error(_error_status))
+            {
+                return;
+            }
+        }
+    }
+
+    void add_clip(Clip* clip, TimeRange range)
+    {
+        MediaReference* media_reference = clip->media_reference();
+        if (!media_reference)
+        {
+            return;
+        }
+
+        std::string const key = media_key(media_reference);
+        size_t const      index =
+            key.empty() ? usage_index(_by_reference, media_reference)
+                        : usage_index(_by_key, key);
+        if (index == usages.size())
+        {
+            usages.push_back(
+                MediaUsage{ media_reference, {}, opentime::TimeRangeSet() });
+        }
+
+        if (_handles.value() != 0)
+        {
+            range = TimeRange(
+                range.start_time() - _handles,
+                range.duration() + _handles + _handles);
+        }
+        usages[index].clips.push_back(clip);
+        usages[index].ranges.add(range);
+    }
+
+    // Return the index of the usage for the given key, adding the key with
+    // the index of a new usage if it is not found.
+    template <typename Key>
+    size_t usage_index(
+        std::map<Key, size_t>&                          indices,
+        typename std::map<Key, size_t>::key_type const& key)
+    {
+        return indices.emplace(key, usages.size()).first->second;
+    }
+
+    RationalTime                             _handles;
+    ErrorStatus*                             _error_status;
+    std::map<std::string, size_t>            _by_key;
+    std::map<MediaReference const*, size_t>  _by_reference;
+};
+
+} // namespace
+
+Timeline*
+timeline_trimmed_to_range(
+    Timeline*    in_timeline,
+    TimeRange    trim_range,
+    ErrorStatus* error_status)
+{
+    // Trim each track, which clones only the children that are kept.
+    Stack* stack = in_timeline->tracks();
+    std::vector<SerializableObject::Retainer<Track>> new_tracks;
+    new_tracks.reserve(stack->children().size());
+    for (auto const& child: stack->children())
+    {
+        auto track = dynamic_cast<Track*>(child.value);
+        if (!track)
+        {
+            if (error_status)
+            {
+                *error_status = ErrorStatus(
+                    ErrorStatus::TYPE_MISMATCH,
+                    "Expected child of type Track*",
+                    child);
+            }
+            return nullptr;
+        }
+        new_tracks.push_back(
+            track_trimmed_to_range(track, trim_range, error_status));
+        if (is_error(error_status))
+        {
+            return nullptr;
+        }
+    }
+
+    // Clone the rest of the timeline from a twin whose stack shares the
+    // properties of the timeline's stack but has no children. Subclasses of
+    // Timeline or Stack may have properties that the twin would lose, so
+    // they are cloned whole and the children of the cloned stack removed.
+    SerializableObject::Retainer<Timeline> new_timeline;
+    if (typeid(*in_timeline) != typeid(Timeline)
+        || typeid(*stack) != typeid(Stack))
+    {
+        new_timeline =
+            dynamic_cast<Timeline*>(in_timeline->clone(error_status));
+        if (is_error(error_status) || !new_timeline)
+        {
+            return nullptr;
+        }
+        new_timeline->tracks()->clear_children();
+    }
+    else
+    {
+        SerializableObject::Retainer<Stack> twin_stack(new Stack(
+            stack->name(),
+            stack->source_range(),
+            stack->metadata()));
+        twin_stack->set_enabled(stack->enabled());
+        twin_stack->set_color(stack->color());
+        twin_stack->effects()        = stack->effects();
+        twin_stack->markers()        = stack->markers();
+        twin_stack->dynamic_fields() = stack->dynamic_fields();
+
+        SerializableObject::Retainer<Timeline> twin(new Timeline(
+            in_timeline->name(),
+            in_timeline->global_start_time(),
+            in_timeline->metadata()));
+        twin->set_tracks(twin_stack);
+        twin->dynamic_fields() = in_timeline->dynamic_fields();
+
+        new_timeline = dynamic_cast<Timeline*>(twin->clone(error_status));
+        if (is_error(error_status) || !new_timeline)
+        {
+            return nullptr;
+        }
+    }
+    for (auto const& new_track: new_tracks)
+    {
+        new_timeline->tracks()->append_child(new_track, error_status);
+        if (is_error(error_status))
+        {
+            return nullptr;
+        }
+    }
+    return new_timeline.take_value();
+}
+
+std::vector<MediaUsage>
+media_usage(Composition* root, RationalTime handles, ErrorStatus* error_status)
+{
+    MediaUsageBuilder builder(handles, error_status);
+    TimeRange         range = root->trimmed_range(error_status);
+    if (is_error(error_status))
+    {
+        return {};
+    }
+    builder.visit(root, range);
+    if (is_error(error_status))
+    {
+        return {};
+    }
+    return std::move(builder.usages);
+}
+
+std::vector<MediaUsage>
+media_usage(Timeline* timeline, RationalTime handles, ErrorStatus* error_status)
+{
+    return media_usage(timeline->tracks(), handles, error_status);
+}
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
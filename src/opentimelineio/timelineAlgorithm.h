@@ -0,0 +1,72 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#pragma once
+
+#include "opentimelineio/clip.h"
+#include "opentimelineio/composition.h"
+#include "opentimelineio/mediaReference.h"
+#include "opentimelineio/timeline.h"
+#include "opentimelineio/version.h"
+
+#include "opentime/timeRangeSet.h"
+
+#include <vector>
+
+namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
+
+/// @brief Return a copy of the timeline with each of its tracks trimmed to
+/// the given range, as track_trimmed_to_range() trims a track.
+///
+/// Each track is cloned once, keeping only the children that intersect the
+/// range. If a child of the timeline's stack is not a track, error_status
+/// is set to TYPE_MISMATCH.
+OTIO_API Timeline* timeline_trimmed_to_range(
+    Timeline*    in_timeline,
+    TimeRange    trim_range,
+    ErrorStatus* error_status = nullptr);
+
+/// @brief The source media used from one media reference.
+struct MediaUsage
+{
+    /// @brief The first media reference found for the media.
+    SerializableObject::Retainer<MediaReference> media_reference;
+
+    /// @brief The clips that use the media, in the order they were found.
+    std::vector<SerializableObject::Retainer<Clip>> clips;
+
+    /// @brief The merged ranges of the media that are used, in the time of
+    /// the media reference.
+    opentime::TimeRangeSet ranges;
+};
+
+/// @brief Return the source media used by each distinct media reference
+/// below the given composition.
+///
+/// The composition is traversed once. For every enabled clip, the part of
+/// its trimmed range that is visible through its parents is mapped to the
+/// time of its media reference, accounting for the trimming of nested
+/// compositions, linear time warps and freeze frames on the clip and its
+/// parents, and the handles needed by neighboring transitions. The given
+/// handles are then added to both ends, and the ranges of each media are
+/// merged.
+///
+/// Media references are grouped by target URL; references without one are
+/// grouped by identity. The results are in the order the media were found.
+///
+/// @param root The composition to traverse.
+/// @param handles The amount of media to add before and after each use.
+/// @param error_status The return status.
+OTIO_API std::vector<MediaUsage> media_usage(
+    Composition* root,
+    RationalTime handles      = RationalTime(),
+    ErrorStatus* error_status = nullptr);
+
+/// @brief Return the source media used by each distinct media reference
+/// in the given timeline.
+OTIO_API std::vector<MediaUsage> media_usage(
+    Timeline*    timeline,
+    RationalTime handles      = RationalTime(),
+    ErrorStatus* error_status = nullptr);
+
+}} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
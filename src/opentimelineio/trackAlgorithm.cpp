@@ -2,36 +2,70 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include "opentimelineio/trackAlgorithm.h"
+#include "opentimelineio/effect.h"
+#include "opentimelineio/marker.h"
 #include "opentimelineio/transition.h"
 
+#include <algorithm>
+#include <typeinfo>
+
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
+namespace {
+
+// Return a clone of a track without its children.
+//
+// A plain track is cloned from a twin that shares its properties but has no
+// children, so that its children are not copied only to be thrown away, and
+// everything else is deep copied as clone() would. Subclasses of Track may
+// have properties that the twin would lose, so they are cloned whole and the
+// children of the clone are removed.
+Track*
+clone_without_children(Track* track, ErrorStatus* error_status)
+{
+    if (typeid(*track) != typeid(Track))
+    {
+        Track* clone = dynamic_cast<Track*>(track->clone(error_status));
+        if (clone)
+        {
+            clone->clear_children();
+        }
+        return clone;
+    }
+
+    SerializableObject::Retainer<Track> twin(new Track(
+        track->name(),
+        track->source_range(),
+        track->kind(),
+        track->metadata(),
+        track->color()));
+    twin->set_enabled(track->enabled());
+    twin->effects()        = track->effects();
+    twin->markers()        = track->markers();
+    twin->dynamic_fields() = track->dynamic_fields();
+    return dynamic_cast<Track*>(twin->clone(error_status));
+}
+
+} // namespace
+
 Track*
 track_trimmed_to_range(
     Track*       in_track,
     TimeRange    trim_range,
     ErrorStatus* error_status)
 {
-    Track* new_track = dynamic_cast<Track*>(in_track->clone(error_status));
-    if (is_error(error_status) || !new_track)
-    {
-        return nullptr;
-    }
-
-    auto track_map = new_track->range_of_all_children(error_status);
+    auto track_map = in_track->range_of_all_children(error_status);
     if (is_error(error_status))
     {
         return nullptr;
     }
 
-    std::vector<Composable*> children_copy(
-        new_track->children().begin(),
-        new_track->children().end());
-
-    for (size_t i = children_copy.size(); i--;)
+    auto const&            children = in_track->children();
+    std::vector<TimeRange> ranges;
+    ranges.reserve(children.size());
+    for (auto const& child: children)
     {
-        Composable* child          = children_copy[i];
-        auto        child_range_it = track_map.find(child);
+        auto child_range_it = track_map.find(child);
         if (child_range_it == track_map.end())
         {
             if (error_status)
@@ -42,17 +76,92 @@ track_trimmed_to_range(
             }
             return nullptr;
         }
+        ranges.push_back(child_range_it->second);
+    }
+
+    // The items of a track follow each other, so their ranges are sorted
+    // and the ones that intersect the trim range can be found by bisection,
+    // with the same tolerance as TimeRange::intersects(). Transitions may
+    // reach past the items next to them, so they are checked separately.
+    std::vector<size_t> item_indices;
+    std::vector<size_t> transition_indices;
+    item_indices.reserve(children.size());
+    for (size_t i = 0; i < children.size(); i++)
+    {
+        if (dynamic_cast<Transition*>(children[i].value))
+        {
+            transition_indices.push_back(i);
+        }
+        else
+        {
+            item_indices.push_back(i);
+        }
+    }
+    double const trim_start = trim_range.start_time().to_seconds();
+    double const trim_end   = trim_range.end_time_exclusive().to_seconds();
+    auto const   first_item = std::partition_point(
+        item_indices.begin(),
+        item_indices.end(),
+        [&](size_t i) {
+            return ranges[i].end_time_exclusive().to_seconds() - trim_start
+                   < opentime::DEFAULT_EPSILON_s;
+        });
+    auto const last_item = std::partition_point(
+        first_item,
+        item_indices.end(),
+        [&](size_t i) {
+            return trim_end - ranges[i].start_time().to_seconds()
+                   >= opentime::DEFAULT_EPSILON_s;
+        });
 
-        auto child_range = child_range_it->second;
-        if (!trim_range.intersects(child_range))
+    // Collect the children to keep, in order: the transitions before the
+    // first item, the children from the first to the last item, and the
+    // transitions after the last item.
+    size_t first = 0;
+    size_t last  = 0;
+    if (first_item != last_item)
+    {
+        first = *first_item;
+        last  = *(last_item - 1) + 1;
+    }
+    std::vector<size_t> kept_indices;
+    for (size_t i: transition_indices)
+    {
+        if (i < first && trim_range.intersects(ranges[i]))
         {
-            new_track->remove_child(static_cast<int>(i), error_status);
-            if (is_error(error_status))
-            {
-                return nullptr;
-            }
+            kept_indices.push_back(i);
+        }
+    }
+    for (size_t i = first; i < last; i++)
+    {
+        if (trim_range.intersects(ranges[i]))
+        {
+            kept_indices.push_back(i);
+        }
+    }
+    for (size_t i: transition_indices)
+    {
+        if (i >= last && trim_range.intersects(ranges[i]))
+        {
+            kept_indices.push_back(i);
         }
-        else if (!trim_range.contains(child_range))
+    }
+
+    SerializableObject::Retainer<Track> new_track(
+        clone_without_children(in_track, error_status));
+    if (is_error(error_status) || !new_track)
+    {
+        return nullptr;
+    }
+
+    // Only the children that are kept are cloned.
+    std::vector<SerializableObject::Retainer<Composable>> new_children;
+    new_children.reserve(kept_indices.size());
+    for (size_t i: kept_indices)
+    {
+        Composable* child       = children[i];
+        auto const& child_range = ranges[i];
+        if (!trim_range.contains(child_range))
         {
             if (dynamic_cast<Transition*>(child))
             {
@@ -64,9 +173,7 @@ track_trimmed_to_range(
                 }
                 return nullptr;
             }
-
-            Item* child_item = dynamic_cast<Item*>(child);
-            if (!child_item)
+            if (!dynamic_cast<Item*>(child))
             {
                 if (error_status)
                 {
@@ -77,36 +184,60 @@ track_trimmed_to_range(
                 }
                 return nullptr;
             }
-            auto child_source_range = child_item->trimmed_range(error_status);
-            if (is_error(error_status))
-            {
-                return nullptr;
-            }
+        }
 
-            if (trim_range.start_time() > child_range.start_time())
-            {
-                auto trim_amount =
-                    trim_range.start_time() - child_range.start_time();
-                child_source_range = TimeRange(
-                    child_source_range.start_time() + trim_amount,
-                    child_source_range.duration() - trim_amount);
-            }
+        SerializableObject::Retainer<Composable> new_child(
+            dynamic_cast<Composable*>(child->clone(error_status)));
+        if (is_error(error_status))
+        {
+            return nullptr;
+        }
+        new_children.push_back(new_child);
 
-            auto trim_end  = trim_range.end_time_exclusive();
-            auto child_end = child_range.end_time_exclusive();
-            if (trim_end < child_end)
-            {
-                auto trim_amount   = child_end - trim_end;
-                child_source_range = TimeRange(
-                    child_source_range.start_time(),
-                    child_source_range.duration() - trim_amount);
-            }
+        if (trim_range.contains(child_range))
+        {
+            continue;
+        }
 
-            child_item->set_source_range(child_source_range);
+        // Trim the ends of the items that cross the ends of the range.
+        Item* child_item         = dynamic_cast<Item*>(new_child.value);
+        auto  child_source_range = child_item->trimmed_range(error_status);
+        if (is_error(error_status))
+        {
+            return nullptr;
+        }
+
+        if (trim_range.start_time() > child_range.start_time())
+        {
+            auto trim_amount =
+                trim_range.start_time() - child_range.start_time();
+            child_source_range = TimeRange(
+                child_source_range.start_time() + trim_amount,
+                child_source_range.duration() - trim_amount);
         }
+
+        auto trim_end_time = trim_range.end_time_exclusive();
+        auto child_end     = child_range.end_time_exclusive();
+        if (trim_end_time < child_end)
+        {
+            auto trim_amount   = child_end - trim_end_time;
+            child_source_range = TimeRange(
+                child_source_range.start_time(),
+                child_source_range.duration() - trim_amount);
+        }
+
+        child_item->set_source_range(child_source_range);
     }
 
-    return new_track;
+    for (auto const& new_child: new_children)
+    {
+        new_track->append_child(new_child, error_status);
+        if (is_error(error_status))
+        {
+            return nullptr;
+        }
+    }
+    return new_track.take_value();
 }
 
 }} // namespace opentimelineio::OPENTIMELINEIO_VERSION_NS
@@ -8,7 +8,15 @@
 
 namespace opentimelineio { namespace OPENTIMELINEIO_VERSION_NS {
 
-/// @brief Trim the track to the given range.
+/// @brief Return a copy of the track with the children outside the given
+/// range removed and the children at the ends of the range trimmed to it.
+///
+/// The track is never expanded, only shortened. Only the children that are
+/// kept are cloned; the children that intersect the range are found by
+/// bisection.
+///
+/// If a transition crosses an end of the range, error_status is set to
+/// CANNOT_TRIM_TRANSITION.
 OTIO_API Track* track_trimmed_to_range(
     Track*       in_track,
     TimeRange    trim_range,
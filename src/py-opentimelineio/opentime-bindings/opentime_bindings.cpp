@@ -9,5 +9,8 @@ PYBIND11_MODULE(_opentime, m)
     m.doc() = "Bindings to C++ OTIO implementation";
     opentime_rationalTime_bindings(m);
     opentime_timeRange_bindings(m);
+    opentime_timeRangeSet_bindings(m);
     opentime_timeTransform_bindings(m);
+    opentime_tickTime_bindings(m);
+    opentime_timeArrays_bindings(m);
 }
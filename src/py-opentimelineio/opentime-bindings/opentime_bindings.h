@@ -10,7 +10,10 @@
 
 void opentime_rationalTime_bindings(pybind11::module);
 void opentime_timeRange_bindings(pybind11::module);
+void opentime_timeRangeSet_bindings(pybind11::module);
 void opentime_timeTransform_bindings(pybind11::module);
+void opentime_tickTime_bindings(pybind11::module);
+void opentime_timeArrays_bindings(pybind11::module);
 
 std::string opentime_python_str(opentime::RationalTime rt);
 std::string opentime_python_repr(opentime::RationalTime rt);
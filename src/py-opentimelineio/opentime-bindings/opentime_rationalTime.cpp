@@ -6,7 +6,9 @@
 #include <pybind11/stl.h>
 
 #include "opentime/rationalTime.h"
+#include "opentime/timecodeFormatter.h"
 #include "opentimelineio/stringUtils.h"
+#include "opentime_timeArrays.h"
 
 namespace py = pybind11;
 using namespace pybind11::literals;
@@ -46,6 +48,25 @@ df_enum_converter(std::optional<bool>& df)
         return IsDropFrameRate::ForceNo;
     }
 }
+
+std::optional<bool>
+df_optional_converter(IsDropFrameRate df)
+{
+    if (df == IsDropFrameRate::InferFromRate)
+    {
+        return std::nullopt;
+    }
+    return df == IsDropFrameRate::ForceYes;
+}
+
+void
+throw_element_error(size_t index, ErrorStatus const& error_status)
+{
+    throw py::value_error(string_printf(
+        "element %zu: %s",
+        index,
+        error_status.details.c_str()));
+}
 } // namespace
 
 std::string
@@ -63,6 +84,14 @@ opentime_python_repr(RationalTime rt)
         rt.rate());
 }
 
+// Comparisons with a RationalTimeArray are left to the array, which
+// compares each of its times.
+py::object
+_compared_by_array(RationalTime, RationalTimeArray const&)
+{
+    return py::reinterpret_borrow<py::object>(Py_NotImplemented);
+}
+
 RationalTime
 _type_checked(py::object const& rhs, char const* op)
 {
@@ -285,31 +314,37 @@ For example, the duration of a clip from frame 10 to frame 15 is 6 frames. Resul
         .def("__str__", &opentime_python_str)
         .def("__repr__", &opentime_python_repr)
         .def(-py::self)
+        .def("__lt__", &_compared_by_array)
         .def(
             "__lt__",
             [](RationalTime lhs, py::object const& rhs) {
                 return lhs < _type_checked(rhs, "<");
             })
+        .def("__gt__", &_compared_by_array)
         .def(
             "__gt__",
             [](RationalTime lhs, py::object const& rhs) {
                 return lhs > _type_checked(rhs, ">");
             })
+        .def("__le__", &_compared_by_array)
         .def(
             "__le__",
             [](RationalTime lhs, py::object const& rhs) {
                 return lhs <= _type_checked(rhs, "<=");
             })
+        .def("__ge__", &_compared_by_array)
         .def(
             "__ge__",
             [](RationalTime lhs, py::object const& rhs) {
                 return lhs >= _type_checked(rhs, ">=");
             })
+        .def("__eq__", &_compared_by_array)
         .def(
             "__eq__",
             [](RationalTime lhs, py::object const& rhs) {
                 return lhs == _type_checked(rhs, "==");
             })
+        .def("__ne__", &_compared_by_array)
         .def(
             "__ne__",
             [](RationalTime lhs, py::object const& rhs) {
@@ -325,6 +360,85 @@ For example, the duration of a clip from frame 10 to frame 15 is 6 frames. Resul
             return lhs += rhs;
         });
 
+    py::class_<TimecodeFormatter>(m, "TimecodeFormatter", R"docstring(
+Converts between :class:`~RationalTime` and timecode strings for a single rate
+and drop frame mode.
+
+The rate validation and drop frame constants are computed once, when the
+formatter is created, so converting many times with one formatter is faster
+than calling :meth:`RationalTime.to_timecode` for each of them. The results
+are the same.
+)docstring")
+        .def(
+            py::init([](double rate, std::optional<bool> drop_frame) {
+                return TimecodeFormatter(rate, df_enum_converter(drop_frame));
+            }),
+            "rate"_a,
+            "drop_frame"_a = py::none())
+        .def_property_readonly("rate", &TimecodeFormatter::rate)
+        .def_property_readonly("drop_frame", [](TimecodeFormatter const& f) {
+            return df_optional_converter(f.drop_frame());
+        })
+        .def(
+            "to_timecode",
+            [](TimecodeFormatter const& f, RationalTime rt) {
+                return f.to_timecode(rt, ErrorStatusConverter());
+            },
+            "time"_a,
+            "Convert a time to timecode (``HH:MM:SS;FRAME``).")
+        .def(
+            "to_timecodes",
+            [](TimecodeFormatter const& f,
+               std::vector<RationalTime> const& times) {
+                std::vector<std::string> result;
+                result.reserve(times.size());
+                char        buffer[TimecodeFormatter::buffer_size];
+                ErrorStatus error_status;
+                for (size_t i = 0; i < times.size(); ++i)
+                {
+                    size_t length = f.format(
+                        times[i],
+                        buffer,
+                        sizeof(buffer),
+                        &error_status);
+                    if (is_error(error_status))
+                    {
+                        throw_element_error(i, error_status);
+                    }
+                    result.emplace_back(buffer, length);
+                }
+                return result;
+            },
+            "times"_a,
+            "Convert a sequence of times to a list of timecode strings.")
+        .def(
+            "from_timecode",
+            [](TimecodeFormatter const& f, std::string const& timecode) {
+                return f.from_timecode(timecode, ErrorStatusConverter());
+            },
+            "timecode"_a,
+            "Convert a timecode string (``HH:MM:SS;FRAME``) into a :class:`~RationalTime`.")
+        .def(
+            "from_timecodes",
+            [](TimecodeFormatter const&        f,
+               std::vector<std::string> const& timecodes) {
+                std::vector<RationalTime> result;
+                result.reserve(timecodes.size());
+                ErrorStatus error_status;
+                for (size_t i = 0; i < timecodes.size(); ++i)
+                {
+                    result.push_back(
+                        f.from_timecode(timecodes[i], &error_status));
+                    if (is_error(error_status))
+                    {
+                        throw_element_error(i, error_status);
+                    }
+                }
+                return result;
+            },
+            "timecodes"_a,
+            "Convert a sequence of timecode strings into a list of :class:`~RationalTime`.");
+
     py::module test =
         m.def_submodule("_testing", "Module for regression tests");
     test.def("add_many", [](RationalTime step_time, int final_frame_number) {
@@ -0,0 +1,97 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include <pybind11/operators.h>
+#include <pybind11/pybind11.h>
+
+#include "opentime/stringPrintf.h"
+#include "opentime/tickTime.h"
+#include "opentime_bindings.h"
+
+namespace py = pybind11;
+using namespace pybind11::literals;
+using namespace opentime;
+
+void
+opentime_tickTime_bindings(py::module m)
+{
+    py::class_<TickTime>(m, "TickTime", R"docstring(
+A time stored as an integer number of ticks of a timebase shared by all times.
+
+There are :attr:`ticks_per_second` ticks in a second, which is a whole number
+of ticks per frame or sample for the common video rates (including the
+1000/1001 NTSC rates) and audio rates, so times at those rates convert to and
+from :class:`~RationalTime` without loss. Comparisons and sums are exact
+integer operations, so long sums of durations do not drift.
+)docstring")
+        .def(py::init<int64_t>(), "ticks"_a = 0)
+        .def_readonly_static("ticks_per_second", &TickTime::ticks_per_second)
+        .def_property_readonly("ticks", &TickTime::ticks)
+        .def_static(
+            "ticks_per_unit",
+            &TickTime::ticks_per_unit,
+            "rate"_a,
+            "Returns the number of ticks in one unit of rate, or 0 if that is not a whole number of ticks.")
+        .def_static(
+            "from_rational_time",
+            [](RationalTime time, bool allow_rounding) {
+                ErrorStatus error_status;
+                TickTime    result =
+                    TickTime::from_rational_time(time, &error_status);
+                if (is_error(error_status) && !allow_rounding)
+                {
+                    throw py::value_error(string_printf(
+                        "%s: %s",
+                        opentime_python_repr(time).c_str(),
+                        error_status.details.c_str()));
+                }
+                return result;
+            },
+            "time"_a,
+            "allow_rounding"_a = false,
+            R"docstring(
+Convert a :class:`~RationalTime` to ticks. If the time is not a whole number of
+ticks, ``ValueError`` is raised, unless ``allow_rounding`` is true, in which
+case it is rounded to the nearest tick.
+)docstring")
+        .def(
+            "to_rational_time",
+            &TickTime::to_rational_time,
+            "rate"_a,
+            "Convert to a :class:`~RationalTime` at the given rate.")
+        .def("to_seconds", &TickTime::to_seconds)
+        .def("__copy__", [](TickTime t) { return t; })
+        .def(
+            "__deepcopy__",
+            [](TickTime t, py::object) { return t; },
+            "copier"_a = py::none())
+        .def(
+            "__hash__",
+            [](TickTime t) { return py::hash(py::int_(t.ticks())); })
+        .def(
+            "__str__",
+            [](TickTime t) {
+                return string_printf("TickTime(%lld)", (long long) t.ticks());
+            })
+        .def(
+            "__repr__",
+            [](TickTime t) {
+                return string_printf(
+                    "otio.opentime.TickTime(ticks=%lld)",
+                    (long long) t.ticks());
+            })
+        .def(-py::self)
+        .def(py::self + py::self)
+        .def(py::self - py::self)
+        .def(py::self == py::self)
+        .def(py::self != py::self)
+        .def(py::self < py::self)
+        .def(py::self <= py::self)
+        .def(py::self > py::self)
+        .def(py::self >= py::self)
+        // As with RationalTime, in-place addition must return a new object
+        // since this class has value semantics.
+        .def("__iadd__", [](TickTime lhs, TickTime rhs) {
+            return lhs += rhs;
+        });
+}
@@ -0,0 +1,774 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "opentime/rationalTime.h"
+#include "opentime/stringPrintf.h"
+#include "opentime/timeRange.h"
+#include "opentime/timecodeFormatter.h"
+#include "opentime_bindings.h"
+#include "opentime_timeArrays.h"
+
+#include <functional>
+#include <memory>
+#include <optional>
+#include <vector>
+
+namespace py = pybind11;
+using namespace pybind11::literals;
+using namespace opentime;
+
+namespace {
+
+// A flat buffer of numbers, exposed through the buffer protocol so that
+// it can be wrapped without copying, e.g. with numpy.asarray().  The
+// buffer keeps its owner alive, which is either the storage of a
+// RationalTimeArray (whose values and rates are exposed as writable
+// buffers) or the result of a vectorized call.
+template <typename T>
+struct TimeArrayBuffer
+{
+    std::shared_ptr<void> owner;
+    T*                    data;
+    size_t                size;
+    bool                  readonly;
+};
+
+template <typename T>
+void
+define_time_array_buffer(py::module m, char const* name)
+{
+    py::class_<TimeArrayBuffer<T>>(m, name, py::buffer_protocol())
+        .def_buffer([](TimeArrayBuffer<T>& b) {
+            return py::buffer_info(
+                b.data,
+                sizeof(T),
+                py::format_descriptor<T>::format(),
+                1,
+                { py::ssize_t(b.size) },
+                { py::ssize_t(sizeof(T)) },
+                b.readonly);
+        })
+        .def("__len__", [](TimeArrayBuffer<T> const& b) { return b.size; })
+        .def(
+            "__iter__",
+            [](TimeArrayBuffer<T> const& b) {
+                return py::make_iterator(b.data, b.data + b.size);
+            },
+            py::keep_alive<0, 1>())
+        .def("tolist", [](TimeArrayBuffer<T> const& b) {
+            return std::vector<T>(b.data, b.data + b.size);
+        });
+}
+
+template <typename T>
+TimeArrayBuffer<T>
+shared_buffer(std::shared_ptr<std::vector<T>> const& values)
+{
+    return { values, values->data(), values->size(), false };
+}
+
+template <typename T>
+TimeArrayBuffer<T>
+new_buffer(size_t size)
+{
+    std::shared_ptr<T[]> owner(new T[size]);
+    return { owner, owner.get(), size, true };
+}
+
+struct TimeRangeArray
+{
+    size_t size() const { return start_time.size(); }
+
+    TimeRange operator[](size_t i) const
+    {
+        return TimeRange(start_time[i], duration[i]);
+    }
+
+    RationalTimeArray start_time;
+    RationalTimeArray duration;
+};
+
+IsDropFrameRate
+df_enum_converter(std::optional<bool> const& df)
+{
+    if (!df.has_value())
+    {
+        return IsDropFrameRate::InferFromRate;
+    }
+    return df.value() ? IsDropFrameRate::ForceYes : IsDropFrameRate::ForceNo;
+}
+
+// Read a sequence of numbers.  One dimensional buffers of doubles (such as
+// float64 numpy arrays or array.array('d')) are read directly, with a single
+// copy of their memory when they are contiguous; anything else is iterated
+// and each item converted to a float.
+std::vector<double>
+doubles_from(py::handle h, char const* what)
+{
+    if (PyObject_CheckBuffer(h.ptr()))
+    {
+        py::buffer_info info = py::reinterpret_borrow<py::buffer>(h).request();
+        if (info.ndim == 1
+            && info.format == py::format_descriptor<double>::format())
+        {
+            size_t        size = size_t(info.shape[0]);
+            double const* data = static_cast<double const*>(info.ptr);
+            if (info.strides[0] == py::ssize_t(sizeof(double)))
+            {
+                return std::vector<double>(data, data + size);
+            }
+
+            std::vector<double> result(size);
+            char const*         p = static_cast<char const*>(info.ptr);
+            for (size_t i = 0; i < size; ++i)
+            {
+                result[i] =
+                    *reinterpret_cast<double const*>(p + i * info.strides[0]);
+            }
+            return result;
+        }
+    }
+
+    std::vector<double> result;
+    try
+    {
+        for (auto item: py::iter(h))
+        {
+            result.push_back(py::cast<double>(item));
+        }
+    }
+    catch (py::cast_error const&)
+    {
+        throw py::type_error(
+            string_printf("%s must be a sequence of numbers", what));
+    }
+    return result;
+}
+
+// A rate is either a single number, used for every element, or a sequence
+// or buffer with one rate per element.  Buffers are checked first, since
+// they are not all sequences (e.g. the rates of another array); numpy
+// scalars are zero dimensional buffers.
+std::vector<double>
+rates_from(py::handle h, size_t size)
+{
+    bool per_element =
+        PyObject_CheckBuffer(h.ptr())
+            ? py::reinterpret_borrow<py::buffer>(h).request().ndim != 0
+            : PySequence_Check(h.ptr());
+    if (!per_element)
+    {
+        return std::vector<double>(size, py::cast<double>(h));
+    }
+
+    std::vector<double> rates = doubles_from(h, "rate");
+    if (rates.size() != size)
+    {
+        throw py::value_error(string_printf(
+            "expected %zu rates, got %zu",
+            size,
+            rates.size()));
+    }
+    return rates;
+}
+
+void
+check_size(size_t expected, size_t size)
+{
+    if (expected != size)
+    {
+        throw py::value_error(string_printf(
+            "arrays must have the same length, got %zu and %zu",
+            expected,
+            size));
+    }
+}
+
+size_t
+checked_index(py::ssize_t index, size_t size)
+{
+    if (index < 0)
+    {
+        index += py::ssize_t(size);
+    }
+    if (index < 0 || size_t(index) >= size)
+    {
+        throw py::index_error("array index out of range");
+    }
+    return size_t(index);
+}
+
+template <typename F>
+RationalTimeArray
+transformed(size_t size, F&& f)
+{
+    std::vector<double> values(size);
+    std::vector<double> rates(size);
+    for (size_t i = 0; i < size; ++i)
+    {
+        RationalTime rt = f(i);
+        values[i]       = rt.value();
+        rates[i]        = rt.rate();
+    }
+    return RationalTimeArray(std::move(values), std::move(rates));
+}
+
+// Consecutive times at the same rate share one TimecodeFormatter.
+std::vector<std::string>
+array_to_timecode(
+    RationalTimeArray const& a,
+    std::optional<double>    rate,
+    IsDropFrameRate          drop_frame,
+    bool                     nearest)
+{
+    std::vector<std::string>         result(a.size());
+    std::optional<TimecodeFormatter> formatter;
+    char                             buffer[TimecodeFormatter::buffer_size];
+    ErrorStatus                      error_status;
+    for (size_t i = 0; i < a.size(); ++i)
+    {
+        RationalTime rt      = a[i];
+        double       tc_rate = rate ? *rate : rt.rate();
+        if (nearest)
+        {
+            tc_rate = RationalTime::nearest_smpte_timecode_rate(tc_rate);
+        }
+        if (!formatter || formatter->rate() != tc_rate)
+        {
+            formatter.emplace(tc_rate, drop_frame);
+        }
+
+        size_t length =
+            formatter->format(rt, buffer, sizeof(buffer), &error_status);
+        if (is_error(error_status))
+        {
+            throw py::value_error(string_printf(
+                "element %zu: %s",
+                i,
+                error_status.details.c_str()));
+        }
+        result[i].assign(buffer, length);
+    }
+    return result;
+}
+
+RationalTimeArray
+array_from_timecode(std::vector<std::string> const& timecodes, double rate)
+{
+    TimecodeFormatter formatter(rate);
+    ErrorStatus       error_status;
+    return transformed(timecodes.size(), [&](size_t i) {
+        RationalTime rt = formatter.from_timecode(timecodes[i], &error_status);
+        if (is_error(error_status))
+        {
+            throw py::value_error(string_printf(
+                "element %zu: %s",
+                i,
+                error_status.details.c_str()));
+        }
+        return rt;
+    });
+}
+
+template <typename F>
+TimeArrayBuffer<bool>
+range_predicate(TimeRangeArray const& a, F&& f)
+{
+    auto result = new_buffer<bool>(a.size());
+    for (size_t i = 0; i < a.size(); ++i)
+    {
+        result.data[i] = f(a[i], i);
+    }
+    return result;
+}
+
+// Compare each time of an array with the time at the same index of another
+// array, or with a single time, as operator name.
+template <typename Compare>
+void
+define_array_comparison(
+    py::class_<RationalTimeArray>& time_array_class,
+    char const*                    name,
+    Compare                        compare)
+{
+    time_array_class
+        .def(
+            name,
+            [compare](
+                RationalTimeArray const& lhs,
+                RationalTimeArray const& rhs) {
+                check_size(lhs.size(), rhs.size());
+                auto result = new_buffer<bool>(lhs.size());
+                for (size_t i = 0; i < lhs.size(); ++i)
+                {
+                    result.data[i] = compare(lhs[i], rhs[i]);
+                }
+                return result;
+            },
+            py::is_operator())
+        .def(
+            name,
+            [compare](RationalTimeArray const& lhs, RationalTime rhs) {
+                auto result = new_buffer<bool>(lhs.size());
+                for (size_t i = 0; i < lhs.size(); ++i)
+                {
+                    result.data[i] = compare(lhs[i], rhs);
+                }
+                return result;
+            },
+            py::is_operator());
+}
+
+} // namespace
+
+void
+opentime_timeArrays_bindings(py::module m)
+{
+    define_time_array_buffer<double>(m, "_TimeArrayFloatBuffer");
+    define_time_array_buffer<int64_t>(m, "_TimeArrayIntBuffer");
+    define_time_array_buffer<bool>(m, "_TimeArrayBoolBuffer");
+
+    auto time_array_class =
+        py::class_<RationalTimeArray>(m, "RationalTimeArray", R"docstring(
+An array of :class:`~RationalTime` values, stored as two contiguous buffers of
+doubles holding the values and the rates.
+
+Operations on the array run in C++ over every element, which avoids making one
+Python call per time. The :attr:`values` and :attr:`rates` buffers support the
+buffer protocol and share the array's storage, so ``numpy.asarray(a.values)``
+does not copy. Vectorized conversions that return numbers also return buffers,
+and comparisons with another array or a single time return buffers of flags.
+)docstring")
+        .def(
+            py::init([](std::vector<RationalTime> const& times) {
+                return transformed(times.size(), [&](size_t i) {
+                    return times[i];
+                });
+            }),
+            "times"_a)
+        .def(
+            py::init([](py::object values, py::object rate) {
+                std::vector<double> v = doubles_from(values, "values");
+                std::vector<double> r = rates_from(rate, v.size());
+                return RationalTimeArray(std::move(v), std::move(r));
+            }),
+            "values"_a,
+            "rate"_a = 1.0,
+            R"docstring(
+Construct an array from a sequence or buffer of values, and either a single
+rate or a sequence or buffer of rates of the same length.
+)docstring")
+        .def_property_readonly(
+            "values",
+            [](RationalTimeArray const& a) { return shared_buffer(a.values); },
+            "Writable buffer of the time values.")
+        .def_property_readonly(
+            "rates",
+            [](RationalTimeArray const& a) { return shared_buffer(a.rates); },
+            "Writable buffer of the time rates.")
+        .def("__len__", &RationalTimeArray::size)
+        .def(
+            "__getitem__",
+            [](RationalTimeArray const& a, py::ssize_t index) {
+                return a[checked_index(index, a.size())];
+            },
+            "index"_a)
+        .def(
+            "__getitem__",
+            [](RationalTimeArray const& a, py::slice slice) {
+                size_t start, stop, step, length;
+                if (!slice.compute(a.size(), &start, &stop, &step, &length))
+                {
+                    throw py::error_already_set();
+                }
+                return transformed(length, [&](size_t i) {
+                    return a[start + i * step];
+                });
+            },
+            "slice"_a,
+            "Returns a copy of the times in the slice.")
+        .def(
+            "tolist",
+            [](RationalTimeArray const& a) {
+                std::vector<RationalTime> result(a.size());
+                for (size_t i = 0; i < a.size(); ++i)
+                {
+                    result[i] = a[i];
+                }
+                return result;
+            },
+            "Returns the times as a list of :class:`~RationalTime`.")
+        .def(
+            "rescaled_to",
+            [](RationalTimeArray const& a, double new_rate) {
+                return transformed(a.size(), [&](size_t i) {
+                    return a[i].rescaled_to(new_rate);
+                });
+            },
+            "new_rate"_a,
+            R"docstring(Returns the times converted to new_rate.)docstring")
+        .def(
+            "rescaled_to",
+            [](RationalTimeArray const& a, RationalTime other) {
+                return transformed(a.size(), [&](size_t i) {
+                    return a[i].rescaled_to(other);
+                });
+            },
+            "other"_a,
+            R"docstring(Returns the times converted to the rate of other.)docstring")
+        .def(
+            "value_rescaled_to",
+            [](RationalTimeArray const& a, double new_rate) {
+                auto result = new_buffer<double>(a.size());
+                for (size_t i = 0; i < a.size(); ++i)
+                {
+                    result.data[i] = a[i].value_rescaled_to(new_rate);
+                }
+                return result;
+            },
+            "new_rate"_a,
+            R"docstring(Returns a buffer of the time values converted to new_rate.)docstring")
+        .def(
+            "to_frames",
+            [](RationalTimeArray const& a) {
+                auto result = new_buffer<int64_t>(a.size());
+                for (size_t i = 0; i < a.size(); ++i)
+                {
+                    result.data[i] = a[i].to_frames();
+                }
+                return result;
+            },
+            "Returns a buffer of frame numbers based on the current rates.")
+        .def(
+            "to_frames",
+            [](RationalTimeArray const& a, double rate) {
+                auto result = new_buffer<int64_t>(a.size());
+                for (size_t i = 0; i < a.size(); ++i)
+                {
+                    result.data[i] = a[i].to_frames(rate);
+                }
+                return result;
+            },
+            "rate"_a,
+            "Returns a buffer of frame numbers based on the given rate.")
+        .def(
+            "to_seconds",
+            [](RationalTimeArray const& a) {
+                auto result = new_buffer<double>(a.size());
+                for (size_t i = 0; i < a.size(); ++i)
+                {
+                    result.data[i] = a[i].to_seconds();
+                }
+                return result;
+            },
+            "Returns a buffer of the times in seconds.")
+        .def(
+            "to_timecode",
+            [](RationalTimeArray const& a,
+               double                   rate,
+               std::optional<bool>      drop_frame) {
+                return array_to_timecode(
+                    a,
+                    rate,
+                    df_enum_converter(drop_frame),
+                    false);
+            },
+            "rate"_a,
+            "drop_frame"_a,
+            "Convert every time to a timecode string (``HH:MM:SS;FRAME``).")
+        .def(
+            "to_timecode",
+            [](RationalTimeArray const& a, double rate) {
+                return array_to_timecode(
+                    a,
+                    rate,
+                    IsDropFrameRate::InferFromRate,
+                    false);
+            },
+            "rate"_a)
+        .def(
+            "to_timecode",
+            [](RationalTimeArray const& a) {
+                return array_to_timecode(
+                    a,
+                    std::nullopt,
+                    IsDropFrameRate::InferFromRate,
+                    false);
+            })
+        .def(
+            "to_nearest_timecode",
+            [](RationalTimeArray const& a,
+               double                   rate,
+               std::optional<bool>      drop_frame) {
+                return array_to_timecode(
+                    a,
+                    rate,
+                    df_enum_converter(drop_frame),
+                    true);
+            },
+            "rate"_a,
+            "drop_frame"_a,
+            "Convert every time to the nearest timecode string (``HH:MM:SS;FRAME``).")
+        .def(
+            "to_nearest_timecode",
+            [](RationalTimeArray const& a, double rate) {
+                return array_to_timecode(
+                    a,
+                    rate,
+                    IsDropFrameRate::InferFromRate,
+                    true);
+            },
+            "rate"_a)
+        .def(
+            "to_nearest_timecode",
+            [](RationalTimeArray const& a) {
+                return array_to_timecode(
+                    a,
+                    std::nullopt,
+                    IsDropFrameRate::InferFromRate,
+                    true);
+            })
+        .def_static(
+            "from_timecode",
+            &array_from_timecode,
+            "timecodes"_a,
+            "rate"_a,
+            "Convert a sequence of timecode strings (``HH:MM:SS;FRAME``) into a :class:`~RationalTimeArray`.")
+        .def_static(
+            "from_frames",
+            [](py::object frames, double rate) {
+                std::vector<double> f = doubles_from(frames, "frames");
+                return transformed(f.size(), [&](size_t i) {
+                    return RationalTime::from_frames(f[i], rate);
+                });
+            },
+            "frames"_a,
+            "rate"_a,
+            "Turn a sequence of frame numbers and a rate into a :class:`~RationalTimeArray`.")
+        .def_static(
+            "from_seconds",
+            [](py::object seconds, double rate) {
+                std::vector<double> s = doubles_from(seconds, "seconds");
+                return transformed(s.size(), [&](size_t i) {
+                    return RationalTime::from_seconds(s[i], rate);
+                });
+            },
+            "seconds"_a,
+            "rate"_a)
+        .def(
+            "__add__",
+            [](RationalTimeArray const& lhs, RationalTimeArray const& rhs) {
+                check_size(lhs.size(), rhs.size());
+                return transformed(lhs.size(), [&](size_t i) {
+                    return lhs[i] + rhs[i];
+                });
+            },
+            py::is_operator())
+        .def(
+            "__add__",
+            [](RationalTimeArray const& lhs, RationalTime rhs) {
+                return transformed(lhs.size(), [&](size_t i) {
+                    return lhs[i] + rhs;
+                });
+            },
+            py::is_operator())
+        .def(
+            "__radd__",
+            [](RationalTimeArray const& rhs, RationalTime lhs) {
+                return transformed(rhs.size(), [&](size_t i) {
+                    return lhs + rhs[i];
+                });
+            },
+            py::is_operator())
+        .def(
+            "__sub__",
+            [](RationalTimeArray const& lhs, RationalTimeArray const& rhs) {
+                check_size(lhs.size(), rhs.size());
+                return transformed(lhs.size(), [&](size_t i) {
+                    return lhs[i] - rhs[i];
+                });
+            },
+            py::is_operator())
+        .def(
+            "__sub__",
+            [](RationalTimeArray const& lhs, RationalTime rhs) {
+                return transformed(lhs.size(), [&](size_t i) {
+                    return lhs[i] - rhs;
+                });
+            },
+            py::is_operator())
+        .def(
+            "__rsub__",
+            [](RationalTimeArray const& rhs, RationalTime lhs) {
+                return transformed(rhs.size(), [&](size_t i) {
+                    return lhs - rhs[i];
+                });
+            },
+            py::is_operator())
+        .def(
+            "__neg__",
+            [](RationalTimeArray const& a) {
+                return transformed(a.size(), [&](size_t i) { return -a[i]; });
+            },
+            py::is_operator())
+        // The values and rates are writable, so copies must not share them.
+        .def(
+            "__copy__",
+            [](RationalTimeArray const& a) {
+                return RationalTimeArray(*a.values, *a.rates);
+            })
+        .def(
+            "__deepcopy__",
+            [](RationalTimeArray const& a, py::object) {
+                return RationalTimeArray(*a.values, *a.rates);
+            },
+            "copier"_a = py::none())
+        .def(
+            "__str__",
+            [](RationalTimeArray const& a) {
+                return string_printf("RationalTimeArray(%zu times)", a.size());
+            })
+        .def("__repr__", [](RationalTimeArray const& a) {
+            return string_printf(
+                "otio.opentime.RationalTimeArray(<%zu times>)",
+                a.size());
+        });
+
+    define_array_comparison(
+        time_array_class,
+        "__eq__",
+        std::equal_to<RationalTime>());
+    define_array_comparison(
+        time_array_class,
+        "__ne__",
+        std::not_equal_to<RationalTime>());
+    define_array_comparison(time_array_class, "__lt__", std::less<RationalTime>());
+    define_array_comparison(
+        time_array_class,
+        "__le__",
+        std::less_equal<RationalTime>());
+    define_array_comparison(
+        time_array_class,
+        "__gt__",
+        std::greater<RationalTime>());
+    define_array_comparison(
+        time_array_class,
+        "__ge__",
+        std::greater_equal<RationalTime>());
+
+    py::class_<TimeRangeArray>(m, "TimeRangeArray", R"docstring(
+An array of :class:`~TimeRange` values, stored as a :class:`~RationalTimeArray`
+of start times and a :class:`~RationalTimeArray` of durations.
+
+Constructing a range array from two time arrays does not copy them, so writes to
+their values and rates are seen by the ranges.
+)docstring")
+        .def(
+            py::init([](std::vector<TimeRange> const& ranges) {
+                auto start_time = transformed(ranges.size(), [&](size_t i) {
+                    return ranges[i].start_time();
+                });
+                auto duration = transformed(ranges.size(), [&](size_t i) {
+                    return ranges[i].duration();
+                });
+                return TimeRangeArray{ start_time, duration };
+            }),
+            "ranges"_a)
+        .def(
+            py::init([](RationalTimeArray const& start_time,
+                        RationalTimeArray const& duration) {
+                check_size(start_time.size(), duration.size());
+                return TimeRangeArray{ start_time, duration };
+            }),
+            "start_time"_a,
+            "duration"_a)
+        .def_readonly("start_time", &TimeRangeArray::start_time)
+        .def_readonly("duration", &TimeRangeArray::duration)
+        .def("__len__", &TimeRangeArray::size)
+        .def(
+            "__getitem__",
+            [](TimeRangeArray const& a, py::ssize_t index) {
+                return a[checked_index(index, a.size())];
+            },
+            "index"_a)
+        .def(
+            "tolist",
+            [](TimeRangeArray const& a) {
+                std::vector<TimeRange> result(a.size());
+                for (size_t i = 0; i < a.size(); ++i)
+                {
+                    result[i] = a[i];
+                }
+                return result;
+            },
+            "Returns the ranges as a list of :class:`~TimeRange`.")
+        .def(
+            "end_time_exclusive",
+            [](TimeRangeArray const& a) {
+                return transformed(a.size(), [&](size_t i) {
+                    return a[i].end_time_exclusive();
+                });
+            },
+            "Returns the end times (exclusive) of the ranges.")
+        .def(
+            "contains",
+            [](TimeRangeArray const& a, RationalTime other) {
+                return range_predicate(a, [&](TimeRange r, size_t) {
+                    return r.contains(other);
+                });
+            },
+            "other"_a,
+            "Returns a buffer of flags telling which ranges contain other.")
+        .def(
+            "contains",
+            [](TimeRangeArray const& a, RationalTimeArray const& other) {
+                check_size(a.size(), other.size());
+                return range_predicate(a, [&](TimeRange r, size_t i) {
+                    return r.contains(other[i]);
+                });
+            },
+            "other"_a,
+            "Returns a buffer of flags telling whether each range contains the time at the same index of other.")
+        .def(
+            "contains",
+            [](TimeRangeArray const& a, TimeRange other, double epsilon_s) {
+                return range_predicate(a, [&](TimeRange r, size_t) {
+                    return r.contains(other, epsilon_s);
+                });
+            },
+            "other"_a,
+            "epsilon_s"_a = opentime::DEFAULT_EPSILON_s,
+            "Returns a buffer of flags telling which ranges contain other.")
+        .def(
+            "overlaps",
+            [](TimeRangeArray const& a, RationalTime other) {
+                return range_predicate(a, [&](TimeRange r, size_t) {
+                    return r.overlaps(other);
+                });
+            },
+            "other"_a,
+            "Returns a buffer of flags telling which ranges overlap other.")
+        .def(
+            "overlaps",
+            [](TimeRangeArray const& a, TimeRange other, double epsilon_s) {
+                return range_predicate(a, [&](TimeRange r, size_t) {
+                    return r.overlaps(other, epsilon_s);
+                });
+            },
+            "other"_a,
+            "epsilon_s"_a = opentime::DEFAULT_EPSILON_s,
+            "Returns a buffer of flags telling which ranges overlap other.")
+        .def(
+            "__str__",
+            [](TimeRangeArray const& a) {
+                return string_printf("TimeRangeArray(%zu ranges)", a.size());
+            })
+        .def("__repr__", [](TimeRangeArray const& a) {
+            return string_printf(
+                "otio.opentime.TimeRangeArray(<%zu ranges>)",
+                a.size());
+        });
+}
@@ -0,0 +1,31 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#ifndef OTIO_OPENTIME_TIME_ARRAYS_H
+#define OTIO_OPENTIME_TIME_ARRAYS_H
+
+#include "opentime/rationalTime.h"
+#include <memory>
+#include <vector>
+
+// The storage of the RationalTimeArray bound in the _opentime module.  The
+// _otio module uses it to return arrays that it fills in place.
+struct RationalTimeArray
+{
+    RationalTimeArray(std::vector<double> values, std::vector<double> rates)
+        : values{ std::make_shared<std::vector<double>>(std::move(values)) }
+        , rates{ std::make_shared<std::vector<double>>(std::move(rates)) }
+    {}
+
+    size_t size() const { return values->size(); }
+
+    opentime::RationalTime operator[](size_t i) const
+    {
+        return opentime::RationalTime((*values)[i], (*rates)[i]);
+    }
+
+    std::shared_ptr<std::vector<double>> values;
+    std::shared_ptr<std::vector<double>> rates;
+};
+
+#endif
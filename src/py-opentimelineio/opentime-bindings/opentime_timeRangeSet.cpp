@@ -0,0 +1,147 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include <pybind11/operators.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "opentime/stringPrintf.h"
+#include "opentime/timeRangeSet.h"
+#include "opentime_bindings.h"
+
+#include <optional>
+
+namespace py = pybind11;
+using namespace pybind11::literals;
+using namespace opentime;
+
+void
+opentime_timeRangeSet_bindings(py::module m)
+{
+    py::class_<TimeRangeSet>(m, "TimeRangeSet", R"docstring(
+A set of times, stored as a sorted list of disjoint :class:`~TimeRange`.
+
+Ranges are merged when they overlap or when the gap between them is less than
+``epsilon_s``, and ranges shorter than ``epsilon_s`` are dropped, matching the
+epsilon comparisons of the :class:`~TimeRange` relations. Invalid ranges are
+ignored. Construction sorts the ranges once, in O(n log n); set operations are
+linear and queries are logarithmic in the number of ranges.
+)docstring")
+        .def(
+            py::init<std::vector<TimeRange> const&, double>(),
+            "ranges"_a    = std::vector<TimeRange>(),
+            "epsilon_s"_a = opentime::DEFAULT_EPSILON_s)
+        .def_property_readonly("epsilon_s", &TimeRangeSet::epsilon_s)
+        .def_property_readonly(
+            "ranges",
+            &TimeRangeSet::ranges,
+            "The sorted, disjoint ranges of the set.")
+        .def("__len__", &TimeRangeSet::size)
+        .def(
+            "__iter__",
+            [](TimeRangeSet const& s) {
+                return py::make_iterator(s.ranges().begin(), s.ranges().end());
+            },
+            py::keep_alive<0, 1>())
+        .def(
+            "__getitem__",
+            [](TimeRangeSet const& s, py::ssize_t index) {
+                if (index < 0)
+                {
+                    index += py::ssize_t(s.size());
+                }
+                if (index < 0 || size_t(index) >= s.size())
+                {
+                    throw py::index_error("TimeRangeSet index out of range");
+                }
+                return s.ranges()[size_t(index)];
+            },
+            "index"_a)
+        .def(
+            "add",
+            &TimeRangeSet::add,
+            "range"_a,
+            "Add a range to the set, merging it with the ranges it overlaps.")
+        .def(
+            "union",
+            &TimeRangeSet::union_with,
+            "other"_a,
+            "Returns the union of this set and other.")
+        .def(
+            "intersection",
+            &TimeRangeSet::intersection_with,
+            "other"_a,
+            "Returns the intersection of this set and other.")
+        .def(
+            "difference",
+            &TimeRangeSet::difference_with,
+            "other"_a,
+            "Returns the times of this set that are not in other.")
+        .def("__or__", &TimeRangeSet::union_with, py::is_operator())
+        .def("__and__", &TimeRangeSet::intersection_with, py::is_operator())
+        .def("__sub__", &TimeRangeSet::difference_with, py::is_operator())
+        .def(
+            "clamped",
+            &TimeRangeSet::clamped,
+            "range"_a,
+            "Returns the part of this set within range.")
+        .def(
+            "gaps",
+            [](TimeRangeSet const& s, std::optional<TimeRange> bounds) {
+                return bounds ? s.gaps(*bounds) : s.gaps();
+            },
+            "bounds"_a = py::none(),
+            R"docstring(
+Returns the gaps between the ranges of this set, or, if bounds is given, the
+times within bounds that are not in this set.
+)docstring")
+        .def(
+            "bounds",
+            &TimeRangeSet::bounds,
+            "Returns the range from the start of the first range to the end of the last range.")
+        .def(
+            "duration",
+            &TimeRangeSet::duration,
+            "rate"_a,
+            "Returns the total duration of the set at the given rate.")
+        .def(
+            "contains",
+            &TimeRangeSet::contains,
+            "time"_a,
+            "Returns whether the set contains the given time.")
+        .def(
+            "covers",
+            &TimeRangeSet::covers,
+            "range"_a,
+            "Returns whether range is entirely within the set.")
+        .def(
+            "overlaps",
+            &TimeRangeSet::overlaps,
+            "range"_a,
+            "Returns whether range shares any time with the set.")
+        .def("__contains__", &TimeRangeSet::contains)
+        .def("__contains__", &TimeRangeSet::covers)
+        .def(py::self == py::self)
+        .def(py::self != py::self)
+        .def("__copy__", [](TimeRangeSet const& s) { return s; })
+        .def(
+            "__deepcopy__",
+            [](TimeRangeSet const& s, py::object) { return s; },
+            "copier"_a = py::none())
+        .def(
+            "__str__",
+            [](TimeRangeSet const& s) {
+                return string_printf("TimeRangeSet(%zu ranges)", s.size());
+            })
+        .def("__repr__", [](TimeRangeSet const& s) {
+            std::string ranges;
+            for (auto const& range: s.ranges())
+            {
+                ranges += ranges.empty() ? "" : ", ";
+                ranges += py::cast<std::string>(py::repr(py::cast(range)));
+            }
+            return string_printf(
+                "otio.opentime.TimeRangeSet(ranges=[%s])",
+                ranges.c_str());
+        });
+}
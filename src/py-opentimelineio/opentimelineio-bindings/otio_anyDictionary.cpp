@@ -33,6 +33,15 @@ otio_any_dictionary_bindings(py::module m)
             "item"_a)
         .def("__delitem__", &AnyDictionaryProxy::del_item, "key"_a)
         .def("__len__", &AnyDictionaryProxy::len)
+        .def(
+            "to_python",
+            [](AnyDictionaryProxy* d) {
+                return any_dictionary_to_python(d->fetch_any_dictionary());
+            },
+            R"docstring(Return a plain python dict copy of this dictionary.
+
+Nested dictionaries and lists are converted in a single call, which is much faster than
+reading the values one key at a time when scanning large amounts of metadata.)docstring")
         .def(
             "__iter__",
             &AnyDictionaryProxy::iter,
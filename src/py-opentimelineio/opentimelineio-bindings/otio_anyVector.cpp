@@ -29,6 +29,14 @@ otio_any_vector_bindings(py::module m)
             "item"_a)
         .def("__internal_delitem__", &AnyVectorProxy::del_item, "index"_a)
         .def("__len__", &AnyVectorProxy::len)
+        .def(
+            "to_python",
+            [](AnyVectorProxy* v) {
+                return any_vector_to_python(v->fetch_any_vector());
+            },
+            R"docstring(Return a plain python list copy of this vector.
+
+Nested dictionaries and lists are converted in a single call.)docstring")
         .def("__internal_insert", &AnyVectorProxy::insert)
         .def(
             "__iter__",
@@ -3,14 +3,20 @@
 
 #include "otio_bindings.h"
 #include "opentimelineio/deserialization.h"
+#include "opentimelineio/editJournal.h"
+#include "opentimelineio/itemAlgorithm.h"
 #include "opentimelineio/serializableObject.h"
 #include "opentimelineio/serialization.h"
 #include "opentimelineio/stackAlgorithm.h"
+#include "opentimelineio/timelineAlgorithm.h"
+#include "opentimelineio/trackAlgorithm.h"
 #include "opentimelineio/typeRegistry.h"
 #include "otio_anyDictionary.h"
 #include "otio_anyVector.h"
 #include "otio_errorStatusHandler.h"
 #include "otio_utils.h"
+#include "py-opentimelineio/opentime-bindings/opentime_timeArrays.h"
+#include <memory>
 #include <pybind11/functional.h>
 #include <pybind11/pybind11.h>
 
@@ -195,6 +201,26 @@ PYBIND11_MODULE(_otio, m)
     otio_tests_bindings(m);
     otio_bundle_bindings(m);
 
+    py::class_<DeserializeOptions>(
+        m,
+        "DeserializeOptions",
+        R"docstring(Options for deserializing json.)docstring")
+        .def(py::init<>())
+        .def_readwrite(
+            "num_threads",
+            &DeserializeOptions::num_threads,
+            "Maximum number of threads used to decode the data. When greater "
+            "than one, the tracks of a timeline (the elements of the largest "
+            "\"children\" array near the top of the document) are decoded "
+            "concurrently. Results and errors are the same as with one "
+            "thread.")
+        .def_readwrite(
+            "track_line_numbers",
+            &DeserializeOptions::track_line_numbers,
+            "Whether to track line numbers while decoding. When false, "
+            "decoding is faster and the input is only decoded again, with "
+            "line numbers, if an error is reported.");
+
     m.def(
          "_serialize_json_to_string",
          [](PyAny*                    pyAny,
@@ -230,18 +256,27 @@ PYBIND11_MODULE(_otio, m)
             "indent"_a)
         .def(
             "deserialize_json_from_string",
-            [](std::string input) {
+            [](std::string input, DeserializeOptions const& options) {
                 std::any result;
-                deserialize_json_from_string(
-                    input,
-                    &result,
-                    ErrorStatusHandler());
+                {
+                    ErrorStatusHandler error_status;
+                    // worker threads may need the GIL for Python schemas
+                    // and upgrade functions
+                    py::gil_scoped_release release;
+                    deserialize_json_from_string(
+                        input,
+                        &result,
+                        options,
+                        error_status);
+                }
                 return any_to_py(result, true /*top_level*/);
             },
             "input"_a,
+            "options"_a = DeserializeOptions(),
             R"docstring(Deserialize json string to in-memory objects.
 
 :param str input: json string to deserialize
+:param DeserializeOptions options: options for deserializing
 
 :returns: root object in the string (usually a Timeline or SerializableCollection)
 :rtype: SerializableObject
@@ -249,18 +284,25 @@ PYBIND11_MODULE(_otio, m)
 )docstring")
         .def(
             "deserialize_json_from_file",
-            [](std::string filename) {
+            [](std::string filename, DeserializeOptions const& options) {
                 std::any result;
-                deserialize_json_from_file(
-                    filename,
-                    &result,
-                    ErrorStatusHandler());
+                {
+                    ErrorStatusHandler error_status;
+                    py::gil_scoped_release release;
+                    deserialize_json_from_file(
+                        filename,
+                        &result,
+                        options,
+                        error_status);
+                }
                 return any_to_py(result, true /*top_level*/);
             },
             "filename"_a,
+            "options"_a = DeserializeOptions(),
             R"docstring(Deserialize json file to in-memory objects.
 
 :param str filename: path to json file to read
+:param DeserializeOptions options: options for deserializing
 
 :returns: root object in the file (usually a Timeline or SerializableCollection)
 :rtype: SerializableObject
@@ -300,6 +342,18 @@ PYBIND11_MODULE(_otio, m)
             return new PyAny(p->fetch_any_dictionary());
         }));
 
+    m.def(
+        "_value_to_any",
+        [](py::object value) {
+            auto result = std::make_unique<PyAny>();
+            py_to_any(value, &result->a);
+            return result;
+        },
+        "value"_a,
+        R"docstring(Convert a python value (e.g. a metadata dictionary) to a :class:`PyAny`.
+
+Dictionaries, lists, tuples, strings, numbers, booleans and None are converted in C++.)docstring");
+
     m.def(
         "register_serializable_object_type",
         &register_python_type,
@@ -369,6 +423,247 @@ The CORE_VERSION_MAP maps OTIO release versions to maps of schema name to schema
             return flatten_stack(tracks, ErrorStatusHandler());
         },
         "tracks"_a);
+    py::class_<StackFlattener>(
+        m,
+        "StackFlattener",
+        R"docstring(
+Keeps a flattened copy of a stack up to date as the stack is edited.
+
+The stack is flattened when the flattener is created, as with
+:func:`flatten_stack`. After an edit of the stack, :meth:`update` flattens
+only the part of the stack that the edit changed.
+)docstring")
+        .def(
+            py::init([](Stack* stack) {
+                return new StackFlattener(stack, ErrorStatusHandler());
+            }),
+            "stack"_a)
+        .def_property_readonly(
+            "stack",
+            &StackFlattener::stack,
+            "The stack that is flattened.")
+        .def_property_readonly(
+            "flattened_track",
+            &StackFlattener::flattened_track,
+            "The flattened track, which is updated in place.")
+        .def(
+            "update",
+            [](StackFlattener& flattener, TimeRange const& range) {
+                flattener.update(range, ErrorStatusHandler());
+            },
+            "range"_a,
+            R"docstring(
+Update the flattened track after an edit of the stack.
+
+:param TimeRange range: The range of the stack that the edit changed,
+    including the items that it moved. The rest of the stack must be
+    unchanged.
+)docstring")
+        .def(
+            "reset",
+            [](StackFlattener& flattener) {
+                flattener.reset(ErrorStatusHandler());
+            },
+            "Flatten the whole stack again.");
+
+    py::class_<EditJournal>(
+        m,
+        "EditJournal",
+        R"docstring(
+Records the edits of a timeline so that they can be undone and redone.
+
+While the journal exists, each change of the children of a composition in
+the timeline and each change of the source range of an item in the timeline
+is recorded. Undo and redo cost in proportion to the size of the edit, not
+the size of the timeline. Changes made between :meth:`begin_group` and
+:meth:`end_group` are undone and redone as one step.
+)docstring")
+        .def(py::init<Timeline*>(), "timeline"_a)
+        .def_property_readonly(
+            "timeline",
+            &EditJournal::timeline,
+            "The timeline whose edits are recorded.")
+        .def(
+            "begin_group",
+            &EditJournal::begin_group,
+            "Begin a group of changes that are one step. Groups may be nested.")
+        .def("end_group", &EditJournal::end_group, "End a group of changes.")
+        .def(
+            "can_undo",
+            &EditJournal::can_undo,
+            "Return whether there is a step to undo.")
+        .def(
+            "can_redo",
+            &EditJournal::can_redo,
+            "Return whether there is a step to redo.")
+        .def(
+            "undo",
+            [](EditJournal& journal) {
+                return journal.undo(ErrorStatusHandler());
+            },
+            "Undo the last step. Return False if there is nothing to undo.")
+        .def(
+            "redo",
+            [](EditJournal& journal) {
+                return journal.redo(ErrorStatusHandler());
+            },
+            "Redo the last step that was undone. Return False if there is "
+            "nothing to redo.")
+        .def("clear", &EditJournal::clear, "Forget all of the steps.");
+
+    // Return the top clips as (clip, source_time) pairs, with None for both
+    // where no clip is visible.
+    auto top_clips_to_list = [](std::vector<TopClip> const& top_clips) {
+        std::vector<std::pair<Clip*, std::optional<RationalTime>>> result;
+        result.reserve(top_clips.size());
+        for (auto const& top_clip: top_clips)
+        {
+            if (top_clip.clip)
+            {
+                result.emplace_back(top_clip.clip.value, top_clip.source_time);
+            }
+            else
+            {
+                result.emplace_back(nullptr, std::nullopt);
+            }
+        }
+        return result;
+    };
+    m.def(
+        "top_clips_at_times",
+        [top_clips_to_list](Stack* s, std::vector<RationalTime> times) {
+            return top_clips_to_list(
+                top_clips_at_times(s, times, ErrorStatusHandler()));
+        },
+        "in_stack"_a,
+        "times"_a);
+    m.def(
+        "top_clips_at_times",
+        [top_clips_to_list](Stack* s, TimeRange range, RationalTime step) {
+            return top_clips_to_list(
+                top_clips_at_times(s, range, step, ErrorStatusHandler()));
+        },
+        "in_stack"_a,
+        "range"_a,
+        "step"_a);
+    m.def(
+        "track_trimmed_to_range",
+        [](Track* in_track, TimeRange trim_range) {
+            return track_trimmed_to_range(
+                in_track,
+                trim_range,
+                ErrorStatusHandler());
+        },
+        "in_track"_a,
+        "trim_range"_a);
+    m.def(
+        "timeline_trimmed_to_range",
+        [](Timeline* in_timeline, TimeRange trim_range) {
+            return timeline_trimmed_to_range(
+                in_timeline,
+                trim_range,
+                ErrorStatusHandler());
+        },
+        "in_timeline"_a,
+        "trim_range"_a);
+
+    m.def(
+        "item_source_time",
+        [](Item* item, RationalTime time) {
+            return item_source_time(item, time, ErrorStatusHandler());
+        },
+        "item"_a,
+        "time"_a,
+        R"docstring(
+Return the time of the source media that ``item`` shows at ``time``, applying
+the time effects of the item.
+
+Times are in the time of the item's trimmed range. The effects are anchored at
+the start of the trimmed range: a :class:`.LinearTimeWarp` scales the distance
+from the start, and a :class:`.FreezeFrame` holds the first frame.
+
+:raises NotImplementedError: if the item has a time effect that cannot be
+    evaluated
+)docstring");
+    m.def(
+        "item_source_times",
+        [](Item* item, py::object times) {
+            if (!py::isinstance<RationalTimeArray>(times))
+            {
+                times = py::module::import("opentimelineio._opentime")
+                            .attr("RationalTimeArray")(times);
+            }
+            auto const& in = py::cast<RationalTimeArray const&>(times);
+
+            // The source values are written straight into the storage of
+            // the result, which has the same rates as the input.
+            RationalTimeArray result(std::vector<double>(in.size()), *in.rates);
+            item_source_times(
+                item,
+                in.values->data(),
+                in.rates->data(),
+                in.size(),
+                result.values->data(),
+                ErrorStatusHandler());
+            return result;
+        },
+        "item"_a,
+        "times"_a,
+        R"docstring(
+Map presentation times of ``item`` to the times of its source media in one
+call, as :func:`item_source_time` does for a single time.
+
+``times`` is a :class:`~opentimelineio.opentime.RationalTimeArray` or a
+sequence of :class:`~opentimelineio.opentime.RationalTime`. The result is a
+:class:`~opentimelineio.opentime.RationalTimeArray` with the same rates, whose
+buffers can be wrapped with ``numpy.asarray()`` without copying.
+
+:raises NotImplementedError: if the item has a time effect that cannot be
+    evaluated
+)docstring");
+
+    py::class_<MediaUsage>(
+        m,
+        "MediaUsage",
+        R"docstring(The source media used from one media reference.)docstring")
+        .def_property_readonly(
+            "media_reference",
+            [](MediaUsage const& usage) {
+                return usage.media_reference.value;
+            },
+            "The first media reference found for the media.")
+        .def_property_readonly(
+            "clips",
+            [](MediaUsage const& usage) {
+                std::vector<Clip*> clips;
+                clips.reserve(usage.clips.size());
+                for (auto const& clip: usage.clips)
+                {
+                    clips.push_back(clip.value);
+                }
+                return clips;
+            },
+            "The clips that use the media, in the order they were found.")
+        .def_readonly(
+            "ranges",
+            &MediaUsage::ranges,
+            "The merged ranges of the media that are used, as a "
+            ":class:`~opentimelineio.opentime.TimeRangeSet` in the time of "
+            "the media reference.");
+    m.def(
+        "media_usage",
+        [](Timeline* timeline, RationalTime handles) {
+            return media_usage(timeline, handles, ErrorStatusHandler());
+        },
+        "timeline"_a,
+        "handles"_a = RationalTime());
+    m.def(
+        "media_usage",
+        [](Composition* root, RationalTime handles) {
+            return media_usage(root, handles, ErrorStatusHandler());
+        },
+        "root"_a,
+        "handles"_a = RationalTime());
 
     void _build_any_to_py_dispatch_table();
     _build_any_to_py_dispatch_table();
@@ -2,6 +2,7 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include <pybind11/pybind11.h>
+#include <pybind11/functional.h>
 #include <pybind11/operators.h>
 #include <pybind11/stl.h>
 
@@ -34,6 +35,26 @@ This enumeration provides the bundle media reference policy.
             "all_missing",
             MediaReferencePolicy::all_missing,
             "Replace all media references with missing references.");
+
+    py::enum_<MediaCopyPolicy>(mbundle, "MediaCopyPolicy",
+R"docstring(
+This enumeration provides how media files are placed in .otiod bundles.
+Links are only made when the filesystem supports them, otherwise the media
+is copied.
+)docstring")
+        .value(
+            "copy_files",
+            MediaCopyPolicy::copy_files,
+            "Copy the media files.")
+        .value(
+            "hardlink_if_possible",
+            MediaCopyPolicy::hardlink_if_possible,
+            "Hard link the media files, which then share their data with the "
+            "original media.")
+        .value(
+            "reflink_if_possible",
+            MediaCopyPolicy::reflink_if_possible,
+            "Make copy-on-write clones of the media files.");
     
     py::class_<WriteOptions>(mbundle, "WriteOptions",
 R"docstring(
@@ -53,7 +74,23 @@ Options for writing bundles.
         .def_readwrite(
             "indent",
             &WriteOptions::indent,
-            "Number of spaces for JSON indentation.");
+            "Number of spaces for JSON indentation.")
+        .def_readwrite(
+            "num_threads",
+            &WriteOptions::num_threads,
+            "Maximum number of threads used to write the media files. For "
+            ".otiod bundles the media files are copied concurrently, and for "
+            ".otioz bundles they are read ahead while the zip file is written.")
+        .def_readwrite(
+            "copy_policy",
+            &WriteOptions::copy_policy,
+            "How media files are placed in .otiod bundles.")
+        .def_readwrite(
+            "progress_callback",
+            &WriteOptions::progress_callback,
+            "Called after each media file is written, with the number of "
+            "media files written, the total number of media files, and the "
+            "same for bytes. If it raises an exception, writing stops.");
     
     py::class_<ReadOptions>(mbundle, "ReadOptions",
 R"docstring(
@@ -71,6 +108,26 @@ Options for reading bundles.
             "Convert the media reference paths to absolute paths. "
             "If this is set to true for otioz files, an extract_path must also be set.");
 
+    py::class_<MediaEntry>(mbundle, "MediaEntry",
+R"docstring(
+The location of a media file in an .otioz bundle. Media files are stored
+uncompressed, so the contents of a media file are the size bytes at the
+offset in the .otioz file.
+)docstring")
+        .def_readonly(
+            "name",
+            &MediaEntry::name,
+            "The name of the media file in the bundle, as used by the media "
+            "references (for example \"media/video.mov\").")
+        .def_readonly(
+            "offset",
+            &MediaEntry::offset,
+            "Byte offset of the media file contents in the .otioz file.")
+        .def_readonly(
+            "size",
+            &MediaEntry::size,
+            "Size of the media file in bytes.");
+
     mbundle.def(
         "dry_run",
         [](
@@ -92,7 +149,10 @@ Options for reading bundles.
             std::string const&  path,
             WriteOptions const& options = WriteOptions())
         {
-            return write_otioz(timeline, path, options, ErrorStatusHandler());
+            ErrorStatusHandler error_status;
+            // the progress callback may be called from worker threads
+            py::gil_scoped_release release;
+            return write_otioz(timeline, path, options, error_status);
         },
         "Write a timeline and it's referenced media to an .otioz bundle.",
         py::arg("timeline"),
@@ -111,6 +171,16 @@ Options for reading bundles.
         py::arg("path"),
         py::arg("options") = ReadOptions());
 
+    mbundle.def(
+        "otioz_media_entries",
+        [](std::string const& path)
+        {
+            return otioz_media_entries(path, ErrorStatusHandler());
+        },
+        "Get the locations of the media files in an .otioz bundle, so that "
+        "they can be read directly from the bundle without extracting them.",
+        py::arg("path"));
+
     mbundle.def(
         "write_otiod",
         [](
@@ -118,7 +188,10 @@ Options for reading bundles.
             std::string const&  path,
             WriteOptions const& options = WriteOptions())
         {
-            return write_otiod(timeline, path, options, ErrorStatusHandler());
+            ErrorStatusHandler error_status;
+            // the progress callback may be called from worker threads
+            py::gil_scoped_release release;
+            return write_otiod(timeline, path, options, error_status);
         },
         "Write a timeline and it's referenced media to an .otiod bundle.",
         py::arg("timeline"),
@@ -31,6 +31,11 @@ struct _CannotComputeAvailableRangeException : public OTIOException
     using OTIOException::OTIOException;
 };
 
+struct _CannotTrimTransitionsException : public OTIOException
+{
+    using OTIOException::OTIOException;
+};
+
 ErrorStatusHandler::~ErrorStatusHandler() noexcept(false)
 {
     if (!is_error(error_status))
@@ -75,6 +80,8 @@ ErrorStatusHandler::~ErrorStatusHandler() noexcept(false)
             throw _NotAChildException(full_details());
         case ErrorStatus::CANNOT_COMPUTE_AVAILABLE_RANGE:
             throw _CannotComputeAvailableRangeException(full_details());
+        case ErrorStatus::CANNOT_TRIM_TRANSITION:
+            throw _CannotTrimTransitionsException(full_details());
         case ErrorStatus::OBJECT_CYCLE:
             throw py::value_error(
                 "Detected SerializableObject cycle while copying/serializing: "
@@ -137,4 +144,8 @@ otio_exception_bindings(py::module m)
         m,
         "CannotComputeAvailableRangeError",
         otio_exception.ptr());
+    py::register_exception<_CannotTrimTransitionsException>(
+        m,
+        "CannotTrimTransitionsError",
+        otio_exception.ptr());
 }
@@ -10,12 +10,15 @@ using namespace opentimelineio::OPENTIMELINEIO_VERSION_NS;
 
 struct ErrorStatusHandler
 {
-    operator ErrorStatus*() { return &error_status; }
+    operator opentimelineio::OPENTIMELINEIO_VERSION_NS::ErrorStatus*()
+    {
+        return &error_status;
+    }
 
     ~ErrorStatusHandler() noexcept(false);
 
     std::string details();
     std::string full_details();
 
-    ErrorStatus error_status;
+    opentimelineio::OPENTIMELINEIO_VERSION_NS::ErrorStatus error_status;
 };
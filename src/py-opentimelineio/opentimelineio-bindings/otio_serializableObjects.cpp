@@ -2,6 +2,7 @@
 // Copyright Contributors to the OpenTimelineIO project
 
 #include "otio_errorStatusHandler.h"
+#include <memory>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -181,6 +182,77 @@ find_clips(
     }
     return l;
 }
+
+// A column of TimelineColumns, exposed through the buffer protocol so that it
+// can be wrapped without copying, e.g. with numpy.asarray().
+template <typename T>
+struct TimelineColumn
+{
+    std::shared_ptr<TimelineColumns> columns;
+    std::vector<T> const*            values;
+};
+
+template <typename T>
+void
+define_timeline_column(py::module m, char const* name)
+{
+    py::class_<TimelineColumn<T>>(m, name, py::buffer_protocol())
+        .def_buffer([](TimelineColumn<T>& c) {
+            return py::buffer_info(
+                const_cast<T*>(c.values->data()),
+                sizeof(T),
+                py::format_descriptor<T>::format(),
+                1,
+                { py::ssize_t(c.values->size()) },
+                { py::ssize_t(sizeof(T)) },
+                true /* readonly */);
+        })
+        .def(
+            "__len__",
+            [](TimelineColumn<T> const& c) { return c.values->size(); })
+        .def("tolist", [](TimelineColumn<T> const& c) { return *c.values; });
+}
+
+template <typename T>
+py::object
+timeline_column(
+    std::shared_ptr<TimelineColumns> const& columns,
+    std::vector<T> const&                   values)
+{
+    return py::cast(TimelineColumn<T>{ columns, &values });
+}
+
+py::dict
+timeline_to_columns(Timeline* t)
+{
+    auto columns =
+        std::make_shared<TimelineColumns>(t->to_columns(ErrorStatusHandler()));
+
+    std::vector<MediaReference*> media_references;
+    for (auto const& media_reference: columns->media_references)
+    {
+        media_references.push_back(media_reference.value);
+    }
+
+    py::dict result;
+    result["track_index"]  = timeline_column(columns, columns->track_index);
+    result["schema_index"] = timeline_column(columns, columns->schema_index);
+    result["start"]        = timeline_column(columns, columns->start);
+    result["duration"]     = timeline_column(columns, columns->duration);
+    result["source_start"] = timeline_column(columns, columns->source_start);
+    result["rate"]         = timeline_column(columns, columns->rate);
+    result["name_index"]   = timeline_column(columns, columns->name_index);
+    result["media_reference_index"] =
+        timeline_column(columns, columns->media_reference_index);
+    result["schema_names"] = py::cast(columns->schema_names);
+    result["names"]        = py::cast(columns->names);
+
+    // The media references are not copyable; the holder of each one retains
+    // it, as for any other media reference returned to Python.
+    result["media_references"] =
+        py::cast(media_references, py::return_value_policy::take_ownership);
+    return result;
+}
 } // namespace
 
 /*
@@ -1145,6 +1217,9 @@ Should be subclassed (for example by :class:`.Track` and :class:`.Stack`), not u
             "effects"_a      = py::none(),
             py::arg_v("metadata"_a = py::none()));
 
+    define_timeline_column<int64_t>(m, "TimelineIntColumn");
+    define_timeline_column<double>(m, "TimelineFloatColumn");
+
     py::class_<
         Timeline,
         SerializableObjectWithMetadata,
@@ -1185,6 +1260,23 @@ Should be subclassed (for example by :class:`.Track` and :class:`.Stack`), not u
             })
         .def("video_tracks", &Timeline::video_tracks)
         .def("audio_tracks", &Timeline::audio_tracks)
+        .def(
+            "to_columns",
+            &timeline_to_columns,
+            R"docstring(Return the children of the timeline's tracks as a dictionary of columns.
+
+Each row describes one direct child of one track, computed in a single native pass:
+
+- ``track_index``: index of the track in :attr:`tracks`
+- ``schema_index``: index into ``schema_names``
+- ``start``, ``duration``: range of the child in its track
+- ``source_start``: start of the child's trimmed range (NaN for transitions)
+- ``rate``: rate of the time columns
+- ``name_index``: index into ``names``
+- ``media_reference_index``: index into ``media_references``, or -1
+
+The columns support the buffer protocol, so ``numpy.asarray(columns["start"])``
+wraps them without a copy.)docstring")
         .def(
             "find_clips",
             [](Timeline*                       t,
@@ -13,8 +13,11 @@
 
 #include <Imath/ImathBox.h>
 
+#include <algorithm>
 #include <cstring>
+#include <limits>
 #include <map>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -150,18 +153,154 @@ _build_any_to_py_dispatch_table()
 // Initialized lazily after the interpreter is ready.
 // constructing py::none() at static init time triggers
 // pybind11 GIL assertions in Debug builds.
-static py::object _value_to_any;
+static py::object _python_value_to_any;
 
 static void
-py_to_any(py::object const& o, std::any* result)
+_python_fallback_to_any(py::handle o, std::any* result)
 {
-    if (!_value_to_any || _value_to_any.is_none())
+    if (!_python_value_to_any || _python_value_to_any.is_none())
     {
-        py::object core = py::module::import("opentimelineio.core");
-        _value_to_any   = core.attr("_value_to_any");
+        py::object core_utils =
+            py::module::import("opentimelineio.core._core_utils");
+        _python_value_to_any = core_utils.attr("_python_value_to_any");
     }
 
-    result->swap(_value_to_any(o).cast<PyAny*>()->a);
+    result->swap(_python_value_to_any(o).cast<PyAny*>()->a);
+}
+
+static void _py_to_any(
+    py::handle              o,
+    std::any*               result,
+    std::vector<PyObject*>& containers);
+
+static void
+_py_child_to_any(
+    py::handle              o,
+    std::any*               result,
+    std::vector<PyObject*>& containers)
+{
+    if (std::find(containers.begin(), containers.end(), o.ptr())
+        != containers.end())
+    {
+        throw py::value_error(
+            "circular reference converting dictionary to C++ datatype");
+    }
+
+    _py_to_any(o, result, containers);
+}
+
+// Converts the builtin python types that metadata is made of without calling
+// back into python; everything else is converted by
+// opentimelineio.core._core_utils._python_value_to_any.  containers holds the
+// dicts and lists being converted, to detect circular references.
+static void
+_py_to_any(py::handle o, std::any* result, std::vector<PyObject*>& containers)
+{
+    PyObject* p = o.ptr();
+
+    if (p == Py_None)
+    {
+        *result = std::any();
+    }
+    else if (PyBool_Check(p))
+    {
+        *result = create_safely_typed_any(bool(p == Py_True));
+    }
+    else if (PyLong_CheckExact(p))
+    {
+        int     overflow = 0;
+        int64_t value    = PyLong_AsLongLongAndOverflow(p, &overflow);
+        if (overflow)
+        {
+            throw py::value_error(string_printf(
+                "A value of %s is outside of the range of integers that "
+                "OpenTimelineIO supports, [%lld, %lld], which is the range "
+                "of C++ int64_t.",
+                std::string(py::str(o)).c_str(),
+                (long long) std::numeric_limits<int64_t>::min(),
+                (long long) std::numeric_limits<int64_t>::max()));
+        }
+        *result = create_safely_typed_any(std::move(value));
+    }
+    else if (PyFloat_CheckExact(p))
+    {
+        double value = PyFloat_AS_DOUBLE(p);
+        *result      = create_safely_typed_any(std::move(value));
+    }
+    else if (PyUnicode_CheckExact(p))
+    {
+        Py_ssize_t  size;
+        char const* data = PyUnicode_AsUTF8AndSize(p, &size);
+        if (!data)
+        {
+            PyErr_Clear();
+            _python_fallback_to_any(o, result);
+            return;
+        }
+        *result = create_safely_typed_any(std::string(data, size));
+    }
+    else if (PyDict_CheckExact(p))
+    {
+        // AnyDictionary and AnyVector have no move constructors, so the
+        // containers are filled in place rather than copied into result
+        *result          = create_safely_typed_any(AnyDictionary());
+        AnyDictionary& d = std::any_cast<AnyDictionary&>(*result);
+        containers.push_back(p);
+
+        PyObject*  key;
+        PyObject*  value;
+        Py_ssize_t pos = 0;
+        while (PyDict_Next(p, &pos, &key, &value))
+        {
+            if (!PyUnicode_Check(key))
+            {
+                throw py::value_error(string_printf(
+                    "key '%s' is not a string",
+                    std::string(py::str(key)).c_str()));
+            }
+
+            std::any a;
+            _py_child_to_any(value, &a, containers);
+            d.emplace(py::handle(key).cast<std::string>(), std::move(a));
+        }
+
+        containers.pop_back();
+    }
+    else if (PyList_CheckExact(p) || PyTuple_CheckExact(p))
+    {
+        *result      = create_safely_typed_any(AnyVector());
+        AnyVector& v = std::any_cast<AnyVector&>(*result);
+        v.reserve(PySequence_Fast_GET_SIZE(p));
+        containers.push_back(p);
+
+        for (Py_ssize_t i = 0; i < PySequence_Fast_GET_SIZE(p); ++i)
+        {
+            std::any a;
+            _py_child_to_any(PySequence_Fast_GET_ITEM(p, i), &a, containers);
+            v.push_back(std::move(a));
+        }
+
+        containers.pop_back();
+    }
+    else if (py::isinstance<PyAny>(o))
+    {
+        *result = o.cast<PyAny*>()->a;
+    }
+    else if (py::isinstance<SerializableObject>(o))
+    {
+        *result = create_safely_typed_any(o.cast<SerializableObject*>());
+    }
+    else
+    {
+        _python_fallback_to_any(o, result);
+    }
+}
+
+void
+py_to_any(py::handle o, std::any* result)
+{
+    std::vector<PyObject*> containers;
+    _py_to_any(o, result, containers);
 }
 
 AnyDictionary
@@ -210,6 +349,44 @@ any_to_py(std::any const& a, bool top_level)
     return e->second(a, top_level);
 }
 
+py::dict
+any_dictionary_to_python(AnyDictionary const& d)
+{
+    py::dict result;
+    for (auto const& e: d)
+    {
+        result[plain_string(e.first)] = any_to_python(e.second);
+    }
+    return result;
+}
+
+py::list
+any_vector_to_python(AnyVector const& v)
+{
+    py::list result(v.size());
+    for (size_t i = 0; i < v.size(); ++i)
+    {
+        result[i] = any_to_python(v[i]);
+    }
+    return result;
+}
+
+py::object
+any_to_python(std::any const& a)
+{
+    if (compare_typeids(a.type(), typeid(AnyDictionary)))
+    {
+        return any_dictionary_to_python(
+            temp_safely_cast_any_dictionary_any(a));
+    }
+    else if (compare_typeids(a.type(), typeid(AnyVector)))
+    {
+        return any_vector_to_python(temp_safely_cast_any_vector_any(a));
+    }
+
+    return any_to_py(a);
+}
+
 struct KeepaliveMonitor
 {
     SerializableObject* _so;
@@ -167,8 +167,15 @@ struct PyAny
 };
 
 pybind11::object any_to_py(std::any const& a, bool top_level = false);
+
+// Convert a value, including any nested AnyDictionary and AnyVector
+// containers, to plain python dicts and lists.
+pybind11::object any_to_python(std::any const& a);
+pybind11::dict   any_dictionary_to_python(AnyDictionary const& d);
+pybind11::list   any_vector_to_python(AnyVector const& v);
 pybind11::object plain_string(std::string const& s);
 pybind11::object plain_int(int i);
+void             py_to_any(pybind11::handle o, std::any* result);
 AnyDictionary    py_to_any_dictionary(pybind11::object const& o);
 
 bool compare_typeids(std::type_info const& lhs, std::type_info const& rhs);
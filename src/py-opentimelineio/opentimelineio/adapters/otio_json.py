@@ -14,30 +14,51 @@ import os
 _DEFAULT_VERSION_ENVVAR = "OTIO_DEFAULT_TARGET_VERSION_FAMILY_LABEL"
 
 
-def read_from_file(filepath):
+def _deserialize_options(num_threads, track_line_numbers):
+    options = core.DeserializeOptions()
+    options.num_threads = num_threads
+    options.track_line_numbers = track_line_numbers
+    return options
+
+
+def read_from_file(filepath, num_threads=1, track_line_numbers=True):
     """
     De-serializes an OpenTimelineIO object from a file
 
     Args:
         filepath (str): The path to an otio file to read from
+        num_threads (int): Maximum number of threads used to decode the\
+            file. Tracks are decoded concurrently when greater than one.
+        track_line_numbers (bool): Track line numbers for error messages.\
+            Decoding is faster without them.
 
     Returns:
         OpenTimeline: An OpenTimeline object
     """
-    return core.deserialize_json_from_file(filepath)
+    return core.deserialize_json_from_file(
+        filepath,
+        _deserialize_options(num_threads, track_line_numbers)
+    )
 
 
-def read_from_string(input_str):
+def read_from_string(input_str, num_threads=1, track_line_numbers=True):
     """
     De-serializes an OpenTimelineIO object from a json string
 
     Args:
         input_str (str): A string containing json serialized otio contents
+        num_threads (int): Maximum number of threads used to decode the\
+            string. Tracks are decoded concurrently when greater than one.
+        track_line_numbers (bool): Track line numbers for error messages.\
+            Decoding is faster without them.
 
     Returns:
         OpenTimeline: An OpenTimeline object
     """
-    return core.deserialize_json_from_string(input_str)
+    return core.deserialize_json_from_string(
+        input_str,
+        _deserialize_options(num_threads, track_line_numbers)
+    )
 
 
 def _fetch_downgrade_map_from_env():
@@ -30,11 +30,22 @@ def write_to_file(
     relative_media_base_dir=None,
     # see documentation bundle.h for more information on the media_policy
     media_policy=_otio.bundle.MediaReferencePolicy.error_if_not_file,
-    dryrun=False
+    dryrun=False,
+    # maximum number of threads used to write the media files
+    num_threads=1,
+    # see documentation in bundle.h for more information on the copy_policy
+    copy_policy=_otio.bundle.MediaCopyPolicy.copy_files,
+    # called with (files_written, files_total, bytes_written, bytes_total)
+    # after each media file is written
+    progress_callback=None,
 ):
     options = _otio.bundle.WriteOptions()
     options.relative_media_base_dir = relative_media_base_dir
     options.policy = media_policy
+    options.num_threads = num_threads
+    options.copy_policy = copy_policy
+    if progress_callback is not None:
+        options.progress_callback = progress_callback
 
     if dryrun:
         return _otio.bundle.dry_run(input_otio, options)
@@ -14,8 +14,14 @@ Can also extract the content.otio file from an otioz bundle for processing.
 Note that OTIOZ files _always_ use the unix style path separator ('/'). This
 ensures that regardless of which platform a bundle was created on, it can be
 read on unix and windows platforms.
+
+Because media is stored uncompressed, media files can also be read directly
+from an otioz bundle, without extracting them, with open_media().
 """
 
+import io
+import mmap
+
 from .. import (
     _otio
 )
@@ -38,14 +44,123 @@ def write_to_file(
     relative_media_base_dir=None,
     # see documentation in bundle. for more information on the media_policy
     media_policy=_otio.bundle.MediaReferencePolicy.error_if_not_file,
-    dryrun=False
+    dryrun=False,
+    # maximum number of threads used to write the media files
+    num_threads=1,
+    # called with (files_written, files_total, bytes_written, bytes_total)
+    # after each media file is written
+    progress_callback=None,
 ):
     options = _otio.bundle.WriteOptions()
     options.relative_media_base_dir = relative_media_base_dir
     options.policy = media_policy
+    options.num_threads = num_threads
+    if progress_callback is not None:
+        options.progress_callback = progress_callback
 
     if dryrun:
         return _otio.bundle.dry_run(input_otio, options)
 
     _otio.bundle.write_otioz(input_otio, filepath, options)
     return
+
+
+def media_entries(filepath):
+    """
+    Return a dictionary of the media files in an otioz bundle, by their name
+    in the bundle (for example "media/video.mov"), as used by the media
+    references. The values are MediaEntry objects, with the offset and size
+    of the media file contents in the bundle.
+    """
+    return {
+        entry.name: entry
+        for entry in _otio.bundle.otioz_media_entries(filepath)
+    }
+
+
+def open_media(filepath, name):
+    """
+    Open a media file in an otioz bundle for reading, without extracting it.
+    The name is the name of the media file in the bundle, for example
+    "media/video.mov". Returns a MediaFile.
+    """
+    entry = media_entries(filepath).get(name)
+    if entry is None:
+        raise FileNotFoundError(
+            f"no media file named '{name}' in '{filepath}'"
+        )
+    return MediaFile(filepath, entry)
+
+
+class MediaFile(io.RawIOBase):
+    """
+    A read-only, seekable file object for a media file in an otioz bundle,
+    which reads the media directly from the bundle file. Offsets are relative
+    to the start of the media file.
+    """
+
+    def __init__(self, filepath, entry):
+        super().__init__()
+        self.name = entry.name
+        self.offset = entry.offset
+        self.size = entry.size
+        self._file = open(filepath, "rb")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        self._checkClosed()
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        self._checkClosed()
+        with memoryview(buffer).cast("B") as view:
+            count = max(0, min(len(view), self.size - self._position))
+            if not count:
+                return 0
+            self._file.seek(self.offset + self._position)
+            count = self._file.readinto(view[:count])
+        self._position += count
+        return count
+
+    def mmap(self):
+        """
+        Map the media file into memory, and return a read-only memoryview of
+        its contents. The mapping stays valid after the file is closed.
+        """
+        self._checkClosed()
+        if not self.size:
+            return memoryview(b"")
+        start = self.offset - self.offset % mmap.ALLOCATIONGRANULARITY
+        mapped = mmap.mmap(
+            self._file.fileno(),
+            self.offset + self.size - start,
+            access=mmap.ACCESS_READ,
+            offset=start
+        )
+        return memoryview(mapped)[self.offset - start:]
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+        super().close()
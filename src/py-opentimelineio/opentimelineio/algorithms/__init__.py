@@ -4,6 +4,11 @@
 """Algorithms for OTIO objects."""
 
 # flake8: noqa
+from .item_algo import (
+    item_source_time,
+    item_source_times,
+)
+
 from .track_algo import (
     track_trimmed_to_range,
     track_with_expanded_transitions
@@ -11,7 +16,9 @@ from .track_algo import (
 
 from .stack_algo import (
     flatten_stack,
+    StackFlattener,
     top_clip_at_time,
+    top_clips_at_times,
 )
 
 from .filter import (
@@ -19,5 +26,8 @@ from .filter import (
     filtered_with_sequence_context
 )
 from .timeline_algo import (
-    timeline_trimmed_to_range
+    timeline_trimmed_to_range,
+    timeline_delta,
+    apply_timeline_delta,
+    media_usage,
 )
@@ -6,16 +6,89 @@
 import copy
 
 from .. import (
+    core,
     schema
 )
 
 
-def _is_in(thing, container):
-    return any(thing is item for item in container)
+def _filter_children(thing, keep, filter_fn):
+    """Filter the children of ``thing`` in place, depth first.
 
+    Each composition's children are detached once and its new list of
+    children is built as they are filtered, so every composition costs time
+    linear in its number of children. ``keep`` is whether ``thing`` itself
+    survived filtering; the children of a pruned composition are skipped.
+    """
+
+    if isinstance(thing, schema.SerializableCollection):
+        # children of collections have no parent to be replaced in, so they
+        # are filtered but always kept. As with find_children(), only
+        # composables are passed to the filter; timelines and collections
+        # are searched without being filtered themselves.
+        for child in thing:
+            child_keep = True
+            if isinstance(child, core.Composable):
+                child_keep = filter_fn(None, child, None) is not None
+            _filter_children(child, child_keep, filter_fn)
+    elif isinstance(thing, schema.Timeline):
+        _filter_children(thing.tracks, keep, filter_fn)
+    elif isinstance(thing, core.Composition) and keep:
+        children = list(thing)
+        del thing[:]
+
+        in_track = isinstance(thing, schema.Track)
+        last = len(children) - 1
+        filtered_children = []
+        for index, child in enumerate(children):
+            prev_item = None
+            next_item = None
+            if in_track:
+                prev_item = children[index - 1] if index > 0 else None
+                next_item = children[index + 1] if index < last else None
+
+            result = filter_fn(prev_item, child, next_item)
+            if result is None:
+                continue
+
+            _filter_children(child, True, filter_fn)
+
+            if type(result) is not tuple:
+                result = [result]
+            filtered_children.extend(result)
+
+        thing.extend(filtered_children)
+
+
+def _filtered(root, filter_fn, types_to_prune):
+    """Filter a deep copy of root with ``filter_fn(prev, item, next)``."""
+
+    types_to_prune = tuple(types_to_prune or ())
+
+    def _filter_or_prune(prev_item, thing, next_item):
+        # first try to prune
+        if types_to_prune and isinstance(thing, types_to_prune):
+            return None
+        # finally call the user function
+        return filter_fn(prev_item, thing, next_item)
 
-def _isinstance_in(child, typelist):
-    return any(isinstance(child, t) for t in typelist)
+    # deep copy everything
+    mutable_object = copy.deepcopy(root)
+
+    result = _filter_or_prune(None, mutable_object, None)
+
+    if isinstance(mutable_object, schema.Timeline):
+        # the tracks of the timeline are filtered too, but have no parent to
+        # be replaced in
+        tracks = mutable_object.tracks
+        _filter_children(
+            tracks,
+            _filter_or_prune(None, tracks, None) is not None,
+            _filter_or_prune
+        )
+    else:
+        _filter_children(mutable_object, result is not None, _filter_or_prune)
+
+    return result
 
 
 def filtered_composition(
@@ -92,57 +165,11 @@ def filtered_composition(
     :param tuple(type) types_to_prune: Types to prune. Example: (otio.schema.Gap,...)
     """
 
-    # deep copy everything
-    mutable_object = copy.deepcopy(root)
-
-    prune_list = set()
-
-    header_list = [mutable_object]
-
-    if isinstance(mutable_object, schema.Timeline):
-        header_list.append(mutable_object.tracks)
-
-    iter_list = header_list + list(mutable_object.find_children())
-
-    for child in iter_list:
-        if _safe_parent(child) is not None and _is_in(child.parent(), prune_list):
-            prune_list.add(child)
-            continue
-
-        parent = None
-        child_index = None
-        if _safe_parent(child) is not None:
-            child_index = child.parent().index(child)
-            parent = child.parent()
-            del child.parent()[child_index]
-
-        # first try to prune
-        if (types_to_prune and _isinstance_in(child, types_to_prune)):
-            result = None
-        # finally call the user function
-        else:
-            result = unary_filter_fn(child)
-
-        if child is mutable_object:
-            mutable_object = result
-
-        if result is None:
-            prune_list.add(child)
-            continue
-
-        if type(result) is not tuple:
-            result = [result]
-
-        if parent is not None:
-            parent[child_index:child_index] = result
-
-    return mutable_object
-
-
-def _safe_parent(child):
-    if hasattr(child, 'parent'):
-        return child.parent()
-    return None
+    return _filtered(
+        root,
+        lambda _, thing, __: unary_filter_fn(thing),
+        types_to_prune
+    )
 
 
 def filtered_with_sequence_context(
@@ -226,60 +253,4 @@ def filtered_with_sequence_context(
     :param tuple(type) types_to_prune: Types to prune. Example: (otio.schema.Gap,...)
     """
 
-    # deep copy everything
-    mutable_object = copy.deepcopy(root)
-
-    prune_list = set()
-
-    header_list = [mutable_object]
-
-    if isinstance(mutable_object, schema.Timeline):
-        header_list.append(mutable_object.tracks)
-
-    iter_list = header_list + list(mutable_object.find_children())
-
-    # expand to include prev, next when appropriate
-    expanded_iter_list = []
-    for child in iter_list:
-        if _safe_parent(child) and isinstance(child.parent(), schema.Track):
-            prev_item, next_item = child.parent().neighbors_of(child)
-            expanded_iter_list.append((prev_item, child, next_item))
-        else:
-            expanded_iter_list.append((None, child, None))
-
-    def _safe_name(x):
-        return x.name if x else "<NONE>"
-
-    for prev_item, child, next_item in expanded_iter_list:
-        if _safe_parent(child) is not None and _is_in(child.parent(), prune_list):
-            prune_list.add(child)
-            continue
-
-        parent = None
-        child_index = None
-        if _safe_parent(child) is not None:
-            child_index = child.parent().index(child)
-            parent = child.parent()
-            del child.parent()[child_index]
-
-        # first try to prune
-        if types_to_prune and _isinstance_in(child, types_to_prune):
-            result = None
-        # finally call the user function
-        else:
-            result = reduce_fn(prev_item, child, next_item)
-
-        if child is mutable_object:
-            mutable_object = result
-
-        if result is None:
-            prune_list.add(child)
-            continue
-
-        if type(result) is not tuple:
-            result = [result]
-
-        if parent is not None:
-            parent[child_index:child_index] = result
-
-    return mutable_object
+    return _filtered(root, reduce_fn, types_to_prune)
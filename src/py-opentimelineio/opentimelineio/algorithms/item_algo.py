@@ -0,0 +1,10 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Algorithms for item objects."""
+
+from .. import _otio
+
+
+item_source_time = _otio.item_source_time
+item_source_times = _otio.item_source_times
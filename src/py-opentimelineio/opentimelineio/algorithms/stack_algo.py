@@ -63,4 +63,53 @@ def top_clip_at_time(in_stack, t):
     return None
 
 
+def top_clips_at_times(in_stack, times, step=None):
+    """Return the topmost visible clip at each of many times, and the time of
+    its source media at that time.
+
+    The clips are the ones that :func:`top_clip_at_time` returns, but the
+    tracks are searched with cursors that move forward with the times, so
+    scanning every frame of a stack costs about as much as visiting each
+    of its clips once. The times should be sorted; times that go backwards
+    are still handled, more slowly.
+
+    ``times`` is a sequence of :class:`~opentimelineio.opentime.RationalTime`,
+    or a :class:`~opentimelineio.opentime.TimeRange` to sample every ``step``
+    from its start time. ``step`` defaults to one frame at the rate of the
+    range.
+
+    Example::
+
+        for clip, source_time in top_clips_at_times(
+            stack, stack.trimmed_range()
+        ):
+            ...
+
+    :param Stack in_stack: Stack
+    :param times: Times, or a range
+    :type times: list[RationalTime] or TimeRange
+    :param RationalTime step: Time between the times, for a range
+    :returns: A ``(clip, source_time)`` pair for each time, which is
+        ``(None, None)`` where no clip is visible
+    :rtype: list[tuple[Clip, RationalTime]]
+    """
+
+    # ensure that it only runs on stacks
+    if not isinstance(in_stack, schema.Stack):
+        raise ValueError(
+            "Argument in_stack must be of type otio.schema.Stack, "
+            "not: '{}'".format(
+                type(in_stack)
+            )
+        )
+
+    if isinstance(times, opentime.TimeRange):
+        if step is None:
+            step = opentime.RationalTime(1, times.start_time.rate)
+        return _otio.top_clips_at_times(in_stack, times, step)
+
+    return _otio.top_clips_at_times(in_stack, list(times))
+
+
 flatten_stack = _otio.flatten_stack
+StackFlattener = _otio.StackFlattener
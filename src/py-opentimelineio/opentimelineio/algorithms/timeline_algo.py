@@ -3,10 +3,16 @@
 
 """Algorithms for timeline objects."""
 
-import copy
+import bisect
+import collections
+import json
 
-from . import (
-    track_algo
+from .. import (
+    core,
+    exceptions,
+    opentime,
+    schema,
+    _otio,
 )
 
 
@@ -22,24 +28,384 @@ def timeline_trimmed_to_range(in_timeline, trim_range):
     just setting the :py:class:`.Track`\'s source_range but sometimes you want to
     really cut away the stuff outside and that's what this function is meant for.
 
+    Each track is copied once, keeping only the children that intersect the
+    trim_range.
+
     :param Timeline in_timeline: Timeline to trim
     :param TimeRange trim_range:
     :returns: New trimmed timeline
     :rtype: Timeline
+    :raises CannotTrimTransitionsError: if a transition crosses an end of
+        the trim_range
+    :raises ValueError: if a child of the timeline's stack is not a
+        :class:`.Track`
+    """
+    return _otio.timeline_trimmed_to_range(in_timeline, trim_range)
+
+
+def timeline_delta(base_timeline, target_timeline):
+    """
+    Returns a :class:`~opentimelineio.schema.TimelineDelta` describing the
+    changes that turn ``base_timeline`` into ``target_timeline``.
+
+    Both timelines are compared in their serialized form.  Children of
+    compositions are matched by schema and name (in order, when several
+    children share a name), so inserted, removed and reordered children
+    become ``add``, ``remove`` and ``move`` operations instead of a
+    rewrite of everything that follows them.  The children left unmatched,
+    such as renamed ones, are then paired in order with unmatched children
+    of the same schema, so a renamed clip becomes a ``replace`` of its name.
+    Matched children and dictionaries such as ``metadata`` are compared
+    field by field, and any other value that differs is replaced as a whole.
+
+    :param Timeline base_timeline: Timeline the delta applies to
+    :param Timeline target_timeline: Timeline the delta produces
+    :returns: Delta that turns base_timeline into target_timeline
+    :rtype: TimelineDelta
+    """
+    operations = []
+    _diff_values(
+        _serialized_tree(base_timeline),
+        _serialized_tree(target_timeline),
+        "",
+        operations
+    )
+
+    return schema.TimelineDelta(operations=operations)
+
+
+def apply_timeline_delta(in_timeline, delta):
+    """
+    Returns a new timeline that is a copy of ``in_timeline`` with the
+    operations of ``delta`` applied.
+
+    The operations are not applied to the objects of ``in_timeline``:
+    the timeline is serialized, the operations are applied to the
+    serialized form and the result is read back through the regular
+    deserializer, so schema upgrades apply to both the timeline and the
+    values carried by the delta.  Applying a delta therefore costs a full
+    write and read of the timeline, however few operations it has.
+
+    :param Timeline in_timeline: Timeline to apply the delta to
+    :param TimelineDelta delta: Delta computed by :func:`timeline_delta`
+    :returns: New patched timeline
+    :rtype: Timeline
+    :raises InvalidTimelineDeltaError: if an operation does not apply to
+        in_timeline
+    """
+    tree = _serialized_tree(in_timeline)
+    for operation in delta.operations:
+        tree = _apply_operation(tree, operation)
+
+    return core.deserialize_json_from_string(json.dumps(tree))
+
+
+def media_usage(in_timeline, handles=None):
+    """
+    Returns the source media used by each distinct media reference in
+    ``in_timeline``, for building pull lists.
+
+    The timeline is traversed once in C++. The visible part of each enabled
+    clip is mapped to the time of its media reference. This accounts for
+    trims of nested compositions, :class:`.LinearTimeWarp` and
+    :class:`.FreezeFrame` effects, and the handles needed by transitions
+    (see :meth:`.Track.handles_of_child`). ``handles`` is then added to both
+    ends of each use, and the ranges of each media are merged.
+
+    Media references are grouped by target URL. References without one are
+    grouped by identity.
+
+    :param in_timeline: Timeline, or any composition, to traverse
+    :type in_timeline: Timeline or Composition
+    :param RationalTime handles: Amount of media to add before and after each
+        use
+    :returns: One entry per media, in the order the media were found
+    :rtype: list[MediaUsage]
     """
-    new_timeline = copy.deepcopy(in_timeline)
+    if handles is None:
+        handles = opentime.RationalTime()
+
+    return _otio.media_usage(in_timeline, handles)
+
+
+_CHILDREN_KEY = "children"
+
+
+def _serialized_tree(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    return json.loads(core.serialize_json_to_string(value, indent=-1))
+
+
+def _value_from_tree(tree):
+    if tree is None or isinstance(tree, (bool, int, float, str)):
+        return tree
+
+    return core.deserialize_json_from_string(json.dumps(tree))
+
+
+def _pointer(path, token):
+    return "{}/{}".format(
+        path,
+        str(token).replace("~", "~0").replace("/", "~1")
+    )
+
+
+def _diff_values(base, target, path, operations):
+    if base == target:
+        return
+
+    if (
+        isinstance(base, dict)
+        and isinstance(target, dict)
+        and base.get("OTIO_SCHEMA") == target.get("OTIO_SCHEMA")
+    ):
+        _diff_dicts(base, target, path, operations)
+    elif (
+        isinstance(base, list)
+        and isinstance(target, list)
+        and path.endswith("/" + _CHILDREN_KEY)
+    ):
+        _diff_children(base, target, path, operations)
+    else:
+        operations.append(
+            {"op": "replace", "path": path, "value": _value_from_tree(target)}
+        )
+
+
+def _diff_dicts(base, target, path, operations):
+    for key in base:
+        if key not in target:
+            operations.append({"op": "remove", "path": _pointer(path, key)})
+
+    for key, value in target.items():
+        if key not in base:
+            operations.append(
+                {
+                    "op": "add",
+                    "path": _pointer(path, key),
+                    "value": _value_from_tree(value)
+                }
+            )
+        else:
+            _diff_values(base[key], value, _pointer(path, key), operations)
 
-    for track_num, child_track in enumerate(in_timeline.tracks):
-        # @TODO: put the trim_range into the space of the tracks
-        # new_range = new_timeline.tracks.transformed_time_range(
-        #     trim_range,
-        #     child_track
-        # )
 
-        # trim the track and assign it to the new stack.
-        new_timeline.tracks[track_num] = track_algo.track_trimmed_to_range(
-            child_track,
-            trim_range
+def _child_key(child):
+    if isinstance(child, dict):
+        return (child.get("OTIO_SCHEMA"), child.get("name"))
+
+    return (None, json.dumps(child, sort_keys=True))
+
+
+def _child_schema(child):
+    if isinstance(child, dict):
+        return child.get("OTIO_SCHEMA")
+
+    return None
+
+
+def _longest_increasing_subsequence(sequence):
+    tail_values = []
+    tail_indices = []
+    previous = [None] * len(sequence)
+    for index, value in enumerate(sequence):
+        length = bisect.bisect_left(tail_values, value)
+        if length > 0:
+            previous[index] = tail_indices[length - 1]
+        if length == len(tail_values):
+            tail_values.append(value)
+            tail_indices.append(index)
+        else:
+            tail_values[length] = value
+            tail_indices[length] = index
+
+    result = set()
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        result.add(sequence[index])
+        index = previous[index]
+
+    return result
+
+
+def _diff_children(base, target, path, operations):
+    # pair up children with the same key in the order they appear
+    unmatched = collections.defaultdict(collections.deque)
+    for index, child in enumerate(base):
+        unmatched[_child_key(child)].append(index)
+
+    base_index_for_target = []
+    for child in target:
+        candidates = unmatched.get(_child_key(child))
+        base_index_for_target.append(
+            candidates.popleft() if candidates else None
+        )
+
+    # pair the children left over, in order, with left over children of the
+    # same schema, so that an edited name is diffed like any other field
+    leftover = collections.defaultdict(collections.deque)
+    for index in sorted(i for indices in unmatched.values() for i in indices):
+        schema_name = _child_schema(base[index])
+        if schema_name is not None:
+            leftover[schema_name].append(index)
+
+    for index, child in enumerate(target):
+        if base_index_for_target[index] is not None:
+            continue
+        candidates = leftover.get(_child_schema(child))
+        if candidates:
+            base_index_for_target[index] = candidates.popleft()
+
+    # removals, from the back so that earlier indices stay valid
+    matched = set(i for i in base_index_for_target if i is not None)
+    current = list(range(len(base)))
+    for index in reversed(range(len(base))):
+        if index not in matched:
+            operations.append({"op": "remove", "path": _pointer(path, index)})
+            del current[index]
+
+    # moves, leaving the longest run that is already in order untouched
+    order = [i for i in base_index_for_target if i is not None]
+    rank = {base_index: r for r, base_index in enumerate(order)}
+    in_place = _longest_increasing_subsequence([rank[i] for i in current])
+    for r, base_index in enumerate(order):
+        if r in in_place:
+            continue
+
+        source = current.index(base_index)
+        del current[source]
+        destination = current.index(order[r - 1]) + 1 if r else 0
+        current.insert(destination, base_index)
+        operations.append(
+            {
+                "op": "move",
+                "from": _pointer(path, source),
+                "path": _pointer(path, destination)
+            }
+        )
+
+    # additions, front to back so each lands on its final index
+    for index, base_index in enumerate(base_index_for_target):
+        if base_index is None:
+            operations.append(
+                {
+                    "op": "add",
+                    "path": _pointer(path, index),
+                    "value": _value_from_tree(target[index])
+                }
+            )
+
+    for index, base_index in enumerate(base_index_for_target):
+        if base_index is not None:
+            _diff_values(
+                base[base_index],
+                target[index],
+                _pointer(path, index),
+                operations
+            )
+
+
+def _split_pointer(path):
+    if not path:
+        return []
+    if not path.startswith("/"):
+        raise exceptions.InvalidTimelineDeltaError(
+            f"Invalid path in timeline delta: '{path}'"
+        )
+
+    return [
+        token.replace("~1", "/").replace("~0", "~")
+        for token in path[1:].split("/")
+    ]
+
+
+def _container_and_key(tree, path):
+    tokens = _split_pointer(path)
+    if not tokens:
+        raise exceptions.InvalidTimelineDeltaError(
+            "Timeline delta operations may not add, remove or move the root."
+        )
+
+    container = tree
+    try:
+        for token in tokens[:-1]:
+            if isinstance(container, list):
+                container = container[int(token)]
+            else:
+                container = container[token]
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise exceptions.InvalidTimelineDeltaError(
+            f"Path '{path}' does not exist in the timeline."
+        )
+
+    key = tokens[-1]
+    if isinstance(container, list):
+        try:
+            key = len(container) if key == "-" else int(key)
+        except ValueError:
+            raise exceptions.InvalidTimelineDeltaError(
+                f"Path '{path}' does not index a list."
+            )
+    elif not isinstance(container, dict):
+        raise exceptions.InvalidTimelineDeltaError(
+            f"Path '{path}' does not exist in the timeline."
+        )
+
+    return container, key
+
+
+def _remove(tree, path):
+    container, key = _container_and_key(tree, path)
+    try:
+        return container.pop(key)
+    except (KeyError, IndexError):
+        raise exceptions.InvalidTimelineDeltaError(
+            f"Path '{path}' does not exist in the timeline."
+        )
+
+
+def _add(tree, path, value):
+    container, key = _container_and_key(tree, path)
+    if isinstance(container, list):
+        if not 0 <= key <= len(container):
+            raise exceptions.InvalidTimelineDeltaError(
+                f"Path '{path}' is out of range."
+            )
+        container.insert(key, value)
+    else:
+        container[key] = value
+
+
+def _apply_operation(tree, operation):
+    op = operation.get("op")
+    path = operation.get("path")
+    if not isinstance(path, str):
+        raise exceptions.InvalidTimelineDeltaError(
+            f"Timeline delta operation has no path: {operation}"
+        )
+
+    if op == "add":
+        _add(tree, path, _serialized_tree(operation.get("value")))
+    elif op == "remove":
+        _remove(tree, path)
+    elif op == "replace":
+        value = _serialized_tree(operation.get("value"))
+        if not path:
+            return value
+        _remove(tree, path)
+        _add(tree, path, value)
+    elif op == "move":
+        source = operation.get("from")
+        if not isinstance(source, str):
+            raise exceptions.InvalidTimelineDeltaError(
+                f"Timeline delta move operation has no source: {operation}"
+            )
+        _add(tree, path, _remove(tree, source))
+    else:
+        raise exceptions.InvalidTimelineDeltaError(
+            f"Unknown timeline delta operation: '{op}'"
         )
 
-    return new_timeline
+    return tree
@@ -9,6 +9,7 @@ from .. import (
     schema,
     exceptions,
     opentime,
+    _otio,
 )
 
 
@@ -24,57 +25,16 @@ def track_trimmed_to_range(in_track, trim_range):
     just setting the :py:class:`.Track`\'s source_range but sometimes you want
     to really cut away the stuff outside and that's what this function is meant for.
 
+    Only the children that are kept are copied.
+
     :param Track in_track: Track to trim
     :param TimeRange trim_range:
     :returns: New trimmed track
     :rtype: Track
+    :raises CannotTrimTransitionsError: if a transition crosses an end of
+        the trim_range
     """
-    new_track = copy.deepcopy(in_track)
-
-    track_map = new_track.range_of_all_children()
-
-    # iterate backwards so we can delete items
-    for c, child in reversed(list(enumerate(new_track))):
-        child_range = track_map[child]
-        if not trim_range.intersects(child_range):
-            # completely outside the trim range, so we discard it
-            del new_track[c]
-        elif trim_range.contains(child_range):
-            # completely contained, keep the whole thing
-            pass
-        else:
-            if isinstance(child, schema.Transition):
-                raise exceptions.CannotTrimTransitionsError(
-                    "Cannot trim in the middle of a Transition."
-                )
-
-            # we need to clip the end(s)
-            child_source_range = child.trimmed_range()
-
-            # should we trim the start?
-            if trim_range.start_time > child_range.start_time:
-                trim_amount = trim_range.start_time - child_range.start_time
-                child_source_range = opentime.TimeRange(
-                    start_time=child_source_range.start_time + trim_amount,
-                    duration=child_source_range.duration - trim_amount
-
-                )
-
-            # should we trim the end?
-            trim_end = trim_range.end_time_exclusive()
-            child_end = child_range.end_time_exclusive()
-            if trim_end < child_end:
-                trim_amount = child_end - trim_end
-                child_source_range = opentime.TimeRange(
-                    start_time=child_source_range.start_time,
-                    duration=child_source_range.duration - trim_amount
-
-                )
-
-            # set the new child's trims
-            child.source_range = child_source_range
-
-    return new_track
+    return _otio.track_trimmed_to_range(in_track, trim_range)
 
 
 def track_with_expanded_transitions(in_track):
@@ -2,8 +2,13 @@
 # Copyright Contributors to the OpenTimelineIO project
 
 import ast
+import collections
+import concurrent.futures
+import glob
+import os
 
 from .. import (
+    adapters,
     media_linker,
 )
 
@@ -49,3 +54,68 @@ def media_linker_name(ml_name_arg):
         media_linker_name = ml_name_arg
 
     return media_linker_name
+
+
+def expand_input_paths(paths, suffixes=None):
+    """
+    Yield the files named by paths, which may be files, directories or glob
+    patterns. Directories are searched recursively for files with one of the
+    suffixes, which default to the suffixes that adapters can read.
+    """
+
+    if suffixes is None:
+        suffixes = adapters.suffixes_with_defined_adapters(read=True)
+    suffixes = {suffix.lower().lstrip('.') for suffix in suffixes}
+
+    def has_suffix(name):
+        return os.path.splitext(name)[1][1:].lower() in suffixes
+
+    for path in paths:
+        # some formats, such as .otiod bundles, are directories
+        if os.path.isdir(path) and not has_suffix(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files + [d for d in dirs if has_suffix(d)]):
+                    if has_suffix(name):
+                        yield os.path.join(root, name)
+                dirs[:] = [d for d in dirs if not has_suffix(d)]
+        elif (
+            any(c in path for c in "*?[")
+            and not os.path.exists(path)
+        ):
+            yield from expand_input_paths(
+                sorted(glob.glob(path, recursive=True)),
+                suffixes
+            )
+        else:
+            # missing files are passed on, so that reading them reports it
+            yield path
+
+
+def ordered_map(fn, items, jobs=1, executor_class=None, read_ahead=None):
+    """
+    Yield fn(item) for each of the items, in order. When jobs is greater than
+    one, the calls are spread over a pool of that many workers, which are
+    processes unless another executor_class is given. At most read_ahead
+    calls (by default jobs + 1) are submitted ahead of the results that have
+    been yielded, so that only that many results are held in memory at once.
+    """
+
+    if jobs <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    if read_ahead is None:
+        read_ahead = jobs + 1
+    read_ahead = max(read_ahead, 1)
+
+    executor_class = executor_class or concurrent.futures.ProcessPoolExecutor
+    with executor_class(max_workers=jobs) as executor:
+        pending = collections.deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= read_ahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -6,12 +6,19 @@
 import argparse
 import sys
 import copy
+import functools
+import json
+import os
+import time
 
 import opentimelineio as otio
 
 __doc__ = """ Python wrapper around OTIO to convert timeline files between \
 formats.
 
+Many files can be converted at once by giving them, or directories of them,
+after the arguments, together with --output-dir.
+
 Available adapters: {}
 """.format(otio.adapters.available_adapter_names())
 
@@ -37,6 +44,14 @@ def _parsed_args():
         required=False,
         help='path to output file',
     )
+    parser.add_argument(
+        'inputs',
+        type=str,
+        nargs='*',
+        help='more input files, directories or glob patterns to convert in'
+        ' batch mode, which requires --output-dir. Directories are searched'
+        ' recursively for files that an adapter can read.',
+    )
     parser.add_argument(
         '-I',
         '--input-adapter',
@@ -110,6 +125,36 @@ def _parsed_args():
         'key=value. Values are strings, numbers or Python literals: True, '
         'False, etc. Can be used multiple times: -A burrito="bar" -A taco=12.'
     )
+    parser.add_argument(
+        '-d',
+        '--output-dir',
+        type=str,
+        default=None,
+        help='convert each input into this directory, in batch mode. Files'
+        ' found in an input directory keep their paths relative to it.',
+    )
+    parser.add_argument(
+        '--output-suffix',
+        type=str,
+        default='otio',
+        help='suffix of the files written in batch mode, which chooses the'
+        ' output adapter unless -O is given',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='number of files to convert at once in batch mode, in separate'
+        ' processes',
+    )
+    parser.add_argument(
+        '--report',
+        type=str,
+        default=None,
+        help='write a JSON report of the conversions to this path in batch'
+        ' mode',
+    )
     parser.add_argument(
         '--version',
         default=False,
@@ -158,10 +203,18 @@ def _parsed_args():
                 print(f"   {plugin.dist.name} {plugin.dist.version}")
         parser.exit()
 
-    if not result.input:
-        parser.error("-i/--input is a required argument")
-    if not result.output:
-        parser.error("-o/--output is a required argument")
+    if result.output_dir is not None:
+        if not result.input and not result.inputs:
+            parser.error("--output-dir requires inputs to convert")
+        if result.output:
+            parser.error("-o/--output can't be used with --output-dir")
+    else:
+        if result.inputs:
+            parser.error("converting many inputs requires --output-dir")
+        if not result.input:
+            parser.error("-i/--input is a required argument")
+        if not result.output:
+            parser.error("-o/--output is a required argument")
 
     if result.begin is not None and result.end is None:
         parser.error("--begin requires --end.")
@@ -195,84 +248,228 @@ def _parsed_args():
     return result
 
 
-def main():
-    """Parse arguments and convert the files."""
-
-    args = _parsed_args()
-
-    in_adapter = args.input_adapter
-    if in_adapter is None:
-        in_adapter = otio.adapters.from_filepath(args.input).name
-
-    out_adapter = args.output_adapter
-    if out_adapter is None:
-        out_adapter = otio.adapters.from_filepath(args.output).name
-
-    media_linker_name = otio.console.console_utils.media_linker_name(
-        args.media_linker
-    )
+def _conversion_options(args):
+    """
+    Return the options of a conversion as a dictionary of plain values, which
+    can be passed to worker processes.
+    """
 
     try:
-        read_adapter_arg_map = otio.console.console_utils.arg_list_to_map(
-            args.adapter_arg,
-            "input adapter"
-        )
-        hooks_args = otio.console.console_utils.arg_list_to_map(
-            args.hook_function_arg,
-            "hook function"
-        )
-        ml_args = otio.console.console_utils.arg_list_to_map(
-            args.media_linker_arg,
-            "media linker"
-        )
+        options = {
+            "input_adapter": args.input_adapter,
+            "output_adapter": args.output_adapter,
+            "media_linker_name": otio.console.console_utils.media_linker_name(
+                args.media_linker
+            ),
+            "read_adapter_arg_map": otio.console.console_utils.arg_list_to_map(
+                args.adapter_arg,
+                "input adapter"
+            ),
+            "hooks_args": otio.console.console_utils.arg_list_to_map(
+                args.hook_function_arg,
+                "hook function"
+            ),
+            "ml_args": otio.console.console_utils.arg_list_to_map(
+                args.media_linker_arg,
+                "media linker"
+            ),
+            "write_adapter_arg_map": otio.console.console_utils.arg_list_to_map(
+                args.output_adapter_arg,
+                "output adapter"
+            ),
+            "tracks": args.tracks,
+            "trim": None,
+        }
     except ValueError as exc:
         sys.stderr.write("\n" + str(exc) + "\n")
         sys.exit(1)
 
+    # handle trim arguments
+    if args.begin is not None and args.end is not None:
+        options["trim"] = (
+            args.begin.value,
+            args.begin.rate,
+            args.end.value,
+            args.end.rate
+        )
+
+    return options
+
+
+def _convert(options, input_path, output_path):
+    """Convert one file."""
+
+    in_adapter = options["input_adapter"]
+    if in_adapter is None:
+        in_adapter = otio.adapters.from_filepath(input_path).name
+
+    out_adapter = options["output_adapter"]
+    if out_adapter is None:
+        out_adapter = otio.adapters.from_filepath(output_path).name
+
     result_tl = otio.adapters.read_from_file(
-        args.input,
+        input_path,
         in_adapter,
-        hook_function_argument_map=hooks_args,
-        media_linker_name=media_linker_name,
-        media_linker_argument_map=ml_args,
-        **read_adapter_arg_map
+        hook_function_argument_map=options["hooks_args"],
+        media_linker_name=options["media_linker_name"],
+        media_linker_argument_map=options["ml_args"],
+        **options["read_adapter_arg_map"]
     )
 
-    if args.tracks:
+    if options["tracks"]:
         result_tracks = copy.deepcopy(otio.schema.Stack())
         del result_tracks[:]
-        for track in args.tracks.split(","):
+        for track in options["tracks"].split(","):
             tr = result_tl.tracks[int(track)]
             del result_tl.tracks[int(track)]
             print(f"track {track} is of kind: '{tr.kind}'")
             result_tracks.append(tr)
         result_tl.tracks = result_tracks
 
-    # handle trim arguments
-    if args.begin is not None and args.end is not None:
+    if options["trim"] is not None:
+        begin_value, begin_rate, end_value, end_rate = options["trim"]
         result_tl = otio.algorithms.timeline_trimmed_to_range(
             result_tl,
-            otio.opentime.range_from_start_end_time(args.begin, args.end)
+            otio.opentime.range_from_start_end_time(
+                otio.opentime.RationalTime(begin_value, begin_rate),
+                otio.opentime.RationalTime(end_value, end_rate)
+            )
         )
 
-    try:
-        write_adapter_arg_map = otio.console.console_utils.arg_list_to_map(
-            args.output_adapter_arg,
-            "output adapter"
-        )
-    except ValueError as exc:
-        sys.stderr.write("\n" + str(exc) + "\n")
-        sys.exit(1)
-
     otio.adapters.write_to_file(
         result_tl,
-        args.output,
+        output_path,
         out_adapter,
-        hook_function_argument_map=hooks_args,
-        **write_adapter_arg_map
+        hook_function_argument_map=options["hooks_args"],
+        **options["write_adapter_arg_map"]
     )
 
 
+def _convert_batch_file(options, job):
+    """Convert one file of a batch, returning a record of the result."""
+
+    input_path, output_path = job
+    record = {
+        "input": input_path,
+        "output": output_path,
+        "seconds": 0.0,
+        "error": None,
+    }
+
+    start = time.perf_counter()
+    try:
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        _convert(options, input_path, output_path)
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def _batch_jobs(args):
+    """
+    Yield the (input path, output path) pairs of a batch conversion. Inputs
+    found in a directory keep their path relative to it.
+    """
+
+    inputs = ([args.input] if args.input else []) + args.inputs
+    for input_arg in inputs:
+        for input_path in otio.console.console_utils.expand_input_paths(
+            [input_arg]
+        ):
+            if os.path.isdir(input_arg) and input_path != input_arg:
+                relative_path = os.path.relpath(input_path, input_arg)
+            else:
+                relative_path = os.path.basename(input_path)
+            yield (
+                input_path,
+                os.path.join(
+                    args.output_dir,
+                    os.path.splitext(relative_path)[0]
+                    + "." + args.output_suffix.lstrip(".")
+                )
+            )
+
+
+def _batch_convert(args, options):
+    """
+    Convert many files, reporting failures instead of stopping at them.
+    Return whether all of the files were converted.
+    """
+
+    # load the plugin manifest once, so that worker processes that are forked
+    # from this one share it
+    otio.plugins.ActiveManifest()
+
+    records = []
+    outputs = set()
+    jobs = []
+    for input_path, output_path in _batch_jobs(args):
+        # two inputs with the same name would write the same output
+        if output_path in outputs:
+            records.append(
+                {
+                    "input": input_path,
+                    "output": output_path,
+                    "seconds": 0.0,
+                    "error": "another input is converted to this output",
+                }
+            )
+            continue
+        outputs.add(output_path)
+        jobs.append((input_path, output_path))
+
+    records.extend(
+        otio.console.console_utils.ordered_map(
+            functools.partial(_convert_batch_file, options),
+            jobs,
+            args.jobs
+        )
+    )
+
+    failed = [record for record in records if record["error"] is not None]
+    for record in failed:
+        sys.stderr.write(
+            "ERROR: {}: {}\n".format(record["input"], record["error"])
+        )
+    print(
+        "converted {} of {} files".format(
+            len(records) - len(failed),
+            len(records)
+        )
+    )
+
+    if args.report:
+        with open(args.report, "w") as fo:
+            json.dump(
+                {
+                    "converted": len(records) - len(failed),
+                    "failed": len(failed),
+                    "files": records,
+                },
+                fo,
+                indent=4
+            )
+
+    return not failed
+
+
+def main():
+    """Parse arguments and convert the files."""
+
+    args = _parsed_args()
+    options = _conversion_options(args)
+
+    if args.output_dir is not None:
+        if not _batch_convert(args, options):
+            sys.exit(1)
+        return
+
+    _convert(options, args.input, args.output)
+
+
 if __name__ == '__main__':
     try:
         main()
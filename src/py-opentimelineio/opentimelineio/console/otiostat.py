@@ -6,7 +6,10 @@
 """Print statistics about the otio file, including validation information."""
 
 import argparse
+import csv
+import json
 import sys
+import time
 
 import opentimelineio as otio
 
@@ -22,7 +25,24 @@ def _parsed_args():
         'filepath',
         type=str,
         nargs='+',
-        help='files to operate on'
+        help='files to operate on. Directories are searched recursively for'
+        ' files that an adapter can read, and glob patterns are expanded.'
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='number of files to process at once, in separate processes'
+    )
+    parser.add_argument(
+        '-f',
+        '--format',
+        choices=['text', 'json', 'csv'],
+        default='text',
+        help="output format. 'json' prints one JSON object per file, and"
+        " 'csv' prints one row per file. Both include the time taken to read"
+        " and check each file, and any errors."
     )
 
     return parser.parse_args()
@@ -38,18 +58,75 @@ def stat_check(name):
     return real_stat_check
 
 
+class _Summary:
+    """ Statistics about the children of an object, gathered in one pass. """
+
+    def __init__(self, input):
+        self.input = input
+        self.clips = 0
+        self.clips_with_cdl_data = 0
+        self.non_standard_tracks = 0
+
+        if isinstance(input, otio.schema.Timeline):
+            self.depth = self._visit(input.tracks) + 1
+        elif isinstance(input, otio.core.Composition):
+            self.depth = self._visit(input)
+        else:
+            self.depth = 1
+            if isinstance(input, otio.schema.Clip):
+                self._count(input)
+            elif isinstance(input, otio.schema.SerializableCollection):
+                self._visit(input)
+
+    def _visit(self, parent):
+        """ count the descendants of parent and return its depth """
+        depth = 0
+        children = parent.tracks if isinstance(
+            parent, otio.schema.Timeline
+        ) else parent
+        for child in children:
+            self._count(child)
+            if isinstance(child, otio.core.Composition):
+                depth = max(depth, self._visit(child) + 1)
+            else:
+                if isinstance(
+                    child,
+                    (otio.schema.SerializableCollection, otio.schema.Timeline)
+                ):
+                    self._visit(child)
+                depth = max(depth, 2)
+        return depth
+
+    def _count(self, child):
+        if isinstance(child, otio.schema.Clip):
+            self.clips += 1
+            if 'cdl' in child.metadata:
+                self.clips_with_cdl_data += 1
+        elif isinstance(child, otio.schema.Track):
+            if child.kind not in otio.schema.TrackKind.__dict__:
+                self.non_standard_tracks += 1
+
+    def searched(self, attribute, method):
+        """
+        Return a count, or raise AttributeError as searching with the method
+        would for an object that doesn't have it.
+        """
+        getattr(self.input, method)
+        return getattr(self, attribute)
+
+
 @stat_check("parsed")
-def _did_parse(input):
+def _did_parse(input, summary):
     return input and True or False
 
 
 @stat_check("top level object")
-def _top_level_object(input):
+def _top_level_object(input, summary):
     return f"{input.schema_name()}.{input.schema_version()}"
 
 
 @stat_check("number of tracks")
-def _num_tracks(input):
+def _num_tracks(input, summary):
     try:
         return len(input.tracks)
     except AttributeError:
@@ -57,7 +134,7 @@ def _num_tracks(input):
 
 
 @stat_check("Tracks are the same length")
-def _equal_length_tracks(tl):
+def _equal_length_tracks(tl, summary):
     if not tl.tracks:
         return True
     for i, track in enumerate(tl.tracks):
@@ -74,27 +151,17 @@ def _equal_length_tracks(tl):
 
 
 @stat_check("deepest nesting")
-def _deepest_nesting(input):
-    def depth(parent):
-        if not isinstance(parent, otio.core.Composition):
-            return 1
-        d = 0
-        for child in parent:
-            d = max(d, depth(child) + 1)
-        return d
-    if isinstance(input, otio.schema.Timeline):
-        return depth(input.tracks) + 1
-    else:
-        return depth(input)
+def _deepest_nesting(input, summary):
+    return summary.depth
 
 
 @stat_check("number of clips")
-def _num_clips(input):
-    return len(list(input.find_clips()))
+def _num_clips(input, summary):
+    return summary.searched("clips", "find_clips")
 
 
 @stat_check("total duration")
-def _total_duration(input):
+def _total_duration(input, summary):
     try:
         return input.tracks.duration()
     except AttributeError:
@@ -102,7 +169,7 @@ def _total_duration(input):
 
 
 @stat_check("total duration in timecode")
-def _total_duration_timecode(input):
+def _total_duration_timecode(input, summary):
     try:
         d = input.tracks.duration()
         return otio.opentime.to_timecode(d, d.rate)
@@ -111,7 +178,7 @@ def _total_duration_timecode(input):
 
 
 @stat_check("top level rate")
-def _top_level_rate(input):
+def _top_level_rate(input, summary):
     try:
         return input.tracks.duration().rate
     except AttributeError:
@@ -119,54 +186,129 @@ def _top_level_rate(input):
 
 
 @stat_check("clips with cdl data")
-def _clips_with_cdl_data(input):
-    return len(list(c for c in input.find_clips() if 'cdl' in c.metadata))
+def _clips_with_cdl_data(input, summary):
+    return summary.searched("clips_with_cdl_data", "find_clips")
 
 
 @stat_check("Tracks with non standard types")
-def _sequences_with_non_standard_types(input):
-    return len(
-        list(
-            c
-            for c in input.find_children(descended_from_type=otio.schema.Track)
-            if c.kind not in (otio.schema.TrackKind.__dict__)
-        )
-    )
+def _sequences_with_non_standard_types(input, summary):
+    return summary.searched("non_standard_tracks", "find_children")
+
+
+def _error(stat, e):
+    return {
+        "stat": stat,
+        "message": str(e),
+        "otio_error": isinstance(e, otio.exceptions.OTIOError),
+    }
+
+
+def _plain_value(value):
+    """ values that json can't represent are written as strings """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
 
 
 def _stat_otio(input_otio):
+    """ Run all of the checks on input_otio, returning (stats, errors). """
+    summary = _Summary(input_otio)
+
+    stats = {}
+    errors = []
     for (test, testfunc) in TESTS:
         try:
-            print(f"{test}: {testfunc(input_otio)}")
-        except (otio.exceptions.OTIOError) as e:
+            stats[test] = _plain_value(testfunc(input_otio, summary))
+        except (Exception) as e:
+            errors.append(_error(test, e))
+
+    return stats, errors
+
+
+def _stat_file(filepath):
+    """ Read a file and check it, returning a record of the results. """
+    record = {
+        "file": filepath,
+        "read_seconds": 0.0,
+        "stat_seconds": 0.0,
+        "stats": {},
+        "errors": [],
+    }
+
+    start = time.perf_counter()
+    try:
+        parsed_otio = otio.adapters.read_from_file(filepath)
+    except (Exception) as e:
+        record["read_seconds"] = time.perf_counter() - start
+        record["errors"].append(_error(None, e))
+        return record
+    record["read_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    record["stats"], record["errors"] = _stat_otio(parsed_otio)
+    record["stat_seconds"] = time.perf_counter() - start
+    return record
+
+
+def _write_text(record):
+    for test, value in record["stats"].items():
+        print(f"{test}: {value}")
+    for error in record["errors"]:
+        if error["stat"] is None and error["otio_error"]:
+            sys.stderr.write(
+                "The file did not successfully parse, with error:"
+                " {}\n".format(error["message"]),
+            )
+        elif error["otio_error"]:
             sys.stderr.write(
                 "There was an OTIO Error: "
-                " {}\n".format(e),
+                " {}\n".format(error["message"]),
             )
-            continue
-        except (Exception) as e:
-            sys.stderr.write(f"There was a system error: {e}\n")
-            continue
+        else:
+            sys.stderr.write(
+                "There was a system error: {}\n".format(error["message"])
+            )
+
+
+def _csv_row(record):
+    row = [
+        record["file"],
+        record["read_seconds"],
+        record["stat_seconds"],
+        "; ".join(
+            "{}: {}".format(error["stat"] or "read", error["message"])
+            for error in record["errors"]
+        ),
+    ]
+    row.extend(record["stats"].get(test, "") for (test, _) in TESTS)
+    return row
 
 
 def main():
     """  main entry point  """
     args = _parsed_args()
 
-    for fp in args.filepath:
-        try:
-            parsed_otio = otio.adapters.read_from_file(fp)
-        except (otio.exceptions.OTIOError) as e:
-            sys.stderr.write(
-                "The file did not successfully parse, with error:"
-                " {}\n".format(e),
-            )
-            continue
-        except (Exception) as e:
-            sys.stderr.write(f"There was a system error: {e}\n")
-            continue
+    records = otio.console.console_utils.ordered_map(
+        _stat_file,
+        otio.console.console_utils.expand_input_paths(args.filepath),
+        args.jobs
+    )
 
-        _stat_otio(parsed_otio)
+    if args.format == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(
+            ["file", "read_seconds", "stat_seconds", "errors"]
+            + [test for (test, _) in TESTS]
+        )
+        for record in records:
+            writer.writerow(_csv_row(record))
+    elif args.format == 'json':
+        # one object per line, so that long runs can be read as they go
+        for record in records:
+            print(json.dumps(record))
+    else:
+        for record in records:
+            _write_text(record)
 
 
 if __name__ == '__main__':
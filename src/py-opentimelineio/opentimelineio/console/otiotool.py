@@ -12,12 +12,16 @@ as concise examples of how OTIO can be used to perform common
 workflow tasks."""
 
 import argparse
+import concurrent.futures
+import hashlib
 import os
 import pathlib
 import re
+import shutil
 import sys
 
-from urllib.request import urlopen
+from urllib.parse import urlparse
+from urllib.request import url2pathname, urlopen
 
 from copy import deepcopy
 
@@ -43,14 +47,46 @@ def main():
 
     # Phase 1: Input...
 
-    # Most of this function will operate on this list of timelines.
+    # Most of this tool will operate on a list of timelines.
     # Often there will be just one, but this tool in general enough
     # to operate on several. This is essential when the --stack or
     # --concatenate arguments are used.
-    if args.input:
-        timelines = read_inputs(args.input)
+    inputs = iter_inputs(args.input or [], jobs=args.jobs)
+
+    if can_stream(args):
+        # Each timeline can be processed on its own, so only a few of them
+        # need to be in memory at once.
+        for timeline in inputs:
+            process_timelines(args, [timeline])
     else:
-        timelines = []
+        process_timelines(args, list(inputs))
+
+
+def can_stream(args):
+    """Return whether the timelines can be processed one at a time, with the
+    same results as processing all of them together. That isn't so when they
+    are combined or written to one output, or when more than one phase
+    prints something for each timeline, since the output would be
+    interleaved differently."""
+    if args.stack or args.concat or args.output:
+        return False
+    printing_phases = [
+        args.relink_by_name,
+        args.copy_media_to_folder,
+        args.stats,
+        args.inspect,
+        (args.list_clips or
+         args.list_media or
+         args.verify_media or
+         args.list_tracks or
+         args.list_markers or
+         args.verify_ranges),
+    ]
+    return len([phase for phase in printing_phases if phase]) <= 1
+
+
+def process_timelines(args, timelines):
+    """Execute phases 2 and later on the given list of timelines."""
 
     # Phase 2: Filter (remove stuff)...
 
@@ -113,7 +149,13 @@ def main():
 
     if args.copy_media_to_folder:
         for timeline in timelines:
-            copy_media_to_folder(timeline, args.copy_media_to_folder)
+            copy_media_to_folder(
+                timeline,
+                args.copy_media_to_folder,
+                jobs=args.copy_media_jobs,
+                naming=args.copy_media_naming,
+                verify=args.copy_media_verify
+            )
 
     # Phase 6: Remove/Redaction
 
@@ -183,7 +225,10 @@ This tool works in phases, as follows:
 1. Input
     Input files provided by the "--input <filename>" argument(s) are read into
     memory. Files may be OTIO format, or any format supported by adapter
-    plugins.
+    plugins. With --jobs, several files are read at once. When the timelines
+    are not combined or written out, and only one kind of information is
+    printed, each timeline is processed as soon as it is read, so that only a
+    few are in memory at once.
 
 2. Filtering
     Options such as --video-only, --audio-only, --only-tracks-with-name,
@@ -206,6 +251,8 @@ This tool works in phases, as follows:
     file:// URLs). Clip names are matched to filenames ignoring file extension.
     If specified, the --copy-media-to-folder option, will copy or download
     all linked media, and relink the OTIO to reference the local copies.
+    Copies that are already complete are skipped, so an interrupted copy can
+    be resumed by running it again.
 6. Remove/Redact
     The --remove-metadata-key option allows you to remove a specific piece of
     metadata from all objects.
@@ -251,6 +298,16 @@ otiotool -i playlist.otio --only-audio --list-tracks --inspect "Interview"
         help="""Input file path(s). All formats supported by adapter plugins
         are supported. Use '-' to read OTIO from standard input."""
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar='N',
+        help="""Read up to N input files at once. OTIO files are read
+        concurrently with the C++ deserializer. At most N + 1 files are read
+        ahead of the ones being processed. Defaults to 1."""
+    )
 
     # Filter...
     track_type_group = parser.add_mutually_exclusive_group()
@@ -364,6 +421,30 @@ otiotool -i playlist.otio --only-audio --list-tracks --inspect "Interview"
         help="""Copy or download all linked media to the specified folder and
         relink all media references to the copies"""
     )
+    parser.add_argument(
+        "--copy-media-jobs",
+        type=int,
+        default=4,
+        metavar='N',
+        help="""Copy or download up to N media files at once with
+        --copy-media-to-folder."""
+    )
+    parser.add_argument(
+        "--copy-media-naming",
+        choices=["basename", "hash"],
+        default="basename",
+        help="""How --copy-media-to-folder names the copies. 'basename' keeps
+        the name of each file, and 'hash' prefixes it with a hash of its URL,
+        so that different files with the same name don't collide."""
+    )
+    parser.add_argument(
+        "--copy-media-verify",
+        choices=["size", "hash"],
+        default="size",
+        help="""How --copy-media-to-folder decides that an existing copy of a
+        local file is complete, so that it isn't copied again. 'size' compares
+        the size and modification time, and 'hash' compares the contents."""
+    )
 
     # Remove/Redact
     parser.add_argument(
@@ -471,19 +552,35 @@ otiotool -i playlist.otio --only-audio --list-tracks --inspect "Interview"
     return args
 
 
-def read_inputs(input_paths):
+def read_inputs(input_paths, jobs=1):
     """Read one or more timlines from the list of file paths given.
     If a file path is '-' then a timeline is read from stdin.
+    Up to the given number of jobs are read at once.
     """
-    timelines = []
-    for input_path in input_paths:
-        if input_path == '-':
-            text = sys.stdin.read()
-            timeline = otio.adapters.read_from_string(text, 'otio_json')
-        else:
-            timeline = otio.adapters.read_from_file(input_path)
-        timelines.append(timeline)
-    return timelines
+    return list(iter_inputs(input_paths, jobs=jobs))
+
+
+def iter_inputs(input_paths, jobs=1, read_ahead=None):
+    """Read and yield timelines from the list of file paths given, in order,
+    reading up to the given number of them at once on a thread pool. At most
+    read_ahead timelines (by default jobs + 1) are read ahead of the ones
+    that have been yielded.
+    If a file path is '-' then a timeline is read from stdin.
+    """
+    return otio.console.console_utils.ordered_map(
+        _read_input,
+        input_paths,
+        jobs=min(jobs, len(input_paths)),
+        executor_class=concurrent.futures.ThreadPoolExecutor,
+        read_ahead=read_ahead
+    )
+
+
+def _read_input(input_path):
+    if input_path == '-':
+        text = sys.stdin.read()
+        return otio.adapters.read_from_string(text, 'otio_json')
+    return otio.adapters.read_from_file(input_path)
 
 
 def keep_only_video_tracks(timeline):
@@ -732,17 +829,87 @@ def redact_timeline(timeline):
                 media_reference.metadata.clear()
 
 
+# Media is copied in chunks of this many bytes, so that large files don't
+# have to fit in memory.
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _local_media_path(url):
+    """Return the path of the file that a media URL refers to, or None if it
+    is not a local file."""
+    if url.startswith("file://"):
+        return url2pathname(urlparse(url).path)
+    if os.path.isabs(url):
+        return url
+    return None
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fi:
+        for chunk in iter(lambda: fi.read(_COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_media_copy_complete(url, destination_path, verify="size"):
+    """Return whether destination_path is already a complete copy of the
+    media at url. Local files are compared by size and modification time,
+    or by the hash of their contents if verify is 'hash'. Downloads are only
+    moved to their destination once they are complete, so any existing
+    destination of a download is taken to be complete."""
+    if not os.path.isfile(destination_path):
+        return False
+    source_path = _local_media_path(url)
+    if source_path is None:
+        return True
+    if not os.path.isfile(source_path):
+        return False
+
+    if verify == "hash":
+        return _file_hash(source_path) == _file_hash(destination_path)
+    source_stat = os.stat(source_path)
+    destination_stat = os.stat(destination_path)
+    return (source_stat.st_size == destination_stat.st_size and
+            int(source_stat.st_mtime) == int(destination_stat.st_mtime))
+
+
 def copy_media(url, destination_path):
-    if url.startswith("/"):
-        print(f"COPYING: {url}")
-        data = open(url, "rb").read()
-    else:
-        print(f"DOWNLOADING: {url}")
-        data = urlopen(url).read()
-    open(destination_path, "wb").write(data)
+    """Copy or download the media at url to destination_path, in chunks.
+    The data is written to a temporary file next to the destination, which
+    replaces the destination once it is complete. Copies of local files keep
+    their modification time."""
+    partial_path = destination_path + ".part"
+    source_path = _local_media_path(url)
+    try:
+        if source_path is not None:
+            print(f"COPYING: {url}")
+            with open(source_path, "rb") as fi, open(partial_path, "wb") as fo:
+                shutil.copyfileobj(fi, fo, _COPY_CHUNK_SIZE)
+            shutil.copystat(source_path, partial_path)
+        else:
+            print(f"DOWNLOADING: {url}")
+            with urlopen(url) as fi, open(partial_path, "wb") as fo:
+                shutil.copyfileobj(fi, fo, _COPY_CHUNK_SIZE)
+        os.replace(partial_path, destination_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
     return destination_path
 
 
+def media_copy_name(url, naming="basename"):
+    """Return the file name of the copy of the media at url. With the 'hash'
+    naming, the name starts with a hash of the whole url, so that files with
+    the same name in different places get different copies."""
+    basename = os.path.basename(urlparse(url).path) or os.path.basename(url)
+    if naming == "hash":
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        return f"{url_hash}_{basename}"
+    return basename
+
+
 def relink_by_name(timeline, path):
     """Relink clips in the timeline to media files discovered at the
     given folder path."""
@@ -781,48 +948,71 @@ def relink_by_name(timeline, path):
     print(f"Relinked {count} clips to files in folder {path}")
 
 
-def copy_media_to_folder(timeline, folder):
+def copy_media_to_folder(timeline, folder, jobs=4, naming="basename",
+                         verify="size"):
     """Copy or download all referenced media to this folder, and relink media
-    references to the copies."""
+    references to the copies. Up to the given number of jobs are copied at
+    once, and copies that are already complete are skipped, so an
+    interrupted copy can be resumed by running it again."""
 
     # @TODO: Add an option to allow mkdir
     # if not os.path.exists(folder):
     #     os.mkdir(folder)
 
-    copied_files = set()
+    # Gather the media references by destination, so that each file is only
+    # copied once.
+    references = {}
+    sources = {}
     for clip in timeline.find_clips():
         media_reference = clip.media_reference
         has_actual_url = (media_reference and
                           hasattr(media_reference, 'target_url') and
                           media_reference.target_url)
-        if has_actual_url:
-            source_url = media_reference.target_url
-            filename = os.path.basename(source_url)
-            # @TODO: This is prone to name collisions if the basename is not unique
-            # We probably need to hash the url, or turn the whole url into a filename.
-            destination_path = os.path.join(folder, filename)
-            already_copied_this = destination_path in copied_files
-            file_exists = os.path.exists(destination_path)
-            if already_copied_this:
+        if not has_actual_url:
+            continue
+        source_url = media_reference.target_url
+        destination_path = os.path.join(
+            folder,
+            media_copy_name(source_url, naming)
+        )
+        other_url = sources.setdefault(destination_path, source_url)
+        if other_url != source_url:
+            print(
+                "WARNING: Not copying {} for clip {}, because {} has the same"
+                " name (see --copy-media-naming)".format(
+                    source_url, clip.name, other_url
+                )
+            )
+            continue
+        references.setdefault(destination_path, []).append(media_reference)
+
+    def _copy(destination_path):
+        source_url = sources[destination_path]
+        if is_media_copy_complete(source_url, destination_path, verify):
+            print(f"SKIPPING: {source_url} was already copied")
+        else:
+            copy_media(source_url, destination_path)
+        return destination_path
+
+    total = len(references)
+    with concurrent.futures.ThreadPoolExecutor(max(jobs, 1)) as executor:
+        futures = [
+            executor.submit(_copy, destination_path)
+            for destination_path in references
+        ]
+        for done, future in enumerate(
+            concurrent.futures.as_completed(futures),
+            start=1
+        ):
+            try:
+                destination_path = future.result()
+            except Exception as ex:
+                print(f"ERROR: Problem copying/downloading media {ex}")
+                # don't relink this one, since the copy failed
+                continue
+            for media_reference in references[destination_path]:
                 media_reference.target_url = destination_path
-            else:
-                if file_exists:
-                    print(
-                        "WARNING: Relinking clip {} to existing file"
-                        " (instead of overwriting it): {}".format(
-                            clip.name, destination_path
-                        )
-                    )
-                    media_reference.target_url = destination_path
-                    already_copied_this.add(destination_path)
-                else:
-                    try:
-                        copy_media(source_url, destination_path)
-                        media_reference.target_url = destination_path
-                        already_copied_this.add(destination_path)
-                    except Exception as ex:
-                        print(f"ERROR: Problem copying/downloading media {ex}")
-                        # don't relink this one, since the copy failed
+            print(f"COPIED {done} of {total}: {destination_path}")
 
 
 def print_timeline_stats(timeline):
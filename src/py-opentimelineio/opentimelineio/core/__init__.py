@@ -11,6 +11,8 @@ from .. _otio import ( # noqa
     Color,
     Composable,
     Composition,
+    DeserializeOptions,
+    EditJournal,
     Item,
     MediaReference,
     SerializableObject,
@@ -51,6 +53,8 @@ __all__ = [
     'Color',
     'Composable',
     'Composition',
+    'DeserializeOptions',
+    'EditJournal',
     'Item',
     'MediaReference',
     'SerializableObject',
@@ -39,7 +39,12 @@ def _is_nonstring_sequence(v):
     return isinstance(v, collections.abc.Sequence) and not _is_str(v)
 
 
-def _value_to_any(value, ids=None):
+# Converts a value to a PyAny.  The conversion of dictionaries, lists and
+# scalars happens in C++; other values are handed to _python_value_to_any.
+_value_to_any = _otio._value_to_any
+
+
+def _python_value_to_any(value, ids=None):
     if isinstance(value, PyAny):
         return value
 
@@ -57,7 +62,7 @@ def _value_to_any(value, ids=None):
                     "circular reference converting dictionary to C++ datatype"
                 )
             ids.add(id(v))
-            d[k] = _value_to_any(v, ids)
+            d[k] = _python_value_to_any(v, ids)
             ids.discard(id(v))
         return PyAny(d)
     elif _is_nonstring_sequence(value):
@@ -70,7 +75,7 @@ def _value_to_any(value, ids=None):
                     "circular reference converting dictionary to C++ datatype"
                 )
             ids.add(id(v))
-            vec.append(_value_to_any(v, ids))
+            vec.append(_python_value_to_any(v, ids))
             ids.discard(id(v))
         return PyAny(vec)
     else:
@@ -6,7 +6,8 @@ from . _otio import ( # noqa
     OTIOError,
     NotAChildError,
     UnsupportedSchemaError,
-    CannotComputeAvailableRangeError
+    CannotComputeAvailableRangeError,
+    CannotTrimTransitionsError
 )
 
 __all__ = [
@@ -25,7 +26,8 @@ __all__ = [
     'TransitionFollowingATransitionError',
     'MisconfiguredPluginError',
     'CannotTrimTransitionsError',
-    'NoDefaultMediaLinkerError'
+    'NoDefaultMediaLinkerError',
+    'InvalidTimelineDeltaError'
 ]
 
 
@@ -69,13 +71,13 @@ class MisconfiguredPluginError(OTIOError):
     pass
 
 
-class CannotTrimTransitionsError(OTIOError):
+class NoDefaultMediaLinkerError(OTIOError):
     pass
 
 
-class NoDefaultMediaLinkerError(OTIOError):
+class InvalidEnvironmentVariableError(OTIOError):
     pass
 
 
-class InvalidEnvironmentVariableError(OTIOError):
+class InvalidTimelineDeltaError(OTIOError):
     pass
@@ -3,14 +3,24 @@
 
 from . _opentime import ( # noqa
     RationalTime,
+    RationalTimeArray,
+    TickTime,
     TimeRange,
+    TimeRangeArray,
+    TimeRangeSet,
     TimeTransform,
+    TimecodeFormatter,
 )
 
 __all__ = [
     'RationalTime',
+    'RationalTimeArray',
+    'TickTime',
     'TimeRange',
+    'TimeRangeArray',
+    'TimeRangeSet',
     'TimeTransform',
+    'TimecodeFormatter',
     'from_frames',
     'from_timecode',
     'from_time_string',
@@ -35,6 +35,9 @@ NeighborGapPolicy = Track.NeighborGapPolicy
 from . schemadef import (
     SchemaDef
 )
+from . timeline_delta import (
+    TimelineDelta
+)
 
 from . import (
     box2d,
@@ -72,6 +75,7 @@ __all__ = [
     'SerializableCollection',
     'Stack',
     'Timeline',
+    'TimelineDelta',
     'Transition',
     'SchemaDef',
     'timeline_from_clips',
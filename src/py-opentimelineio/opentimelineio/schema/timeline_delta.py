@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+from .. import (
+    core,
+)
+
+
+@core.register_type
+class TimelineDelta(core.SerializableObject):
+    """
+    A set of structural changes that turns one timeline into another.
+
+    The changes are stored as an ordered list of JSON-patch style operations
+    (``add``, ``remove``, ``replace`` and ``move``) whose ``path`` and
+    ``from`` entries are JSON pointers into the serialized form of the base
+    timeline.  Values carried by ``add`` and ``replace`` operations are
+    regular OTIO values, so they are written and read with the same schema
+    versioning as any other object.
+
+    Deltas are computed with
+    :func:`~opentimelineio.algorithms.timeline_delta` and applied with
+    :func:`~opentimelineio.algorithms.apply_timeline_delta`.
+    """
+    _serializable_label = "TimelineDelta.1"
+
+    def __init__(self, operations=None):
+        core.SerializableObject.__init__(self)
+        self.operations = operations if operations is not None else []
+
+    operations = core.serializable_field(
+        "operations",
+        type([]),
+        "Ordered list of patch operations."
+    )
+
+    def __repr__(self):
+        return f"otio.schema.TimelineDelta(operations={list(self.operations)!r})"
+
+    def __str__(self):
+        return f"TimelineDelta({len(self.operations)} operations)"
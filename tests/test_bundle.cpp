@@ -374,6 +374,152 @@ main(int argc, char** argv)
         assertTrue(std::filesystem::u8path(*file).is_absolute());
     });
 
+    tests.add_test("test_bundle_threads", [] {
+        TempDir temp;
+
+        // Create a timeline with an image sequence, and give each frame
+        // different contents
+        auto tl = create_simple_timeline();
+        find_clip_by_name(tl, "video clip 1")->set_media_reference(
+            new ImageSequenceReference(
+                "",
+                "render.",
+                ".exr",
+                0, 1, 24, 0,
+                ImageSequenceReference::MissingFramePolicy::error,
+                TimeRange(0, 24, 24)));
+        for (int i = 0; i < 24; ++i)
+        {
+            std::ofstream fs(
+                temp.path() / ("render." + std::to_string(i) + ".exr"),
+                std::ios::binary);
+            fs << std::string(i * 1000, static_cast<char>('a' + i));
+        }
+
+        WriteOptions write_options;
+        write_options.relative_media_base_dir = temp.path().u8string();
+        write_options.num_threads = 4;
+        size_t   files_written = 0;
+        uint64_t bytes_written = 0;
+        write_options.progress_callback = [&](
+            size_t   files,
+            size_t   files_total,
+            uint64_t bytes,
+            uint64_t bytes_total)
+        {
+            assertEqual(files, files_written + 1);
+            assertEqual(files_total, size_t(24));
+            assertEqual(bytes_total, uint64_t(276000));
+            files_written = files;
+            bytes_written = bytes;
+        };
+
+        auto check_media = [&](std::filesystem::path const& media_path)
+        {
+            for (int i = 0; i < 24; ++i)
+            {
+                auto const name = "render." + std::to_string(i) + ".exr";
+                std::ifstream a(temp.path() / name, std::ios::binary);
+                std::ifstream b(media_path / name, std::ios::binary);
+                std::stringstream a_ss, b_ss;
+                a_ss << a.rdbuf();
+                b_ss << b.rdbuf();
+                assertEqual(a_ss.str(), b_ss.str());
+            }
+        };
+
+        // Write the otioz
+        auto const otioz_path = temp.path() / "threads.otioz";
+        OTIO_NS::ErrorStatus error;
+        assertTrue(write_otioz(tl, otioz_path.u8string(), write_options, &error));
+        assertEqual(files_written, size_t(24));
+        assertEqual(bytes_written, uint64_t(276000));
+        ReadOptions read_options;
+        read_options.extract_path = (temp.path() / "extract").u8string();
+        assertNotNull(read_otioz(otioz_path.u8string(), read_options, &error));
+        check_media(temp.path() / "extract" / media_dir);
+
+        // Write the otiod, with hard links where possible
+        files_written = 0;
+        write_options.copy_policy = MediaCopyPolicy::hardlink_if_possible;
+        auto const otiod_path = temp.path() / "threads.otiod";
+        assertTrue(write_otiod(tl, otiod_path.u8string(), write_options, &error));
+        assertEqual(files_written, size_t(24));
+        check_media(otiod_path / media_dir);
+
+        // An exception in the callback stops writing
+        write_options.progress_callback = [](
+            size_t files, size_t, uint64_t, uint64_t)
+        {
+            if (files == 12)
+                throw std::runtime_error("cancelled");
+        };
+        assertFalse(write_otioz(
+            tl,
+            (temp.path() / "cancelled.otioz").u8string(),
+            write_options,
+            &error));
+        assertFalse(std::filesystem::exists(temp.path() / "cancelled.otioz"));
+        assertFalse(write_otiod(
+            tl,
+            (temp.path() / "cancelled.otiod").u8string(),
+            write_options,
+            &error));
+    });
+
+    tests.add_test("test_otioz_media_entries", [] {
+        TempDir temp;
+
+        // Create a timeline and media with different contents
+        auto tl = create_simple_timeline();
+        find_clip_by_name(tl, "video clip 1")->set_media_reference(
+            new ExternalReference("video1.mov"));
+        find_clip_by_name(tl, "video clip 2")->set_media_reference(
+            new ExternalReference("video2.mov"));
+        find_clip_by_name(tl, "audio clip 1")->set_media_reference(
+            new ExternalReference("audio.wav"));
+        std::map<std::string, std::string> const media =
+        {
+            { "media/video1.mov", std::string(1000, '1') },
+            { "media/video2.mov", std::string(70000, '2') },
+            { "media/audio.wav", "" }
+        };
+        for (auto const& i : media)
+        {
+            std::ofstream fs(
+                temp.path() / std::filesystem::u8path(i.first).filename(),
+                std::ios::binary);
+            fs << i.second;
+        }
+
+        std::string const otioz_path =
+            (temp.path() / "media_entries.otioz").u8string();
+        WriteOptions write_options;
+        write_options.relative_media_base_dir = temp.path().u8string();
+        OTIO_NS::ErrorStatus error;
+        assertTrue(write_otioz(tl, otioz_path, write_options, &error));
+
+        // Read the media directly from the otioz file
+        auto const entries = otioz_media_entries(otioz_path, &error);
+        assertFalse(is_error(error));
+        assertEqual(entries.size(), media.size());
+        std::ifstream in(otioz_path, std::ios::binary);
+        for (auto const& entry : entries)
+        {
+            auto const i = media.find(entry.name);
+            assertTrue(i != media.end());
+            assertEqual(entry.size, uint64_t(i->second.size()));
+            std::string data(entry.size, '\0');
+            in.seekg(entry.offset);
+            in.read(data.data(), data.size());
+            assertEqual(data, i->second);
+        }
+
+        // Error on a missing file
+        otioz_media_entries((temp.path() / "missing.otioz").u8string(), &error);
+        assertTrue(is_error(error));
+    });
+
     tests.add_test("test_otioz_media_policy", [] {
 
         // Create a timeline with file and non-file references
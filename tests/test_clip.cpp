@@ -8,6 +8,7 @@
 #include <opentimelineio/deserialization.h>
 #include <opentimelineio/externalReference.h>
 #include <opentimelineio/freezeFrame.h>
+#include <opentimelineio/itemAlgorithm.h>
 #include <opentimelineio/linearTimeWarp.h>
 #include <opentimelineio/marker.h>
 #include <opentimelineio/missingReference.h>
@@ -300,6 +301,44 @@ main(int argc, char** argv)
             std::optional<IMATH_NAMESPACE::Box2d>());
     });
 
+    tests.add_test("test_item_source_times", [] {
+        SerializableObject::Retainer<Clip> cl(new Clip(
+            "test_clip",
+            nullptr,
+            TimeRange(RationalTime(100, 24), RationalTime(50, 24))));
+
+        // Without time effects, source times are presentation times.
+        assertEqual(
+            item_source_time(cl, RationalTime(110, 24)),
+            RationalTime(110, 24));
+
+        cl->effects().push_back(new LinearTimeWarp("fast", "", 2));
+        cl->effects().push_back(new LinearTimeWarp("half", "", 0.75));
+        assertEqual(
+            item_source_time(cl, RationalTime(110, 24)),
+            RationalTime(115, 24));
+
+        double const values[] = { 100, 104, 220 };
+        double const rates[]  = { 24, 24, 48 };
+        double       source_values[3];
+
+        OTIO_NS::ErrorStatus err;
+        item_source_times(cl, values, rates, 3, source_values, &err);
+        assertFalse(is_error(err));
+        assertEqual(source_values[0], 100.0);
+        assertEqual(source_values[1], 106.0);
+        assertEqual(source_values[2], 230.0);
+
+        cl->effects().push_back(new FreezeFrame);
+        assertEqual(
+            item_source_time(cl, RationalTime(130, 24)),
+            RationalTime(100, 24));
+
+        cl->effects().push_back(new TimeEffect("custom", "Custom"));
+        item_source_time(cl, RationalTime(130, 24), &err);
+        assertEqual(err.outcome, OTIO_NS::ErrorStatus::NOT_IMPLEMENTED);
+    });
+
     tests.run(argc, argv);
     return 0;
 }
@@ -3,6 +3,8 @@
 
 """Unit tests for the 'console' module."""
 
+import argparse
+import concurrent.futures
 import unittest
 import sys
 import os
@@ -12,6 +14,9 @@ import pathlib
 import platform
 
 import io
+import csv
+import json
+import shutil
 
 from tempfile import TemporaryDirectory  # noqa: F401
 import tempfile
@@ -114,6 +119,72 @@ class OTIOStatTest(ConsoleTester, unittest.TestCase):
         self.run_test()
         self.assertIn("top level object: Timeline.1", sys.stdout.getvalue())
 
+    def test_json(self):
+        sys.argv = [
+            'otiostat',
+            '--format', 'json',
+            '--jobs', '2',
+            SCREENING_EXAMPLE_PATH,
+            os.path.join(SAMPLE_DATA_DIR, "missing.otio"),
+        ]
+        self.run_test()
+        records = [
+            json.loads(line) for line in sys.stdout.getvalue().splitlines()
+        ]
+        self.assertEqual(
+            [record["file"] for record in records],
+            [SCREENING_EXAMPLE_PATH, os.path.join(SAMPLE_DATA_DIR, "missing.otio")]
+        )
+        self.assertEqual(records[0]["stats"]["top level object"], "Timeline.1")
+        self.assertEqual(records[0]["stats"]["number of clips"], 9)
+        self.assertEqual(records[0]["stats"]["deepest nesting"], 4)
+        self.assertEqual(records[0]["errors"], [])
+        self.assertGreater(records[0]["read_seconds"], 0)
+        self.assertEqual(records[1]["stats"], {})
+        self.assertIsNone(records[1]["errors"][0]["stat"])
+
+    def test_csv_directory(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.otio", "b.otio"):
+                shutil.copy(SIMPLE_CUT_PATH, os.path.join(temp_dir, name))
+            with open(os.path.join(temp_dir, "notes.txt"), "w") as fo:
+                fo.write("not a timeline")
+
+            sys.argv = ['otiostat', '--format', 'csv', temp_dir]
+            self.run_test()
+
+        rows = list(csv.reader(io.StringIO(sys.stdout.getvalue())))
+        self.assertEqual(
+            rows[0][:4],
+            ["file", "read_seconds", "stat_seconds", "errors"]
+        )
+        self.assertIn("number of clips", rows[0])
+        self.assertEqual(
+            [os.path.basename(row[0]) for row in rows[1:]],
+            ["a.otio", "b.otio"]
+        )
+        self.assertEqual(rows[1][3], "")
+
+    def test_glob_pattern(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.otio", "b.otio", "[c].otio"):
+                shutil.copy(SIMPLE_CUT_PATH, os.path.join(temp_dir, name))
+
+            # a name that exists is used as is, even if it looks like a glob
+            sys.argv = [
+                'otiostat', '--format', 'csv',
+                os.path.join(temp_dir, "?.otio"),
+                os.path.join(temp_dir, "[c].otio"),
+            ]
+            self.run_test()
+
+        rows = list(csv.reader(io.StringIO(sys.stdout.getvalue())))
+        self.assertEqual(
+            [os.path.basename(row[0]) for row in rows[1:]],
+            ["a.otio", "b.otio", "[c].otio"]
+        )
+        self.assertEqual([row[3] for row in rows[1:]], ["", "", ""])
+
 
 OTIOStatTest_ShellOut = CreateShelloutTest(OTIOStatTest)
 
@@ -291,6 +362,67 @@ class OTIOConvertTests(ConsoleTester, unittest.TestCase):
             # read results back in
             self.assertIn('error: media linker', sys.stderr.getvalue())
 
+    def test_batch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = os.path.join(temp_dir, "in")
+            os.makedirs(os.path.join(input_dir, "reel"))
+            shutil.copy(SIMPLE_CUT_PATH, os.path.join(input_dir, "cut.otio"))
+            shutil.copy(
+                MULTITRACK_PATH,
+                os.path.join(input_dir, "reel", "multitrack.otio")
+            )
+            with open(os.path.join(input_dir, "broken.otio"), "w") as fo:
+                fo.write("not a timeline")
+            output_dir = os.path.join(temp_dir, "out")
+            report_path = os.path.join(temp_dir, "report.json")
+
+            sys.argv = [
+                'otioconvert',
+                input_dir,
+                SCREENING_EXAMPLE_PATH,
+                '--output-dir', output_dir,
+                '--output-suffix', 'otio',
+                '--jobs', '2',
+                '--report', report_path,
+            ]
+
+            # the broken file is reported, and doesn't stop the others
+            with self.assertRaises(SystemExit):
+                self.run_test()
+            self.assertIn("converted 3 of 4 files", sys.stdout.getvalue())
+            self.assertIn("broken.otio", sys.stderr.getvalue())
+
+            for path, expected in (
+                ("cut.otio", SIMPLE_CUT_PATH),
+                (os.path.join("reel", "multitrack.otio"), MULTITRACK_PATH),
+                ("screening_example.otio", SCREENING_EXAMPLE_PATH),
+            ):
+                self.assertJsonEqual(
+                    otio.adapters.read_from_file(os.path.join(output_dir, path)),
+                    otio.adapters.read_from_file(expected)
+                )
+
+            with open(report_path) as fi:
+                report = json.load(fi)
+            self.assertEqual(report["converted"], 3)
+            self.assertEqual(report["failed"], 1)
+            self.assertEqual(
+                [os.path.basename(f["input"]) for f in report["files"]],
+                [
+                    "broken.otio",
+                    "cut.otio",
+                    "multitrack.otio",
+                    "screening_example.otio"
+                ]
+            )
+            self.assertIsNotNone(report["files"][0]["error"])
+
+    def test_batch_argument_error(self):
+        sys.argv = ['otioconvert', SCREENING_EXAMPLE_PATH, SIMPLE_CUT_PATH]
+        with self.assertRaises(SystemExit):
+            self.run_test()
+        self.assertIn('requires --output-dir', sys.stderr.getvalue())
+
 
 OTIOConvertTests_OnShell = CreateShelloutTest(OTIOConvertTests)
 
@@ -342,6 +474,140 @@ TRACK: Sequence 3 (Video)
   CLIP: ZZ100_510B (LAY1)
 """, out)
 
+    def test_read_inputs_in_order(self):
+        paths = [SCREENING_EXAMPLE_PATH, MULTITRACK_PATH, SIMPLE_CUT_PATH] * 3
+        timelines = otio_console.otiotool.read_inputs(paths, jobs=4)
+        self.assertEqual(
+            [timeline.name for timeline in timelines],
+            [
+                otio.adapters.read_from_file(path).name
+                for path in paths
+            ]
+        )
+
+    def test_read_ahead_is_bounded(self):
+        started = []
+
+        def read(item):
+            started.append(item)
+            return item
+
+        results = otio_console.console_utils.ordered_map(
+            read,
+            range(20),
+            jobs=4,
+            executor_class=concurrent.futures.ThreadPoolExecutor
+        )
+        for expected, result in enumerate(results):
+            self.assertEqual(result, expected)
+            # at most jobs + 1 calls are submitted ahead of the results
+            self.assertLessEqual(len(started), expected + 5)
+
+    def test_stream_list_tracks(self):
+        sys.argv = [
+            'otiotool',
+            '-i', MULTITRACK_PATH, MULTITRACK_PATH,
+            '--jobs', '2',
+            '--list-tracks'
+        ]
+        out, err = self.run_test()
+        self.assertEqual("""TIMELINE: OTIO TEST - multitrack.Exported.01
+TRACK: Sequence (Video)
+TRACK: Sequence 2 (Video)
+TRACK: Sequence 3 (Video)
+""" * 2, out)
+
+    def test_copy_media_to_folder(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # two different files with the same name
+            media_paths = []
+            for folder, data in (("a", b"first"), ("b", b"second" * 1000)):
+                os.makedirs(os.path.join(temp_dir, folder))
+                media_path = os.path.join(temp_dir, folder, "shot.mov")
+                with open(media_path, "wb") as fo:
+                    fo.write(data)
+                media_paths.append(media_path)
+
+            timeline = otio.schema.Timeline(name="copy media")
+            track = otio.schema.Track()
+            for i, media_path in enumerate(media_paths + media_paths[:1]):
+                track.append(
+                    otio.schema.Clip(
+                        name=f"clip{i}",
+                        media_reference=otio.schema.ExternalReference(
+                            target_url=media_path
+                        )
+                    )
+                )
+            timeline.tracks.append(track)
+            input_path = os.path.join(temp_dir, "input.otio")
+            otio.adapters.write_to_file(timeline, input_path)
+
+            copy_dir = os.path.join(temp_dir, "copies")
+            os.makedirs(copy_dir)
+            output_path = os.path.join(temp_dir, "output.otio")
+            sys.argv = [
+                'otiotool',
+                '-i', input_path,
+                '--copy-media-to-folder', copy_dir,
+                '--copy-media-naming', 'hash',
+                '--copy-media-jobs', '2',
+                '-o', output_path,
+            ]
+            out, err = self.run_test()
+            self.assertEqual(out.count("COPYING:"), 2)
+
+            result = otio.adapters.read_from_file(output_path)
+            urls = [
+                clip.media_reference.target_url for clip in result.find_clips()
+            ]
+            self.assertEqual(len(set(urls)), 2)
+            self.assertEqual(urls[0], urls[2])
+            for url, media_path in zip(urls, media_paths):
+                self.assertEqual(os.path.dirname(url), copy_dir)
+                with open(url, "rb") as fi, open(media_path, "rb") as fm:
+                    self.assertEqual(fi.read(), fm.read())
+            self.assertEqual(sorted(os.listdir(copy_dir)), sorted(
+                os.path.basename(url) for url in set(urls)
+            ))
+
+            # copying again skips the complete copies, and replaces the
+            # incomplete one
+            with open(urls[1], "wb") as fo:
+                fo.write(b"sec")
+            sys.stdout = io.StringIO()
+            out, err = self.run_test()
+            self.assertEqual(out.count("SKIPPING:"), 1)
+            self.assertEqual(out.count("COPYING:"), 1)
+            with open(urls[1], "rb") as fi:
+                self.assertEqual(fi.read(), b"second" * 1000)
+
+    def test_can_stream(self):
+        args = argparse.Namespace(
+            stack=False,
+            concat=False,
+            output=None,
+            relink_by_name=None,
+            copy_media_to_folder=None,
+            stats=True,
+            inspect=None,
+            list_clips=False,
+            list_media=False,
+            verify_media=False,
+            list_tracks=False,
+            list_markers=False,
+            verify_ranges=False,
+        )
+        self.assertTrue(otio_console.otiotool.can_stream(args))
+
+        # the stats and the clips of each timeline would be interleaved
+        args.list_clips = True
+        self.assertFalse(otio_console.otiotool.can_stream(args))
+
+        args.stats = False
+        args.output = "-"
+        self.assertFalse(otio_console.otiotool.can_stream(args))
+
     def test_list_markers(self):
         sys.argv = [
             'otiotool',
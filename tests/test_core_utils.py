@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright Contributors to the OpenTimelineIO project
 
+import collections
 import copy
 import unittest
 
 import opentimelineio._otio
 import opentimelineio.core._core_utils
+import opentimelineio.opentime
 
 
 class AnyDictionaryTests(unittest.TestCase):
@@ -55,6 +57,33 @@ class AnyDictionaryTests(unittest.TestCase):
             # Integer smaller than C++ int64_t can accept.
             d['super big int'] = -9223372036854775809
 
+    def test_to_python(self):
+        d = opentimelineio.core._core_utils.AnyDictionary()
+        d['scalars'] = {'int': 1, 'float': 2.5, 'str': 'x', 'none': None}
+        d['list'] = [1, [2, 3], {'nested': True}]
+        d['time'] = opentimelineio.opentime.RationalTime(1, 24)
+
+        result = d.to_python()
+        self.assertIs(type(result), dict)
+        self.assertIs(type(result['scalars']), dict)
+        self.assertIs(type(result['list']), list)
+        self.assertIs(type(result['list'][1]), list)
+        self.assertIs(type(result['list'][2]), dict)
+        self.assertEqual(
+            result,
+            {
+                'scalars': {'int': 1, 'float': 2.5, 'str': 'x', 'none': None},
+                'list': [1, [2, 3], {'nested': True}],
+                'time': opentimelineio.opentime.RationalTime(1, 24),
+            }
+        )
+
+        # the result is a copy
+        result['scalars']['int'] = 2
+        self.assertEqual(d['scalars']['int'], 1)
+
+        self.assertEqual(d['list'].to_python(), [1, [2, 3], {'nested': True}])
+
     def test_raise_on_mutation_during_iter(self):
         d = opentimelineio.core._core_utils.AnyDictionary()
         d['a'] = 'test'
@@ -242,3 +271,50 @@ class AnyVectorTests(unittest.TestCase):
         deepcopied = copy.deepcopy(v)
         self.assertIsNot(v, deepcopied)
         self.assertIsNot(v[2], deepcopied[2])
+
+
+class ValueToAnyTests(unittest.TestCase):
+    def serialized(self, pyany):
+        return opentimelineio._otio._serialize_json_to_string(pyany, {}, -1)
+
+    def test_matches_python_conversion(self):
+        value = {
+            "cdl": [
+                {"slope": [1.0, 1.1, 0.9], "offset": (0, 0, 0), "frame": i}
+                for i in range(10)
+            ],
+            "vendor": {
+                "enabled": True,
+                "notes": None,
+                "label": "grade",
+                "time": opentimelineio.opentime.RationalTime(10, 24),
+                "ordered": collections.OrderedDict([("b", 2), ("a", 1)]),
+            }
+        }
+
+        self.assertEqual(
+            self.serialized(opentimelineio.core._core_utils._value_to_any(value)),
+            self.serialized(
+                opentimelineio.core._core_utils._python_value_to_any(value)
+            )
+        )
+
+    def test_errors(self):
+        value_to_any = opentimelineio.core._core_utils._value_to_any
+
+        circular = {"a": []}
+        circular["a"].append(circular)
+        with self.assertRaisesRegex(ValueError, "circular reference"):
+            value_to_any(circular)
+
+        with self.assertRaisesRegex(ValueError, "key '1' is not a string"):
+            value_to_any({1: "one"})
+
+        with self.assertRaises(ValueError):
+            value_to_any({"big": [9223372036854775808]})
+
+        class CustomClass(object):
+            pass
+
+        with self.assertRaises(TypeError):
+            value_to_any({"custom": CustomClass()})
@@ -114,6 +114,168 @@ debug_clip_ranges(const std::string& title, Track* track)
 #endif
 }
 
+void
+apply_edit(
+    algo::EditOperation const& operation,
+    Track*                     track,
+    OTIO_NS::ErrorStatus*      error_status)
+{
+    using algo::EditOperationKind;
+    switch (operation.kind)
+    {
+        case EditOperationKind::Overwrite:
+            algo::overwrite(
+                operation.item,
+                track,
+                operation.range,
+                operation.remove_transitions,
+                operation.fill_template,
+                error_status);
+            break;
+        case EditOperationKind::Insert:
+            algo::insert(
+                operation.item,
+                track,
+                operation.time,
+                operation.remove_transitions,
+                operation.fill_template,
+                error_status);
+            break;
+        case EditOperationKind::Trim:
+            algo::trim(
+                operation.item,
+                operation.delta_in,
+                operation.delta_out,
+                operation.fill_template,
+                error_status);
+            break;
+        case EditOperationKind::Slice:
+            algo::slice(
+                track,
+                operation.time,
+                operation.remove_transitions,
+                error_status);
+            break;
+        case EditOperationKind::Slip:
+            algo::slip(operation.item, operation.delta);
+            break;
+        case EditOperationKind::Slide:
+            algo::slide(operation.item, operation.delta);
+            break;
+        case EditOperationKind::Ripple:
+            algo::ripple(
+                operation.item,
+                operation.delta_in,
+                operation.delta_out,
+                error_status);
+            break;
+        case EditOperationKind::Roll:
+            algo::roll(
+                operation.item,
+                operation.delta_in,
+                operation.delta_out,
+                error_status);
+            break;
+        case EditOperationKind::Fill:
+            algo::fill(
+                operation.item,
+                track,
+                operation.time,
+                operation.reference_point,
+                error_status);
+            break;
+        case EditOperationKind::Remove:
+            algo::remove(
+                track,
+                operation.time,
+                operation.fill,
+                operation.fill_template,
+                error_status);
+            break;
+    }
+}
+
+Track*
+make_edit_session_track()
+{
+    // A long gap to fill, then clips and gaps of varying lengths, with a
+    // few dissolves.
+    Track* track = new Track();
+    track->append_child(new Gap(RationalTime(400, 24.0)));
+    for (int i = 0; i < 60; ++i)
+    {
+        const double duration = 4 + (i * 7) % 20;
+        if (i % 4 == 3)
+        {
+            track->append_child(new Gap(RationalTime(duration, 24.0)));
+        }
+        else
+        {
+            track->append_child(new Clip(
+                "clip " + std::to_string(i),
+                nullptr,
+                TimeRange(
+                    RationalTime(i * 10, 24.0),
+                    RationalTime(duration, 24.0))));
+        }
+        if (i % 10 == 1)
+        {
+            track->append_child(new Transition(
+                "dissolve",
+                Transition::Type::SMPTE_Dissolve,
+                RationalTime(2, 24.0),
+                RationalTime(2, 24.0)));
+        }
+    }
+    return track;
+}
+
+std::vector<algo::EditOperation>
+make_edit_session_edits(Track* track)
+{
+    using algo::EditOperation;
+    using algo::EditOperationKind;
+    std::vector<EditOperation> edits;
+    auto item_at = [track](int index) {
+        return dynamic_cast<Item*>(track->children()[index].value);
+    };
+    for (int i = 0; i < 40; ++i)
+    {
+        const RationalTime time(413 + i * 16, 24.0);
+        EditOperation      edit;
+        edit.kind = EditOperationKind(i % 10);
+        edit.item = new Clip(
+            "edit " + std::to_string(i),
+            nullptr,
+            TimeRange(RationalTime(i, 24.0), RationalTime(6, 24.0)));
+        edit.range     = TimeRange(time, RationalTime(5 + i % 9, 24.0));
+        edit.time      = time;
+        edit.delta     = RationalTime(i % 2 ? 2 : -2, 24.0);
+        edit.delta_in  = RationalTime(i % 3 - 1, 24.0);
+        edit.delta_out = RationalTime(i % 5 - 2, 24.0);
+        switch (edit.kind)
+        {
+            case EditOperationKind::Trim:
+            case EditOperationKind::Slip:
+            case EditOperationKind::Slide:
+            case EditOperationKind::Ripple:
+            case EditOperationKind::Roll:
+                // An item near the end of the track, after the other edits
+                // and away from the dissolves.
+                edit.item = item_at(60 + i % 4);
+                break;
+            case EditOperationKind::Fill:
+                // After the clips of the previous fills.
+                edit.time = RationalTime(10 + i * 3, 24.0);
+                break;
+            default:
+                break;
+        }
+        edits.push_back(edit);
+    }
+    return edits;
+}
+
 void
 assert_clip_ranges(Track* track, const std::vector<TimeRange>& expected_ranges)
 {
@@ -2303,6 +2465,51 @@ main(int argc, char** argv)
         assert(error_status.outcome == OTIO_NS::ErrorStatus::TYPE_MISMATCH);
     });
 
+    tests.add_test("test_edit_session", [] {
+        // Apply the same edits to two copies of a track, one at a time and
+        // through a session.
+        SerializableObject::Retainer<Track> track = make_edit_session_track();
+        SerializableObject::Retainer<Track> session_track =
+            dynamic_cast<Track*>(track->clone());
+
+        OTIO_NS::ErrorStatus error_status;
+        for (const auto& edit: make_edit_session_edits(track))
+        {
+            apply_edit(edit, track, &error_status);
+            assertFalse(is_error(error_status));
+        }
+
+        algo::EditSession session(session_track);
+        assertEqual(session.track(), session_track.value);
+        session.apply(make_edit_session_edits(session_track), &error_status);
+        assertFalse(is_error(error_status));
+
+        assertEqual(
+            session_track->to_json_string(),
+            track->to_json_string());
+    });
+
+    tests.add_test("test_edit_session_stops_at_error", [] {
+        SerializableObject::Retainer<Track> track = make_edit_session_track();
+        const size_t size = track->children().size();
+
+        std::vector<algo::EditOperation> edits(3);
+        edits[0].kind = algo::EditOperationKind::Slice;
+        edits[0].time = RationalTime(10, 24.0);
+        // There is nothing to remove after the end of the track.
+        edits[1].kind = algo::EditOperationKind::Remove;
+        edits[1].time = track->duration() + RationalTime(10, 24.0);
+        edits[2].kind = algo::EditOperationKind::Slice;
+        edits[2].time = RationalTime(30, 24.0);
+
+        OTIO_NS::ErrorStatus error_status;
+        algo::EditSession    session(track);
+        session.apply(edits, &error_status);
+        assertTrue(is_error(error_status));
+        assertEqual(error_status.outcome, OTIO_NS::ErrorStatus::NOT_AN_ITEM);
+        assertEqual(track->children().size(), size + 1);
+    });
+
     tests.run(argc, argv);
     return 0;
 }
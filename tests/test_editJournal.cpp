@@ -0,0 +1,289 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "utils.h"
+
+#include <opentimelineio/algo/editAlgorithm.h>
+#include <opentimelineio/clip.h>
+#include <opentimelineio/editJournal.h>
+#include <opentimelineio/gap.h>
+#include <opentimelineio/stack.h>
+#include <opentimelineio/timeline.h>
+#include <opentimelineio/track.h>
+#include <opentimelineio/transition.h>
+
+using namespace OTIO_NS;
+
+namespace {
+
+SerializableObject::Retainer<Clip>
+make_clip(std::string const& name, double duration)
+{
+    return new Clip(
+        name,
+        nullptr,
+        TimeRange(RationalTime(0.0, 24.0), RationalTime(duration, 24.0)));
+}
+
+SerializableObject::Retainer<Timeline>
+make_timeline(SerializableObject::Retainer<Track>& track)
+{
+    SerializableObject::Retainer<Timeline> timeline = new Timeline();
+    track                                           = new Track();
+    for (int i = 0; i < 6; ++i)
+    {
+        track->append_child(make_clip("clip" + std::to_string(i), 24.0));
+    }
+    timeline->tracks()->append_child(track);
+    return timeline;
+}
+
+} // namespace
+
+int
+main(int argc, char** argv)
+{
+    Tests tests;
+
+    tests.add_test("test_undo_redo_children", [] {
+        SerializableObject::Retainer<Track> track;
+        auto        timeline = make_timeline(track);
+        std::string original = timeline->to_json_string();
+
+        EditJournal journal(timeline);
+        assertFalse(journal.can_undo());
+        assertFalse(journal.undo());
+
+        SerializableObject::Retainer<Clip> clip = make_clip("new", 12.0);
+        track->insert_child(2, clip);
+        track->remove_child(0);
+        track->set_child(0, make_clip("set", 6.0));
+        std::string edited = timeline->to_json_string();
+
+        OTIO_NS::ErrorStatus err;
+        for (int i = 0; i < 3; ++i)
+        {
+            assertTrue(journal.undo(&err));
+            assertFalse(is_error(err));
+        }
+        assertFalse(journal.can_undo());
+        assertEqual(timeline->to_json_string(), original);
+        assertEqual(clip->parent(), static_cast<Composition*>(nullptr));
+
+        for (int i = 0; i < 3; ++i)
+        {
+            assertTrue(journal.redo(&err));
+            assertFalse(is_error(err));
+        }
+        assertFalse(journal.can_redo());
+        assertEqual(timeline->to_json_string(), edited);
+        assertEqual(clip->parent(), static_cast<Composition*>(track));
+    });
+
+    tests.add_test("test_undo_set_children", [] {
+        SerializableObject::Retainer<Track> track;
+        auto        timeline = make_timeline(track);
+        std::string original = timeline->to_json_string();
+
+        EditJournal journal(timeline);
+        track->clear_children();
+        track->set_children({ make_clip("a", 1.0), make_clip("b", 2.0) });
+        std::string edited = timeline->to_json_string();
+
+        assertTrue(journal.undo());
+        assertEqual(track->children().size(), size_t(0));
+        assertTrue(journal.undo());
+        assertEqual(timeline->to_json_string(), original);
+        assertTrue(journal.redo());
+        assertTrue(journal.redo());
+        assertEqual(timeline->to_json_string(), edited);
+    });
+
+    tests.add_test("test_undo_source_range", [] {
+        SerializableObject::Retainer<Track> track;
+        auto timeline = make_timeline(track);
+
+        EditJournal journal(timeline);
+        auto        clip = dynamic_retainer_cast<Clip>(track->children()[1]);
+        const TimeRange range(
+            RationalTime(12.0, 24.0),
+            RationalTime(6.0, 24.0));
+        clip->set_source_range(range);
+        track->set_source_range(range);
+
+        assertTrue(journal.undo());
+        assertFalse(track->source_range().has_value());
+        assertTrue(journal.undo());
+        assertEqual(clip->source_range()->duration().value(), 24.0);
+        assertTrue(journal.redo());
+        assertEqual(clip->source_range().value(), range);
+    });
+
+    tests.add_test("test_unattached_changes", [] {
+        SerializableObject::Retainer<Track> track;
+        auto timeline = make_timeline(track);
+
+        // Objects outside of the timeline aren't recorded.
+        {
+            EditJournal journal(timeline);
+            SerializableObject::Retainer<Track> other = new Track();
+            other->append_child(make_clip("other", 24.0));
+            make_clip("loose", 24.0)->set_source_range(std::nullopt);
+            assertFalse(journal.can_undo());
+        }
+
+        // Nor are the changes made after the journal is detached.
+        EditJournal journal(new Timeline());
+        track->remove_child(0);
+        assertFalse(journal.can_undo());
+        assertEqual(
+            EditJournal::journal_of(track),
+            static_cast<EditJournal*>(nullptr));
+    });
+
+    tests.add_test("test_groups", [] {
+        SerializableObject::Retainer<Track> track;
+        auto        timeline = make_timeline(track);
+        std::string original = timeline->to_json_string();
+
+        EditJournal journal(timeline);
+        assertEqual(EditJournal::journal_of(track->children()[0]), &journal);
+        {
+            EditJournal::Group group(track);
+            track->remove_child(0);
+            {
+                EditJournal::Group inner(&journal);
+                track->remove_child(0);
+            }
+            track->append_child(make_clip("new", 1.0));
+        }
+        // An empty group is not a step.
+        {
+            EditJournal::Group group(track);
+        }
+        track->remove_child(0);
+
+        assertTrue(journal.undo());
+        assertEqual(track->children().size(), size_t(5));
+        assertTrue(journal.undo());
+        assertEqual(timeline->to_json_string(), original);
+        assertFalse(journal.can_undo());
+
+        // A new change forgets the steps that were undone.
+        assertTrue(journal.can_redo());
+        track->remove_child(0);
+        assertFalse(journal.can_redo());
+
+        journal.clear();
+        assertFalse(journal.can_undo());
+    });
+
+    tests.add_test("test_undo_edit_algorithms", [] {
+        SerializableObject::Retainer<Track> track;
+        auto timeline = make_timeline(track);
+        track->insert_child(
+            3,
+            new Transition(
+                "",
+                Transition::Type::SMPTE_Dissolve,
+                RationalTime(6.0, 24.0),
+                RationalTime(6.0, 24.0)));
+        std::vector<std::string> states = { timeline->to_json_string() };
+
+        EditJournal          journal(timeline);
+        OTIO_NS::ErrorStatus err;
+        algo::overwrite(
+            make_clip("overwrite", 30.0),
+            track,
+            TimeRange(RationalTime(12.0, 24.0), RationalTime(30.0, 24.0)),
+            true,
+            nullptr,
+            &err);
+        states.push_back(timeline->to_json_string());
+        algo::insert(
+            make_clip("insert", 10.0),
+            track,
+            RationalTime(60.0, 24.0),
+            true,
+            nullptr,
+            &err);
+        states.push_back(timeline->to_json_string());
+        algo::slice(track, RationalTime(100.0, 24.0), true, &err);
+        states.push_back(timeline->to_json_string());
+        auto item = dynamic_retainer_cast<Item>(track->children()[4]);
+        algo::trim(
+            item,
+            RationalTime(2.0, 24.0),
+            RationalTime(-3.0, 24.0),
+            nullptr,
+            &err);
+        states.push_back(timeline->to_json_string());
+        algo::slip(item, RationalTime(4.0, 24.0));
+        states.push_back(timeline->to_json_string());
+        algo::remove(track, RationalTime(50.0, 24.0), true, nullptr, &err);
+        states.push_back(timeline->to_json_string());
+        assertFalse(is_error(err));
+
+        // Each edit is one step.
+        for (size_t i = states.size() - 1; i > 0; --i)
+        {
+            assertTrue(journal.undo(&err));
+            assertFalse(is_error(err));
+            assertEqual(timeline->to_json_string(), states[i - 1]);
+        }
+        assertFalse(journal.can_undo());
+        for (size_t i = 1; i < states.size(); ++i)
+        {
+            assertTrue(journal.redo(&err));
+            assertFalse(is_error(err));
+            assertEqual(timeline->to_json_string(), states[i]);
+        }
+    });
+
+    tests.add_test("test_undo_edit_session", [] {
+        SerializableObject::Retainer<Track> track;
+        auto timeline = make_timeline(track);
+        for (int i = 0; i < 40; ++i)
+        {
+            track->append_child(make_clip("more" + std::to_string(i), 12.0));
+        }
+        std::vector<std::string> states = { timeline->to_json_string() };
+
+        EditJournal          journal(timeline);
+        algo::EditSession    session(track);
+        OTIO_NS::ErrorStatus err;
+        for (int i = 0; i < 8; ++i)
+        {
+            algo::EditOperation operation;
+            operation.kind = i % 2 ? algo::EditOperationKind::Slice
+                                   : algo::EditOperationKind::Overwrite;
+            operation.time = RationalTime(200.0 + i * 40.0 + 5.0, 24.0);
+            operation.item = make_clip("edit" + std::to_string(i), 8.0).value;
+            operation.range =
+                TimeRange(operation.time, RationalTime(8.0, 24.0));
+            session.apply(operation, &err);
+            assertFalse(is_error(err));
+            states.push_back(timeline->to_json_string());
+        }
+
+        for (size_t i = states.size() - 1; i > 0; --i)
+        {
+            assertTrue(journal.undo(&err));
+            assertFalse(is_error(err));
+            assertEqual(timeline->to_json_string(), states[i - 1]);
+        }
+        assertFalse(journal.can_undo());
+
+        // The session must be reset after the track is changed by the
+        // journal.
+        session.reset();
+        for (size_t i = 1; i < states.size(); ++i)
+        {
+            assertTrue(journal.redo(&err));
+            assertEqual(timeline->to_json_string(), states[i]);
+        }
+    });
+
+    tests.run(argc, argv);
+    return 0;
+}
@@ -124,6 +124,34 @@ class FilterTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
         self.assertJsonEqual(tl, test)
 
+    def test_collection_with_timeline_and_collection(self):
+        """only composables inside a collection are passed to the filter"""
+
+        tl = otio.schema.Timeline(name='tl')
+        tl.tracks.append(otio.schema.Track(name='tr1'))
+        tl.tracks[0].extend(
+            [otio.schema.Clip(name='cl1'), otio.schema.Clip(name='cl2')]
+        )
+        nested = otio.schema.SerializableCollection(name='nested')
+        nested.append(otio.schema.Track(name='tr2'))
+        nested[0].append(otio.schema.Clip(name='cl3'))
+        sc = otio.schema.SerializableCollection(name='sc')
+        sc.extend([tl, nested])
+
+        visited = []
+
+        def prune_cl1(thing):
+            visited.append(thing.name)
+            return None if thing.name == 'cl1' else thing
+
+        result = otio.algorithms.filtered_composition(sc, prune_cl1)
+        self.assertEqual(
+            visited,
+            ['sc', 'tr1', 'cl1', 'cl2', 'tr2', 'cl3']
+        )
+        self.assertEqual([c.name for c in result[0].tracks[0]], ['cl2'])
+        self.assertEqual([c.name for c in result[1][0]], ['cl3'])
+
     def test_insert_tuple(self):
         """test a reduce that takes each clip in a sequence and triples it"""
 
@@ -320,6 +348,58 @@ class ReduceTest(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertTrue(isinstance(result[2], otio.schema.Gap))
         self.assertTrue(isinstance(result[3], otio.schema.Clip))
 
+    def test_calls_in_order_with_original_neighbors(self):
+        """test that reduce_fn sees the copied neighbors, depth first"""
+
+        tl = otio.schema.Timeline(name='tl')
+        for t in range(2):
+            tr = otio.schema.Track(name='tr{}'.format(t))
+            for c in range(3):
+                tr.append(otio.schema.Clip(name='cl{}{}'.format(t, c)))
+            tl.tracks.append(tr)
+
+        calls = []
+
+        def expand_first_clips(prev_item, thing, next_item):
+            calls.append(
+                (
+                    prev_item.name if prev_item is not None else None,
+                    thing.name,
+                    next_item.name if next_item is not None else None,
+                )
+            )
+            if thing.name.endswith('0') and thing.name.startswith('cl'):
+                return (thing, otio.schema.Gap(name='gap'))
+            return thing
+
+        result = otio.algorithms.filtered_with_sequence_context(
+            tl,
+            expand_first_clips
+        )
+
+        self.assertEqual(
+            calls,
+            [
+                (None, 'tl', None),
+                (None, tl.tracks.name, None),
+                (None, 'tr0', None),
+                (None, 'cl00', 'cl01'),
+                ('cl00', 'cl01', 'cl02'),
+                ('cl01', 'cl02', None),
+                (None, 'tr1', None),
+                (None, 'cl10', 'cl11'),
+                ('cl10', 'cl11', 'cl12'),
+                ('cl11', 'cl12', None),
+            ]
+        )
+        self.assertEqual(
+            [[child.name for child in tr] for tr in result.tracks],
+            [
+                ['cl00', 'gap', 'cl01', 'cl02'],
+                ['cl10', 'gap', 'cl11', 'cl12'],
+            ]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
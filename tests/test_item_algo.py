@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the OpenTimelineIO project
+
+"""Test file for the item algorithms library."""
+
+import unittest
+
+import opentimelineio as otio
+
+
+class ItemSourceTimesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.clip = otio.schema.Clip(
+            name="clip",
+            source_range=otio.opentime.TimeRange(
+                otio.opentime.RationalTime(100, 24),
+                otio.opentime.RationalTime(50, 24)
+            )
+        )
+
+    def test_no_effects(self):
+        t = otio.opentime.RationalTime(110, 24)
+        self.assertEqual(otio.algorithms.item_source_time(self.clip, t), t)
+
+    def test_time_warps(self):
+        self.clip.effects.append(otio.schema.LinearTimeWarp(time_scalar=2))
+        self.clip.effects.append(otio.schema.LinearTimeWarp(time_scalar=0.75))
+
+        self.assertEqual(
+            otio.algorithms.item_source_time(
+                self.clip,
+                otio.opentime.RationalTime(110, 24)
+            ),
+            otio.opentime.RationalTime(115, 24)
+        )
+
+        times = otio.opentime.RationalTimeArray(range(100, 150), 24)
+        source_times = otio.algorithms.item_source_times(self.clip, times)
+        self.assertEqual(len(source_times), 50)
+        self.assertEqual(
+            list(source_times.values),
+            [100 + i * 1.5 for i in range(50)]
+        )
+        self.assertEqual(list(source_times.rates), [24] * 50)
+
+        source_times = otio.algorithms.item_source_times(
+            self.clip,
+            [otio.opentime.RationalTime(220, 48)]
+        )
+        self.assertEqual(source_times[0], otio.opentime.RationalTime(230, 48))
+
+    def test_freeze_frame(self):
+        self.clip.effects.append(otio.schema.FreezeFrame())
+        times = otio.opentime.RationalTimeArray([100, 120, 149], 24)
+        self.assertEqual(
+            list(otio.algorithms.item_source_times(self.clip, times).values),
+            [100, 100, 100]
+        )
+
+    def test_unknown_time_effect(self):
+        self.clip.effects.append(otio.schema.TimeEffect())
+        with self.assertRaises(NotImplementedError):
+            otio.algorithms.item_source_time(
+                self.clip,
+                otio.opentime.RationalTime(110, 24)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -127,6 +127,59 @@ class TestJsonFormat(unittest.TestCase, otio_test_utils.OTIOAssertions):
         trx = otio.schema.GeneratorReference()
         self.check_against_baseline(trx, "empty_generator_reference")
 
+    def test_read_with_threads(self):
+        tl = otio.schema.Timeline(name="threaded")
+        for i in range(4):
+            tr = otio.schema.Track(name="track{}".format(i))
+            for j in range(3):
+                tr.append(
+                    otio.schema.Clip(
+                        name="clip{}.{}".format(i, j),
+                        source_range=otio.opentime.TimeRange(
+                            otio.opentime.RationalTime(0, 24),
+                            otio.opentime.RationalTime(10 + j, 24)
+                        )
+                    )
+                )
+            tl.tracks.append(tr)
+
+        serialized = otio.adapters.otio_json.write_to_string(tl)
+        result = otio.adapters.otio_json.read_from_string(
+            serialized,
+            num_threads=4
+        )
+        self.assertJsonEqual(tl, result)
+        for track in result.tracks:
+            self.assertIs(track.parent(), result.tracks)
+
+        with self.assertRaises(ValueError):
+            otio.adapters.otio_json.read_from_string(
+                serialized.replace('"Clip.2"', '"Clip.x"'),
+                num_threads=4
+            )
+
+    def test_read_without_line_numbers(self):
+        tl = otio.schema.Timeline(name="untracked")
+        tl.tracks.append(otio.schema.Track(name="track"))
+        tl.tracks[0].append(otio.schema.Clip(name="clip"))
+
+        serialized = otio.adapters.otio_json.write_to_string(tl)
+        result = otio.adapters.otio_json.read_from_string(
+            serialized,
+            track_line_numbers=False
+        )
+        self.assertJsonEqual(tl, result)
+
+        broken = serialized.replace('"Clip.2"', '"Clip.x"')
+        with self.assertRaises(ValueError) as tracked:
+            otio.adapters.otio_json.read_from_string(broken)
+        with self.assertRaises(ValueError) as untracked:
+            otio.adapters.otio_json.read_from_string(
+                broken,
+                track_line_numbers=False
+            )
+        self.assertEqual(str(tracked.exception), str(untracked.exception))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,7 +4,10 @@
 #include "utils.h"
 
 #include <opentime/rationalTime.h>
+#include <opentime/tickTime.h>
 #include <opentime/timeRange.h>
+#include <opentime/timeRangeSet.h>
+#include <opentime/timecodeFormatter.h>
 
 using namespace opentime::OPENTIME_VERSION_NS;
 
@@ -179,6 +182,152 @@ main(int argc, char** argv)
         assertTrue(r3.is_invalid_range());
     });
 
+    tests.add_test("test_time_range_set", [] {
+        TimeRangeSet set({ TimeRange(10.0, 5.0, 24.0),
+                           TimeRange(0.0, 5.0, 24.0),
+                           TimeRange(3.0, 4.0, 24.0),
+                           TimeRange(20.0, 0.0, 24.0),
+                           TimeRange(0.0, -1.0, 24.0) });
+        assertEqual(set.size(), size_t(2));
+        assertEqual(set.ranges()[0], TimeRange(0.0, 7.0, 24.0));
+        assertEqual(set.ranges()[1], TimeRange(10.0, 5.0, 24.0));
+        assertEqual(set.bounds(), TimeRange(0.0, 15.0, 24.0));
+        assertEqual(set.duration(24.0), RationalTime(12.0, 24.0));
+
+        assertTrue(set.contains(RationalTime(6.0, 24.0)));
+        assertFalse(set.contains(RationalTime(7.0, 24.0)));
+        assertTrue(set.contains(RationalTime(20.0, 48.0)));
+        assertTrue(set.covers(TimeRange(1.0, 6.0, 24.0)));
+        assertFalse(set.covers(TimeRange(1.0, 10.0, 24.0)));
+        assertTrue(set.overlaps(TimeRange(6.0, 10.0, 24.0)));
+        assertFalse(set.overlaps(TimeRange(7.0, 3.0, 24.0)));
+
+        assertEqual(set.gaps().ranges()[0], TimeRange(7.0, 3.0, 24.0));
+        auto gaps = set.gaps(TimeRange(5.0, 20.0, 24.0));
+        assertEqual(gaps.size(), size_t(2));
+        assertEqual(gaps.ranges()[0], TimeRange(7.0, 3.0, 24.0));
+        assertEqual(gaps.ranges()[1], TimeRange(15.0, 10.0, 24.0));
+
+        TimeRangeSet other({ TimeRange(5.0, 7.0, 24.0) });
+        assertEqual(
+            set.union_with(other),
+            TimeRangeSet({ TimeRange(0.0, 15.0, 24.0) }));
+        assertEqual(
+            set.intersection_with(other),
+            TimeRangeSet({ TimeRange(5.0, 2.0, 24.0),
+                           TimeRange(10.0, 2.0, 24.0) }));
+        assertEqual(
+            set.difference_with(other),
+            TimeRangeSet({ TimeRange(0.0, 5.0, 24.0),
+                           TimeRange(12.0, 3.0, 24.0) }));
+
+        set.add(TimeRange(7.0, 3.0, 24.0));
+        assertEqual(set, TimeRangeSet({ TimeRange(0.0, 15.0, 24.0) }));
+    });
+
+    tests.add_test("test_time_range_set_epsilon", [] {
+        // Ranges closer than epsilon_s are merged, matching the TimeRange
+        // relations, which treat them as meeting.
+        TimeRange    a(0.0, 1.0, 1.0);
+        TimeRange    b(1.0 + DEFAULT_EPSILON_s / 2, 1.0, 1.0);
+        TimeRangeSet set({ a, b });
+        assertTrue(a.meets(b));
+        assertEqual(set.size(), size_t(1));
+        assertTrue(set.covers(TimeRange(0.5, 1.0, 1.0)));
+
+        TimeRangeSet strict({ a, b }, 0.0);
+        assertEqual(strict.size(), size_t(2));
+        assertFalse(strict.covers(TimeRange(0.5, 1.0, 1.0)));
+
+        // Mixed rates are compared in seconds.
+        TimeRangeSet mixed(
+            { TimeRange(0.0, 24.0, 24.0), TimeRange(48.0, 48.0, 48.0) });
+        assertEqual(mixed.size(), size_t(1));
+        assertEqual(mixed.duration(24.0), RationalTime(48.0, 24.0));
+    });
+
+    tests.add_test("test_timecode_formatter", [] {
+        TimecodeFormatter formatter(24);
+        assertEqual(formatter.rate(), 24.0);
+
+        RationalTime t(1 + 24 * (2 + 60 * (3 + 60 * 4)), 24);
+        assertEqual(formatter.to_timecode(t), std::string("04:03:02:01"));
+        assertEqual(formatter.to_timecode(t), t.to_timecode());
+        assertEqual(
+            formatter.to_timecode(t.rescaled_to(48)),
+            t.rescaled_to(48).to_timecode(24, IsDropFrameRate::InferFromRate));
+        assertEqual(formatter.from_timecode("04:03:02:01").value(), t.value());
+
+        char buffer[TimecodeFormatter::buffer_size];
+        assertEqual(formatter.format(t, buffer, sizeof(buffer)), size_t(11));
+        assertEqual(std::string(buffer), std::string("04:03:02:01"));
+
+        // truncated output reports the full length, as snprintf does
+        assertEqual(formatter.format(t, buffer, 6), size_t(11));
+        assertEqual(std::string(buffer), std::string("04:03"));
+
+        ErrorStatus err;
+        RationalTime negative(-1, 24);
+        assertEqual(
+            formatter.format(negative, buffer, sizeof(buffer), &err),
+            size_t(0));
+        assertEqual(err.outcome, ErrorStatus::NEGATIVE_VALUE);
+    });
+
+    tests.add_test("test_timecode_formatter_drop_frame", [] {
+        double            rate = 30000 / 1001.0;
+        TimecodeFormatter formatter(rate, IsDropFrameRate::ForceYes);
+        for (double frame: { 0.0, 1799.0, 1800.0, 17982.0, 107892.0 })
+        {
+            RationalTime t(frame, rate);
+            std::string  timecode = formatter.to_timecode(t);
+            assertEqual(
+                timecode,
+                t.to_timecode(rate, IsDropFrameRate::ForceYes));
+            assertEqual(formatter.from_timecode(timecode).value(), frame);
+        }
+        assertEqual(
+            formatter.to_timecode(RationalTime(1800, rate)),
+            std::string("00:01:00;02"));
+
+        ErrorStatus err;
+        TimecodeFormatter(24, IsDropFrameRate::ForceYes)
+            .to_timecode(RationalTime(1, 24), &err);
+        assertEqual(
+            err.outcome,
+            ErrorStatus::INVALID_RATE_FOR_DROP_FRAME_TIMECODE);
+
+        TimecodeFormatter(23).from_timecode("00:00:00:01", &err);
+        assertEqual(err.outcome, ErrorStatus::INVALID_TIMECODE_RATE);
+    });
+
+    tests.add_test("test_tick_time", [] {
+        for (double rate: { 24000 / 1001.0, 30000 / 1001.0, 48000.0, 25.0 })
+        {
+            assertTrue(TickTime::ticks_per_unit(rate) != 0);
+            RationalTime t(86399, rate);
+            ErrorStatus  err;
+            TickTime     ticks = TickTime::from_rational_time(t, &err);
+            assertFalse(is_error(err));
+            assertEqual(ticks.to_rational_time(rate).value(), t.value());
+        }
+        assertEqual(TickTime::ticks_per_unit(29.97), int64_t(0));
+
+        ErrorStatus err;
+        TickTime::from_rational_time(RationalTime(1, 29.97), &err);
+        assertEqual(err.outcome, ErrorStatus::INEXACT_TICK_CONVERSION);
+
+        double   rate = 24000 / 1001.0;
+        TickTime sum;
+        for (int i = 0; i < 100000; ++i)
+        {
+            sum += TickTime::from_rational_time(RationalTime(1, rate));
+        }
+        assertEqual(sum.to_rational_time(rate).value(), 100000.0);
+        assertEqual(sum - sum, TickTime());
+        assertTrue(-sum < sum);
+    });
+
     tests.run(argc, argv);
     return 0;
 }
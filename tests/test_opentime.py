@@ -5,6 +5,7 @@
 
 import opentimelineio as otio
 
+import array
 import unittest
 import copy
 
@@ -239,6 +240,34 @@ class TestTime(unittest.TestCase):
         with self.assertRaises(ValueError):
             otio.opentime.to_timecode(t, 25)
 
+    def test_timecode_formatter(self):
+        formatter = otio.opentime.TimecodeFormatter(24)
+        self.assertEqual(formatter.rate, 24)
+        self.assertIsNone(formatter.drop_frame)
+
+        times = [otio.opentime.RationalTime(v, 24) for v in (0, 1, 86399)]
+        timecodes = formatter.to_timecodes(times)
+        self.assertEqual(timecodes, [t.to_timecode(24) for t in times])
+        self.assertEqual(formatter.to_timecode(times[1]), "00:00:00:01")
+        self.assertEqual(formatter.from_timecodes(timecodes), times)
+        self.assertEqual(formatter.from_timecode("00:00:00:01"), times[1])
+
+        with self.assertRaises(ValueError):
+            formatter.to_timecode(otio.opentime.RationalTime(-1, 24))
+        with self.assertRaises(ValueError):
+            formatter.from_timecodes(["00:00:00:01", "bogus"])
+
+        dropframe = otio.opentime.TimecodeFormatter(29.97, drop_frame=True)
+        self.assertTrue(dropframe.drop_frame)
+        self.assertEqual(
+            dropframe.to_timecode(otio.opentime.RationalTime(1800, 29.97)),
+            otio.opentime.RationalTime(1800, 29.97).to_timecode(29.97, True)
+        )
+        with self.assertRaises(ValueError):
+            otio.opentime.TimecodeFormatter(24, drop_frame=True).to_timecode(
+                times[0]
+            )
+
     def test_dropframe_timecode_2997fps(self):
         """Test drop frame in action. Focused on minute roll overs
 
@@ -1393,5 +1422,346 @@ class TestTimeRange(unittest.TestCase):
         self.assertNotEqual(frame, otio.opentime.to_frames(t, 12))
 
 
+class TestTimeArrays(unittest.TestCase):
+
+    def test_rational_time_array(self):
+        times = otio.opentime.RationalTimeArray([0, 12, 48.5], 24)
+        self.assertEqual(len(times), 3)
+        self.assertEqual(times[1], otio.opentime.RationalTime(12, 24))
+        self.assertEqual(times[-1], otio.opentime.RationalTime(48.5, 24))
+        with self.assertRaises(IndexError):
+            times[3]
+
+        self.assertEqual(
+            list(times),
+            [
+                otio.opentime.RationalTime(0, 24),
+                otio.opentime.RationalTime(12, 24),
+                otio.opentime.RationalTime(48.5, 24),
+            ]
+        )
+        self.assertEqual(
+            otio.opentime.RationalTimeArray(times.tolist()).tolist(),
+            times.tolist()
+        )
+
+        mixed = otio.opentime.RationalTimeArray([1, 1], [24, 30])
+        self.assertEqual(mixed.rates.tolist(), [24, 30])
+        with self.assertRaises(ValueError):
+            otio.opentime.RationalTimeArray([1, 1], [24])
+
+    def test_rational_time_array_buffers(self):
+        times = otio.opentime.RationalTimeArray(
+            array.array('d', [0, 12, 48]),
+            24
+        )
+        values = memoryview(times.values)
+        self.assertEqual(values.format, 'd')
+        self.assertEqual(values.tolist(), [0, 12, 48])
+
+        # the buffer shares the storage of the array
+        values[1] = 36
+        self.assertEqual(times[1], otio.opentime.RationalTime(36, 24))
+
+        copied = copy.copy(times)
+        values[1] = 12
+        self.assertEqual(copied[1], otio.opentime.RationalTime(36, 24))
+
+        frames = memoryview(times.to_frames())
+        self.assertEqual(frames.tolist(), [0, 12, 48])
+        self.assertTrue(frames.readonly)
+
+        # buffers of rates are used per element, and strided buffers are read
+        strided = otio.opentime.RationalTimeArray(
+            memoryview(array.array('d', [0, 1, 2, 3, 4, 5]))[::2],
+            times.rates
+        )
+        self.assertEqual(strided.values.tolist(), [0, 2, 4])
+        self.assertEqual(strided.rates.tolist(), [24, 24, 24])
+        with self.assertRaises(ValueError):
+            otio.opentime.RationalTimeArray([1], times.rates)
+
+    def test_rational_time_array_comparisons(self):
+        times = otio.opentime.RationalTimeArray([0, 12, 24, 36], 24)
+        one_second = otio.opentime.RationalTime(1, 1)
+
+        self.assertEqual(
+            list(times == otio.opentime.RationalTime(12, 24)),
+            [False, True, False, False]
+        )
+        self.assertEqual(
+            list(times != otio.opentime.RationalTime(12, 24)),
+            [True, False, True, True]
+        )
+        self.assertEqual(list(times < one_second), [True, True, False, False])
+        self.assertEqual(list(times <= one_second), [True, True, True, False])
+        self.assertEqual(list(times > one_second), [False, False, False, True])
+        self.assertEqual(list(times >= one_second), [False, False, True, True])
+
+        # a time on the left is compared with each time of the array
+        self.assertEqual(list(one_second < times), [False, False, False, True])
+        self.assertEqual(
+            list(one_second == times),
+            [False, False, True, False]
+        )
+
+        reversed_times = otio.opentime.RationalTimeArray([36, 24, 12, 0], 24)
+        self.assertEqual(
+            list(times < reversed_times),
+            [True, True, False, False]
+        )
+        self.assertEqual(memoryview(times == times).format, '?')
+        with self.assertRaises(ValueError):
+            times == otio.opentime.RationalTimeArray([0], 24)
+        with self.assertRaises(TypeError):
+            one_second < 5
+
+    def test_rational_time_array_slices(self):
+        times = otio.opentime.RationalTimeArray([0, 12, 24, 36], [24, 24, 30, 30])
+
+        self.assertEqual(times[1:3].values.tolist(), [12, 24])
+        self.assertEqual(times[1:3].rates.tolist(), [24, 30])
+        self.assertEqual(times[::-2].values.tolist(), [36, 12])
+        self.assertEqual(len(times[10:]), 0)
+
+        # slices are copies
+        sliced = times[:2]
+        memoryview(sliced.values)[0] = 6
+        self.assertEqual(times[0], otio.opentime.RationalTime(0, 24))
+
+    def test_rational_time_array_conversions(self):
+        times = otio.opentime.RationalTimeArray([0, 12, 48], 24)
+        for i, rescaled in enumerate(times.rescaled_to(48)):
+            self.assertTrue(rescaled.strictly_equal(times[i].rescaled_to(48)))
+        self.assertEqual(times.value_rescaled_to(48).tolist(), [0, 24, 96])
+        self.assertEqual(times.to_seconds().tolist(), [0, 0.5, 2])
+        self.assertEqual(times.to_frames(12).tolist(), [0, 6, 24])
+
+        timecodes = times.to_timecode()
+        self.assertEqual(timecodes, [t.to_timecode() for t in times])
+        self.assertEqual(
+            times.to_timecode(24, False),
+            [t.to_timecode(24, False) for t in times]
+        )
+        self.assertEqual(
+            otio.opentime.RationalTimeArray.from_timecode(
+                timecodes,
+                24
+            ).tolist(),
+            times.tolist()
+        )
+        with self.assertRaises(ValueError):
+            otio.opentime.RationalTimeArray.from_timecode(["bogus"], 24)
+
+        self.assertEqual(
+            otio.opentime.RationalTimeArray.from_frames([0, 12], 24).tolist(),
+            [otio.opentime.from_frames(0, 24), otio.opentime.from_frames(12, 24)]
+        )
+        self.assertEqual(
+            otio.opentime.RationalTimeArray.from_seconds([0.5], 24)[0],
+            otio.opentime.from_seconds(0.5, 24)
+        )
+
+    def test_rational_time_array_arithmetic(self):
+        times = otio.opentime.RationalTimeArray([0, 12, 48], 24)
+        offset = otio.opentime.RationalTime(1, 48)
+
+        self.assertEqual(
+            (times + offset).tolist(),
+            [t + offset for t in times]
+        )
+        self.assertEqual(
+            (offset + times).tolist(),
+            [offset + t for t in times]
+        )
+        self.assertEqual(
+            (times - offset).tolist(),
+            [t - offset for t in times]
+        )
+        self.assertEqual(
+            (offset - times).tolist(),
+            [offset - t for t in times]
+        )
+        self.assertEqual((-times).tolist(), [-t for t in times])
+        self.assertEqual(
+            (times + times).tolist(),
+            [t + t for t in times]
+        )
+        with self.assertRaises(ValueError):
+            times + otio.opentime.RationalTimeArray([1], 24)
+
+    def test_time_range_array(self):
+        ranges = otio.opentime.TimeRangeArray(
+            [
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(0, 24),
+                    otio.opentime.RationalTime(24, 24)
+                ),
+                otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(24, 24),
+                    otio.opentime.RationalTime(24, 24)
+                ),
+            ]
+        )
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual(ranges.start_time.values.tolist(), [0, 24])
+        self.assertEqual(
+            ranges.end_time_exclusive().tolist(),
+            [r.end_time_exclusive() for r in ranges]
+        )
+
+        time = otio.opentime.RationalTime(30, 24)
+        self.assertEqual(ranges.contains(time).tolist(), [False, True])
+        self.assertEqual(ranges.overlaps(time).tolist(), [False, True])
+        self.assertEqual(
+            ranges.contains(
+                otio.opentime.RationalTimeArray([12, 12], 24)
+            ).tolist(),
+            [True, False]
+        )
+
+        other = otio.opentime.TimeRange(
+            otio.opentime.RationalTime(12, 24),
+            otio.opentime.RationalTime(24, 24)
+        )
+        self.assertEqual(
+            ranges.overlaps(other).tolist(),
+            [r.overlaps(other) for r in ranges]
+        )
+        self.assertEqual(
+            ranges.contains(other).tolist(),
+            [r.contains(other) for r in ranges]
+        )
+
+        with self.assertRaises(ValueError):
+            otio.opentime.TimeRangeArray(
+                otio.opentime.RationalTimeArray([0, 1], 24),
+                otio.opentime.RationalTimeArray([1], 24)
+            )
+
+
+class TestTimeRangeSet(unittest.TestCase):
+
+    def _range(self, start, duration, rate=24):
+        return otio.opentime.TimeRange(
+            otio.opentime.RationalTime(start, rate),
+            otio.opentime.RationalTime(duration, rate)
+        )
+
+    def test_normalize(self):
+        ranges = otio.opentime.TimeRangeSet(
+            [
+                self._range(10, 5),
+                self._range(0, 5),
+                self._range(3, 4),
+                self._range(20, 0),
+            ]
+        )
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual(
+            list(ranges),
+            [self._range(0, 7), self._range(10, 5)]
+        )
+        self.assertEqual(ranges[-1], self._range(10, 5))
+        self.assertEqual(ranges.bounds(), self._range(0, 15))
+        self.assertEqual(
+            ranges.duration(24),
+            otio.opentime.RationalTime(12, 24)
+        )
+        self.assertEqual(len(otio.opentime.TimeRangeSet()), 0)
+
+        ranges.add(self._range(7, 3))
+        self.assertEqual(list(ranges), [self._range(0, 15)])
+
+    def test_set_operations(self):
+        ranges = otio.opentime.TimeRangeSet(
+            [self._range(0, 7), self._range(10, 5)]
+        )
+        other = otio.opentime.TimeRangeSet([self._range(5, 7)])
+
+        self.assertEqual(
+            ranges | other,
+            otio.opentime.TimeRangeSet([self._range(0, 15)])
+        )
+        self.assertEqual(ranges.union(other), ranges | other)
+        self.assertEqual(
+            list(ranges & other),
+            [self._range(5, 2), self._range(10, 2)]
+        )
+        self.assertEqual(ranges.intersection(other), ranges & other)
+        self.assertEqual(
+            list(ranges - other),
+            [self._range(0, 5), self._range(12, 3)]
+        )
+        self.assertEqual(ranges.difference(other), ranges - other)
+        self.assertEqual(
+            list(ranges.clamped(self._range(5, 7))),
+            [self._range(5, 2), self._range(10, 2)]
+        )
+
+        self.assertEqual(list(ranges.gaps()), [self._range(7, 3)])
+        self.assertEqual(
+            list(ranges.gaps(self._range(5, 20))),
+            [self._range(7, 3), self._range(15, 10)]
+        )
+
+    def test_queries(self):
+        ranges = otio.opentime.TimeRangeSet(
+            [self._range(0, 7), self._range(10, 5)]
+        )
+        self.assertTrue(ranges.contains(otio.opentime.RationalTime(6, 24)))
+        self.assertFalse(ranges.contains(otio.opentime.RationalTime(7, 24)))
+        self.assertIn(otio.opentime.RationalTime(20, 48), ranges)
+        self.assertIn(self._range(1, 6), ranges)
+        self.assertNotIn(self._range(1, 10), ranges)
+        self.assertTrue(ranges.covers(self._range(10, 5)))
+        self.assertTrue(ranges.overlaps(self._range(6, 10)))
+        self.assertFalse(ranges.overlaps(self._range(7, 3)))
+
+    def test_epsilon(self):
+        a = self._range(0, 1, 1)
+        b = self._range(1 + otio.opentime.TimeRangeSet().epsilon_s / 2, 1, 1)
+        self.assertEqual(len(otio.opentime.TimeRangeSet([a, b])), 1)
+        self.assertEqual(
+            len(otio.opentime.TimeRangeSet([a, b], epsilon_s=0)),
+            2
+        )
+
+
+class TestTickTime(unittest.TestCase):
+
+    def test_round_trip(self):
+        for rate in (24000 / 1001, 30000 / 1001, 48000, 25):
+            self.assertNotEqual(otio.opentime.TickTime.ticks_per_unit(rate), 0)
+            t = otio.opentime.RationalTime(86399, rate)
+            ticks = otio.opentime.TickTime.from_rational_time(t)
+            self.assertEqual(ticks.to_rational_time(rate).value, t.value)
+
+    def test_inexact(self):
+        t = otio.opentime.RationalTime(1, 29.97)
+        with self.assertRaises(ValueError):
+            otio.opentime.TickTime.from_rational_time(t)
+        ticks = otio.opentime.TickTime.from_rational_time(t, allow_rounding=True)
+        self.assertAlmostEqual(ticks.to_seconds(), t.to_seconds())
+
+    def test_arithmetic(self):
+        rate = 24000 / 1001
+        frame = otio.opentime.TickTime.from_rational_time(
+            otio.opentime.RationalTime(1, rate)
+        )
+        total = otio.opentime.TickTime()
+        for _ in range(10000):
+            total += frame
+        self.assertEqual(total.to_rational_time(rate).value, 10000)
+        self.assertEqual(total.ticks, frame.ticks * 10000)
+        self.assertLess(-total, total)
+        self.assertEqual(total - total, otio.opentime.TickTime())
+        self.assertEqual(hash(frame), hash(otio.opentime.TickTime(frame.ticks)))
+        self.assertEqual(
+            repr(otio.opentime.TickTime(5)),
+            "otio.opentime.TickTime(ticks=5)"
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
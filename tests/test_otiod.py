@@ -41,6 +41,54 @@ class OTIODTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
             result = otio.adapters.read_from_file(otiod_path)
             self.assertIsNotNone(result)
 
+    def test_threads_and_progress(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            # Create a timeline with several media references
+            tl = otio.schema.Timeline()
+            tr = otio.schema.Track()
+            tl.tracks.append(tr)
+            for i in range(8):
+                ref = otio.schema.ExternalReference("video{}.mov".format(i))
+                tr.append(otio.schema.Clip(media_reference=ref))
+                with open(os.path.join(temp_dir, ref.target_url), "w") as fo:
+                    fo.write(str(i) * i)
+
+            # Write with several threads
+            progress = []
+            otiod_path = os.path.join(temp_dir, "threads.otiod")
+            otio.adapters.write_to_file(
+                tl,
+                otiod_path,
+                relative_media_base_dir=temp_dir,
+                num_threads=4,
+                copy_policy=otio._otio.bundle.MediaCopyPolicy.hardlink_if_possible,
+                progress_callback=lambda *args: progress.append(args)
+            )
+            self.assertEqual(len(progress), 8)
+            self.assertEqual(progress[-1], (8, 8, 28, 28))
+            self.assertEqual([p[0] for p in progress], list(range(1, 9)))
+            for i in range(8):
+                path = os.path.join(
+                    otiod_path, "media", "video{}.mov".format(i)
+                )
+                with open(path) as fi:
+                    self.assertEqual(fi.read(), str(i) * i)
+
+            # An exception in the callback stops writing
+            def cancel(files_written, files_total, bytes_written, bytes_total):
+                if files_written == 4:
+                    raise RuntimeError("cancelled")
+
+            with self.assertRaises(OSError):
+                otio.adapters.write_to_file(
+                    tl,
+                    os.path.join(temp_dir, "cancelled.otiod"),
+                    relative_media_base_dir=temp_dir,
+                    num_threads=4,
+                    progress_callback=cancel
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
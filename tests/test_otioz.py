@@ -6,6 +6,7 @@
 """Tests for the OTIOZ adapter."""
 
 import unittest
+import io
 import os
 import pathlib
 import tempfile
@@ -13,6 +14,10 @@ import tempfile
 import opentimelineio as otio
 import opentimelineio.test_utils as otio_test_utils
 
+from opentimelineio.adapters import (
+    otioz,
+)
+
 
 class OTIOZTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
     def test_round_trip(self):
@@ -41,6 +46,102 @@ class OTIOZTester(unittest.TestCase, otio_test_utils.OTIOAssertions):
             result = otio.adapters.read_from_file(otioz_path)
             self.assertIsNotNone(result)
 
+    def test_threads_and_progress(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            # Create a timeline with several media references
+            tl = otio.schema.Timeline()
+            tr = otio.schema.Track()
+            tl.tracks.append(tr)
+            for i in range(8):
+                ref = otio.schema.ExternalReference("video{}.mov".format(i))
+                tr.append(otio.schema.Clip(media_reference=ref))
+                with open(os.path.join(temp_dir, ref.target_url), "w") as fo:
+                    fo.write(str(i) * i)
+
+            # Write with several threads
+            progress = []
+            otioz_path = os.path.join(temp_dir, "threads.otioz")
+            otio.adapters.write_to_file(
+                tl,
+                otioz_path,
+                relative_media_base_dir=temp_dir,
+                num_threads=4,
+                progress_callback=lambda *args: progress.append(args)
+            )
+            self.assertEqual(len(progress), 8)
+            self.assertEqual(progress[-1], (8, 8, 28, 28))
+            self.assertEqual([p[0] for p in progress], list(range(1, 9)))
+            otio.adapters.read_from_file(
+                otioz_path,
+                extract_to_directory=os.path.join(temp_dir, "extract")
+            )
+            for i in range(8):
+                path = os.path.join(
+                    temp_dir, "extract", "media", "video{}.mov".format(i)
+                )
+                with open(path) as fi:
+                    self.assertEqual(fi.read(), str(i) * i)
+
+            # An exception in the callback stops writing
+            def cancel(files_written, files_total, bytes_written, bytes_total):
+                if files_written == 4:
+                    raise RuntimeError("cancelled")
+
+            with self.assertRaises(OSError):
+                otio.adapters.write_to_file(
+                    tl,
+                    os.path.join(temp_dir, "cancelled.otioz"),
+                    relative_media_base_dir=temp_dir,
+                    num_threads=4,
+                    progress_callback=cancel
+                )
+
+    def test_open_media(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+
+            # Create a timeline with a media reference
+            tl = otio.schema.Timeline()
+            tr = otio.schema.Track()
+            tl.tracks.append(tr)
+            ref = otio.schema.ExternalReference("video.mov")
+            tr.append(otio.schema.Clip(media_reference=ref))
+            data = bytes(range(256)) * 100
+            with open(os.path.join(temp_dir, ref.target_url), "wb") as fo:
+                fo.write(data)
+
+            otioz_path = os.path.join(temp_dir, "media.otioz")
+            otio.adapters.write_to_file(
+                tl,
+                otioz_path,
+                relative_media_base_dir=temp_dir)
+
+            # Find the media in the bundle
+            result = otio.adapters.read_from_file(otioz_path)
+            name = result.find_clips()[0].media_reference.target_url
+            entries = otioz.media_entries(otioz_path)
+            self.assertEqual(list(entries), [name])
+            self.assertEqual(entries[name].size, len(data))
+            with open(otioz_path, "rb") as fi:
+                fi.seek(entries[name].offset)
+                self.assertEqual(fi.read(len(data)), data)
+
+            # Read and seek in the media without extracting it
+            with otioz.open_media(otioz_path, name) as fi:
+                self.assertEqual(fi.read(), data)
+                fi.seek(1000)
+                self.assertEqual(fi.read(10), data[1000:1010])
+                self.assertEqual(fi.tell(), 1010)
+                fi.seek(-5, io.SEEK_END)
+                self.assertEqual(fi.read(), data[-5:])
+                self.assertEqual(fi.read(), b"")
+                mapped = fi.mmap()
+            self.assertEqual(mapped, data)
+            mapped.release()
+
+            with self.assertRaises(FileNotFoundError):
+                otioz.open_media(otioz_path, "media/missing.mov")
+
 
 if __name__ == "__main__":
     unittest.main()
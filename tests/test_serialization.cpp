@@ -4,10 +4,12 @@
 #include "utils.h"
 
 #include <opentimelineio/clip.h>
+#include <opentimelineio/deserialization.h>
 #include <opentimelineio/safely_typed_any.h>
 #include <opentimelineio/serializableObject.h>
 #include <opentimelineio/serializableObjectWithMetadata.h>
 #include <opentimelineio/serialization.h>
+#include <opentimelineio/stack.h>
 #include <opentimelineio/timeline.h>
 #include <opentimelineio/track.h>
 
@@ -143,6 +145,184 @@ main(int argc, char** argv)
         assert(cloned == nullptr);
     });
 
+    tests.add_test("deserialize in parallel", [] {
+        SerializableObject::Retainer<Timeline> tl = new Timeline("tl");
+        for (int i = 0; i < 5; ++i)
+        {
+            SerializableObject::Retainer<Track> tr =
+                new Track(std::to_string(i));
+            for (int j = 0; j < 3; ++j)
+            {
+                SerializableObject::Retainer<Clip> cl = new Clip(
+                    std::to_string(i) + "." + std::to_string(j),
+                    nullptr,
+                    TimeRange(RationalTime(0, 24), RationalTime(10 + j, 24)));
+                tr->append_child(cl);
+            }
+            tl->tracks()->append_child(tr);
+        }
+
+        OTIO_NS::ErrorStatus err;
+        auto                 json = tl->to_json_string(&err);
+        assertFalse(is_error(err));
+
+        DeserializeOptions options;
+        options.num_threads = 3;
+        std::any serial, parallel;
+        assertTrue(deserialize_json_from_string(json, &serial, &err));
+        assertTrue(
+            deserialize_json_from_string(json, &parallel, options, &err));
+        assertFalse(is_error(err));
+
+        auto serial_tl = dynamic_retainer_cast<Timeline>(
+            std::any_cast<SerializableObject::Retainer<>>(serial));
+        auto parallel_tl = dynamic_retainer_cast<Timeline>(
+            std::any_cast<SerializableObject::Retainer<>>(parallel));
+        assertTrue(serial_tl.value->is_equivalent_to(*parallel_tl.value));
+        assertEqual(parallel_tl->tracks()->children().size(), size_t(5));
+        for (auto const& child: parallel_tl->tracks()->children())
+        {
+            assertEqual(child->parent(), parallel_tl->tracks());
+        }
+    });
+
+    tests.add_test("deserialize in parallel with references", [] {
+        auto json = R"CONTENT({
+    "OTIO_SCHEMA": "Stack.1",
+    "name": "stack",
+    "metadata": {},
+    "children": [
+        {
+            "OTIO_SCHEMA": "Track.1",
+            "name": "a",
+            "kind": "Video",
+            "children": [],
+            "metadata": {
+                "ref": {
+                    "OTIO_SCHEMA": "SerializableObjectRef.1",
+                    "id": "shared"
+                }
+            }
+        },
+        {
+            "OTIO_SCHEMA": "Track.1",
+            "name": "b",
+            "kind": "Video",
+            "children": [],
+            "metadata": {
+                "shared": {
+                    "OTIO_SCHEMA": "SerializableObjectWithMetadata.1",
+                    "OTIO_REF_ID": "shared",
+                    "name": "shared"
+                }
+            }
+        }
+    ]
+})CONTENT";
+
+        DeserializeOptions options;
+        options.num_threads = 2;
+        OTIO_NS::ErrorStatus err;
+        std::any             result;
+        assertTrue(deserialize_json_from_string(json, &result, options, &err));
+        assertFalse(is_error(err));
+
+        auto stack = dynamic_retainer_cast<Stack>(
+            std::any_cast<SerializableObject::Retainer<>>(result));
+        auto a = dynamic_cast<Track*>(stack->children()[0].value);
+        auto b = dynamic_cast<Track*>(stack->children()[1].value);
+        assertEqual(
+            std::any_cast<SerializableObject::Retainer<>>(a->metadata()["ref"])
+                .value,
+            std::any_cast<SerializableObject::Retainer<>>(
+                b->metadata()["shared"])
+                .value);
+    });
+
+    tests.add_test("deserialize in parallel reports serial errors", [] {
+        auto json = R"CONTENT({
+    "OTIO_SCHEMA": "Stack.1",
+    "name": "stack",
+    "metadata": {},
+    "children": [
+        {
+            "OTIO_SCHEMA": "Track.1",
+            "name": "a",
+            "kind": "Video",
+            "children": []
+        },
+        {
+            "OTIO_SCHEMA": "Track.1",
+            "name": "b",
+            "kind": "Video",
+            "children": [],
+            "metadata": {
+                "ref": {
+                    "OTIO_SCHEMA": "SerializableObjectRef.1",
+                    "id": "missing"
+                }
+            }
+        }
+    ]
+})CONTENT";
+
+        DeserializeOptions options;
+        options.num_threads = 2;
+        OTIO_NS::ErrorStatus serial_err, parallel_err;
+        std::any             serial, parallel;
+        assertFalse(deserialize_json_from_string(json, &serial, &serial_err));
+        assertFalse(deserialize_json_from_string(
+            json,
+            &parallel,
+            options,
+            &parallel_err));
+        assertEqual(serial_err.outcome, parallel_err.outcome);
+        assertEqual(serial_err.details, parallel_err.details);
+    });
+
+    tests.add_test("deserialize without line numbers", [] {
+        auto json = R"CONTENT({
+    "OTIO_SCHEMA": "Track.1",
+    "name": "track",
+    "kind": "Video",
+    "children": [
+        {
+            "OTIO_SCHEMA": "Clip.2",
+            "name": "clip without media references"
+        }
+    ]
+})CONTENT";
+
+        DeserializeOptions options;
+        options.track_line_numbers = false;
+        OTIO_NS::ErrorStatus tracked_err, untracked_err;
+        std::any             tracked, untracked;
+        assertFalse(deserialize_json_from_string(json, &tracked, &tracked_err));
+        assertFalse(deserialize_json_from_string(
+            json,
+            &untracked,
+            options,
+            &untracked_err));
+        assertEqual(tracked_err.outcome, untracked_err.outcome);
+        assertEqual(tracked_err.details, untracked_err.details);
+        assertNotEqual(
+            untracked_err.details.find("near line 9"),
+            std::string::npos);
+
+        SerializableObject::Retainer<Track> track(new Track("track"));
+        track->append_child(new Clip("clip"));
+        std::any             result;
+        OTIO_NS::ErrorStatus err;
+        assertTrue(deserialize_json_from_string(
+            track->to_json_string(),
+            &result,
+            options,
+            &err));
+        assertFalse(is_error(err));
+        auto decoded = std::any_cast<SerializableObject::Retainer<>>(result);
+        assertTrue(decoded->is_equivalent_to(*track));
+    });
+
     tests.run(argc, argv);
     return 0;
 }
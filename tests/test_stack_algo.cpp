@@ -4,7 +4,9 @@
 #include "opentime/timeRange.h"
 #include "utils.h"
 
+#include <opentimelineio/algo/editAlgorithm.h>
 #include <opentimelineio/clip.h>
+#include <opentimelineio/gap.h>
 #include <opentimelineio/stack.h>
 #include <opentimelineio/stackAlgorithm.h>
 #include <opentimelineio/track.h>
@@ -186,6 +188,214 @@ main(int argc, char** argv)
         assertEqual(result->duration().value(), 300);
     });
 
+    tests.add_test("test_flatten_stack_gaps", [] {
+        // 0    5    10   20             45   50                 100
+        // [C-] [        gap              ]
+        //      [gap][ B ][      gap          ]
+        // [                  A                                   ]
+        //
+        // should flatten to:
+        // [C-][A ][ B ][       A         ][A ][        A          ]
+        auto range = [](double start, double duration) {
+            return TimeRange(
+                RationalTime(start, 24),
+                RationalTime(duration, 24));
+        };
+
+        SerializableObject::Retainer<Track> tr_top = new Track();
+        tr_top->append_child(new Clip("C", nullptr, range(0, 5)));
+        tr_top->append_child(new Gap(RationalTime(40, 24)));
+
+        SerializableObject::Retainer<Track> tr_middle = new Track();
+        tr_middle->append_child(new Gap(RationalTime(10, 24)));
+        tr_middle->append_child(new Clip("B", nullptr, range(50, 10)));
+        tr_middle->append_child(new Gap(RationalTime(30, 24)));
+
+        SerializableObject::Retainer<Track> tr_bottom = new Track();
+        tr_bottom->append_child(new Clip("A", nullptr, range(0, 100)));
+
+        SerializableObject::Retainer<Stack> st = new Stack();
+        st->append_child(tr_bottom);
+        st->append_child(tr_middle);
+        st->append_child(tr_top);
+
+        OTIO_NS::ErrorStatus                err;
+        SerializableObject::Retainer<Track> result = flatten_stack(st, &err);
+        assertFalse(is_error(err));
+
+        std::vector<std::string> names;
+        std::vector<TimeRange>   ranges;
+        for (auto const& child: result->children())
+        {
+            names.push_back(child->name());
+            ranges.push_back(dynamic_cast<Item*>(child.value)->trimmed_range());
+        }
+        assertEqual(
+            names,
+            std::vector<std::string>({ "C", "A", "B", "A", "A", "A" }));
+        assertEqual(ranges[0], range(0, 5));
+        assertEqual(ranges[1], range(5, 5));
+        assertEqual(ranges[2], range(50, 10));
+        assertEqual(ranges[3], range(20, 25));
+        assertEqual(ranges[4], range(45, 5));
+        assertEqual(ranges[5], range(50, 50));
+        assertEqual(result->duration().value(), 100);
+    });
+
+    tests.add_test("test_top_clips_at_times", [] {
+        // 0    5    10   20             45   50                 100
+        // [C-] [        gap              ]
+        //      [gap][ B ][      gap          ]
+        // [                  A                                   ]
+        auto range = [](double start, double duration) {
+            return TimeRange(
+                RationalTime(start, 24),
+                RationalTime(duration, 24));
+        };
+
+        SerializableObject::Retainer<Track> tr_top = new Track();
+        tr_top->append_child(new Clip("C", nullptr, range(0, 5)));
+        tr_top->append_child(new Gap(RationalTime(40, 24)));
+
+        SerializableObject::Retainer<Clip> clip_b =
+            new Clip("B", nullptr, range(50, 10));
+        SerializableObject::Retainer<Track> tr_middle = new Track();
+        tr_middle->append_child(new Gap(RationalTime(10, 24)));
+        tr_middle->append_child(clip_b);
+        tr_middle->append_child(new Gap(RationalTime(30, 24)));
+
+        SerializableObject::Retainer<Track> tr_bottom = new Track();
+        tr_bottom->append_child(new Clip("A", nullptr, range(0, 100)));
+
+        SerializableObject::Retainer<Stack> st = new Stack();
+        st->append_child(tr_bottom);
+        st->append_child(tr_middle);
+        st->append_child(tr_top);
+
+        OTIO_NS::ErrorStatus err;
+        std::vector<TopClip> result = top_clips_at_times(
+            st,
+            range(0, 101),
+            RationalTime(1, 24),
+            &err);
+        assertFalse(is_error(err));
+        assertEqual(result.size(), 101);
+        for (int frame = 0; frame < 101; ++frame)
+        {
+            std::string name  = "A";
+            double      start = 0;
+            if (frame < 5)
+            {
+                name = "C";
+            }
+            else if (frame >= 10 && frame < 20)
+            {
+                name  = "B";
+                start = 40;
+            }
+            if (frame == 100)
+            {
+                assertFalse(result[frame].clip);
+                continue;
+            }
+            assertEqual(result[frame].clip->name(), name);
+            assertEqual(
+                result[frame].source_time,
+                RationalTime(start + frame, 24));
+        }
+
+        // Times that go backwards are searched again, and hidden clips are
+        // skipped.
+        clip_b->set_enabled(false);
+        result = top_clips_at_times(
+            st,
+            std::vector<RationalTime>({ RationalTime(15, 24),
+                                        RationalTime(2, 24),
+                                        RationalTime(1, 48),
+                                        RationalTime(50, 24) }),
+            &err);
+        assertFalse(is_error(err));
+        assertEqual(result.size(), 4);
+        assertEqual(result[0].clip->name(), std::string("A"));
+        assertEqual(result[0].source_time, RationalTime(15, 24));
+        assertEqual(result[1].clip->name(), std::string("C"));
+        assertEqual(result[2].clip->name(), std::string("C"));
+        assertEqual(result[2].source_time, RationalTime(1, 48));
+        assertEqual(result[3].clip->name(), std::string("A"));
+
+        top_clips_at_times(st, range(0, 10), RationalTime(0, 24), &err);
+        assertEqual(err.outcome, OTIO_NS::ErrorStatus::INVALID_TIME_RANGE);
+    });
+
+    tests.add_test("test_stack_flattener", [] {
+        auto range = [](double start, double duration) {
+            return TimeRange(
+                RationalTime(start, 24),
+                RationalTime(duration, 24));
+        };
+
+        SerializableObject::Retainer<Track> tr_top = new Track();
+        tr_top->append_child(new Clip("C", nullptr, range(0, 5)));
+        tr_top->append_child(new Gap(RationalTime(40, 24)));
+
+        SerializableObject::Retainer<Track> tr_bottom = new Track();
+        tr_bottom->append_child(new Clip("A", nullptr, range(0, 100)));
+
+        SerializableObject::Retainer<Stack> st = new Stack();
+        st->append_child(tr_bottom);
+        st->append_child(tr_top);
+
+        OTIO_NS::ErrorStatus err;
+        StackFlattener       flattener(st, &err);
+        assertFalse(is_error(err));
+
+        auto assert_flattened = [&] {
+            SerializableObject::Retainer<Track> result =
+                flatten_stack(st, &err);
+            assertFalse(is_error(err));
+            assertEqual(
+                flattener.flattened_track()->to_json_string(),
+                result->to_json_string());
+        };
+        assert_flattened();
+
+        // Overwrite part of the gap in the top track.
+        algo::overwrite(
+            new Clip("D", nullptr, range(0, 10)),
+            tr_top,
+            range(20, 10),
+            true,
+            nullptr,
+            &err);
+        assertFalse(is_error(err));
+        flattener.update(range(20, 10), &err);
+        assertFalse(is_error(err));
+        assert_flattened();
+
+        // Insert into the top track, which moves the rest of it.
+        algo::insert(
+            new Clip("E", nullptr, range(0, 10)),
+            tr_top,
+            RationalTime(10, 24),
+            true,
+            nullptr,
+            &err);
+        assertFalse(is_error(err));
+        flattener.update(range(10, 45), &err);
+        assertFalse(is_error(err));
+        assert_flattened();
+
+        std::vector<std::string> names;
+        for (auto const& child: flattener.flattened_track()->children())
+        {
+            names.push_back(child->name());
+        }
+        assertEqual(
+            names,
+            std::vector<std::string>(
+                { "C", "A", "E", "A", "D", "A", "A" }));
+    });
+
     tests.run(argc, argv);
     return 0;
 }
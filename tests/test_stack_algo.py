@@ -584,6 +584,33 @@ class StackAlgoTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertEqual(4, len(flat_track))
         self.assertEqual(flat_track[1].name, "test_transition")
 
+    def test_stack_flattener(self):
+        stack = otio.schema.Stack(children=[
+            self.trackZ,
+            self.trackDgE
+        ])
+        flattener = otio.algorithms.StackFlattener(stack)
+        self.assertOTIOEqual(
+            flattener.flattened_track,
+            otio.algorithms.flatten_stack(stack)
+        )
+
+        # fill the gap in the top track with a clip
+        gap = stack[1][1]
+        stack[1][1] = otio.schema.Clip(
+            name="G",
+            source_range=gap.source_range
+        )
+        flattener.update(stack[1].range_of_child_at_index(1))
+        self.assertEqual(
+            [child.name for child in flattener.flattened_track],
+            ["D", "G", "E"]
+        )
+        self.assertOTIOEqual(
+            flattener.flattened_track,
+            otio.algorithms.flatten_stack(stack)
+        )
+
     def test_top_child_at_time(self):
         stack = otio.schema.Stack(
             children=[
@@ -617,6 +644,46 @@ class StackAlgoTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         )
         self.assertEqual(top_child, self.trackDgE[0])
 
+    def test_top_clips_at_times(self):
+        stack = otio.schema.Stack(
+            children=[
+                self.trackABC,
+                self.trackDgE,
+            ]
+        )
+        stack_range = stack.trimmed_range()
+        times = [
+            otio.opentime.RationalTime(frame, 24)
+            for frame in range(int(stack_range.duration.value) + 1)
+        ]
+
+        results = otio.algorithms.top_clips_at_times(stack, stack_range)
+        self.assertEqual(len(results), len(times) - 1)
+        self.assertEqual(
+            results,
+            otio.algorithms.top_clips_at_times(stack, times)[:-1]
+        )
+
+        for t, (clip, source_time) in zip(times, results):
+            self.assertEqual(
+                clip,
+                otio.algorithms.top_clip_at_time(stack, t)
+            )
+            self.assertEqual(
+                source_time,
+                clip.trimmed_range().start_time
+                + t - clip.range_in_parent().start_time
+            )
+
+        # past the end of the stack
+        self.assertEqual(
+            otio.algorithms.top_clips_at_times(stack, times[-1:]),
+            [(None, None)]
+        )
+
+        with self.assertRaises(ValueError):
+            otio.algorithms.top_clips_at_times(self.trackABC, times)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,9 +4,12 @@
 #include "utils.h"
 
 #include <opentimelineio/clip.h>
+#include <opentimelineio/externalReference.h>
 #include <opentimelineio/timeline.h>
 #include <opentimelineio/track.h>
+#include <opentimelineio/transition.h>
 
+#include <cmath>
 #include <iostream>
 
 using namespace OTIO_NS;
@@ -61,6 +64,67 @@ main(int argc, char** argv)
         assertEqual(result.size(), 1);
         assertEqual(result[0].value, cl.value);
     });
+    tests.add_test("test_to_columns", [] {
+        SerializableObject::Retainer<ExternalReference> ref =
+            new ExternalReference("shot.mov");
+        SerializableObject::Retainer<Clip> cl0 = new Clip(
+            "a",
+            ref,
+            TimeRange(RationalTime(10, 24), RationalTime(24, 24)));
+        SerializableObject::Retainer<Transition> tx = new Transition(
+            "dissolve",
+            Transition::Type::SMPTE_Dissolve,
+            RationalTime(6, 24),
+            RationalTime(6, 24));
+        SerializableObject::Retainer<Clip> cl1 = new Clip(
+            "b",
+            nullptr,
+            TimeRange(RationalTime(0, 24), RationalTime(48, 24)));
+        SerializableObject::Retainer<Clip> cl2 = new Clip(
+            "a",
+            ref,
+            TimeRange(RationalTime(100, 24), RationalTime(12, 24)));
+        SerializableObject::Retainer<Track> tr0 = new Track();
+        tr0->append_child(cl0);
+        tr0->append_child(tx);
+        tr0->append_child(cl1);
+        SerializableObject::Retainer<Track> tr1 = new Track();
+        tr1->append_child(cl2);
+        SerializableObject::Retainer<Timeline> tl = new Timeline();
+        tl->tracks()->append_child(tr0);
+        tl->tracks()->append_child(tr1);
+
+        OTIO_NS::ErrorStatus err;
+        TimelineColumns      columns = tl->to_columns(&err);
+        assertFalse(is_error(err));
+        assertEqual(columns.track_index, std::vector<int64_t>{ 0, 0, 0, 1 });
+        assertEqual(
+            columns.schema_names,
+            std::vector<std::string>{ "Clip", "Transition" });
+        assertEqual(columns.schema_index, std::vector<int64_t>{ 0, 1, 0, 0 });
+        assertEqual(columns.start, std::vector<double>{ 0, 18, 24, 0 });
+        assertEqual(columns.duration, std::vector<double>{ 24, 12, 48, 12 });
+        assertEqual(columns.source_start[0], 10.0);
+        assertTrue(std::isnan(columns.source_start[1]));
+        assertEqual(columns.source_start[3], 100.0);
+        assertEqual(columns.rate, std::vector<double>{ 24, 24, 24, 24 });
+        assertEqual(
+            columns.names,
+            std::vector<std::string>{ "a", "dissolve", "b" });
+        assertEqual(columns.name_index, std::vector<int64_t>{ 0, 1, 2, 0 });
+        assertEqual(
+            columns.media_reference_index,
+            std::vector<int64_t>{ 0, -1, 1, 0 });
+        assertEqual(columns.media_references.size(), size_t(2));
+        assertEqual(columns.media_references[0].value, ref.value);
+
+        for (size_t i = 0; i < tr0->children().size(); ++i)
+        {
+            auto range = tr0->range_of_child_at_index(int(i), &err);
+            assertEqual(columns.start[i], range.start_time().value());
+            assertEqual(columns.duration[i], range.duration().value());
+        }
+    });
 
     tests.run(argc, argv);
     return 0;
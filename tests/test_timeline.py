@@ -583,6 +583,123 @@ class TimelineTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], cl)
 
+    def test_to_columns(self):
+        ref = otio.schema.ExternalReference(target_url="shot.mov")
+        rate = 24
+        tr0 = otio.schema.Track()
+        tr0.append(
+            otio.schema.Clip(
+                name="a",
+                media_reference=ref,
+                source_range=otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(10, rate),
+                    otio.opentime.RationalTime(24, rate)
+                )
+            )
+        )
+        tr0.append(
+            otio.schema.Transition(
+                name="dissolve",
+                in_offset=otio.opentime.RationalTime(6, rate),
+                out_offset=otio.opentime.RationalTime(6, rate)
+            )
+        )
+        tr0.append(
+            otio.schema.Gap(
+                source_range=otio.opentime.TimeRange(
+                    duration=otio.opentime.RationalTime(48, rate)
+                )
+            )
+        )
+        tl = otio.schema.Timeline(tracks=[tr0, otio.schema.Track()])
+
+        columns = tl.to_columns()
+        self.assertEqual(list(memoryview(columns["track_index"])), [0, 0, 0])
+        self.assertEqual(columns["start"].tolist(), [0.0, 18.0, 24.0])
+        self.assertEqual(columns["duration"].tolist(), [24.0, 12.0, 48.0])
+        self.assertEqual(columns["rate"].tolist(), [24.0, 24.0, 24.0])
+        self.assertEqual(columns["source_start"].tolist()[0], 10.0)
+        self.assertTrue(math.isnan(columns["source_start"].tolist()[1]))
+        self.assertEqual(
+            [columns["schema_names"][i] for i in columns["schema_index"].tolist()],
+            ["Clip", "Transition", "Gap"]
+        )
+        self.assertEqual(
+            [columns["names"][i] for i in columns["name_index"].tolist()],
+            ["a", "dissolve", ""]
+        )
+        self.assertEqual(
+            columns["media_reference_index"].tolist(),
+            [0, -1, -1]
+        )
+        self.assertIs(columns["media_references"][0], ref)
+
+        for child, start in zip(tr0, columns["start"].tolist()):
+            self.assertEqual(child.range_in_parent().start_time.value, start)
+
+    def test_to_columns_read_timeline(self):
+        rt = otio.opentime.RationalTime(24, 24)
+        tl = otio.schema.Timeline(tracks=[
+            otio.schema.Track(children=[
+                otio.schema.Clip(
+                    media_reference=otio.schema.ExternalReference(
+                        target_url="shot.mov"
+                    ),
+                    source_range=otio.opentime.TimeRange(duration=rt)
+                )
+            ])
+        ])
+
+        # none of the media references of the read timeline have been
+        # returned to Python before
+        tl = otio.adapters.read_from_string(otio.adapters.write_to_string(tl))
+        columns = tl.to_columns()
+        del tl
+
+        self.assertEqual(len(columns["media_references"]), 1)
+        self.assertEqual(
+            columns["media_references"][0].target_url,
+            "shot.mov"
+        )
+
+    def test_edit_journal(self):
+        rt = otio.opentime.RationalTime(24, 24)
+        track = otio.schema.Track(children=[
+            otio.schema.Clip(
+                name=name,
+                source_range=otio.opentime.TimeRange(duration=rt)
+            )
+            for name in "abc"
+        ])
+        tl = otio.schema.Timeline(tracks=[track])
+        original = otio.adapters.write_to_string(tl)
+
+        journal = otio.core.EditJournal(tl)
+        self.assertIs(journal.timeline, tl)
+        self.assertFalse(journal.can_undo())
+
+        del track[0]
+        journal.begin_group()
+        track.append(otio.schema.Gap(duration=rt))
+        track[0].source_range = otio.opentime.TimeRange(rt, rt)
+        journal.end_group()
+        edited = otio.adapters.write_to_string(tl)
+
+        self.assertTrue(journal.undo())
+        self.assertEqual(len(track), 2)
+        self.assertEqual(track[0].source_range.start_time.value, 0)
+        self.assertTrue(journal.undo())
+        self.assertFalse(journal.undo())
+        self.assertEqual(otio.adapters.write_to_string(tl), original)
+
+        self.assertTrue(journal.redo())
+        self.assertTrue(journal.redo())
+        self.assertFalse(journal.can_redo())
+        self.assertEqual(otio.adapters.write_to_string(tl), edited)
+
+        journal.clear()
+        self.assertFalse(journal.can_undo())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,227 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright Contributors to the OpenTimelineIO project
+
+#include "utils.h"
+
+#include <opentimelineio/clip.h>
+#include <opentimelineio/externalReference.h>
+#include <opentimelineio/freezeFrame.h>
+#include <opentimelineio/linearTimeWarp.h>
+#include <opentimelineio/stack.h>
+#include <opentimelineio/timeline.h>
+#include <opentimelineio/timelineAlgorithm.h>
+#include <opentimelineio/track.h>
+#include <opentimelineio/trackAlgorithm.h>
+#include <opentimelineio/transition.h>
+#include <opentimelineio/typeRegistry.h>
+
+using namespace OTIO_NS;
+
+static TimeRange
+range_24(double start, double duration)
+{
+    return TimeRange(RationalTime(start, 24), RationalTime(duration, 24));
+}
+
+static Clip*
+clip_24(std::string const& url, double start, double duration)
+{
+    return new Clip(
+        url,
+        new ExternalReference(url, range_24(0, 1000)),
+        range_24(start, duration));
+}
+
+// A track with a property of its own, which trimming must keep.
+class LabeledTrack : public Track
+{
+public:
+    struct Schema
+    {
+        static auto constexpr name   = "LabeledTrack";
+        static int constexpr version = 1;
+    };
+
+    using Parent = Track;
+
+    std::string label;
+
+protected:
+    bool read_from(Reader& reader) override
+    {
+        return reader.read("label", &label) && Parent::read_from(reader);
+    }
+
+    void write_to(Writer& writer) const override
+    {
+        Parent::write_to(writer);
+        writer.write("label", label);
+    }
+};
+
+int
+main(int argc, char** argv)
+{
+    Tests tests;
+
+    tests.add_test("test_media_usage", [] {
+        // [ A: a.mov 10-20 ]T[ B: b.mov 100-110 ][ C: a.mov 18-30 ]
+        SerializableObject::Retainer<Track> track = new Track();
+        track->append_child(clip_24("a.mov", 10, 10));
+        track->append_child(new Transition(
+            "dissolve",
+            Transition::Type::SMPTE_Dissolve,
+            RationalTime(2, 24),
+            RationalTime(3, 24)));
+        track->append_child(clip_24("b.mov", 100, 10));
+        track->append_child(clip_24("a.mov", 18, 12));
+
+        OTIO_NS::ErrorStatus err;
+        auto                 usages = media_usage(track, RationalTime(), &err);
+        assertFalse(is_error(err));
+        assertEqual(usages.size(), size_t(2));
+        assertEqual(usages[0].clips.size(), size_t(2));
+        assertEqual(usages[0].clips[0]->name(), std::string("a.mov"));
+        assertEqual(usages[0].ranges.size(), size_t(1));
+        assertEqual(usages[0].ranges.ranges()[0], range_24(10, 20));
+        assertEqual(usages[1].ranges.size(), size_t(1));
+        assertEqual(usages[1].ranges.ranges()[0], range_24(98, 12));
+
+        usages = media_usage(track, RationalTime(5, 24), &err);
+        assertEqual(usages[0].ranges.ranges()[0], range_24(5, 30));
+        assertEqual(usages[1].ranges.ranges()[0], range_24(93, 22));
+
+        dynamic_cast<Item*>(track->children()[3].value)->set_enabled(false);
+        usages = media_usage(track, RationalTime(), &err);
+        assertEqual(usages[0].ranges.ranges()[0], range_24(10, 13));
+    });
+
+    tests.add_test("test_media_usage_nested", [] {
+        // A stack trimmed to frames 5-15 over a track with a clip played at
+        // double speed and a frozen clip.
+        SerializableObject::Retainer<Track> track = new Track();
+        Clip* fast = clip_24("fast.mov", 100, 10);
+        fast->effects().push_back(new LinearTimeWarp("fast", "", 2));
+        track->append_child(fast);
+        Clip* frozen = clip_24("frozen.mov", 50, 10);
+        frozen->effects().push_back(new FreezeFrame());
+        track->append_child(frozen);
+        track->append_child(clip_24("unused.mov", 0, 10));
+
+        SerializableObject::Retainer<Timeline> timeline = new Timeline();
+        Stack* stack = new Stack("nested", range_24(5, 10));
+        stack->append_child(track);
+        timeline->tracks()->append_child(new Track());
+        dynamic_cast<Track*>(timeline->tracks()->children()[0].value)
+            ->append_child(stack);
+
+        OTIO_NS::ErrorStatus err;
+        auto usages = media_usage(timeline, RationalTime(), &err);
+        assertFalse(is_error(err));
+        assertEqual(usages.size(), size_t(2));
+        assertEqual(usages[0].ranges.ranges()[0], range_24(110, 10));
+        assertEqual(usages[1].ranges.ranges()[0], range_24(50, 1));
+    });
+
+    tests.add_test("test_timeline_trimmed_to_range", [] {
+        // [ A: 0-50 ]T[ B: 100-150 ][ C: 200-250 ]
+        // [ D: 0-150                               ]
+        Track* track = new Track("top");
+        track->metadata()["reel"] = std::string("1");
+        track->append_child(clip_24("a.mov", 0, 50));
+        track->append_child(new Transition(
+            "dissolve",
+            Transition::Type::SMPTE_Dissolve,
+            RationalTime(5, 24),
+            RationalTime(5, 24)));
+        track->append_child(clip_24("b.mov", 100, 50));
+        track->append_child(clip_24("c.mov", 200, 50));
+
+        SerializableObject::Retainer<Timeline> timeline =
+            new Timeline("timeline");
+        timeline->tracks()->append_child(track);
+        timeline->tracks()->append_child(new Track());
+        dynamic_cast<Track*>(timeline->tracks()->children()[1].value)
+            ->append_child(clip_24("d.mov", 0, 150));
+
+        OTIO_NS::ErrorStatus                   err;
+        SerializableObject::Retainer<Timeline> trimmed =
+            timeline_trimmed_to_range(timeline, range_24(60, 60), &err);
+        assertFalse(is_error(err));
+        assertEqual(trimmed->name(), std::string("timeline"));
+        assertEqual(trimmed->tracks()->children().size(), size_t(2));
+
+        auto trimmed_track =
+            dynamic_cast<Track*>(trimmed->tracks()->children()[0].value);
+        assertEqual(trimmed_track->name(), std::string("top"));
+        assertEqual(
+            std::any_cast<std::string>(trimmed_track->metadata()["reel"]),
+            std::string("1"));
+        assertEqual(trimmed_track->children().size(), size_t(2));
+        assertEqual(
+            trimmed_track->children()[0]->name(),
+            std::string("b.mov"));
+        assertEqual(
+            dynamic_cast<Item*>(trimmed_track->children()[0].value)
+                ->trimmed_range(),
+            range_24(110, 40));
+        assertEqual(
+            dynamic_cast<Item*>(trimmed_track->children()[1].value)
+                ->trimmed_range(),
+            range_24(200, 20));
+        assertEqual(
+            dynamic_cast<Item*>(
+                dynamic_cast<Track*>(trimmed->tracks()->children()[1].value)
+                    ->children()[0]
+                    .value)
+                ->trimmed_range(),
+            range_24(60, 60));
+
+        // The original timeline is unchanged.
+        assertEqual(track->children().size(), size_t(4));
+        assertEqual(timeline->duration(), RationalTime(150, 24));
+
+        // A transition cannot be cut.
+        timeline_trimmed_to_range(timeline, range_24(48, 20), &err);
+        assertEqual(
+            err.outcome,
+            OTIO_NS::ErrorStatus::CANNOT_TRIM_TRANSITION);
+    });
+
+    tests.add_test("test_trimmed_to_range_keeps_track_subclass", [] {
+        TypeRegistry::instance().register_type<LabeledTrack>();
+
+        LabeledTrack* track = new LabeledTrack;
+        track->label        = "picture";
+        track->append_child(clip_24("a.mov", 0, 50));
+        track->append_child(clip_24("b.mov", 100, 50));
+
+        SerializableObject::Retainer<Timeline> timeline =
+            new Timeline("timeline");
+        timeline->tracks()->append_child(track);
+
+        OTIO_NS::ErrorStatus                       err;
+        SerializableObject::Retainer<LabeledTrack> trimmed_track(
+            dynamic_cast<LabeledTrack*>(
+                track_trimmed_to_range(track, range_24(60, 60), &err)));
+        assertFalse(is_error(err));
+        assertTrue(trimmed_track.value != nullptr);
+        assertEqual(trimmed_track->label, std::string("picture"));
+        assertEqual(trimmed_track->children().size(), size_t(1));
+        assertEqual(
+            trimmed_track->children()[0]->name(),
+            std::string("b.mov"));
+
+        SerializableObject::Retainer<Timeline> trimmed =
+            timeline_trimmed_to_range(timeline, range_24(60, 60), &err);
+        assertFalse(is_error(err));
+        auto timeline_track = dynamic_cast<LabeledTrack*>(
+            trimmed->tracks()->children()[0].value);
+        assertTrue(timeline_track != nullptr);
+        assertEqual(timeline_track->label, std::string("picture"));
+        assertEqual(timeline_track->children().size(), size_t(1));
+    });
+
+    tests.run(argc, argv);
+    return 0;
+}
@@ -353,6 +353,175 @@ class TimelineTrimmingTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
 
         self.assertJsonEqual(expected, trimmed)
 
+    def test_trim_stack_child_that_is_not_a_track(self):
+        original_timeline, _ = self.make_sample_timeline()
+        original_timeline.tracks.append(otio.schema.Stack(name="nested"))
+
+        # only tracks can be trimmed
+        with self.assertRaises(ValueError):
+            otio.algorithms.timeline_trimmed_to_range(
+                original_timeline,
+                otio.opentime.TimeRange(
+                    start_time=otio.opentime.RationalTime(12, 24),
+                    duration=otio.opentime.RationalTime(50, 24)
+                )
+            )
+
+
+class TimelineDeltaTests(unittest.TestCase, otio_test_utils.OTIOAssertions):
+    """ test harness for timeline delta functions """
+
+    def make_sample_timeline(self):
+        rate = 24
+        track = otio.schema.Track(name="V1")
+        for name in "ABCDE":
+            track.append(
+                otio.schema.Clip(
+                    name=name,
+                    source_range=otio.opentime.TimeRange(
+                        otio.opentime.RationalTime(0, rate),
+                        otio.opentime.RationalTime(10, rate)
+                    )
+                )
+            )
+
+        timeline = otio.schema.Timeline(name="sample")
+        timeline.tracks.append(track)
+        timeline.metadata["department"] = "edit"
+        return timeline
+
+    def test_delta_roundtrip(self):
+        base = self.make_sample_timeline()
+        target = base.deepcopy()
+        track = target.tracks[0]
+
+        # move, insert, remove and modify children and metadata
+        track.append(track.pop(0))
+        track.insert(2, otio.schema.Gap(name="gap"))
+        del track[1]
+        track[0].metadata["note"] = "check"
+        target.metadata["department"] = "color"
+
+        delta = otio.algorithms.timeline_delta(base, target)
+        result = otio.algorithms.apply_timeline_delta(base, delta)
+        self.assertJsonEqual(result, target)
+
+        # the base is left untouched
+        self.assertEqual([c.name for c in base.tracks[0]], list("ABCDE"))
+
+        ops = [operation["op"] for operation in delta.operations]
+        self.assertEqual(ops.count("move"), 1)
+        self.assertEqual(ops.count("remove"), 1)
+
+    def test_delta_is_compact(self):
+        base = self.make_sample_timeline()
+        target = base.deepcopy()
+        target.tracks[0][3].name = "renamed"
+
+        delta = otio.algorithms.timeline_delta(base, target)
+        empty_delta = otio.algorithms.timeline_delta(base, base)
+
+        self.assertEqual(list(empty_delta.operations), [])
+
+        # the renamed clip is matched to its original and only its name is
+        # replaced
+        self.assertEqual(len(delta.operations), 1)
+        self.assertEqual(delta.operations[0]["op"], "replace")
+        self.assertEqual(
+            delta.operations[0]["path"],
+            "/tracks/children/0/children/3/name"
+        )
+        self.assertEqual(delta.operations[0]["value"], "renamed")
+        self.assertJsonEqual(
+            otio.algorithms.apply_timeline_delta(base, delta),
+            target
+        )
+        self.assertLess(
+            len(otio.adapters.write_to_string(delta, "otio_json")),
+            len(otio.adapters.write_to_string(target, "otio_json"))
+        )
+
+    def test_delta_serialization(self):
+        base = self.make_sample_timeline()
+        target = base.deepcopy()
+        target.tracks[0].append(otio.schema.Clip(name="F"))
+
+        delta = otio.algorithms.timeline_delta(base, target)
+        decoded = otio.adapters.read_from_string(
+            otio.adapters.write_to_string(delta, "otio_json"),
+            "otio_json"
+        )
+        self.assertIsInstance(decoded, otio.schema.TimelineDelta)
+        self.assertIsInstance(
+            decoded.operations[0]["value"],
+            otio.schema.Clip
+        )
+
+        result = otio.algorithms.apply_timeline_delta(base, decoded)
+        self.assertJsonEqual(result, target)
+
+    def test_invalid_delta(self):
+        base = self.make_sample_timeline()
+        delta = otio.schema.TimelineDelta(
+            operations=[{"op": "remove", "path": "/tracks/children/5"}]
+        )
+
+        with self.assertRaises(otio.exceptions.InvalidTimelineDeltaError):
+            otio.algorithms.apply_timeline_delta(base, delta)
+
+
+class MediaUsageTests(unittest.TestCase):
+
+    def _range(self, start, duration):
+        return otio.opentime.TimeRange(
+            otio.opentime.RationalTime(start, 24),
+            otio.opentime.RationalTime(duration, 24)
+        )
+
+    def _clip(self, url, start, duration):
+        return otio.schema.Clip(
+            name=url,
+            media_reference=otio.schema.ExternalReference(
+                target_url=url,
+                available_range=self._range(0, 1000)
+            ),
+            source_range=self._range(start, duration)
+        )
+
+    def test_media_usage(self):
+        timeline = otio.schema.Timeline()
+        track = otio.schema.Track()
+        timeline.tracks.append(track)
+        track.append(self._clip("a.mov", 10, 10))
+        track.append(
+            otio.schema.Transition(
+                in_offset=otio.opentime.RationalTime(2, 24),
+                out_offset=otio.opentime.RationalTime(3, 24)
+            )
+        )
+        track.append(self._clip("b.mov", 100, 10))
+        fast = self._clip("a.mov", 18, 6)
+        fast.effects.append(otio.schema.LinearTimeWarp(time_scalar=2))
+        track.append(fast)
+
+        usages = otio.algorithms.media_usage(timeline)
+        self.assertEqual(
+            [usage.media_reference.target_url for usage in usages],
+            ["a.mov", "b.mov"]
+        )
+        self.assertEqual(
+            [clip.name for clip in usages[0].clips],
+            ["a.mov", "a.mov"]
+        )
+        self.assertEqual(list(usages[0].ranges), [self._range(10, 20)])
+        self.assertEqual(list(usages[1].ranges), [self._range(98, 12)])
+
+        usages = otio.algorithms.media_usage(
+            track,
+            handles=otio.opentime.RationalTime(5, 24)
+        )
+        self.assertEqual(list(usages[1].ranges), [self._range(93, 22)])
+
 
 if __name__ == '__main__':
     unittest.main()